@@ -32,7 +32,8 @@ import numpy as np
 import pandas as pd
 
 from sktime.base import BaseEstimator
-from sktime.datatypes import check_is_scitype, convert_to
+from sktime.datatypes import LazyPanel, check_is_scitype, convert_to
+from sktime.datatypes._lazy import _concat_batches
 from sktime.utils.sklearn import is_sklearn_transformer
 from sktime.utils.validation import check_n_jobs
 from sktime.utils.validation._dependencies import _check_estimator_deps
@@ -145,6 +146,7 @@ class BaseClassifier(BaseEstimator, ABC):
             or of any other supported Panel mtype
                 for list of mtypes, see datatypes.SCITYPE_REGISTER
                 for specifications, see examples/AA_datatypes_and_datasets.ipynb
+            or LazyPanel, out-of-core Panel, loaded into memory in fit
         y : 1D np.array of int, of shape [n_instances] - class labels for fitting
             indices correspond to instance indices in X
 
@@ -161,6 +163,9 @@ class BaseClassifier(BaseEstimator, ABC):
         self.reset()
 
         start = int(round(time.time() * 1000))
+        # fitting requires the full data, out-of-core panels are materialized
+        if isinstance(X, LazyPanel):
+            X = X.to_numpy()
         # convenience conversions to allow user flexibility:
         # if X is 2D array, convert to 3D, if y is Series, convert to numpy
         X, y = self._internal_convert(X, y)
@@ -222,6 +227,7 @@ class BaseClassifier(BaseEstimator, ABC):
             or of any other supported Panel mtype
                 for list of mtypes, see datatypes.SCITYPE_REGISTER
                 for specifications, see examples/AA_datatypes_and_datasets.ipynb
+            or LazyPanel, out-of-core Panel, predicted in batches of instances
 
         Returns
         -------
@@ -230,6 +236,10 @@ class BaseClassifier(BaseEstimator, ABC):
         """
         self.check_is_fitted()
 
+        # out-of-core panels are streamed through predict in batches
+        if isinstance(X, LazyPanel):
+            return _concat_batches([self.predict(Xb) for Xb in X.iter_batches()])
+
         # boilerplate input checks for predict-like methods
         X = self._check_convert_X_for_predict(X)
 
@@ -254,6 +264,7 @@ class BaseClassifier(BaseEstimator, ABC):
             or of any other supported Panel mtype
                 for list of mtypes, see datatypes.SCITYPE_REGISTER
                 for specifications, see examples/AA_datatypes_and_datasets.ipynb
+            or LazyPanel, out-of-core Panel, predicted in batches of instances
 
         Returns
         -------
@@ -264,6 +275,10 @@ class BaseClassifier(BaseEstimator, ABC):
         """
         self.check_is_fitted()
 
+        # out-of-core panels are streamed through predict_proba in batches
+        if isinstance(X, LazyPanel):
+            return _concat_batches([self.predict_proba(Xb) for Xb in X.iter_batches()])
+
         # boilerplate input checks for predict-like methods
         X = self._check_convert_X_for_predict(X)
 
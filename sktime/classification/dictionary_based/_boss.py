@@ -366,17 +366,14 @@ class BOSSEnsemble(BaseClassifier):
                     divisors[n] += 1
 
         else:
-            for i, clf in enumerate(self.estimators_):
-                if self._transformed_data.shape[1] > 0:
+            for clf in self.estimators_:
+                if clf._transformed_data.shape[1] > 0:
                     distance_matrix = pairwise_distances(
                         clf._transformed_data,
                         use_boss_distance=self.use_boss_distance,
                         n_jobs=self.n_jobs,
                     )
-
-                    preds = []
-                    for i in range(n_instances):
-                        preds.append(clf._train_predict(i, distance_matrix))
+                    preds = clf._class_vals[np.argmin(distance_matrix, axis=1)]
 
                     for n, pred in enumerate(preds):
                         results[n][self._class_dictionary[pred]] += 1
@@ -633,9 +630,7 @@ class IndividualBOSS(BaseClassifier):
                 n_jobs=self.n_jobs,
             )
 
-            for i in range(test_bags.shape[0]):
-                min_pos = np.argmin(distance_matrix[i])
-                classes[i] = self._class_vals[min_pos]
+            classes[:] = self._class_vals[np.argmin(distance_matrix, axis=1)]
         else:
             # set to most frequent element
             counts = np.bincount(self._class_vals)
@@ -684,10 +679,30 @@ class IndividualBOSS(BaseClassifier):
         self._transformed_data = self._transformer.fit_transform(X, y)
 
 
-def _dist_wrapper(dist_matrix, X, Y, s, XX_all=None, XY_all=None):
+def _dist_wrapper(dist_matrix, X, Y, s):
     """Write in-place to a slice of a distance matrix."""
-    for i in range(s.start, s.stop):
-        dist_matrix[i] = boss_distance(X, Y, i, XX_all, XY_all)
+    dist_matrix[s] = _boss_distance_matrix(X[s], Y)
+
+
+def _boss_distance_matrix(X, Y):
+    """Find the boss distance between all pairs of rows of X and Y.
+
+    Batched version of boss_distance, the squared norms of rows of Y restricted to
+    the words of each row of X are the product of the word indicators of X with the
+    squared counts of Y.
+    """
+    X = X.astype(np.float64)
+    Y = Y.astype(np.float64)
+
+    XX = csr_row_norms(X)
+    XY = safe_sparse_dot(X, Y.T, dense_output=True)
+    YY = safe_sparse_dot(
+        (X != 0).astype(np.float64), Y.multiply(Y).T, dense_output=True
+    )
+
+    distance_matrix = XX[:, np.newaxis] - 2 * XY + YY
+    np.maximum(distance_matrix, 0, out=distance_matrix)
+    return distance_matrix
 
 
 def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
@@ -696,19 +711,14 @@ def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
         if Y is None:
             Y = X
 
-        XX_row_norms = csr_row_norms(X)
-        XY = safe_sparse_dot(X, Y.T, dense_output=True)
-
-        distance_matrix = np.zeros((X.shape[0], Y.shape[0]))
-
         if effective_n_jobs(n_jobs) > 1:
+            distance_matrix = np.zeros((X.shape[0], Y.shape[0]))
             Parallel(n_jobs=n_jobs, backend="threading")(
-                delayed(_dist_wrapper)(distance_matrix, X, Y, s, XX_row_norms, XY)
+                delayed(_dist_wrapper)(distance_matrix, X, Y, s)
                 for s in gen_even_slices(_num_samples(X), effective_n_jobs(n_jobs))
             )
         else:
-            for i in range(len(distance_matrix)):
-                distance_matrix[i] = boss_distance(X, Y, i, XX_row_norms, XY)
+            distance_matrix = _boss_distance_matrix(X, Y)
 
     else:
         distance_matrix = pairwise.pairwise_distances(X, Y, n_jobs=n_jobs)
@@ -399,10 +399,7 @@ class ContractableBOSS(BaseClassifier):
                 distance_matrix = pairwise_distances(
                     clf._transformed_data, n_jobs=self.n_jobs
                 )
-
-                preds = []
-                for j in range(len(subsample)):
-                    preds.append(clf._train_predict(j, distance_matrix))
+                preds = clf._class_vals[np.argmin(distance_matrix, axis=1)]
 
                 for n, pred in enumerate(preds):
                     results[subsample[n]][
@@ -11,18 +11,20 @@ __all__ = ["TemporalDictionaryEnsemble", "IndividualTDE", "histogram_intersectio
 import math
 import time
 import warnings
-from collections import defaultdict
 
 import numpy as np
-from joblib import Parallel, delayed
 from sklearn import preprocessing
 from sklearn.kernel_ridge import KernelRidge
 from sklearn.utils import check_random_state
 
 from sktime.classification.base import BaseClassifier
 from sktime.transformations.panel.dictionary_based import SFA
+from sktime.utils.validation import check_n_jobs
 from sktime.utils.validation.panel import check_X_y
 
+# maximum number of similarities computed at once, by chunks of rows
+_MAX_SIMS_SIZE = 2**22
+
 
 class TemporalDictionaryEnsemble(BaseClassifier):
     """Temporal Dictionary Ensemble (TDE).
@@ -81,10 +83,9 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         Max number of parameter combinations to consider when time_limit_in_minutes is
         set.
     typed_dict : bool, default=True
-        Use a numba typed Dict to store word counts. May increase memory usage, but will
-        be faster for larger datasets. As the Dict cannot be pickled currently, there
-        will be some overhead converting it to a python dict with multiple threads and
-        pickling.
+        Use a numba typed Dict to count words in the SFA transform. May increase memory
+        usage, but will be faster for larger datasets. Word counts are kept in a
+        sparse matrix either way, which is cheap to pickle.
     save_train_predictions : bool, default=False
         Save the ensemble member train predictions in fit for use in _get_train_probs
         leave-one-out cross-validation.
@@ -467,12 +468,7 @@ class TemporalDictionaryEnsemble(BaseClassifier):
                 preds = (
                     clf._train_predictions
                     if self.save_train_predictions
-                    else Parallel(n_jobs=self._threads_to_use, prefer="threads")(
-                        delayed(clf._train_predict)(
-                            i,
-                        )
-                        for i in range(len(subsample))
-                    )
+                    else clf._train_predict_all()
                 )
 
                 for n, pred in enumerate(preds):
@@ -511,35 +507,16 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         correct = 0
         required_correct = int(lowest_acc * train_size)
 
-        if self._threads_to_use > 1:
-            c = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
-                delayed(tde._train_predict)(
-                    i,
-                )
-                for i in range(train_size)
-            )
-
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-                elif c[i] == y[i]:
-                    correct += 1
-
-                if self.save_train_predictions:
-                    tde._train_predictions.append(c[i])
-
-        else:
-            for i in range(train_size):
-                if correct + train_size - i < required_correct:
-                    return -1
-
-                c = tde._train_predict(i)
+        c = tde._train_predict_all()
 
-                if c == y[i]:
-                    correct += 1
+        for i in range(train_size):
+            if correct + train_size - i < required_correct:
+                return -1
+            elif c[i] == y[i]:
+                correct += 1
 
-                if self.save_train_predictions:
-                    tde._train_predictions.append(c)
+            if self.save_train_predictions:
+                tde._train_predictions.append(c[i])
 
         return correct / train_size
 
@@ -619,8 +596,9 @@ class IndividualTDE(BaseClassifier):
         Maximum number of dimensions words are extracted from. Only applicable for
         multivariate data.
     typed_dict : bool, default=True
-        Use a numba TypedDict to store word counts. May increase memory usage, but will
-        be faster for larger datasets.
+        Use a numba TypedDict to count words in the SFA transform. May increase memory
+        usage, but will be faster for larger datasets. Word counts are kept in a
+        sparse matrix either way.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
@@ -721,41 +699,6 @@ class IndividualTDE(BaseClassifier):
 
         super(IndividualTDE, self).__init__()
 
-    # todo remove along with BOSS and SFA workarounds when Dict becomes serialisable.
-    def __getstate__(self):
-        """Return state as dictionary for pickling, required for typed Dict objects."""
-        state = self.__dict__.copy()
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, ndict in enumerate(state["_transformed_data"]):
-                pdict = dict()
-                for key, val in ndict.items():
-                    pdict[key] = val
-                nl[i] = pdict
-            state["_transformed_data"] = nl
-        return state
-
-    def __setstate__(self, state):
-        """Set current state using input pickling, required for typed Dict objects."""
-        from numba import types
-        from numba.typed import Dict
-
-        self.__dict__.update(state)
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, pdict in enumerate(self._transformed_data):
-                ndict = (
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
-                    )
-                    if self.levels > 1 or self.n_dims_ > 1
-                    else Dict.empty(key_type=types.int64, value_type=types.uint32)
-                )
-                for key, val in pdict.items():
-                    ndict[key] = val
-                nl[i] = ndict
-            self._transformed_data = nl
-
     def _fit(self, X, y):
         """Fit a single base TDE classifier on n_instances cases (X,y).
 
@@ -776,8 +719,7 @@ class IndividualTDE(BaseClassifier):
         Changes state by creating a fitted model that updates attributes
         ending in "_" and sets is_fitted flag to True.
         """
-        from numba import types
-        from numba.typed import Dict
+        from scipy.sparse import hstack
 
         self.n_instances_, self.n_dims_, self.series_length_ = X.shape
         self._class_vals = y
@@ -786,36 +728,15 @@ class IndividualTDE(BaseClassifier):
         if self.n_dims_ > 1:
             self._dims, self._transformers = self._select_dims(X, y)
 
-            words = (
-                [
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
-                    )
-                    for _ in range(self.n_instances_)
-                ]
-                if self.typed_dict
-                else [defaultdict(int) for _ in range(self.n_instances_)]
-            )
-
+            # words of different dimensions are distinct columns of the bags
+            # refit without the binning dft, for a vocabulary with the words of
+            # all windows
+            dim_bags = []
             for i, dim in enumerate(self._dims):
                 X_dim = X[:, dim, :].reshape(self.n_instances_, 1, self.series_length_)
-                dim_words = self._transformers[i].transform(X_dim, y)
-                dim_words = dim_words[0]
-
-                for n in range(self.n_instances_):
-                    if self.typed_dict:
-                        for word, count in dim_words[n].items():
-                            if self.levels > 1:
-                                words[n][
-                                    (word[0], word[1] << self._highest_dim_bit | dim)
-                                ] = count
-                            else:
-                                words[n][(word, dim)] = count
-                    else:
-                        for word, count in dim_words[n].items():
-                            words[n][word << self._highest_dim_bit | dim] = count
-
-            self._transformed_data = words
+                dim_bags.append(self._transformers[i].fit_transform(X_dim, y))
+
+            self._transformed_data = hstack(dim_bags, format="csr")
         else:
             self._transformers.append(
                 SFA(
@@ -832,10 +753,10 @@ class IndividualTDE(BaseClassifier):
                     use_fallback_dft=True,
                     typed_dict=self.typed_dict,
                     n_jobs=self._threads_to_use,
+                    return_sparse=True,
                 )
             )
-            sfa = self._transformers[0].fit_transform(X, y)
-            self._transformed_data = sfa[0]
+            self._transformed_data = self._transformers[0].fit_transform(X, y)
 
     def _predict(self, X):
         """Predict class values of all instances in X.
@@ -850,69 +771,50 @@ class IndividualTDE(BaseClassifier):
         y : array-like, shape = [n_instances]
             Predicted class labels.
         """
-        from numba import types
-        from numba.typed import Dict
+        from scipy.sparse import hstack
 
         num_cases = X.shape[0]
 
         if self.n_dims_ > 1:
-            words = (
+            test_bags = hstack(
                 [
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
+                    self._transformers[i].transform(
+                        X[:, dim, :].reshape(num_cases, 1, self.series_length_)
                     )
-                    for _ in range(num_cases)
-                ]
-                if self.typed_dict
-                else [defaultdict(int) for _ in range(num_cases)]
+                    for i, dim in enumerate(self._dims)
+                ],
+                format="csr",
             )
-
-            for i, dim in enumerate(self._dims):
-                X_dim = X[:, dim, :].reshape(num_cases, 1, self.series_length_)
-                dim_words = self._transformers[i].transform(X_dim)
-                dim_words = dim_words[0]
-
-                for n in range(num_cases):
-                    if self.typed_dict:
-                        for word, count in dim_words[n].items():
-                            if self.levels > 1:
-                                words[n][
-                                    (word[0], word[1] << self._highest_dim_bit | dim)
-                                ] = count
-                            else:
-                                words[n][(word, dim)] = count
-                    else:
-                        for word, count in dim_words[n].items():
-                            words[n][word << self._highest_dim_bit | dim] = count
-
-            test_bags = words
         else:
             test_bags = self._transformers[0].transform(X)
-            test_bags = test_bags[0]
 
-        classes = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
-            delayed(self._test_nn)(
-                test_bag,
+        chunk_size = max(_MAX_SIMS_SIZE // max(self._transformed_data.shape[0], 1), 1)
+        preds = []
+        for start in range(0, num_cases, chunk_size):
+            sims = histogram_intersection(
+                test_bags[start : start + chunk_size],
+                self._transformed_data,
+                n_jobs=self._threads_to_use,
             )
-            for test_bag in test_bags
-        )
+            preds.extend(self._test_nn(test_sims) for test_sims in sims)
 
-        return np.array(classes)
-
-    def _test_nn(self, test_bag):
-        rng = check_random_state(self.random_state)
+        return np.array(preds)
 
-        best_sim = -1
-        nn = None
+    def _test_nn(self, sims):
+        """Find the nearest neighbour class from similarities to all train cases.
 
-        for n, bag in enumerate(self._transformed_data):
-            sim = histogram_intersection(test_bag, bag)
+        Train cases are visited in order, ties with the best similarity so far are
+        broken by a coin flip each.
+        """
+        rng = check_random_state(self.random_state)
 
-            if sim > best_sim or (sim == best_sim and rng.random() < 0.5):
-                best_sim = sim
-                nn = self._class_vals[n]
+        best_before = np.maximum.accumulate(np.concatenate(([-1], sims[:-1])))
+        ties = np.flatnonzero(sims == best_before)
+        replaces = sims > best_before
+        replaces[ties] = rng.random(len(ties)) < 0.5
 
-        return nn
+        nn = np.flatnonzero(replaces)[-1]
+        return self._class_vals[nn]
 
     def _select_dims(self, X, y):
         self._highest_dim_bit = (math.ceil(math.log2(self.n_dims_))) + 1
@@ -938,25 +840,17 @@ class IndividualTDE(BaseClassifier):
                     use_fallback_dft=True,
                     typed_dict=self.typed_dict,
                     n_jobs=self._threads_to_use,
+                    return_sparse=True,
                 )
             )
 
             X_dim = X[:, i, :].reshape(self.n_instances_, 1, self.series_length_)
 
-            transformers[i].fit(X_dim, y)
-            sfa = transformers[i].transform(
-                X_dim,
-                y,
-            )
+            sfa = transformers[i].fit_transform(X_dim, y)
             transformers[i].keep_binning_dft = False
             transformers[i].binning_dft = None
 
-            correct = 0
-            for i in range(self.n_instances_):
-                if self._train_predict(i, sfa[0]) == y[i]:
-                    correct = correct + 1
-
-            accs.append(correct)
+            accs.append(np.sum(self._train_predict_all(sfa) == y))
 
         max_acc = max(accs)
 
@@ -979,48 +873,83 @@ class IndividualTDE(BaseClassifier):
         if bags is None:
             bags = self._transformed_data
 
-        test_bag = bags[train_num]
-        best_sim = -1
-        nn = None
+        sims = histogram_intersection(
+            bags[train_num], bags, n_jobs=self._threads_to_use
+        )[0]
+        sims[train_num] = -1
+        return self._class_vals[np.argmax(sims)]
 
-        for n, bag in enumerate(bags):
-            if n == train_num:
-                continue
-
-            sim = histogram_intersection(test_bag, bag)
-
-            if sim > best_sim:
-                best_sim = sim
-                nn = self._class_vals[n]
+    def _train_predict_all(self, bags=None):
+        """Predict all train cases by leave-one-out nearest neighbour."""
+        if bags is None:
+            bags = self._transformed_data
 
-        return nn
+        n_cases = bags.shape[0]
+        chunk_size = max(_MAX_SIMS_SIZE // max(n_cases, 1), 1)
+        preds = np.empty(n_cases, dtype=np.int64)
+        for start in range(0, n_cases, chunk_size):
+            sims = histogram_intersection(
+                bags[start : start + chunk_size], bags, n_jobs=self._threads_to_use
+            )
+            rows = np.arange(sims.shape[0])
+            sims[rows, start + rows] = -1
+            preds[start : start + len(rows)] = np.argmax(sims, axis=1)
+        return self._class_vals[preds]
 
 
-def histogram_intersection(first, second):
+def histogram_intersection(first, second, n_jobs=1):
     """Find the distance between two histograms using the histogram intersection.
 
     This distance function is designed for sparse matrix, represented as a
     dictionary or numba Dict, but can accept arrays.
 
+    If both are scipy sparse matrices of word counts with the same columns, the
+    histogram intersection of all pairs of rows is returned.
+
     Parameters
     ----------
-    first : dict, numba.Dict or array
+    first : dict, numba.Dict, array or sparse matrix
         First dictionary used in distance measurement.
-    second : dict, numba.Dict or array
+    second : dict, numba.Dict, array or sparse matrix
         Second dictionary that will be used to measure distance from `first`.
+    n_jobs : int, default=1
+        The number of threads used for sparse matrices.
+        ``-1`` means using all processors.
 
     Returns
     -------
-    dist : float
+    dist : float, or np.ndarray of shape (first.shape[0], second.shape[0])
         The histogram intersection distance between the first and second dictionaries.
     """
     from numba.typed import Dict
+    from scipy.sparse import issparse
 
     from sktime.classification.dictionary_based._tde_numba import (
         _histogram_intersection_dict,
+        _histogram_intersection_sparse,
     )
 
-    if isinstance(first, dict):
+    if issparse(first) and issparse(second):
+        from numba import config, get_num_threads, set_num_threads
+
+        first = first.tocsc()
+        second = second.tocsr()
+
+        n_threads = get_num_threads()
+        set_num_threads(min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS))
+        try:
+            return _histogram_intersection_sparse(
+                first.shape[0],
+                first.indptr,
+                first.indices,
+                first.data,
+                second.indptr,
+                second.indices,
+                second.data,
+            )
+        finally:
+            set_num_threads(n_threads)
+    elif isinstance(first, dict):
         sim = 0
         for word, val_a in first.items():
             val_b = second.get(word, 0)
@@ -3,11 +3,13 @@
 
 __author__ = ["MatthewMiddlehurst"]
 
+import numpy as np
+
 from sktime.utils.numba.njit import njit
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 if _check_soft_dependencies("numba", severity="none"):
-    from numba import types
+    from numba import prange, types
 
 
 @njit(fastmath=True, cache=True)
@@ -17,3 +19,31 @@ def _histogram_intersection_dict(first, second):
         val_b = second.get(word, types.uint32(0))
         sim += min(val_a, val_b)
     return sim
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _histogram_intersection_sparse(
+    n_first,
+    first_indptr,
+    first_indices,
+    first_data,
+    second_indptr,
+    second_indices,
+    second_data,
+):
+    """Histogram intersection of all pairs of rows of two sparse count matrices.
+
+    first is given in csc format, i.e., first_indptr points to the rows of each
+    column, second in csr format, both with the same columns.
+    Returns the (n_first, n_second) array of similarities.
+    """
+    n_second = len(second_indptr) - 1
+
+    sims = np.zeros((n_first, n_second), dtype=np.int64)
+    for j in prange(n_second):
+        for p in range(second_indptr[j], second_indptr[j + 1]):
+            col = second_indices[p]
+            val_b = second_data[p]
+            for q in range(first_indptr[col], first_indptr[col + 1]):
+                sims[first_indices[q], j] += np.int64(min(first_data[q], val_b))
+    return sims
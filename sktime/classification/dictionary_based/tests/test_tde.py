@@ -3,8 +3,13 @@
 import numpy as np
 import pytest
 
-from sktime.classification.dictionary_based._tde import TemporalDictionaryEnsemble
-from sktime.datasets import load_unit_test
+from sktime.classification.dictionary_based import _tde
+from sktime.classification.dictionary_based._tde import (
+    IndividualTDE,
+    TemporalDictionaryEnsemble,
+    histogram_intersection,
+)
+from sktime.datasets import load_basic_motions, load_unit_test
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 
@@ -54,3 +59,48 @@ def test_contracted_tde():
 
     # fails stochastically, probably not a correct expectation, commented out, see #3206
     # assert len(tde.estimators_) > 1
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+def test_histogram_intersection_sparse():
+    """Test batched histogram intersection of sparse bags against dict bags."""
+    from scipy.sparse import csr_matrix
+
+    rng = np.random.RandomState(0)
+    counts = rng.randint(1, 10, size=(12, 50)) * (rng.random_sample((12, 50)) < 0.2)
+    first = csr_matrix(counts[:7], dtype=np.uint32)
+    second = csr_matrix(counts[7:], dtype=np.uint32)
+
+    def _to_dict(row):
+        return dict(zip(row.indices.tolist(), row.data.tolist()))
+
+    sims = histogram_intersection(first, second)
+    assert sims.shape == (7, 5)
+    for i in range(7):
+        for j in range(5):
+            expected = histogram_intersection(
+                _to_dict(first.getrow(i)), _to_dict(second.getrow(j))
+            )
+            assert sims[i, j] == expected
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("load", [load_unit_test, load_basic_motions])
+def test_individual_tde_chunked_similarities(load, monkeypatch):
+    """Test IndividualTDE predictions do not depend on the similarity chunk size."""
+    X_train, y_train = load(split="train", return_type="numpy3D")
+    X_test, _ = load(split="test", return_type="numpy3D")
+
+    tde = IndividualTDE(window_size=8, random_state=0).fit(X_train, y_train)
+    preds = tde.predict(X_test)
+    train_preds = tde._train_predict_all()
+
+    monkeypatch.setattr(_tde, "_MAX_SIMS_SIZE", 3 * len(X_train))
+    np.testing.assert_array_equal(tde.predict(X_test), preds)
+    np.testing.assert_array_equal(tde._train_predict_all(), train_preds)
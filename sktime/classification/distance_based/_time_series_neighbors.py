@@ -28,6 +28,7 @@ from sklearn.neighbors import KNeighborsClassifier
 from sktime.classification.base import BaseClassifier
 from sktime.datatypes import check_is_mtype
 from sktime.distances import pairwise_distance
+from sktime.distances._dtw_knn import _dtw_lb_search_params, _knn_distance_to_train
 
 # add new distance string codes here
 DISTANCES_SUPPORTED = [
@@ -77,6 +78,9 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             'euclidean', 'squared', 'dtw', 'ddtw', 'wdtw', 'wddtw',
             'lcss', 'edr', 'erp', 'msm', 'twe'
         this will substitute a hard-coded distance metric from sktime.distances
+        If "dtw", with algorithm "brute" and distance_params only setting the
+            bounding window, neighbours are searched via ``dtw_kneighbors``,
+            which prunes most dtw computations by lower bounds
         If non-class callable, parameters can be passed via distance_params
             Example: knn_dtw = KNeighborsTimeSeriesClassifier(
                                     distance='dtw', distance_params={'epsilon':0.1})
@@ -209,6 +213,17 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
                 else:
                     return distance(X, **distance_params)
 
+    def _distance_to_train(self, X, n_neighbors=None):
+        """Compute distances of X to the stored training data self._X."""
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        lb_search_params = _dtw_lb_search_params(
+            self.distance, self.algorithm, self.distance_params
+        )
+        return _knn_distance_to_train(
+            X, self._X, self._distance, n_neighbors, lb_search_params
+        )
+
     def _fit(self, X, y):
         """Fit the model using X as training data and y as target values.
 
@@ -267,7 +282,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         X = self._check_convert_X_for_predict(X)
 
         # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._distance_to_train(X, n_neighbors=n_neighbors)
 
         result = self.knn_estimator_.kneighbors(
             dist_mat, n_neighbors=n_neighbors, return_distance=return_distance
@@ -290,7 +305,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             Class labels for each data sample.
         """
         # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._distance_to_train(X)
 
         y_pred = self.knn_estimator_.predict(dist_mat)
 
@@ -312,7 +327,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             by lexicographic order.
         """
         # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._distance_to_train(X)
 
         y_pred = self.knn_estimator_.predict_proba(dist_mat)
 
@@ -352,4 +367,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         dist = AggrDist.create_test_instance()
         params3 = {"distance": dist}
 
-        return [params1, params2, params3]
+        # testing lower bound pruned search
+        params4 = {"distance": "dtw", "distance_params": {"window": 0.2}}
+
+        return [params1, params2, params3, params4]
@@ -8,9 +8,12 @@ representations, using the weighted probabilistic CAWPE as an ensemble controlle
 __author__ = ["MatthewMiddlehurst"]
 __all__ = ["HIVECOTEV2"]
 
+import threading
+import time
 from datetime import datetime
 
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.metrics import accuracy_score
 from sklearn.utils import check_random_state
 
@@ -44,6 +47,10 @@ class HIVECOTEV2(BaseClassifier):
         Time contract to limit build time in minutes, overriding
         n_estimators/n_parameter_samples for each component.
         Default of 0 means n_estimators/n_parameter_samples for each component is used.
+        Components share one deadline, 2/3 of the contract after fit starts, the
+        remainder is left for train estimates. Each component is contracted to its
+        share of the time remaining when it starts, time not used by components that
+        finish early is given to the components started after them.
     save_component_probas : bool, default=False
         When predict/predict_proba is called, save each HIVE-COTEV2 component
         probability predictions in component_probas.
@@ -52,6 +59,9 @@ class HIVECOTEV2(BaseClassifier):
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
+        If more than one, the components and their train estimates are fitted
+        concurrently in threads, ``n_jobs`` threads are split between the
+        components running when a component starts.
     random_state : int or None, default=None
         Seed for random number generation.
 
@@ -169,112 +179,93 @@ class HIVECOTEV2(BaseClassifier):
         if self.tde_params is None:
             self._tde_params = {}
 
-        # If we are contracting split the contract time between each algorithm
-        if self.time_limit_in_minutes > 0:
-            # Leave 1/3 for train estimates
-            ct = self.time_limit_in_minutes / 6
-            self._stc_params["time_limit_in_minutes"] = ct
-            self._drcif_params["time_limit_in_minutes"] = ct
-            self._arsenal_params["time_limit_in_minutes"] = ct
-            self._tde_params["time_limit_in_minutes"] = ct
-
-        # Build STC
-        self._stc = ShapeletTransformClassifier(
-            **self._stc_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._threads_to_use,
+        components = [
+            (
+                "STC",
+                ShapeletTransformClassifier,
+                self._stc_params,
+                {"save_transformed_data": True},
+                {},
+            ),
+            (
+                "DrCIF",
+                DrCIF,
+                self._drcif_params,
+                {"save_transformed_data": True},
+                {},
+            ),
+            (
+                "Arsenal",
+                Arsenal,
+                self._arsenal_params,
+                {"save_transformed_data": True},
+                {},
+            ),
+            (
+                "TDE",
+                TemporalDictionaryEnsemble,
+                self._tde_params,
+                {"save_train_predictions": True},
+                {"train_estimate_method": "loocv"},
+            ),
+        ]
+
+        n_workers = min(len(components), self._threads_to_use)
+        scheduler = _ContractScheduler(
+            self.time_limit_in_minutes,
+            n_workers,
+            len(components),
+            self._threads_to_use,
         )
-        self._stc.fit(X, y)
-
-        if self.verbose > 0:
-            print("STC ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
 
-        # Find STC weight using train set estimate
-        train_probs = self._stc._get_train_probs(X, y)
-        train_preds = self._stc.classes_[np.argmax(train_probs, axis=1)]
-        self.stc_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "STC train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("STC weight = " + str(self.stc_weight_))  # noqa
-
-        # Build DrCIF
-        self._drcif = DrCIF(
-            **self._drcif_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._threads_to_use,
-        )
-        self._drcif.fit(X, y)
-
-        if self.verbose > 0:
-            print("DrCIF ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find DrCIF weight using train set estimate
-        train_probs = self._drcif._get_train_probs(X, y)
-        train_preds = self._drcif.classes_[np.argmax(train_probs, axis=1)]
-        self.drcif_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "DrCIF train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("DrCIF weight = " + str(self.drcif_weight_))  # noqa
-
-        # Build Arsenal
-        self._arsenal = Arsenal(
-            **self._arsenal_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._threads_to_use,
+        fitted = Parallel(n_jobs=n_workers, prefer="threads")(
+            delayed(self._fit_component)(*component, X, y, scheduler)
+            for component in components
         )
-        self._arsenal.fit(X, y)
 
-        if self.verbose > 0:
-            print("Arsenal ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find Arsenal weight using train set estimate
-        train_probs = self._arsenal._get_train_probs(X, y)
-        train_preds = self._arsenal.classes_[np.argmax(train_probs, axis=1)]
-        self.arsenal_weight_ = accuracy_score(y, train_preds) ** 4
+        (
+            (self._stc, self.stc_weight_),
+            (self._drcif, self.drcif_weight_),
+            (self._arsenal, self.arsenal_weight_),
+            (self._tde, self.tde_weight_),
+        ) = fitted
 
-        if self.verbose > 0:
-            print(  # noqa
-                "Arsenal train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("Arsenal weight = " + str(self.arsenal_weight_))  # noqa
+        return self
 
-        # Build TDE
-        self._tde = TemporalDictionaryEnsemble(
-            **self._tde_params,
-            save_train_predictions=True,
+    def _fit_component(
+        self, name, estimator, params, fit_params, train_params, X, y, scheduler
+    ):
+        """Fit a component and find its weight using a train set estimate."""
+        params = {**params, **fit_params}
+        time_limit_in_minutes, n_jobs = scheduler.start()
+        if time_limit_in_minutes is not None:
+            params["time_limit_in_minutes"] = time_limit_in_minutes
+
+        clf = estimator(
+            **params,
             random_state=self.random_state,
-            n_jobs=self._threads_to_use,
+            n_jobs=n_jobs,
         )
-        self._tde.fit(X, y)
+        scheduler.register(clf)
+        clf.fit(X, y)
+        scheduler.finish()
 
         if self.verbose > 0:
-            print("TDE ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
+            print(name, datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
 
-        # Find TDE weight using train set estimate
-        train_probs = self._tde._get_train_probs(X, y, train_estimate_method="loocv")
-        train_preds = self._tde.classes_[np.argmax(train_probs, axis=1)]
-        self.tde_weight_ = accuracy_score(y, train_preds) ** 4
+        train_probs = clf._get_train_probs(X, y, **train_params)
+        train_preds = clf.classes_[np.argmax(train_probs, axis=1)]
+        weight = accuracy_score(y, train_preds) ** 4
+        scheduler.release(clf)
 
         if self.verbose > 0:
             print(  # noqa
-                "TDE train estimate ",
+                name + " train estimate ",
                 datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
             )
-            print("TDE weight = " + str(self.tde_weight_))  # noqa
+            print(name + " weight = " + str(weight))  # noqa
 
-        return self
+        return clf, weight
 
     def _predict(self, X) -> np.ndarray:
         """Predicts labels for sequences in X.
@@ -410,3 +401,93 @@ class HIVECOTEV2(BaseClassifier):
                     "randomly_selected_params": 1,
                 },
             }
+
+
+class _ContractScheduler:
+    """Share a time contract and threads between components fitted by workers.
+
+    Components are fitted by n_workers in parallel, all by one deadline, 2/3 of the
+    contract after construction, the remainder is left for train estimates.
+    A component starting when m components are unfinished, including itself, gets
+    n_workers / m of the remaining time, at most all of it.
+
+    Threads are a shared budget of n_jobs, split between the components holding
+    them, from ``register`` until ``release``. Whenever a component registers or
+    is released, the budget is split again over min(n_workers, r) shares, r the
+    number of components not yet released, and pushed to the running components
+    through ``n_jobs`` and ``_threads_to_use``, which they read again at each batch
+    or checkpoint. Threads of a released component so go to the others. A released
+    component gets the whole budget back for prediction.
+
+    Parameters
+    ----------
+    time_limit_in_minutes : float
+        Time contract, 0 means no contract.
+    n_workers : int
+        Number of components fitted in parallel.
+    n_components : int
+        Number of components to fit.
+    n_jobs : int
+        Number of threads shared by the components.
+    """
+
+    def __init__(self, time_limit_in_minutes, n_workers, n_components, n_jobs):
+        self.time_limit_in_minutes = time_limit_in_minutes
+        self.n_workers = n_workers
+        self.n_components = n_components
+        self.n_jobs = n_jobs
+
+        self._deadline = time.time() + time_limit_in_minutes * 60 * 2 / 3
+        self._n_unfinished = n_components
+        self._n_unreleased = n_components
+        self._running = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Return contract in minutes, None if none, and threads of a component."""
+        with self._lock:
+            remaining = self._deadline - time.time()
+            n_unfinished = self._n_unfinished
+            shares = self._shares()
+            n_jobs = shares[min(len(self._running), len(shares) - 1)]
+
+        if self.time_limit_in_minutes <= 0:
+            return None, n_jobs
+
+        share = min(1, self.n_workers / n_unfinished)
+        # a contract of 0 would mean no contract for the component
+        return max(remaining * share / 60, 1e-3), n_jobs
+
+    def register(self, clf):
+        """Let a component draw threads from the budget until it is released."""
+        with self._lock:
+            self._running.append(clf)
+            self._rebalance()
+
+    def finish(self):
+        """Register that a component has finished fitting."""
+        with self._lock:
+            self._n_unfinished -= 1
+
+    def release(self, clf):
+        """Return the threads of a component to the budget."""
+        with self._lock:
+            self._running.remove(clf)
+            self._n_unreleased -= 1
+            _set_threads(clf, self.n_jobs)
+            self._rebalance()
+
+    def _shares(self):
+        n_shares = max(min(self.n_workers, self._n_unreleased), len(self._running), 1)
+        base, extra = divmod(self.n_jobs, n_shares)
+        return [max(base + (i < extra), 1) for i in range(n_shares)]
+
+    def _rebalance(self):
+        for clf, n_jobs in zip(self._running, self._shares()):
+            _set_threads(clf, n_jobs)
+
+
+def _set_threads(clf, n_jobs):
+    # _threads_to_use is read by a fit in progress, n_jobs by a fit yet to start
+    clf.n_jobs = n_jobs
+    clf._threads_to_use = n_jobs
@@ -3,6 +3,7 @@
 import pytest
 
 from sktime.classification.hybrid import HIVECOTEV2
+from sktime.classification.hybrid._hivecote_v2 import _ContractScheduler
 from sktime.classification.sklearn import RotationForest
 from sktime.datasets import load_unit_test
 from sktime.utils.validation._dependencies import _check_soft_dependencies
@@ -40,3 +41,61 @@ def test_contracted_hivecote_v2():
         random_state=0,
     )
     hc2.fit(X_train, y_train)
+
+
+def test_contract_scheduler():
+    """Test that time and threads are shared by the components fitted by workers."""
+    # 2 of 3 minutes for fitting, the rest for train estimates
+    sequential = _ContractScheduler(3, n_workers=1, n_components=4, n_jobs=1)
+    time_limit, n_jobs = sequential.start()
+    assert time_limit == pytest.approx(0.5, abs=0.01)
+    assert n_jobs == 1
+    sequential.finish()
+    assert sequential.start()[0] == pytest.approx(2 / 3, abs=0.01)
+
+    concurrent = _ContractScheduler(3, n_workers=4, n_components=4, n_jobs=8)
+    for _ in range(4):
+        time_limit, n_jobs = concurrent.start()
+        assert time_limit == pytest.approx(2, abs=0.01)
+        assert n_jobs == 2
+
+    # threads of a released component go to components started later
+    two_workers = _ContractScheduler(0, n_workers=2, n_components=3, n_jobs=4)
+    first, second = _Component(), _Component()
+    assert two_workers.start() == (None, 2)
+    two_workers.register(first)
+    assert two_workers.start() == (None, 2)
+    two_workers.register(second)
+    two_workers.release(first)
+    two_workers.release(second)
+    assert two_workers.start() == (None, 4)
+
+
+class _Component:
+    """Stand-in for a component, holding the threads it was given."""
+
+    n_jobs = 0
+    _threads_to_use = 0
+
+
+def test_contract_scheduler_rebalances_threads():
+    """Test that threads of a component finishing first go to running components."""
+    scheduler = _ContractScheduler(0, n_workers=4, n_components=4, n_jobs=8)
+    components = [_Component() for _ in range(4)]
+    for component in components:
+        scheduler.start()
+        scheduler.register(component)
+    assert [c._threads_to_use for c in components] == [2, 2, 2, 2]
+
+    first, *running = components
+    scheduler.finish()
+    scheduler.release(first)
+    assert [c._threads_to_use for c in running] == [3, 3, 2]
+    assert [c.n_jobs for c in running] == [3, 3, 2]
+    # the released component gets all threads back for prediction
+    assert first.n_jobs == first._threads_to_use == 8
+
+    scheduler.release(running.pop())
+    assert [c._threads_to_use for c in running] == [4, 4]
+    scheduler.release(running.pop())
+    assert running[0]._threads_to_use == 8
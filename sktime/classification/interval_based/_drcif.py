@@ -305,7 +305,9 @@ class DrCIF(BaseClassifier):
                 train_time < time_limit
                 and self._n_estimators < self.contract_max_n_estimators
             ):
-                fit = Parallel(n_jobs=self._threads_to_use)(
+                # threads may change between batches, e.g. in HIVECOTEV2
+                n_jobs = self._threads_to_use
+                fit = Parallel(n_jobs=n_jobs)(
                     delayed(self._fit_estimator)(
                         X,
                         X_p,
@@ -313,7 +315,7 @@ class DrCIF(BaseClassifier):
                         y,
                         i,
                     )
-                    for i in range(self._threads_to_use)
+                    for i in range(n_jobs)
                 )
 
                 (
@@ -330,7 +332,7 @@ class DrCIF(BaseClassifier):
                 self.dims_ += dims
                 self.transformed_data_ += transformed_data
 
-                self._n_estimators += self._threads_to_use
+                self._n_estimators += n_jobs
                 train_time = time.time() - start_time
         else:
             fit = Parallel(n_jobs=self._threads_to_use)(
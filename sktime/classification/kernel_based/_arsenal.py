@@ -56,6 +56,8 @@ class Arsenal(BaseClassifier):
         Max number of estimators when time_limit_in_minutes is set.
     save_transformed_data : bool, default=False
         Save the data transformed in fit for use in _get_train_probs.
+        For rocket_transform="rocket", the kernels of all members are applied in a
+        single pass over the data if set, else in batches of n_jobs members.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
@@ -79,9 +81,10 @@ class Arsenal(BaseClassifier):
     weights_ : list of shape (n_estimators) of float
         Weight of each estimator in the ensemble.
     transformed_data_ : list of shape (n_estimators) of ndarray with shape
-    (n_instances,total_intervals * att_subsample_size)
+    (n_instances, n_features)
         The transformed dataset for all classifiers. Only saved when
-        save_transformed_data is true.
+        save_transformed_data is true. For rocket_transform="rocket", these are
+        views on the blocks of columns of a single array of all members' features.
 
     See Also
     --------
@@ -212,6 +215,9 @@ class Arsenal(BaseClassifier):
         else:
             raise ValueError(f"Invalid Rocket transformer: {self.rocket_transform}")
 
+        # normalise X once, as Rocket does, for the batched kernel application
+        X_rocket = _normalise(X) if isinstance(base_rocket, Rocket) else X
+
         if time_limit > 0:
             self.n_estimators = 0
             self.estimators_ = []
@@ -221,48 +227,25 @@ class Arsenal(BaseClassifier):
                 train_time < time_limit
                 and self.n_estimators < self.contract_max_n_estimators
             ):
-                fit = Parallel(n_jobs=self._threads_to_use)(
-                    delayed(self._fit_estimator)(
-                        _clone_estimator(
-                            base_rocket,
-                            None
-                            if self.random_state is None
-                            else (255 if self.random_state == 0 else self.random_state)
-                            * 37
-                            * (i + 1),
-                        ),
-                        X,
-                        y,
-                    )
-                    for i in range(self._threads_to_use)
+                # threads may change between batches, e.g. in HIVECOTEV2
+                n_jobs = self._threads_to_use
+                estimators, transformed_data = self._fit_estimators(
+                    base_rocket,
+                    X_rocket,
+                    y,
+                    range(self.n_estimators, self.n_estimators + n_jobs),
                 )
 
-                estimators, transformed_data = zip(*fit)
-
                 self.estimators_ += estimators
                 self.transformed_data_ += transformed_data
 
-                self.n_estimators += self._threads_to_use
+                self.n_estimators += n_jobs
                 train_time = time.time() - start_time
         else:
-            fit = Parallel(n_jobs=self._threads_to_use)(
-                delayed(self._fit_estimator)(
-                    _clone_estimator(
-                        base_rocket,
-                        None
-                        if self.random_state is None
-                        else (255 if self.random_state == 0 else self.random_state)
-                        * 37
-                        * (i + 1),
-                    ),
-                    X,
-                    y,
-                )
-                for i in range(self.n_estimators)
+            self.estimators_, self.transformed_data_ = self._fit_estimators(
+                base_rocket, X_rocket, y, range(self.n_estimators)
             )
 
-            self.estimators_, self.transformed_data_ = zip(*fit)
-
         self.weights_ = []
         self._weight_sum = 0
         for rocket_pipeline in self.estimators_:
@@ -306,14 +289,30 @@ class Arsenal(BaseClassifier):
         y : array-like, shape = [n_instances, n_classes_]
             Predicted probabilities using the ordering in classes_.
         """
-        y_probas = Parallel(n_jobs=self._threads_to_use)(
-            delayed(self._predict_proba_for_estimator)(
-                X,
-                self.estimators_[i],
-                i,
+        if isinstance(self.estimators_[0].steps[0][1], Rocket):
+            # apply the kernels of all members in one pass, in batches of members
+            X = _normalise(X)
+            y_probas = []
+            for batch in _batches(range(self.n_estimators), self._threads_to_use):
+                rockets = [self.estimators_[i].steps[0][1] for i in batch]
+                transformed_data = _apply_rockets(X, rockets, self._threads_to_use)
+                y_probas += Parallel(n_jobs=self._threads_to_use, prefer="threads")(
+                    delayed(self._predict_proba_for_estimator)(
+                        transformed_x,
+                        self.estimators_[i][1:],
+                        i,
+                    )
+                    for i, transformed_x in zip(batch, transformed_data)
+                )
+        else:
+            y_probas = Parallel(n_jobs=self._threads_to_use)(
+                delayed(self._predict_proba_for_estimator)(
+                    X,
+                    self.estimators_[i],
+                    i,
+                )
+                for i in range(self.n_estimators)
             )
-            for i in range(self.n_estimators)
-        )
 
         return np.around(
             np.sum(y_probas, axis=0) / (np.ones(self.n_classes_) * self._weight_sum), 8
@@ -343,7 +342,7 @@ class Arsenal(BaseClassifier):
         if not self.save_transformed_data:
             raise ValueError("Currently only works with saved transform data from fit.")
 
-        p = Parallel(n_jobs=self._threads_to_use)(
+        p = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
             delayed(self._train_probas_for_estimator)(
                 y,
                 i,
@@ -367,8 +366,58 @@ class Arsenal(BaseClassifier):
 
         return results
 
+    def _fit_estimators(self, base_rocket, X, y, indices):
+        """Fit the ensemble members with the given indices.
+
+        The kernels of Rocket members are generated up front and applied to the
+        normalised X in a single pass, with the features of each member as a block
+        of columns. All members are transformed at once if the transformed data is
+        saved, else in batches of ``_threads_to_use`` members to bound memory.
+        Other transformers are fitted per member.
+        """
+        rockets = [
+            _clone_estimator(
+                base_rocket,
+                None
+                if self.random_state is None
+                else (255 if self.random_state == 0 else self.random_state)
+                * 37
+                * (i + 1),
+            )
+            for i in indices
+        ]
+
+        if not isinstance(base_rocket, Rocket):
+            fit = Parallel(n_jobs=self._threads_to_use)(
+                delayed(self._fit_estimator)(rocket, X, y) for rocket in rockets
+            )
+            estimators, transformed_data = zip(*fit)
+            return list(estimators), list(transformed_data)
+
+        for rocket in rockets:
+            rocket.fit(X)
+
+        batch_size = (
+            len(rockets) if self.save_transformed_data else self._threads_to_use
+        )
+        estimators = []
+        transformed_data = []
+        for batch in _batches(rockets, batch_size):
+            fit = Parallel(n_jobs=self._threads_to_use, prefer="threads")(
+                delayed(self._fit_ridge)(rocket, transformed_x, y)
+                for rocket, transformed_x in zip(
+                    batch, _apply_rockets(X, batch, self._threads_to_use)
+                )
+            )
+            batch_estimators, batch_transformed_data = zip(*fit)
+            estimators += batch_estimators
+            transformed_data += batch_transformed_data
+        return estimators, transformed_data
+
     def _fit_estimator(self, rocket, X, y):
-        transformed_x = rocket.fit_transform(X)
+        return self._fit_ridge(rocket, rocket.fit_transform(X).to_numpy(), y)
+
+    def _fit_ridge(self, rocket, transformed_x, y):
         scaler = StandardScaler(with_mean=False)
         scaler.fit(transformed_x, y)
         ridge = RidgeClassifierCV(alphas=np.logspace(-3, 3, 10))
@@ -406,8 +455,8 @@ class Arsenal(BaseClassifier):
             StandardScaler(with_mean=False),
             RidgeClassifierCV(alphas=np.logspace(-3, 3, 10)),
         )
-        clf.fit(self.transformed_data_[idx].iloc[subsample], y[subsample])
-        preds = clf.predict(self.transformed_data_[idx].iloc[oob])
+        clf.fit(self.transformed_data_[idx][subsample], y[subsample])
+        preds = clf.predict(self.transformed_data_[idx][oob])
 
         weight = clf.steps[1][1].best_score_
 
@@ -448,3 +497,51 @@ class Arsenal(BaseClassifier):
             }
 
         return params
+
+
+def _normalise(X):
+    """Normalise each series of X and convert to float32, as Rocket does."""
+    X = (X - X.mean(axis=-1, keepdims=True)) / (X.std(axis=-1, keepdims=True) + 1e-8)
+    return X.astype(np.float32)
+
+
+def _batches(items, batch_size):
+    """Split items into consecutive batches of at most batch_size."""
+    return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+def _apply_rockets(X, rockets, n_jobs):
+    """Apply the kernels of fitted Rocket transformers to X in a single pass.
+
+    Parameters
+    ----------
+    X : 3D np.ndarray of float32, shape = [n_instances, n_dimensions, series_length]
+        Data normalised by _normalise.
+    rockets : list of fitted Rocket
+    n_jobs : int
+        Number of threads to use.
+
+    Returns
+    -------
+    list of 2D np.ndarray, for each transformer, its features as a view on the block
+    of columns of the features of all transformers.
+    """
+    from numba import config, get_num_threads, set_num_threads
+
+    from sktime.transformations.panel.rocket._rocket_numba import _apply_kernels
+
+    kernels = tuple(
+        np.concatenate([rocket.kernels[i] for rocket in rockets])
+        for i in range(len(rockets[0].kernels))
+    )
+
+    prev_threads = get_num_threads()
+    set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+    try:
+        transformed_x = _apply_kernels(X, kernels)
+    finally:
+        set_num_threads(prev_threads)
+
+    # 2 features per kernel
+    sections = np.cumsum([2 * len(rocket.kernels[1]) for rocket in rockets])[:-1]
+    return np.split(transformed_x, sections, axis=1)
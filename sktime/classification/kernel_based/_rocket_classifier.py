@@ -67,6 +67,11 @@ class RocketClassifier(_DelegatedClassifier):
         ``-1`` means using all processors.
     random_state : int or None, default=None
         Seed for random number generation.
+    batch_size : int or None, default=None
+        Number of instances to transform at a time. If not None, this is passed on
+        to the rocket class, and `predict` and `predict_proba` transform and classify
+        instances in batches of this size, so that the features of all instances are
+        never held in memory at once. If None, all instances are processed at once.
 
     Attributes
     ----------
@@ -125,6 +130,7 @@ class RocketClassifier(_DelegatedClassifier):
         use_multivariate="auto",
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.num_kernels = num_kernels
         self.rocket_transform = rocket_transform
@@ -134,6 +140,7 @@ class RocketClassifier(_DelegatedClassifier):
 
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.batch_size = batch_size
 
         super(RocketClassifier, self).__init__()
 
@@ -148,6 +155,7 @@ class RocketClassifier(_DelegatedClassifier):
             "random_state": self.random_state,
             "max_dilations_per_kernel": self.max_dilations_per_kernel,
             "n_jobs": self._threads_to_use,
+            "batch_size": self.batch_size,
         }
 
         if rocket_transform == "rocket":
@@ -202,6 +210,32 @@ class RocketClassifier(_DelegatedClassifier):
 
         return delegate
 
+    def _predict(self, X):
+        """Predict labels for sequences in X, in batches of batch_size instances."""
+        if self.batch_size is None:
+            return super(RocketClassifier, self)._predict(X)
+
+        estimator = self._get_delegate()
+        return np.concatenate(
+            [
+                estimator.predict(X=X[i : i + self.batch_size])
+                for i in range(0, X.shape[0], self.batch_size)
+            ]
+        )
+
+    def _predict_proba(self, X):
+        """Predict label probabilities for sequences in X, in batches of batch_size."""
+        if self.batch_size is None:
+            return super(RocketClassifier, self)._predict_proba(X)
+
+        estimator = self._get_delegate()
+        return np.concatenate(
+            [
+                estimator.predict_proba(X=X[i : i + self.batch_size])
+                for i in range(0, X.shape[0], self.batch_size)
+            ]
+        )
+
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """Return testing parameter settings for the estimator.
@@ -227,4 +261,7 @@ class RocketClassifier(_DelegatedClassifier):
         if parameter_set == "results_comparison":
             return {"num_kernels": 100}
         else:
-            return {"num_kernels": 20}
+            return [
+                {"num_kernels": 20},
+                {"num_kernels": 100, "rocket_transform": "minirocket", "batch_size": 3},
+            ]
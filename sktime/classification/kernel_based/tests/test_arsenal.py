@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Arsenal test code."""
+import numpy as np
 import pytest
 
 from sktime.classification.kernel_based import Arsenal
@@ -26,3 +27,32 @@ def test_contracted_arsenal():
     arsenal.fit(X_train, y_train)
 
     assert len(arsenal.estimators_) > 1
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+def test_arsenal_batched_rocket():
+    """Test batched Rocket members of Arsenal against separately fitted pipelines."""
+    X_train, y_train = load_unit_test(split="train", return_X_y=True)
+    X_test, _ = load_unit_test(split="test", return_X_y=True)
+
+    arsenal = Arsenal(
+        num_kernels=20, n_estimators=3, save_transformed_data=True, random_state=0
+    )
+    arsenal.fit(X_train, y_train)
+
+    y_proba = np.zeros((len(X_test), arsenal.n_classes_))
+    for i, pipeline in enumerate(arsenal.estimators_):
+        rocket = pipeline.steps[0][1]
+        np.testing.assert_array_equal(
+            arsenal.transformed_data_[i], rocket.transform(X_train).to_numpy()
+        )
+        for n, pred in enumerate(pipeline.predict(X_test)):
+            y_proba[n, arsenal._class_dictionary[pred]] += arsenal.weights_[i]
+    y_proba /= np.sum(arsenal.weights_)
+
+    np.testing.assert_array_almost_equal(
+        arsenal.predict_proba(X_test), y_proba, decimal=6
+    )
@@ -181,10 +181,10 @@ unit_test_proba["HIVECOTEV1"] = np.array(
 unit_test_proba["HIVECOTEV2"] = np.array(
     [
         [0.0, 1.0],
-        [0.4563, 0.5437],
+        [0.7138, 0.2862],
         [0.0379, 0.9621],
         [1.0, 0.0],
-        [0.719, 0.281],
+        [0.8477, 0.1523],
         [1.0, 0.0],
         [0.8477, 0.1523],
         [0.0379, 0.9621],
@@ -293,7 +293,7 @@ unit_test_proba["RocketClassifier"] = np.array(
 unit_test_proba["ShapeletTransformClassifier"] = np.array(
     [
         [0.0, 1.0],
-        [0.6, 0.4],
+        [0.4, 0.6],
         [0.0, 1.0],
         [1.0, 0.0],
         [1.0, 0.0],
@@ -475,15 +475,15 @@ basic_motions_proba["RocketClassifier"] = np.array(
 )
 basic_motions_proba["ShapeletTransformClassifier"] = np.array(
     [
-        [0.0, 0.0, 0.2, 0.8],
-        [0.2, 0.8, 0.0, 0.0],
-        [0.0, 0.2, 0.6, 0.2],
+        [0.2, 0.0, 0.0, 0.8],
+        [0.2, 0.6, 0.2, 0.0],
+        [0.0, 0.4, 0.6, 0.0],
+        [0.2, 0.4, 0.4, 0.0],
+        [0.2, 0.2, 0.0, 0.6],
+        [0.0, 0.0, 0.0, 1.0],
+        [0.2, 0.4, 0.4, 0.0],
+        [0.2, 0.0, 0.6, 0.2],
+        [0.0, 0.4, 0.6, 0.0],
         [0.0, 0.8, 0.2, 0.0],
-        [0.0, 0.0, 0.2, 0.8],
-        [0.0, 0.0, 0.2, 0.8],
-        [0.2, 0.6, 0.0, 0.2],
-        [0.0, 0.2, 0.8, 0.0],
-        [0.2, 0.6, 0.0, 0.2],
-        [0.2, 0.6, 0.0, 0.2],
     ]
 )
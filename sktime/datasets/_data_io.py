@@ -40,6 +40,7 @@ import pandas as pd
 from sktime.datatypes import (
     MTYPE_LIST_HIERARCHICAL,
     MTYPE_LIST_PANEL,
+    LazyPanel,
     check_is_scitype,
     convert,
     convert_to,
@@ -210,8 +211,11 @@ def _load_dataset(name, split, return_X_y, return_type=None, extract_path=None):
                     f"https://timeseriesclassification.com/.",
                 ) from e
 
+    # downloaded data sets keep a binary cache, baked in ones are read from the .ts
+    cache = extract_path is not None or local_dirname != DIRNAME
+
     return _load_provided_dataset(
-        name, split, return_X_y, return_type, local_module, local_dirname
+        name, split, return_X_y, return_type, local_module, local_dirname, cache
     )
 
 
@@ -222,6 +226,8 @@ def _load_provided_dataset(
     return_type=None,
     local_module=MODULE,
     local_dirname=DIRNAME,
+    cache=False,
+    lazy=False,
 ):
     """Load baked in time series classification datasets (helper function).
 
@@ -249,10 +255,17 @@ def _load_provided_dataset(
         Exception is raised if the data cannot be stored in the requested type.
     local_module: default = os.path.dirname(__file__),
     local_dirname: default = "data"
+    cache: bool, default = False
+        whether to keep a binary cache of the .ts files, see ``load_from_tsfile``
+    lazy: bool, default = False
+        whether to return X as ``LazyPanel``, see ``load_from_tsfile``
+        if True, ``return_type`` is ignored, and ``return_X_y`` must be True
+        out-of-core only if also ``cache=True``
 
     Returns
     -------
     X: sktime data container, following mtype specification `return_type`
+        or ``LazyPanel`` if ``lazy=True``
         The time series data for the problem, with n instances
     y: 1D numpy array of length n, only returned if return_X_y if True
         The class labels for each time series instance in X
@@ -261,30 +274,46 @@ def _load_provided_dataset(
     if isinstance(split, str):
         split = split.upper()
 
-    if split in ("TRAIN", "TEST"):
+    if lazy and not return_X_y:
+        raise ValueError("lazy=True requires return_X_y=True")
+
+    return_type = _alias_mtype_check(return_type)
+    # numpy return types are loaded as numpy3D, avoiding the nested_univ detour
+    if return_X_y and return_type in ["numpy3D", "numpyflat"]:
+        inner_type = "numpy3D"
+    else:
+        inner_type = "nested_univ"
+
+    def _load_split(split):
         fname = name + "_" + split + ".ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X, y = load_from_tsfile(abspath, return_data_type="nested_univ")
+        return load_from_tsfile(
+            abspath, return_data_type=inner_type, cache=cache, lazy=lazy
+        )
+
+    if split in ("TRAIN", "TEST"):
+        X, y = _load_split(split)
     # if split is None, load both train and test set
     elif split is None:
-        fname = name + "_TRAIN.ts"
-        abspath = os.path.join(local_module, local_dirname, name, fname)
-        X_train, y_train = load_from_tsfile(abspath, return_data_type="nested_univ")
-
-        fname = name + "_TEST.ts"
-        abspath = os.path.join(local_module, local_dirname, name, fname)
-        X_test, y_test = load_from_tsfile(abspath, return_data_type="nested_univ")
+        X_train, y_train = _load_split("TRAIN")
+        X_test, y_test = _load_split("TEST")
 
-        X = pd.concat([X_train, X_test])
-        X = X.reset_index(drop=True)
+        if lazy:
+            X = LazyPanel(X_train.arrays + X_test.arrays)
+        elif inner_type == "numpy3D":
+            X = np.concatenate([X_train, X_test])
+        else:
+            X = pd.concat([X_train, X_test])
+            X = X.reset_index(drop=True)
         y = np.concatenate([y_train, y_test])
 
     else:
         raise ValueError("Invalid `split` value =", split)
 
-    return_type = _alias_mtype_check(return_type)
-    if return_X_y:
-        X = convert(X, from_type="nested_univ", to_type=return_type)
+    if lazy:
+        return X, y
+    elif return_X_y:
+        X = convert(X, from_type=inner_type, to_type=return_type)
         return X, y
     else:
         X["class_val"] = pd.Series(y)
@@ -376,11 +405,164 @@ def _read_header(file, full_file_path_and_name):
     )
 
 
+def _read_tsfile_to_numpy3d(full_file_path_and_name, replace_missing_vals_with="NaN"):
+    """Read equal length .ts file without timestamps into numpy3D, vectorized.
+
+    Fast path of ``load_from_tsfile``. Tokenizes all data lines at once, and parses
+    the values with a single numpy call into a preallocated 3D np.ndarray,
+    instead of building one pd.Series per instance and dimension.
+
+    Parameters
+    ----------
+    full_file_path_and_name : str
+        The full pathname and file name of the .ts file to read.
+    replace_missing_vals_with : str, default NaN
+       The value that missing values in the text file should be replaced with prior
+       to parsing.
+
+    Returns
+    -------
+    X : 3D np.ndarray of shape (n_instances, n_dimensions, series_length), or None
+        None if the file is not covered by the fast path, i.e., has timestamps,
+        is not equal length, or is malformed. Such files should be read by
+        ``load_from_tsfile_to_dataframe``, which also raises informative errors.
+    y : 1D np.ndarray of str, or None if the file has no class or target labels
+    """
+    has_labels = None
+    with open(full_file_path_and_name, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip().lower()
+            tokens = line.split(" ")
+            if line.startswith("@timestamps") and tokens[-1] != "false":
+                return None
+            if line.startswith("@equallength") and tokens[-1] != "true":
+                return None
+            if line.startswith("@classlabel") or line.startswith("@targetlabel"):
+                has_labels = len(tokens) > 1 and tokens[1] == "true"
+            if line.startswith("@data"):
+                break
+        else:
+            return None
+        text = file.read()
+
+    if has_labels is None:
+        return None
+
+    text = text.lower().replace("?", replace_missing_vals_with)
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line in lines if line]
+    if len(lines) == 0:
+        return None
+
+    if has_labels:
+        lines = [line.rsplit(":", 1) for line in lines]
+        if any(len(line) != 2 for line in lines):
+            return None
+        y = np.asarray([line[1].strip() for line in lines])
+        lines = [line[0] for line in lines]
+    else:
+        y = None
+
+    # all dimensions of all instances must have the same number of values
+    n_instances = len(lines)
+    n_dims = lines[0].count(":") + 1
+    dims = [dim for line in lines for dim in line.split(":")]
+    n_commas = {dim.count(",") for dim in dims}
+    if len(dims) != n_instances * n_dims or len(n_commas) != 1:
+        return None
+    series_length = n_commas.pop() + 1
+
+    try:
+        X = np.array(",".join(dims).split(","), dtype="float")
+    except ValueError:
+        return None
+
+    X = X.reshape(n_instances, n_dims, series_length)
+    return X, y
+
+
+def _load_tsfile_to_numpy3d(
+    full_file_path_and_name, replace_missing_vals_with="NaN", cache=False
+):
+    """Load equal length .ts file into numpy3D, optionally via binary sidecar cache.
+
+    If ``cache=True``, the parsed data are stored next to the .ts file, in
+    ``<file>.X.npy``, ``<file>.y.npy`` and ``<file>.json`` (meta data).
+    Later loads memory-map ``<file>.X.npy`` instead of parsing the .ts file,
+    as long as size and modification time of the .ts file are unchanged.
+    If the cache files cannot be written, the data are returned without caching.
+
+    Parameters
+    ----------
+    full_file_path_and_name : str
+        The full pathname and file name of the .ts file to read.
+    replace_missing_vals_with : str, default NaN
+       The value that missing values in the text file should be replaced with prior
+       to parsing.
+    cache : bool, default False
+        whether to read from and write to the binary sidecar cache.
+
+    Returns
+    -------
+    same as ``_read_tsfile_to_numpy3d``
+        X is a copy-on-write ``np.memmap`` if the cache could be used
+    """
+    if not cache:
+        return _read_tsfile_to_numpy3d(
+            full_file_path_and_name, replace_missing_vals_with
+        )
+
+    import json
+
+    stat = os.stat(full_file_path_and_name)
+    cache_meta = {
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "replace_missing_vals_with": replace_missing_vals_with,
+    }
+    meta_path = full_file_path_and_name + ".json"
+    X_path = full_file_path_and_name + ".X.npy"
+    y_path = full_file_path_and_name + ".y.npy"
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as meta_file:
+            stored_meta = json.load(meta_file)
+        has_y = stored_meta.pop("has_y")
+        if stored_meta == cache_meta:
+            X = np.load(X_path, mmap_mode="c")
+            y = np.load(y_path) if has_y else None
+            return X, y
+    except (OSError, ValueError, KeyError):
+        pass
+
+    X_y = _read_tsfile_to_numpy3d(full_file_path_and_name, replace_missing_vals_with)
+    if X_y is None:
+        return None
+
+    X, y = X_y
+    try:
+        np.save(X_path, X)
+        if y is not None:
+            np.save(y_path, y)
+        cache_meta["has_y"] = y is not None
+        # meta data are written last, so incomplete caches are never read
+        with open(meta_path, "w", encoding="utf-8") as meta_file:
+            json.dump(cache_meta, meta_file)
+        # release the parsed copy, continue on the memory-mapped one
+        X = np.load(X_path, mmap_mode="c")
+    except OSError:
+        pass
+
+    return X, y
+
+
 def load_from_tsfile(
     full_file_path_and_name,
     replace_missing_vals_with="NaN",
     return_y=True,
     return_data_type="nested_univ",
+    cache=False,
+    lazy=False,
 ):
     """Load time series .ts file into X and (optionally) y.
 
@@ -408,10 +590,25 @@ def load_from_tsfile(
             "numpy2d"/"np2d"/"numpyflat": 2D np.ndarray (instance, time index)
             "pd-multiindex": pd.DataFrame with 2-level (instance, time) MultiIndex
         Exception is raised if the data cannot be stored in the requested type.
+    cache : boolean, default False
+        whether to keep a binary copy of the data next to the .ts file, in
+        ``<file>.X.npy``, ``<file>.y.npy`` and ``<file>.json``.
+        If True, later loads of the unchanged file memory-map the binary copy
+        instead of parsing the .ts file. Applies to equal length files without
+        timestamps, which are parsed directly into numpy3D.
+    lazy : boolean, default False
+        whether to return X as ``LazyPanel``, in which case ``return_data_type`` is
+        ignored. Requires equal length series without timestamps. ``LazyPanel``
+        supports ``len``, instance slicing and iteration over instance batches,
+        and is accepted by classifiers and transformers.
+        ``lazy`` does not imply ``cache``. If ``cache=True``, the ``LazyPanel`` is an
+        out-of-core handle on the memory-mapped binary copy of the data, otherwise
+        it wraps the data parsed into memory, and no files are written.
 
     Returns
     -------
-    X : sktime compatible in-memory container of mtype return_data_type
+    X : sktime compatible in-memory container of mtype return_data_type,
+        or ``LazyPanel`` if ``lazy=True``
         for list of mtypes, see datatypes.SCITYPE_REGISTER
         for specifications, see examples/AA_datatypes_and_datasets.ipynb
     y : returned only if return_y=True, np.ndarray
@@ -425,6 +622,8 @@ def load_from_tsfile(
     ValueError if return_data_type = numpy3d but the data are unequal length series
     ValueError if return_data_type = numpy2d but the data are multivariate and/
     or unequal length series
+    ValueError if lazy = True but the data are unequal length series or have
+    timestamps
     """
     return_data_type = _alias_mtype_check(return_data_type)
 
@@ -440,14 +639,36 @@ def load_from_tsfile(
             f"but found {return_data_type}"
         )
 
-    # Initialize flags and variables used when parsing the file
-    X, y = load_from_tsfile_to_dataframe(
-        full_file_path_and_name=full_file_path_and_name,
-        return_separate_X_and_y=True,
+    # equal length files without timestamps are parsed directly into numpy3D
+    X_y = _load_tsfile_to_numpy3d(
+        full_file_path_and_name,
         replace_missing_vals_with=replace_missing_vals_with,
+        cache=cache,
     )
 
-    X = convert(X, from_type="nested_univ", to_type=return_data_type)
+    if lazy:
+        if X_y is None:
+            raise ValueError(
+                "lazy=True requires equal length series without timestamps, "
+                f"but {full_file_path_and_name} cannot be read into numpy3D"
+            )
+        X, y = X_y
+        X = LazyPanel(X)
+    elif X_y is not None and X_y[1] is not None:
+        X, y = X_y
+        if return_data_type not in ["numpy3D", "numpyflat"]:
+            X = convert(X, from_type="numpy3D", to_type="nested_univ")
+            X.columns = [f"dim_{i}" for i in range(X.shape[1])]
+            X = convert(X, from_type="nested_univ", to_type=return_data_type)
+        elif return_data_type == "numpyflat":
+            X = convert(X, from_type="numpy3D", to_type="numpyflat")
+    else:
+        X, y = load_from_tsfile_to_dataframe(
+            full_file_path_and_name=full_file_path_and_name,
+            return_separate_X_and_y=True,
+            replace_missing_vals_with=replace_missing_vals_with,
+        )
+        X = convert(X, from_type="nested_univ", to_type=return_data_type)
 
     if return_y:
         return X, y
@@ -31,7 +31,7 @@ from sktime.datasets._data_io import (
     _convert_tsf_to_hierarchical,
     _load_provided_dataset,
 )
-from sktime.datatypes import check_is_mtype, scitype_to_mtype
+from sktime.datatypes import LazyPanel, check_is_mtype, convert_to, scitype_to_mtype
 
 # using this and not a direct import
 # in order to avoid mtypes that require soft dependencies
@@ -175,6 +175,187 @@ def test_load_from_tsfile():
     assert X.shape == (270, 12) and y.shape == (270,)
 
 
+_TS_HEADER = """@problemName {name}
+@timeStamps false
+@missing true
+@univariate {univariate}
+@equalLength {equal_length}
+@classLabel true Yes No a B
+@data
+"""
+
+# .ts files for test_load_from_tsfile_matches_dataframe_loader, as (header, data)
+_TS_FILES = {
+    "missing_univariate": (
+        {"univariate": "true", "equal_length": "true"},
+        "1.0,?,3.5,4:Yes\n?,2.25,3,4:No\n5,6,7,?:Yes\n",
+    ),
+    "missing_multivariate": (
+        {"univariate": "false", "equal_length": "true"},
+        "1.0,?,3.5,4:2,2,?,1:Yes\n?,2.25,3,4:1e-3,2,3,-4.5:No\n5,6,7,?:?,?,?,?:a\n",
+    ),
+    "ragged_univariate": (
+        {"univariate": "true", "equal_length": "false"},
+        "1,2,3:a\n4,?,6,7,8:B\n?,1:a\n",
+    ),
+    "ragged_multivariate": (
+        {"univariate": "false", "equal_length": "false"},
+        "1,2,3:4,5,6:a\n4,?,6,7,8:1,2,3,4,5:B\n?,1:2,?:a\n",
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "ts_file",
+    sorted(_TS_FILES.keys())
+    + [
+        "ArrowHead/ArrowHead_TRAIN.ts",
+        "BasicMotions/BasicMotions_TEST.ts",
+        "Covid3Month/Covid3Month_TRAIN.ts",
+        "JapaneseVowels/JapaneseVowels_TRAIN.ts",
+        "PLAID/PLAID_TRAIN.ts",
+    ],
+)
+def test_load_from_tsfile_matches_dataframe_loader(ts_file, tmp_path):
+    """Test load_from_tsfile returns the same as load_from_tsfile_to_dataframe.
+
+    Equal length files are parsed by the numpy3D fast path of load_from_tsfile,
+    other files fall back to load_from_tsfile_to_dataframe. In both cases, X and y
+    must be the same as returned by load_from_tsfile_to_dataframe.
+    """
+    from sktime.datasets._data_io import _read_tsfile_to_numpy3d
+
+    if ts_file in _TS_FILES:
+        header, data = _TS_FILES[ts_file]
+        path = str(tmp_path / f"{ts_file}.ts")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_TS_HEADER.format(name=ts_file, **header) + data)
+        equal_length = header["equal_length"] == "true"
+    else:
+        path = os.path.join(MODULE, "data", ts_file)
+        equal_length = ts_file.split("/")[0] not in ["JapaneseVowels", "PLAID"]
+
+    X_y_fast = _read_tsfile_to_numpy3d(path)
+    assert (X_y_fast is not None) == equal_length
+
+    X_expected, y_expected = load_from_tsfile_to_dataframe(path)
+
+    X, y = load_from_tsfile(path)
+    assert_frame_equal(
+        convert_to(X, "pd-multiindex"), convert_to(X_expected, "pd-multiindex")
+    )
+    assert list(X.columns) == list(X_expected.columns)
+    np.testing.assert_array_equal(y, y_expected)
+
+    if equal_length:
+        X_fast, y_fast = X_y_fast
+        np.testing.assert_array_equal(X_fast, convert_to(X_expected, "numpy3D"))
+        np.testing.assert_array_equal(y_fast, y_expected)
+
+
+def test_load_from_tsfile_cache(tmp_path):
+    """Test loading TS files via the binary sidecar cache.
+
+    Test
+    1. first load parses the .ts file and writes the cache, identical to no cache
+    2. second load memory-maps the cache, identical values
+    3. cache is invalidated and rewritten if the .ts file changes
+    """
+    data_path = MODULE + "/data/BasicMotions/BasicMotions_TRAIN.ts"
+    ts_path = str(tmp_path / "BasicMotions_TRAIN.ts")
+    with open(data_path, "r", encoding="utf-8") as f:
+        ts_text = f.read()
+    with open(ts_path, "w", encoding="utf-8") as f:
+        f.write(ts_text)
+
+    X_expected, y_expected = load_from_tsfile(data_path, return_data_type="numpy3D")
+
+    X, y = load_from_tsfile(ts_path, return_data_type="numpy3D", cache=True)
+    assert os.path.exists(ts_path + ".X.npy")
+    np.testing.assert_array_equal(X, X_expected)
+    np.testing.assert_array_equal(y, y_expected)
+
+    X, y = load_from_tsfile(ts_path, return_data_type="numpy3D", cache=True)
+    assert isinstance(X, np.memmap)
+    np.testing.assert_array_equal(X, X_expected)
+    np.testing.assert_array_equal(y, y_expected)
+
+    X_nested, _ = load_from_tsfile(ts_path, cache=True)
+    assert_frame_equal(
+        convert_to(X_nested, "pd-multiindex"),
+        load_from_tsfile(data_path, return_data_type="pd-multiindex")[0],
+    )
+
+    # drop the last instance, the cache should not be used any more
+    with open(ts_path, "w", encoding="utf-8") as f:
+        f.write(ts_text.strip().rsplit("\n", 1)[0])
+    X, y = load_from_tsfile(ts_path, return_data_type="numpy3D", cache=True)
+    assert X.shape == (39, 6, 100) and y.shape == (39,)
+    assert np.load(ts_path + ".X.npy", mmap_mode="r").shape == (39, 6, 100)
+
+
+def test_load_from_tsfile_lazy(tmp_path):
+    """Test out-of-core loading of TS files into LazyPanel."""
+    data_dir = tmp_path / "BasicMotions"
+    data_dir.mkdir()
+    for split in ["TRAIN", "TEST"]:
+        fname = f"BasicMotions_{split}.ts"
+        with open(MODULE + "/data/BasicMotions/" + fname, "r", encoding="utf-8") as f:
+            (data_dir / fname).write_text(f.read(), encoding="utf-8")
+
+    X_expected, y_expected = load_from_tsfile(
+        MODULE + "/data/BasicMotions/BasicMotions_TRAIN.ts",
+        return_data_type="numpy3D",
+    )
+
+    # lazy does not imply cache, no files are written next to the .ts file
+    X, y = load_from_tsfile(str(data_dir / "BasicMotions_TRAIN.ts"), lazy=True)
+    assert isinstance(X, LazyPanel)
+    assert not isinstance(X.arrays[0], np.memmap)
+    assert sorted(os.listdir(data_dir)) == [
+        "BasicMotions_TEST.ts",
+        "BasicMotions_TRAIN.ts",
+    ]
+    np.testing.assert_array_equal(X.to_numpy(), X_expected)
+    np.testing.assert_array_equal(y, y_expected)
+
+    X, y = _load_provided_dataset(
+        "BasicMotions", local_module=str(tmp_path), local_dirname="", lazy=True
+    )
+    assert len(X) == 80
+    assert len(os.listdir(data_dir)) == 2
+
+    # with cache, X is memory-mapped from the binary copy
+    X, y = load_from_tsfile(
+        str(data_dir / "BasicMotions_TRAIN.ts"), lazy=True, cache=True
+    )
+    assert isinstance(X, LazyPanel)
+    assert isinstance(X.arrays[0], np.memmap)
+    assert len(X) == 40 and X.shape == (40, 6, 100)
+    np.testing.assert_array_equal(X[3:7], X_expected[3:7])
+    np.testing.assert_array_equal(y, y_expected)
+
+    X, y = _load_provided_dataset(
+        "BasicMotions",
+        local_module=str(tmp_path),
+        local_dirname="",
+        lazy=True,
+        cache=True,
+    )
+    assert isinstance(X.arrays[1], np.memmap)
+    X_expected, y_expected = _load_provided_dataset(
+        "BasicMotions", return_type="numpy3D"
+    )
+    assert len(X) == 80
+    np.testing.assert_array_equal(X.to_numpy(), X_expected)
+    np.testing.assert_array_equal(y, y_expected)
+    np.testing.assert_array_equal(X[[0, 39, 40, -1]], X_expected[[0, 39, 40, -1]])
+    assert [len(batch) for batch in X.iter_batches(batch_size=30)] == [30, 30, 20]
+
+    with pytest.raises(ValueError, match="return_X_y"):
+        _load_provided_dataset("BasicMotions", return_X_y=False, lazy=True)
+
+
 def test_load_UCR_UEA_dataset():
     """Tests load_UCR_UEA_dataset correctly loads a baked in data set.
 
@@ -3,6 +3,7 @@
 
 __author__ = ["fkiraly"]
 
+from sktime.datatypes._cache import check_convert_cache
 from sktime.datatypes._check import (
     check_is_mtype,
     check_is_scitype,
@@ -12,6 +13,7 @@ from sktime.datatypes._check import (
 )
 from sktime.datatypes._convert import convert, convert_to
 from sktime.datatypes._examples import get_examples
+from sktime.datatypes._lazy import LazyPanel
 from sktime.datatypes._registry import (
     ALL_TIME_SERIES_MTYPES,
     MTYPE_LIST_HIERARCHICAL,
@@ -30,6 +32,7 @@ from sktime.datatypes._vectorize import VectorizedDF
 
 __all__ = [
     "ALL_TIME_SERIES_MTYPES",
+    "check_convert_cache",
     "check_is_mtype",
     "check_is_scitype",
     "check_raise",
@@ -38,6 +41,7 @@ __all__ = [
     "mtype",
     "get_cutoff",
     "get_examples",
+    "LazyPanel",
     "mtype_to_scitype",
     "MTYPE_REGISTER",
     "MTYPE_LIST_HIERARCHICAL",
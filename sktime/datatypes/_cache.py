@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+"""Memoization of mtype checks and conversions, keyed by object identity.
+
+Contains the check_convert_cache context manager, and the cache it activates.
+"""
+
+__all__ = ["check_convert_cache"]
+
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+
+from sktime.datatypes._common import _metadata_requested
+
+# the active cache is thread-local, so parallel workers never share one
+_active = threading.local()
+
+# placeholder for conversion results that are the converted object itself
+_SELF = object()
+
+# metadata fields that depend on the values of an object, which can change in place
+#   without changing the fingerprint of the object, these are never cached
+_VALUE_METADATA = {"has_nans"}
+
+
+def _isna_any(obj):
+    return obj.isna().values.any()
+
+
+def _isnull_any(obj):
+    return pd.isnull(obj).any()
+
+
+def _nested_has_nans(obj):
+    from sktime.datatypes._panel._check import _nested_dataframe_has_nans
+
+    return _nested_dataframe_has_nans(obj)
+
+
+# has_nans of objects known to be valid for a check, computed as by the checker,
+#   without running the checker; checks not listed here run the checker
+_HAS_NANS = {
+    ("pd.DataFrame", "Series"): _isna_any,
+    ("pd.Series", "Series"): _isna_any,
+    ("np.ndarray", "Series"): _isnull_any,
+    ("numpy3D", "Panel"): _isnull_any,
+    ("pd-multiindex", "Panel"): _isna_any,
+    ("nested_univ", "Panel"): _nested_has_nans,
+    ("numpyflat", "Panel"): lambda obj: np.isnan(obj).any(),
+    ("pd_multiindex_hier", "Hierarchical"): _isna_any,
+    ("pd_DataFrame_Table", "Table"): _isna_any,
+    ("pd_Series_Table", "Table"): _isna_any,
+    ("numpy1D", "Table"): _isnull_any,
+    ("numpy2D", "Table"): _isnull_any,
+    ("pred_quantiles", "Proba"): _isna_any,
+    ("pred_interval", "Proba"): _isna_any,
+}
+
+
+def _get_active_cache():
+    """Return the active _CheckConvertCache of this thread, or None."""
+    return getattr(_active, "cache", None)
+
+
+@contextmanager
+def check_convert_cache(maxsize=64):
+    """Memoize mtype checks and conversions of the same objects, within the context.
+
+    Inside the context, ``check_is_mtype``, ``check_is_scitype``, ``mtype`` and
+    ``convert_to`` remember their results per object identity, so repeated checks
+    and conversions of the same, unchanged object are cheaper.
+    This is the case for data passed between steps of pipelines,
+    therefore the public methods of forecasters and transformers run in this context.
+
+    Whether an object is valid for an mtype is cached separately from metadata.
+    Metadata which depends on the values of an object, i.e., ``has_nans``,
+    is not cached, since values can change in place; for common mtypes it is
+    recomputed directly on a cache hit, without running the full check.
+    Mtype inference still checks all candidate mtypes, so objects valid for more
+    than one mtype raise the same error as outside the context.
+
+    Repeated conversions return a copy of the cached conversion result, so callers
+    never share a converted object. Copying is not free: it is a copy of the data,
+    which is cheaper than the conversion for most, but not all, pairs of mtypes.
+
+    Objects are referenced weakly, their entries are evicted when they are garbage
+    collected, when more than ``maxsize`` objects are cached (least recently used
+    first), or when their shape, dtypes, index or columns change. All entries are
+    dropped when the outermost context is left; nested contexts share the outermost
+    cache.
+
+    Parameters
+    ----------
+    maxsize : int, optional, default=64
+        maximum number of objects with cached results
+
+    Yields
+    ------
+    cache : object with ``hits`` and ``misses`` attributes, int,
+        the number of check and conversion calls served from, or not from, cache
+
+    Examples
+    --------
+    >>> from sktime.datatypes import check_convert_cache, check_is_scitype
+    >>> from sktime.datatypes import get_examples
+    >>> X = get_examples(mtype="pd-multiindex", as_scitype="Panel")[0]
+    >>> with check_convert_cache() as cache:
+    ...     _ = check_is_scitype(X, scitype="Panel")
+    ...     _ = check_is_scitype(X, scitype="Panel")
+    >>> cache.hits > 0
+    True
+    """
+    cache = _get_active_cache()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = _CheckConvertCache(maxsize=maxsize)
+    _active.cache = cache
+    try:
+        yield cache
+    finally:
+        _active.cache = None
+        cache.clear()
+
+
+def _check_convert_cached(method):
+    """Decorate method to run in a check_convert_cache context."""
+
+    @wraps(method)
+    def cached_method(*args, **kwargs):
+        with check_convert_cache():
+            return method(*args, **kwargs)
+
+    return cached_method
+
+
+def _fingerprint(obj):
+    """Return cheap fingerprint of obj, changes with shape, dtypes, index, columns.
+
+    Values of obj are not part of the fingerprint, see _VALUE_METADATA.
+    """
+    if isinstance(obj, pd.DataFrame):
+        # obj.dtypes builds a pd.Series on every call, the block manager is cheaper
+        mgr = getattr(obj, "_mgr", None)
+        if hasattr(mgr, "get_dtypes"):
+            dtypes = tuple(mgr.get_dtypes())
+        else:
+            dtypes = tuple(obj.dtypes)
+    else:
+        dtypes = getattr(obj, "dtype", None)
+    return (
+        type(obj),
+        getattr(obj, "shape", None),
+        dtypes,
+        id(getattr(obj, "index", None)),
+        id(getattr(obj, "columns", None)),
+    )
+
+
+class _CheckConvertCache:
+    """Cache of check and conversion results, keyed by object identity.
+
+    Parameters
+    ----------
+    maxsize : int
+        maximum number of objects with cached results, least recently used
+        objects are evicted first
+
+    Attributes
+    ----------
+    hits : int, number of lookups served from cache
+    misses : int, number of lookups not served from cache
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def clear(self):
+        """Drop all cached entries, counters are kept."""
+        self._entries.clear()
+
+    def __len__(self):
+        """Return number of objects with cached results."""
+        return len(self._entries)
+
+    def __repr__(self):
+        """Return string representation of self."""
+        return (
+            f"_CheckConvertCache(hits={self.hits}, misses={self.misses}, "
+            f"size={len(self)}, maxsize={self.maxsize})"
+        )
+
+    def _evict(self, key, ref):
+        """Weakref callback, drop entry of a garbage collected object."""
+        entry = self._entries.get(key)
+        if entry is not None and entry["ref"] is ref:
+            del self._entries[key]
+
+    def _get_entry(self, obj, create=False):
+        """Return cache entry of obj, optionally create it; None if not available."""
+        key = id(obj)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry["ref"]() is obj and entry["fingerprint"] == _fingerprint(obj):
+                self._entries.move_to_end(key)
+                return entry
+            # obj has changed, or id was reused
+            del self._entries[key]
+
+        if not create:
+            return None
+        try:
+            ref = weakref.ref(obj, lambda ref, key=key: self._evict(key, ref))
+        except TypeError:
+            # obj cannot be referenced weakly, e.g., list or dict, not cached
+            return None
+
+        entry = {
+            "ref": ref,
+            "fingerprint": _fingerprint(obj),
+            "checks": dict(),
+            "conversions": dict(),
+        }
+        self._entries[key] = entry
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def checks_of(self, obj):
+        """Return cached check results of obj, as ``_ObjectChecks``.
+
+        The fingerprint of obj is computed once here, so the returned object should
+        only be used while obj is not changed, e.g., within one call of a checker.
+        """
+        entry = self._get_entry(obj, create=True)
+        checks = entry["checks"] if entry is not None else None
+        return _ObjectChecks(self, obj, checks)
+
+    def set_check(self, obj, check_key, return_metadata, var_name, res):
+        """Store result of a single check of obj, as ``_ObjectChecks.set``."""
+        self.checks_of(obj).set(check_key, return_metadata, var_name, res)
+
+    def get_conversion(self, obj, conversion_key, store=None):
+        """Look up result of converting obj.
+
+        Parameters
+        ----------
+        obj : object that was converted
+        conversion_key : hashable, identifies the conversion, e.g., target mtype
+        store : dict or None, converter store, reset and filled as by the conversion
+
+        Returns
+        -------
+        found : bool, whether the result could be served from the cache
+        converted : copy of converted obj, if found, otherwise None
+            obj itself, if the conversion returned obj itself
+        """
+        entry = self._get_entry(obj)
+        cached = entry["conversions"].get(conversion_key) if entry else None
+
+        if cached is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+
+        converted, store_after, check_key = cached
+        if converted is _SELF:
+            converted = obj
+        else:
+            # callers may modify the converted object, so each gets its own copy
+            converted = _copy(converted)
+            if check_key is not None:
+                self.set_check(converted, check_key, False, "obj", True)
+        if store is not None:
+            store.clear()
+            if store_after:
+                store.update(deepcopy(store_after))
+        return True, converted
+
+    def set_conversion(
+        self, obj, conversion_key, converted, store=None, check_key=None
+    ):
+        """Store result of converting obj.
+
+        Parameters
+        ----------
+        obj, conversion_key, store : as in ``get_conversion``
+        converted : result of converting obj, a copy is stored,
+            as the caller receives, and may modify, converted
+        check_key : (mtype, scitype) tuple, optional
+            check that copies of converted returned by ``get_conversion`` are
+            known to pass
+        """
+        entry = self._get_entry(obj, create=True)
+        if entry is None:
+            return
+        store_after = deepcopy(store) if store is not None else dict()
+        # no strong reference to obj itself, otherwise it is never evicted
+        if converted is obj:
+            converted = _SELF
+        else:
+            converted = _copy(converted)
+        entry["conversions"][conversion_key] = (converted, store_after, check_key)
+
+
+class _ObjectChecks:
+    """Cached check results of one object, in a _CheckConvertCache.
+
+    Parameters
+    ----------
+    cache : _CheckConvertCache, counts hits and misses
+    obj : object the checks are of
+    checks : dict or None, cached check results of obj, by (mtype, scitype) tuple
+        None if obj cannot be cached
+    """
+
+    def __init__(self, cache, obj, checks):
+        self.cache = cache
+        self.obj = obj
+        self.checks = checks
+
+    def get(self, check_key, return_metadata, var_name):
+        """Look up result of a single check of obj.
+
+        Parameters
+        ----------
+        check_key : (mtype, scitype) tuple of the check
+        return_metadata, var_name : as in the checker functions
+
+        Returns
+        -------
+        found : bool, whether the result could be served from the cache
+        res : return of the checker function, if found, otherwise None
+        """
+        cached = self.checks.get(check_key) if self.checks is not None else None
+        res = _from_cached(self.obj, check_key, cached, return_metadata, var_name)
+
+        if res is None:
+            self.cache.misses += 1
+            return False, None
+        self.cache.hits += 1
+        return True, res
+
+    def set(self, check_key, return_metadata, var_name, res):
+        """Store result of a single check of obj, arguments as in ``get``."""
+        if self.checks is None:
+            return
+
+        cached = self.checks.get(check_key)
+        if cached is None:
+            cached = {"valid": None, "msg": dict(), "metadata": None, "requested": None}
+            self.checks[check_key] = cached
+
+        if not _metadata_requested(return_metadata):
+            cached["valid"] = res
+            return
+
+        valid, msg, metadata = res
+        cached["valid"] = valid
+        if not valid:
+            # error messages contain var_name
+            cached["msg"][var_name] = msg
+            return
+
+        metadata = {
+            key: value for key, value in metadata.items() if key not in _VALUE_METADATA
+        }
+        requested = _requested_keys(return_metadata)
+        if requested != "all":
+            requested = requested.difference(_VALUE_METADATA)
+
+        # merge with previously computed metadata of the same check
+        if cached["requested"] is not None:
+            metadata = {**cached["metadata"], **metadata}
+            if "all" in (requested, cached["requested"]):
+                requested = "all"
+            else:
+                requested = requested.union(cached["requested"])
+        cached["metadata"] = metadata
+        cached["requested"] = requested
+
+
+def _copy(obj):
+    """Return copy of obj that shares no mutable data with obj.
+
+    Arrays and pandas objects without object columns are copied via their ``copy``
+    method, which copies the data only. Other objects, e.g., nested_univ data frames
+    which hold a pd.Series per cell, are deep copied.
+    """
+    if isinstance(obj, np.ndarray) and obj.dtype != "object":
+        return obj.copy()
+    if isinstance(obj, pd.Series) and obj.dtype != "object":
+        return obj.copy(deep=True)
+    if isinstance(obj, pd.DataFrame) and "object" not in set(obj.dtypes.astype(str)):
+        return obj.copy(deep=True)
+    if isinstance(obj, list):
+        return [_copy(x) for x in obj]
+    return deepcopy(obj)
+
+
+def _requested_keys(return_metadata):
+    """Normalize return_metadata to "all", or set of requested keys."""
+    if return_metadata is True:
+        return "all"
+    if isinstance(return_metadata, str):
+        return {return_metadata}
+    return set(return_metadata)
+
+
+def _from_cached(obj, check_key, cached, return_metadata, var_name):
+    """Return check result from cached check result, or None if not covered.
+
+    Value metadata, see ``_VALUE_METADATA``, are computed from obj via ``_HAS_NANS``
+    if requested, if this is not possible, None is returned.
+    """
+    if cached is None or cached["valid"] is None:
+        return None
+    valid = cached["valid"]
+
+    if not _metadata_requested(return_metadata):
+        return valid
+
+    if not valid:
+        msg = cached["msg"].get(var_name)
+        if msg is None:
+            return None
+        return False, msg, None
+
+    if cached["requested"] is None:
+        return None
+    requested = _requested_keys(return_metadata)
+    if requested == "all":
+        if cached["requested"] != "all":
+            return None
+        value_keys = _VALUE_METADATA
+    else:
+        value_keys = requested.intersection(_VALUE_METADATA)
+        structure_keys = requested.difference(_VALUE_METADATA)
+        if cached["requested"] != "all" and not structure_keys.issubset(
+            cached["requested"]
+        ):
+            return None
+
+    metadata = dict(cached["metadata"])
+    if value_keys:
+        has_nans = _HAS_NANS.get(check_key)
+        if has_nans is None:
+            return None
+        metadata["has_nans"] = has_nans(obj)
+    return True, None, metadata
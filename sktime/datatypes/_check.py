@@ -29,6 +29,7 @@ from typing import List, Union
 import numpy as np
 
 from sktime.datatypes._alignment import check_dict_Alignment
+from sktime.datatypes._cache import _get_active_cache
 from sktime.datatypes._common import _metadata_requested, _ret
 from sktime.datatypes._hierarchical import check_dict_Hierarchical
 from sktime.datatypes._panel import check_dict_Panel
@@ -47,6 +48,44 @@ check_dict.update(check_dict_Table)
 check_dict.update(check_dict_Proba)
 
 
+def _checks_of(obj):
+    """Return cached check results of obj, or None if no check/convert cache is active.
+
+    Returns
+    -------
+    _ObjectChecks or None, see ``_CheckConvertCache.checks_of``
+    """
+    cache = _get_active_cache()
+    if cache is None:
+        return None
+    return cache.checks_of(obj)
+
+
+def _run_check(key, obj, return_metadata, var_name, checks=None):
+    """Run check_dict[key] on obj, served from the check/convert cache if active.
+
+    Parameters
+    ----------
+    key : (mtype, scitype) tuple, key of check_dict
+    obj, return_metadata, var_name : passed to the checker function
+    checks : _ObjectChecks or None, optional, default=None
+        cached check results of obj, as returned by ``_checks_of(obj)``
+        if None, the cache is not used
+
+    Returns
+    -------
+    return of check_dict[key]
+    """
+    if checks is None:
+        return check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+
+    found, res = checks.get(key, return_metadata, var_name)
+    if not found:
+        res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+        checks.set(key, return_metadata, var_name, res)
+    return res
+
+
 def _check_scitype_valid(scitype: str = None):
     """Check validity of scitype."""
     valid_scitypes = list(set([x[1] for x in check_dict.keys()]))
@@ -158,17 +197,21 @@ def check_is_mtype(
     found_mtype = []
     found_scitype = []
 
+    keys = []
     for m in mtype:
         if scitype is None:
             scitype_of_m = mtype_to_scitype(m)
         else:
             _check_scitype_valid(scitype)
             scitype_of_m = scitype
-        key = (m, scitype_of_m)
         if (m, scitype_of_m) not in valid_keys:
             raise TypeError(f"no check defined for mtype {m}, scitype {scitype_of_m}")
+        keys.append((m, scitype_of_m))
 
-        res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+    checks = _checks_of(obj)
+    for key in keys:
+        m, scitype_of_m = key
+        res = _run_check(key, obj, return_metadata, var_name, checks)
 
         if _metadata_requested(return_metadata):
             check_passed = res[0]
@@ -291,22 +334,10 @@ def mtype(
         m_plus_scitypes = [(x[0], x[1]) for x in m_plus_scitypes if x[1] in as_scitype]
 
     # collects mtypes that are tested as valid for obj
-    mtypes_positive = []
-
-    # collects error messages from mtypes that are tested as invalid for obj
-    mtypes_negative = dict()
-
-    for m_plus_scitype in m_plus_scitypes:
-        valid, msg, _ = check_is_mtype(
-            obj,
-            mtype=m_plus_scitype[0],
-            scitype=m_plus_scitype[1],
-            return_metadata=[],
-        )
-        if valid:
-            mtypes_positive += [m_plus_scitype[0]]
-        else:
-            mtypes_negative[m_plus_scitype[0]] = msg
+    checks = _checks_of(obj)
+    mtypes_positive = [
+        key[0] for key in m_plus_scitypes if _run_check(key, obj, False, "obj", checks)
+    ]
 
     if len(mtypes_positive) > 1:
         raise TypeError(
@@ -315,6 +346,14 @@ def mtype(
         )
 
     if len(mtypes_positive) < 1:
+        # collects error messages from mtypes, all tested as invalid for obj
+        mtypes_negative = dict()
+        for m, scitype in m_plus_scitypes:
+            _, error, _ = check_is_mtype(
+                obj, mtype=m, scitype=scitype, return_metadata=[]
+            )
+            mtypes_negative[m] = error
+
         msg = ""
         for mtype, error in mtypes_negative.items():
             msg += f"{mtype}: {error}\r\n"
@@ -401,8 +440,9 @@ def check_is_scitype(
     found_mtype = []
     found_scitype = []
 
+    checks = _checks_of(obj)
     for key in keys:
-        res = check_dict[key](obj, return_metadata=return_metadata, var_name=var_name)
+        res = _run_check(key, obj, return_metadata, var_name, checks)
 
         if _metadata_requested(return_metadata):
             check_passed = res[0]
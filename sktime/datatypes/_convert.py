@@ -70,6 +70,7 @@ from copy import deepcopy
 import numpy as np
 import pandas as pd
 
+from sktime.datatypes._cache import _get_active_cache
 from sktime.datatypes._check import mtype as infer_mtype
 from sktime.datatypes._hierarchical import convert_dict_Hierarchical
 from sktime.datatypes._panel import convert_dict_Panel
@@ -224,6 +225,16 @@ def convert_to(
     if obj is None:
         return None
 
+    # results are memoized in check_convert_cache contexts,
+    #   unless the conversion reads from or retains contents of store
+    cache = _get_active_cache()
+    use_cache = cache is not None and _store_is_reset(store, store_behaviour)
+    if use_cache:
+        cache_key = (str(to_type), str(as_scitype))
+        found, converted_obj = cache.get_conversion(obj, cache_key, store=store)
+        if found:
+            return converted_obj
+
     # input checks on to_type, as_scitype; coerce to_type, as_scitype to lists
     to_type = _check_str_or_list_of_str(to_type, obj_name="to_type")
 
@@ -269,9 +280,25 @@ def convert_to(
         store_behaviour=store_behaviour,
     )
 
+    # converters return valid objects of to_type, later checks of to_type are cached
+    check_key = (to_type, as_scitype)
+    if use_cache:
+        cache.set_conversion(
+            obj, cache_key, converted_obj, store=store, check_key=check_key
+        )
+    if cache is not None and converted_obj is not obj:
+        cache.set_check(converted_obj, check_key, False, "obj", True)
+
     return converted_obj
 
 
+def _store_is_reset(store, store_behaviour):
+    """Return whether conversion result is independent of prior contents of store."""
+    if store is None or store_behaviour == "reset":
+        return True
+    return store_behaviour in [None, "update"] and store == {}
+
+
 def _conversions_defined(scitype: str):
     """Return an indicator matrix which conversions are defined for scitype.
 
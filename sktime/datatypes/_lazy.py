@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+"""Lazy, out-of-core access to equal length Panel data.
+
+Contains LazyPanel class.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class LazyPanel:
+    """Lazy handle on a numpy3D Panel, with batch-wise access to instances.
+
+    LazyPanel wraps one or more 3D arrays, typically read-only ``np.memmap`` objects
+    backed by binary files on disk, and materializes instances only on access.
+    Multiple arrays are treated as their concatenation along the instance axis,
+    without copying them.
+
+    Estimators accept LazyPanel in ``transform`` (transformers) and in ``predict``,
+    ``predict_proba`` (classifiers), these stream the data through the estimator in
+    batches of ``batch_size`` instances. ``fit`` of classifiers materializes the data.
+
+    Parameters
+    ----------
+    X : 3D np.ndarray or list of 3D np.ndarray
+        of shape (n_instances, n_dimensions, series_length), typically np.memmap
+        if list, all elements must agree in n_dimensions and series_length
+    batch_size : int, optional, default=1000
+        number of instances per batch, when iterating over the panel
+
+    Methods
+    -------
+    len(self) or self.__len__()
+        returns number of instances in the panel
+    self[key] or self.__getitem__(key)
+        returns instances at position key (int, slice or array of int),
+        as in-memory 3D np.ndarray
+    iter(self) or self.__iter__()
+        iterates over batches of ``batch_size`` instances, as 3D np.ndarray
+    iter_batches(batch_size=None)
+        iterates over batches of given size, as 3D np.ndarray
+    to_numpy()
+        returns the full panel as in-memory 3D np.ndarray
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sktime.datatypes import LazyPanel
+    >>> X = LazyPanel([np.zeros((3, 1, 5)), np.ones((2, 1, 5))], batch_size=2)
+    >>> len(X)
+    5
+    >>> X[2:4].shape
+    (2, 1, 5)
+    >>> [batch.shape[0] for batch in X]
+    [2, 2, 1]
+    """
+
+    def __init__(self, X, batch_size=1000):
+        if not isinstance(X, (list, tuple)):
+            X = [X]
+        if len(X) == 0:
+            raise ValueError("LazyPanel requires at least one array")
+        for arr in X:
+            if not hasattr(arr, "ndim") or arr.ndim != 3:
+                raise ValueError(
+                    "LazyPanel arrays must be 3D np.ndarray of shape "
+                    "(n_instances, n_dimensions, series_length)"
+                )
+            if arr.shape[1:] != X[0].shape[1:]:
+                raise ValueError(
+                    "all arrays in LazyPanel must agree in n_dimensions and "
+                    f"series_length, but found shapes {X[0].shape} and {arr.shape}"
+                )
+        if not isinstance(batch_size, (int, np.integer)) or batch_size < 1:
+            raise ValueError(
+                f"batch_size must be a positive int, but found {batch_size}"
+            )
+
+        self.arrays = list(X)
+        self.batch_size = int(batch_size)
+        self._offsets = np.cumsum([0] + [len(arr) for arr in self.arrays])
+
+    @property
+    def shape(self):
+        """Shape of the panel, (n_instances, n_dimensions, series_length)."""
+        return (int(self._offsets[-1]),) + tuple(self.arrays[0].shape[1:])
+
+    @property
+    def dtype(self):
+        """Dtype of the panel, as of the first array."""
+        return self.arrays[0].dtype
+
+    def __len__(self):
+        """Return number of instances in the panel."""
+        return int(self._offsets[-1])
+
+    def __getitem__(self, key):
+        """Return instances at position key as in-memory 3D np.ndarray.
+
+        Parameters
+        ----------
+        key : int, slice, or 1D array-like of int or bool
+            positions of instances to return
+
+        Returns
+        -------
+        3D np.ndarray of shape (n_selected, n_dimensions, series_length)
+            if key is int, n_selected is 1, i.e., the instance axis is kept
+        """
+        n = len(self)
+        if isinstance(key, (int, np.integer)):
+            if key < -n or key >= n:
+                raise IndexError(f"index {key} out of range for LazyPanel of len {n}")
+            key = [key % n]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(n)
+            if step == 1:
+                return self._get_range(start, stop)
+            key = np.arange(start, stop, step)
+        key = np.asarray(key)
+        if key.dtype == bool:
+            key = np.flatnonzero(key)
+        key = np.where(key < 0, key + n, key).astype(np.int64)
+        if len(key) > 0 and (key.min() < 0 or key.max() >= n):
+            raise IndexError(f"index out of range for LazyPanel of len {n}")
+
+        out = np.empty((len(key),) + self.shape[1:], dtype=self.dtype)
+        arr_idx = np.searchsorted(self._offsets, key, side="right") - 1
+        for i in np.unique(arr_idx):
+            mask = arr_idx == i
+            out[mask] = self.arrays[i][key[mask] - self._offsets[i]]
+        return out
+
+    def _get_range(self, start, stop):
+        """Return contiguous instances start:stop, reading each array once."""
+        pieces = []
+        for i, arr in enumerate(self.arrays):
+            lo = max(start - self._offsets[i], 0)
+            hi = min(stop - self._offsets[i], len(arr))
+            if hi > lo:
+                pieces.append(np.asarray(arr[lo:hi]))
+        if len(pieces) == 0:
+            return np.empty((0,) + self.shape[1:], dtype=self.dtype)
+        if len(pieces) == 1:
+            return np.array(pieces[0])
+        return np.concatenate(pieces, axis=0)
+
+    def iter_batches(self, batch_size=None):
+        """Iterate over consecutive batches of instances.
+
+        Parameters
+        ----------
+        batch_size : int, optional, default=None = self.batch_size
+            number of instances per batch, the last batch may be smaller
+
+        Yields
+        ------
+        3D np.ndarray of shape (batch_size, n_dimensions, series_length)
+        """
+        if batch_size is None:
+            batch_size = self.batch_size
+        n = len(self)
+        for start in range(0, n, batch_size):
+            yield self._get_range(start, min(start + batch_size, n))
+
+    def __iter__(self):
+        """Iterate over batches of self.batch_size instances."""
+        return self.iter_batches()
+
+    def to_numpy(self):
+        """Return the full panel as in-memory 3D np.ndarray."""
+        return self._get_range(0, len(self))
+
+    def __repr__(self):
+        """Return string representation of self."""
+        return (
+            f"LazyPanel(n_instances={self.shape[0]}, n_dimensions={self.shape[1]}, "
+            f"series_length={self.shape[2]}, batch_size={self.batch_size})"
+        )
+
+
+def _concat_batches(batches):
+    """Concatenate estimator outputs of consecutive LazyPanel batches.
+
+    Parameters
+    ----------
+    batches : list of outputs of an estimator, one per batch, in batch order
+        np.ndarray, or pd.DataFrame / pd.Series with one row per instance,
+        or pd.DataFrame with (instance, time) MultiIndex, instances 0...n-1 per batch
+
+    Returns
+    -------
+    outputs concatenated along the instance axis, instance index running
+        over all instances of the LazyPanel
+    """
+    first = batches[0]
+    if isinstance(first, np.ndarray):
+        return np.concatenate(batches, axis=0)
+    if isinstance(first, (pd.DataFrame, pd.Series)):
+        if not isinstance(first.index, pd.MultiIndex):
+            return pd.concat(batches, ignore_index=True)
+        offset = 0
+        shifted = []
+        for batch in batches:
+            codes, uniques = pd.factorize(batch.index.get_level_values(0))
+            levels = [codes + offset] + [
+                batch.index.get_level_values(i) for i in range(1, batch.index.nlevels)
+            ]
+            new_index = pd.MultiIndex.from_arrays(levels, names=batch.index.names)
+            shifted.append(batch.set_axis(new_index, axis=0))
+            offset += len(uniques)
+        return pd.concat(shifted)
+    raise TypeError(
+        f"cannot concatenate batch outputs of type {type(first)} for LazyPanel"
+    )
@@ -41,15 +41,14 @@ __author__ = ["fkiraly", "TonyBagnall"]
 
 __all__ = ["check_dict"]
 
+import weakref
+
 import numpy as np
 import pandas as pd
 from pandas.core.dtypes.cast import is_nested_object
 
 from sktime.datatypes._common import _req, _ret
-from sktime.datatypes._series._check import (
-    _index_equally_spaced,
-    check_pddataframe_series,
-)
+from sktime.datatypes._series._check import check_pddataframe_series
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 from sktime.utils.validation.series import is_in_valid_index_types, is_integer_index
 
@@ -67,7 +66,7 @@ def _list_all_equal(obj):
 
     Parameters
     ----------
-    obj: list - assumed, not checked
+    obj: list or 1D np.ndarray of scalars - assumed, not checked
 
     Returns
     -------
@@ -76,7 +75,115 @@ def _list_all_equal(obj):
     if len(obj) < 2:
         return True
 
-    return np.all([s == obj[0] for s in obj])
+    obj = np.asarray(obj)
+    return np.all(obj == obj[0])
+
+
+# MultiIndex objects that sktime produced or already checked, keyed by id
+# pandas indices are immutable, so their validity does not change while alive
+# values are held weakly, entries disappear with the index
+_TRUSTED_MULTIINDEX = weakref.WeakValueDictionary()
+
+
+def _trust_multiindex(index):
+    """Register MultiIndex as valid, checks of frames with this index are cheap.
+
+    Trusted indices skip the structural checks of ``check_pdmultiindex_panel``,
+    i.e., type checks of index levels and monotonicity of the time index.
+    Only for indices of frames that sktime produced, or that passed the checks.
+
+    Parameters
+    ----------
+    index : pd.MultiIndex
+    """
+    _TRUSTED_MULTIINDEX[id(index)] = index
+
+
+def _is_trusted_multiindex(index):
+    """Check whether index was registered via ``_trust_multiindex``."""
+    return _TRUSTED_MULTIINDEX.get(id(index)) is index
+
+
+def _multiindex_group_ids(index, levels):
+    """Return group ids of rows of a MultiIndex, grouped by given levels.
+
+    Parameters
+    ----------
+    index : pd.MultiIndex
+    levels : list of int, levels to group by
+
+    Returns
+    -------
+    group_ids : 1D np.ndarray of int, same length as index
+        ids are 0, ..., n_groups - 1, in order of first appearance,
+        as ``ngroup`` of ``groupby(level=levels, sort=False)``
+    """
+    codes = [index.codes[i] for i in levels]
+    if len(codes) == 1:
+        keys = codes[0]
+    else:
+        # codes are -1 for missing values, hence the shift by one
+        dims = [len(index.levels[i]) + 1 for i in levels]
+        if np.prod(dims, dtype=float) < 2**62:
+            keys = np.ravel_multi_index([c + 1 for c in codes], dims)
+        else:
+            keys = pd.MultiIndex.from_arrays(codes)
+    return pd.factorize(keys)[0]
+
+
+def _multiindex_series_metadata(index):
+    """Compute series metadata from a MultiIndex, in one pass over its codes.
+
+    Series are rows with equal values in all but the last (time) level.
+
+    Parameters
+    ----------
+    index : pd.MultiIndex, time level of valid index type
+
+    Returns
+    -------
+    lengths : 1D np.ndarray of int, number of time points per series
+    is_monotonic : bool, whether time index is monotonic increasing in each series
+    is_equally_spaced : bool, whether time index is equally spaced in each series
+    """
+    group_ids = _multiindex_group_ids(index, list(range(index.nlevels - 1)))
+    lengths = np.bincount(group_ids)
+
+    time_codes = index.codes[-1]
+    if len(time_codes) > 0 and time_codes.min() < 0:
+        # missing time values, never monotonic, as for pandas indices
+        return lengths, False, False
+
+    time_level = index.levels[-1]
+    if isinstance(time_level, (pd.DatetimeIndex, pd.PeriodIndex)):
+        time = time_level.asi8[time_codes]
+    else:
+        time = time_level.to_numpy()[time_codes].astype(np.int64)
+
+    # bring series in contiguous order, stable to keep time order in each series
+    if len(group_ids) > 1 and (np.diff(group_ids) < 0).any():
+        order = np.argsort(group_ids, kind="stable")
+        group_ids = group_ids[order]
+        time = time[order]
+
+    diffs = np.diff(time)
+    in_series = group_ids[1:] == group_ids[:-1]
+    diffs_in_series = diffs[in_series]
+
+    is_monotonic = bool((diffs_in_series >= 0).all())
+
+    if isinstance(time_level, pd.PeriodIndex):
+        # consistent with PeriodIndex.is_full, no missing periods,
+        #   series with less than three time points count as equally spaced
+        long_series = lengths[group_ids[:-1][in_series]] >= 3
+        is_equally_spaced = bool((diffs_in_series[long_series] < 2).all())
+    else:
+        # each spacing is compared to the first spacing in its series
+        starts = np.cumsum(lengths) - lengths
+        first_diffs = diffs[starts[group_ids[:-1][in_series]]]
+        is_equally_spaced = bool((diffs_in_series == first_diffs).all())
+
+    return lengths, is_monotonic, is_equally_spaced
 
 
 check_dict = dict()
@@ -205,8 +312,11 @@ def check_pdmultiindex_panel(obj, return_metadata=False, var_name="obj", panel=T
         )
         return _ret(False, msg, None, return_metadata)
 
+    # frames with indices produced or checked by sktime skip the index checks
+    trusted = _is_trusted_multiindex(index)
+
     # check whether the time index is of valid type
-    if not is_in_valid_index_types(index.levels[-1]):
+    if not trusted and not is_in_valid_index_types(index.levels[-1]):
         msg = (
             f"{type(index)} is not supported for {var_name}, use "
             f"one of {VALID_INDEX_TYPES} or integer index instead."
@@ -215,28 +325,33 @@ def check_pdmultiindex_panel(obj, return_metadata=False, var_name="obj", panel=T
 
     # check instance index being integer or range index
     inst_inds = index.levels[0]
-    if not is_in_valid_multiindex_types(inst_inds):
+    if not trusted and not is_in_valid_multiindex_types(inst_inds):
         msg = (
             f"instance index (first/highest index) must be {VALID_MULTIINDEX_TYPES}, "
             f"integer index, but found {type(inst_inds)}"
         )
         return _ret(False, msg, None, return_metadata)
 
+    # series metadata are obtained from the index codes in one pass,
+    #   this is needed for the monotonicity check unless the index is trusted
+    requires_series_meta = [
+        "n_instances",
+        "is_one_series",
+        "is_equal_length",
+        "is_equally_spaced",
+    ]
+    if not trusted or _req(requires_series_meta, return_metadata):
+        lengths, is_monotonic, is_equally_spaced = _multiindex_series_metadata(index)
+
     # check if time index is monotonic increasing for each group
-    if not index.is_monotonic_increasing:
-        index_frame = index.to_frame()
-        if (
-            not index_frame.groupby(level=list(range(index.nlevels - 1)), sort=False)[
-                index_frame.columns[-1]
-            ]
-            .is_monotonic_increasing.astype(bool)
-            .all()
-        ):
-            msg = (
-                f"The (time) index of {var_name} must be sorted monotonically "
-                f"increasing, but found: {index}"
-            )
-            return _ret(False, msg, None, return_metadata)
+    if not trusted and not is_monotonic:
+        msg = (
+            f"The (time) index of {var_name} must be sorted monotonically "
+            f"increasing, but found: {index}"
+        )
+        return _ret(False, msg, None, return_metadata)
+
+    _trust_multiindex(index)
 
     metadata = dict()
 
@@ -247,39 +362,25 @@ def check_pdmultiindex_panel(obj, return_metadata=False, var_name="obj", panel=T
     if _req("has_nans", return_metadata):
         metadata["has_nans"] = obj.isna().values.any()
 
-    # check whether index is equally spaced or if there are any nans
-    #   compute only if needed
-    requires_series_grps = [
-        "n_instances",
-        "is_one_series",
-        "is_equal_length",
-        "is_equally_spaced",
-    ]
-    if _req(requires_series_grps, return_metadata):
-        series_groups = obj.groupby(level=list(range(index.nlevels - 1)), sort=False)
-        n_series = series_groups.ngroups
+    if _req(requires_series_meta, return_metadata):
+        n_series = len(lengths)
 
         if _req("n_instances", return_metadata):
             metadata["n_instances"] = n_series
         if _req("is_one_series", return_metadata):
             metadata["is_one_series"] = n_series == 1
         if _req("is_equal_length", return_metadata):
-            metadata["is_equal_length"] = _list_all_equal(
-                series_groups.size().to_numpy()
-            )
+            metadata["is_equal_length"] = _list_all_equal(lengths)
         if _req("is_equally_spaced", return_metadata):
-            metadata["is_equally_spaced"] = all(
-                _index_equally_spaced(group.index.get_level_values(-1))
-                for _, group in series_groups
-            )
+            metadata["is_equally_spaced"] = is_equally_spaced
 
     requires_panel_grps = ["n_panels", "is_one_panel"]
     if _req(requires_panel_grps, return_metadata):
         if panel:
             n_panels = 1
         else:
-            panel_groups = obj.groupby(level=list(range(index.nlevels - 2)), sort=False)
-            n_panels = panel_groups.ngroups
+            panel_ids = _multiindex_group_ids(index, list(range(index.nlevels - 2)))
+            n_panels = panel_ids.max() + 1 if len(panel_ids) > 0 else 0
 
         if _req("n_panels", return_metadata):
             metadata["n_panels"] = n_panels
@@ -33,9 +33,9 @@ import pandas as pd
 __all__ = [
     "convert_dict",
 ]
-
 from sktime.datatypes._convert_utils._coerce import _coerce_df_dtypes
 from sktime.datatypes._convert_utils._convert import _extend_conversions
+from sktime.datatypes._panel._check import _trust_multiindex
 from sktime.datatypes._panel._registry import MTYPE_LIST_PANEL
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
@@ -713,6 +713,9 @@ def from_3d_numpy_to_multi_index_adp(obj, store=None):
     if isinstance(store, dict) and "index_names" in store.keys():
         res.index.names = store["index_names"]
 
+    # the index is valid by construction, later checks can skip it
+    _trust_multiindex(res.index)
+
     return res
 
 
@@ -16,6 +16,7 @@ import pandas as pd
 from sktime.datatypes._check import check_is_scitype, mtype
 from sktime.datatypes._convert import convert_to
 from sktime.utils.multiindex import flatten_multiindex
+from sktime.utils.parallel import parallelize
 
 
 class VectorizedDF:
@@ -91,6 +92,7 @@ class VectorizedDF:
         self.iterate_cols = iterate_cols
 
         self.converter_store = dict()
+        self._group_offsets = dict()
 
         self.X_multiindex = self._init_conversion(X)
         self.iter_indices = self._init_iter_indices()
@@ -263,8 +265,89 @@ class VectorizedDF:
         if is_self_iter:
             yield from _iter_cols(self.X_multiindex)
         else:
-            for name, group in self.X_multiindex.groupby(level=iter_levels):
-                yield from _iter_cols(group.droplevel(iter_levels), group_name=name)
+            group_offsets = self._get_group_offsets(iter_levels)
+            if group_offsets is None:
+                for name, group in self.X_multiindex.groupby(level=iter_levels):
+                    yield from _iter_cols(group.droplevel(iter_levels), group_name=name)
+            else:
+                for name, group in self._iter_group_slices(group_offsets):
+                    yield from _iter_cols(group, group_name=name)
+
+    def _get_group_offsets(self, iter_levels):
+        """Get integer offsets of groups in the data, for slicing by position.
+
+        Groups are obtained from the index levels ``iter_levels``, with group keys
+        in sorted order, as in ``groupby(level=iter_levels)``.
+        The result is computed once per ``iter_levels`` and cached,
+        until the cache is cleared at the end of ``vectorize_est``.
+
+        Parameters
+        ----------
+        iter_levels : list of int
+            the multiindex levels to group by, must be the first levels of the index
+
+        Returns
+        -------
+        None, if group offsets cannot be computed, e.g., due to missing group keys,
+        otherwise tuple of length five, with elements in sequence
+
+        * ``keys`` : pd.Index, unique group keys, in sorted order
+        * ``X_sorted`` : pd.DataFrame, rows of self.X_multiindex, stably sorted
+          by group key; this is identical to ``self.X_multiindex`` if already sorted
+        * ``inner_index`` : pd.Index, index of ``X_sorted`` with ``iter_levels``
+          dropped, i.e., the index of the groups, concatenated
+        * ``starts`` : np.ndarray of int, i-th entry is start iloc of i-th group
+        * ``stops`` : np.ndarray of int, i-th entry is stop iloc of i-th group
+        """
+        cache_key = tuple(iter_levels)
+        if cache_key in self._group_offsets:
+            return self._group_offsets[cache_key]
+
+        X = self.X_multiindex
+        nlevels = X.index.nlevels
+        group_ix = X.index.droplevel(list(range(len(iter_levels), nlevels)))
+        codes, keys = pd.factorize(group_ix, sort=True)
+
+        # groupby drops missing keys, factorize codes them as -1 - fall back
+        if (codes < 0).any():
+            group_offsets = None
+        else:
+            # sort rows by group code only if not already contiguous & sorted
+            if (np.diff(codes) < 0).any():
+                order = np.argsort(codes, kind="stable")
+                X = X.iloc[order]
+                codes = codes[order]
+            counts = np.bincount(codes, minlength=len(keys))
+            stops = np.cumsum(counts)
+            starts = stops - counts
+            inner_index = X.index.droplevel(iter_levels)
+            group_offsets = (keys, X, inner_index, starts, stops)
+
+        self._group_offsets[cache_key] = group_offsets
+        return group_offsets
+
+    @staticmethod
+    def _iter_group_slices(group_offsets):
+        """Iterate over (group key, group) via positional slices of sorted data.
+
+        Slices are obtained by ``iloc`` with integer start/stop, avoiding lookups
+        via the group keys. Groups are copies, as in ``groupby``, so that methods
+        changing their input in place do not change the data passed by the user.
+
+        Parameters
+        ----------
+        group_offsets : tuple of length five, as returned by ``_get_group_offsets``
+
+        Returns
+        -------
+        generator of (group key, group) tuples, same as iterating over
+        ``groupby(level=iter_levels)`` and dropping ``iter_levels`` from groups
+        """
+        keys, X_sorted, inner_index, starts, stops = group_offsets
+        for key, start, stop in zip(keys, starts, stops):
+            group = X_sorted.iloc[start:stop].copy()
+            group.index = inner_index[start:stop]
+            yield key, group
 
     def _iter_levels(self, iterate_as):
         """Get the levels to group by for iteration using iterate_as.
@@ -309,8 +392,17 @@ class VectorizedDF:
         iter_levels = self._iter_levels(iterate_as)
         is_self_iter = len(iter_levels) == self.X_multiindex.index.nlevels
 
+        if is_self_iter:
+            n_groups = 1
+        else:
+            group_offsets = self._get_group_offsets(iter_levels)
+            if group_offsets is None:
+                n_groups = self.X_multiindex.groupby(level=iter_levels).ngroups
+            else:
+                n_groups = len(group_offsets[0])
+
         return (
-            1 if is_self_iter else self.X_multiindex.groupby(level=iter_levels).ngroups,
+            n_groups,
             len(self.X_multiindex.columns) if iterate_cols else 1,
         )
 
@@ -386,7 +478,7 @@ class VectorizedDF:
         if row_ix is None and col_ix is None:
             X_mi_reconstructed = self.X_multiindex
         elif col_ix is None:
-            X_mi_reconstructed = pd.concat(df_list, keys=row_ix, axis=0)
+            X_mi_reconstructed = _concat_rows_with_keys(df_list, keys=row_ix)
         elif row_ix is None:
             force_flat = _force_flat(df_list)
             if col_multiindex in ["flat", "multiindex"] or force_flat:
@@ -407,7 +499,7 @@ class VectorizedDF:
                     col_keys = None
                 col_concats += [pd.concat(ith_col_block, axis=1, keys=col_keys)]
 
-            X_mi_reconstructed = pd.concat(col_concats, keys=row_ix, axis=0)
+            X_mi_reconstructed = _concat_rows_with_keys(col_concats, keys=row_ix)
 
         X_mi_index = X_mi_reconstructed.index
         X_orig_row_index = self.X_multiindex.index
@@ -446,6 +538,8 @@ class VectorizedDF:
         rowname_default="estimators",
         colname_default="estimators",
         varname_of_self=None,
+        backend=None,
+        backend_params=None,
         **kwargs,
     ):
         """Vectorize application of estimator method, return results DataFrame or list.
@@ -505,6 +599,21 @@ class VectorizedDF:
             used as index name of single column if no column vectorization is performed
         varname_of_self : str, optional, default=None
             if not None, self will be passed as kwarg under name "varname_of_self"
+        backend : str, optional, default=None
+            backend used for the loop over vectorization slices,
+            one of the backends in ``sktime.utils.parallel.PARALLEL_BACKENDS``
+
+            - None: executes loop sequentially, simple list comprehension
+            - "loky", "multiprocessing" and "threading": uses ``joblib.Parallel``
+            - "dask": uses ``dask``, requires ``dask`` package in environment
+
+            If a parallel backend is used, entries of the return are the
+            estimators as returned by the workers, not identity references
+            to entries of ``estimator``.
+        backend_params : dict, optional, default=None
+            additional parameters passed to the backend as config,
+            see ``sktime.utils.parallel.parallelize`` for valid keys,
+            e.g., ``n_jobs`` or ``batch_size`` for the joblib backends
         kwargs : will be passed to invoked methods of estimator(s) in `estimator`
 
         Returns
@@ -569,28 +678,31 @@ class VectorizedDF:
         else:
             estimators = itertools.cycle([estimator])
 
-        ret = []
-
-        for ((group_name, col_name, group), args_i, args_i_rowvec, est_i) in zip(
+        vec_zip = zip(
             self.items(),
             explode(args, iterate_as=self.iterate_as, iterate_cols=self.iterate_cols),
             explode(args_rowvec, iterate_as=self.iterate_as, iterate_cols=False),
             estimators,
-        ):
-            args_i.update(args_i_rowvec)
-
-            if varname_of_self is not None:
-                args_i[varname_of_self] = group
-
-            est_i_method = getattr(est_i, method)
-            est_i_result = est_i_method(**args_i)
+        )
 
-            if group_name is None:
-                group_name = rowname_default
-            if col_name is None:
-                col_name = colname_default
+        meta = {
+            "method": method,
+            "varname_of_self": varname_of_self,
+            "rowname_default": rowname_default,
+            "colname_default": colname_default,
+        }
 
-            ret.append((group_name, col_name, est_i_result))
+        try:
+            ret = parallelize(
+                fun=self._vectorize_est_single,
+                iter=vec_zip,
+                meta=meta,
+                backend=backend,
+                backend_params=backend_params,
+            )
+        finally:
+            # do not keep the sorted copy of the data alive, e.g., in fitted _yvec
+            self._group_offsets.clear()
 
         if return_type == "pd.DataFrame":
             df = pd.DataFrame(ret).pivot(index=0, columns=1, values=2)
@@ -605,6 +717,49 @@ class VectorizedDF:
         else:  # if return_type == "list"
             return [result for _, _, result in ret]
 
+    @staticmethod
+    def _vectorize_est_single(vec_tuple, meta):
+        """Execute method of estimator on a single vectorization slice.
+
+        Used as the single-element function passed to ``parallelize``
+        in ``vectorize_est``.
+
+        Parameters
+        ----------
+        vec_tuple : tuple of length 4, elements in sequence
+            (group_name, col_name, group) : as returned by ``self.items``
+            args_i : dict, arguments to pass to method, for this slice
+            args_i_rowvec : dict, row-vectorized arguments, for this slice
+            est_i : estimator on which ``method`` is called, for this slice
+        meta : dict with keys
+            method : str, name of method to call
+            varname_of_self : str or None, see ``vectorize_est``
+            rowname_default : str, see ``vectorize_est``
+            colname_default : str, see ``vectorize_est``
+
+        Returns
+        -------
+        tuple of length 3: (group_name, col_name, result of method call)
+        """
+        (group_name, col_name, group), args_i, args_i_rowvec, est_i = vec_tuple
+
+        args_i = args_i.copy()
+        args_i.update(args_i_rowvec)
+
+        varname_of_self = meta["varname_of_self"]
+        if varname_of_self is not None:
+            args_i[varname_of_self] = group
+
+        est_i_method = getattr(est_i, meta["method"])
+        est_i_result = est_i_method(**args_i)
+
+        if group_name is None:
+            group_name = meta["rowname_default"]
+        if col_name is None:
+            col_name = meta["colname_default"]
+
+        return group_name, col_name, est_i_result
+
 
 def _enforce_index_freq(item: pd.Series) -> pd.Series:
     """Enforce the frequency of a Series index using pd.infer_freq.
@@ -622,3 +777,68 @@ def _enforce_index_freq(item: pd.Series) -> pd.Series:
         if len(item.index) > 2:  # pandas.infer_freq errors out for length 1 or 2
             item.index.freq = pd.infer_freq(item.index)
     return item
+
+
+def _concat_rows_with_keys(df_list, keys):
+    """Row-concatenate data frames, with keys as additional outer index levels.
+
+    Same as ``pd.concat(df_list, keys=keys, axis=0)``, but with a fast path
+    for the common case of all elements of ``df_list`` having the same columns
+    and a single, common numpy dtype. In this case, the result is built
+    in one ``np.concatenate`` of the data, and one ``MultiIndex`` construction
+    from the repeated keys and the appended indices of ``df_list``.
+
+    Parameters
+    ----------
+    df_list : list of pd.DataFrame
+    keys : pd.Index or pd.MultiIndex, of same length as ``df_list``
+
+    Returns
+    -------
+    pd.DataFrame, row-concatenation of ``df_list``,
+        with row index being ``keys`` level(s), then levels of ``df_list`` indices
+    """
+    if not _is_fast_concat_possible(df_list, keys):
+        return pd.concat(df_list, keys=keys, axis=0)
+
+    first = df_list[0]
+    lengths = np.array([len(df) for df in df_list])
+
+    outer_index = keys.repeat(lengths)
+    inner_index = first.index.append([df.index for df in df_list[1:]])
+    outer_arrays = [outer_index.get_level_values(i) for i in range(keys.nlevels)]
+    inner_arrays = [inner_index.get_level_values(i) for i in range(inner_index.nlevels)]
+    index = pd.MultiIndex.from_arrays(
+        outer_arrays + inner_arrays,
+        names=list(keys.names) + list(first.index.names),
+    )
+
+    values = np.concatenate([df.to_numpy() for df in df_list], axis=0)
+
+    return pd.DataFrame(values, index=index, columns=first.columns)
+
+
+def _is_fast_concat_possible(df_list, keys):
+    """Check whether fast path of ``_concat_rows_with_keys`` can be used."""
+    if len(df_list) == 0 or len(df_list) != len(keys):
+        return False
+
+    first = df_list[0]
+    if not isinstance(first, pd.DataFrame) or len(first.columns) == 0:
+        return False
+
+    cols = first.columns
+    dtype = first.dtypes.iloc[0]
+    nlevels = first.index.nlevels
+    if not cols.is_unique or not isinstance(dtype, np.dtype):
+        return False
+
+    for df in df_list:
+        if not isinstance(df, pd.DataFrame):
+            return False
+        if df.index.nlevels != nlevels or not df.columns.equals(cols):
+            return False
+        if (df.dtypes != dtype).any():
+            return False
+
+    return True
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Testing memoization of checks and conversions via check_convert_cache."""
+
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.datatypes import (
+    check_convert_cache,
+    check_is_mtype,
+    check_is_scitype,
+    convert_to,
+    get_examples,
+)
+from sktime.datatypes._cache import _get_active_cache
+
+
+def test_check_convert_cache_hits():
+    """Tests that repeated checks and conversions of the same object are cached."""
+    X = get_examples(mtype="pd-multiindex", as_scitype="Panel")[0]
+
+    metadata = ["n_instances", "is_univariate"]
+    with check_convert_cache() as cache:
+        res1 = check_is_scitype(X, scitype="Panel", return_metadata=metadata)
+        misses = cache.misses
+        res2 = check_is_scitype(X, scitype="Panel", return_metadata=metadata)
+        assert cache.misses == misses and cache.hits > 0
+        assert res1 == res2
+
+        # metadata returned from cache are copies, changes do not leak into cache
+        res2[2]["n_instances"] = 42
+        res3 = check_is_scitype(X, scitype="Panel", return_metadata=["n_instances"])
+        assert res3[2]["n_instances"] == res1[2]["n_instances"]
+
+        X_np = convert_to(X, to_type="numpy3D")
+        hits = cache.hits
+        X_np2 = convert_to(X, to_type="numpy3D")
+        assert cache.hits > hits
+        np.testing.assert_array_equal(X_np, X_np2)
+
+        # conversion outputs are known to be numpy3D, inference checks only that
+        misses = cache.misses
+        assert check_is_mtype(X_np, "numpy3D")
+        assert check_is_mtype(X_np2, "numpy3D")
+        assert cache.misses == misses
+
+    assert _get_active_cache() is None
+
+
+def test_check_convert_cache_invalidation():
+    """Tests that entries are evicted when objects change or are collected."""
+    X = get_examples(mtype="pd.DataFrame", as_scitype="Series")[0].copy()
+
+    with check_convert_cache(maxsize=2) as cache:
+        assert check_is_scitype(X, scitype="Series", return_metadata=True)[0]
+        assert len(cache) == 1
+
+        # replacing the columns changes the fingerprint, object is checked again
+        X.columns = ["x"]
+        misses = cache.misses
+        assert check_is_scitype(X, scitype="Series", return_metadata=True)[0]
+        assert cache.misses > misses
+
+        # garbage collected objects are evicted
+        Y = X.copy()
+        check_is_scitype(Y, scitype="Series")
+        assert len(cache) == 2
+        del Y
+        gc.collect()
+        assert len(cache) == 1
+
+        # least recently used objects are evicted beyond maxsize
+        others = [np.zeros((3, 2)) for _ in range(3)]
+        for other in others:
+            check_is_scitype(other, scitype="Series")
+        assert len(cache) == 2
+
+    assert len(cache) == 0
+
+
+def test_check_convert_cache_no_shared_values():
+    """Tests that cached results do not depend on values changed in place."""
+    X = get_examples(mtype="numpy3D", as_scitype="Panel")[0].astype(float)
+
+    with check_convert_cache():
+        # each conversion returns its own object, changes do not leak into others
+        X_df = convert_to(X, to_type="pd-multiindex")
+        X_df2 = convert_to(X, to_type="pd-multiindex")
+        assert X_df2 is not X_df
+        X_df.iloc[0, 0] = np.nan
+        assert not X_df2.isna().any().any()
+
+        # has_nans depends on values, it is not cached
+        res = check_is_mtype(X, "numpy3D", return_metadata=True)
+        assert not res[2]["has_nans"]
+        X[0, 0, 0] = np.nan
+        res = check_is_mtype(X, "numpy3D", return_metadata=True)
+        assert res[2]["has_nans"]
+        res = check_is_mtype(X, "numpy3D", return_metadata=["has_nans"])
+        assert res[2]["has_nans"]
+
+
+def test_check_convert_cache_value_metadata_hits():
+    """Tests that checks requesting value metadata are served from cache."""
+    X = get_examples(mtype="pd-multiindex", as_scitype="Panel")[0].astype(float)
+
+    with check_convert_cache() as cache:
+        res = check_is_scitype(X, scitype="Panel", return_metadata=True)
+        assert not res[2]["has_nans"]
+
+        misses = cache.misses
+        res2 = check_is_scitype(X, scitype="Panel", return_metadata=True)
+        res3 = check_is_mtype(X, "pd-multiindex", return_metadata=["has_nans"])
+        assert cache.misses == misses
+        assert res2 == res
+        assert not res3[2]["has_nans"]
+
+        # value metadata are recomputed on hits, so they see in place changes
+        X.iloc[0, 0] = np.nan
+        res4 = check_is_scitype(X, scitype="Panel", return_metadata=True)
+        assert cache.misses == misses
+        assert res4[2]["has_nans"]
+
+
+def test_check_convert_cache_ambiguous_mtype():
+    """Tests that objects valid for more than one mtype raise as without cache."""
+    X = np.zeros((5, 3))
+    msg = "more than one mtype identified"
+
+    with pytest.raises(TypeError, match=msg):
+        check_is_mtype(X, ["np.ndarray", "numpyflat"])
+
+    with check_convert_cache():
+        # X becomes known as valid np.ndarray, numpyflat must still be checked
+        assert check_is_mtype(X, "np.ndarray")
+        with pytest.raises(TypeError, match=msg):
+            check_is_mtype(X, ["np.ndarray", "numpyflat"])
+        with pytest.raises(TypeError, match=msg):
+            check_is_mtype(X, ["np.ndarray", "numpyflat"], return_metadata=True)
+
+
+def test_check_convert_cache_forecasting_pipeline():
+    """Tests that a forecasting pipeline is served from cache, with same results."""
+    from sktime.datasets import load_airline
+    from sktime.forecasting.compose import TransformedTargetForecaster
+    from sktime.forecasting.naive import NaiveForecaster
+    from sktime.transformations.series.detrend import Deseasonalizer
+    from sktime.transformations.series.exponent import ExponentTransformer
+
+    y = load_airline()
+    pipe = TransformedTargetForecaster(
+        [
+            ("exp", ExponentTransformer()),
+            ("deseason", Deseasonalizer(sp=12)),
+            ("naive", NaiveForecaster()),
+        ]
+    )
+
+    y_pred = pipe.clone().fit(y).predict(fh=[1, 2, 3])
+
+    # the outer context is shared by the fit and predict calls of all steps
+    with check_convert_cache() as cache:
+        y_pred_cached = pipe.clone().fit(y).predict(fh=[1, 2, 3])
+
+    assert cache.hits > 0
+    pd.testing.assert_series_equal(y_pred_cached, y_pred)
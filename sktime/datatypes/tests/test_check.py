@@ -4,6 +4,7 @@
 __author__ = ["fkiraly"]
 
 import numpy as np
+import pandas as pd
 
 from sktime.datatypes._check import (
     AMBIGUOUS_MTYPES,
@@ -13,6 +14,7 @@ from sktime.datatypes._check import (
 )
 from sktime.datatypes._check import mtype as infer_mtype
 from sktime.datatypes._check import scitype as infer_scitype
+from sktime.datatypes._convert import convert_to
 from sktime.datatypes._examples import get_examples
 from sktime.datatypes._registry import SCITYPE_LIST, scitype_to_mtype
 
@@ -414,3 +416,44 @@ def test_scitype_infer(scitype, mtype, fixture_index):
         assert scitype == infer_scitype(
             fixture, candidate_scitypes=SCITYPES_FOR_INFER_TEST
         ), f"scitype {scitype} not correctly identified for fixture {fixture_index}"
+
+
+def test_check_pdmultiindex_metadata_unsorted():
+    """Tests metadata of pd-multiindex panels with interleaved, unequal series.
+
+    Raises
+    ------
+    AssertionError if metadata are not inferred correctly,
+        or unsorted time index within a series is not detected
+    """
+    index = pd.MultiIndex.from_arrays(
+        [[1, 0, 1, 0, 1, 0, 2], [0, 0, 2, 1, 4, 3, 3]], names=["inst", "time"]
+    )
+    obj = pd.DataFrame({"a": np.arange(7.0)}, index=index)
+
+    valid, _, metadata = check_is_mtype(obj, "pd-multiindex", return_metadata=True)
+    assert valid
+    assert metadata["n_instances"] == 3
+    assert not metadata["is_equal_length"]
+    assert not metadata["is_equally_spaced"]
+
+    obj_unsorted = obj.iloc[[0, 4, 2, 1, 3, 5, 6]]
+    assert not check_is_mtype(obj_unsorted, "pd-multiindex")
+
+
+def test_check_pdmultiindex_trusted():
+    """Tests that indices produced by sktime converters skip the index checks."""
+    from sktime.datatypes._panel._check import _is_trusted_multiindex
+
+    X = convert_to(np.zeros((3, 2, 4)), to_type="pd-multiindex")
+    assert _is_trusted_multiindex(X.index)
+
+    valid, _, metadata = check_is_mtype(X, "pd-multiindex", return_metadata=True)
+    assert valid
+    assert metadata["n_instances"] == 3 and metadata["is_equally_spaced"]
+
+    X_other = X.copy()
+    X_other.index = X.index.copy()
+    assert not _is_trusted_multiindex(X_other.index)
+    assert check_is_mtype(X_other, "pd-multiindex")
+    assert _is_trusted_multiindex(X_other.index)
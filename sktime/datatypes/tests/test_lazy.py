@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Testing out-of-core Panel access via LazyPanel."""
+
+import numpy as np
+import pytest
+
+from sktime.classification.distance_based import KNeighborsTimeSeriesClassifier
+from sktime.datatypes import LazyPanel
+from sktime.transformations.series.exponent import ExponentTransformer
+from sktime.transformations.series.summarize import SummaryTransformer
+from sktime.utils._testing.panel import make_classification_problem
+
+
+def _make_lazy_panel(batch_size=7):
+    """Return LazyPanel over two arrays, and the equivalent numpy3D array."""
+    rng = np.random.default_rng(42)
+    X1 = rng.normal(size=(12, 2, 15))
+    X2 = rng.normal(size=(8, 2, 15))
+    return LazyPanel([X1, X2], batch_size=batch_size), np.concatenate([X1, X2])
+
+
+def test_lazy_panel_access():
+    """Test len, shape, slicing and batch iteration of LazyPanel."""
+    X, X_np = _make_lazy_panel()
+
+    assert len(X) == 20 and X.shape == (20, 2, 15)
+    np.testing.assert_array_equal(X.to_numpy(), X_np)
+    np.testing.assert_array_equal(X[10:14], X_np[10:14])
+    np.testing.assert_array_equal(X[::3], X_np[::3])
+    np.testing.assert_array_equal(X[-1], X_np[[-1]])
+    np.testing.assert_array_equal(X[[13, 0, 11]], X_np[[13, 0, 11]])
+
+    batches = list(X)
+    assert [len(batch) for batch in batches] == [7, 7, 6]
+    np.testing.assert_array_equal(np.concatenate(batches), X_np)
+
+    with pytest.raises(IndexError):
+        X[20]
+    with pytest.raises(ValueError, match="n_dimensions"):
+        LazyPanel([X_np, X_np[:, :1]])
+
+
+@pytest.mark.parametrize(
+    "transformer", [ExponentTransformer(), SummaryTransformer()], ids=lambda x: ""
+)
+def test_lazy_panel_transform(transformer):
+    """Test that transform on LazyPanel equals transform on the in-memory panel."""
+    X, X_np = _make_lazy_panel()
+    transformer = transformer.fit(X)
+
+    Xt_lazy = transformer.transform(X)
+    Xt = transformer.transform(X_np)
+
+    assert type(Xt_lazy) is type(Xt)
+    np.testing.assert_array_almost_equal(np.asarray(Xt_lazy), np.asarray(Xt))
+
+
+def test_lazy_panel_classifier():
+    """Test that classifiers fit and predict batch-wise on LazyPanel."""
+    X_np, y = make_classification_problem(
+        n_instances=20, n_columns=2, n_timepoints=15, return_numpy=True
+    )
+    X = LazyPanel(X_np, batch_size=6)
+    clf = KNeighborsTimeSeriesClassifier(distance="euclidean").fit(X, y)
+
+    np.testing.assert_array_equal(clf.predict(X), clf.predict(X_np))
+    np.testing.assert_array_equal(clf.predict_proba(X), clf.predict_proba(X_np))
@@ -473,3 +473,104 @@ def test_vectorize_est(
     assert result.shape == (n_rows, n_cols)
     is_fcst_frame = result.applymap(lambda x: isinstance(x, NaiveForecaster))
     assert is_fcst_frame.all().all()
+
+
+@pytest.mark.parametrize("backend", [None, "loky", "threading"])
+def test_vectorize_est_backend(backend):
+    """Tests that vectorize_est with parallel backend yields same predictions."""
+    from sktime.forecasting.naive import NaiveForecaster
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    y = _make_hierarchical(hierarchy_levels=(2, 3), min_timepoints=10)
+    y_vect = VectorizedDF(X=y, iterate_as="Series", is_scitype="Hierarchical")
+
+    est_clones = y_vect.vectorize_est(NaiveForecaster(), method="clone")
+    fitted = y_vect.vectorize_est(
+        est_clones,
+        method="fit",
+        varname_of_self="y",
+        fh=[1, 2],
+        backend=backend,
+        backend_params={"n_jobs": 2},
+    )
+    assert fitted.shape == y_vect.shape
+    assert all(est.is_fitted for est in fitted.iloc[:, 0])
+
+    y_preds = y_vect.vectorize_est(fitted, method="predict", return_type="list")
+    y_preds_seq = y_vect.vectorize_est(
+        y_vect.vectorize_est(est_clones, method="fit", varname_of_self="y", fh=[1, 2]),
+        method="predict",
+        return_type="list",
+    )
+    for y_pred, y_pred_seq in zip(y_preds, y_preds_seq):
+        pd.testing.assert_frame_equal(y_pred, y_pred_seq)
+
+
+def test_iteration_unsorted_index():
+    """Tests that iteration by group offsets equals groupby, for unsorted index."""
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical(hierarchy_levels=(2, 3), n_columns=2, random_state=42)
+    # reverse the order of instances, keeping time order within instances
+    X = pd.concat([group for _, group in X.groupby(level=[0, 1])][::-1])
+
+    X_vect = VectorizedDF(X=X, iterate_as="Series", is_scitype="Hierarchical")
+    groupby_items = list(X.groupby(level=[0, 1]))
+
+    assert len(X_vect) == len(groupby_items)
+    for (name, _, group), (gb_name, gb_group) in zip(X_vect.items(), groupby_items):
+        assert name == gb_name
+        pd.testing.assert_frame_equal(
+            group, gb_group.droplevel([0, 1]), check_freq=False
+        )
+
+
+def test_reconstruct_fast_concat():
+    """Tests that reconstruct equals pd.concat with keys, for fast path and not."""
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical(hierarchy_levels=(2, 3), n_columns=2)
+    X_vect = VectorizedDF(X=X, iterate_as="Series", is_scitype="Hierarchical")
+    row_ix, _ = X_vect.get_iter_indices()
+
+    # same columns and single dtype - fast path
+    df_list = X_vect.as_list()
+    X_rec = X_vect.reconstruct(df_list, overwrite_index=False)
+    X_concat = pd.concat(df_list, keys=row_ix, axis=0)
+    pd.testing.assert_frame_equal(X_rec, X_concat)
+
+    # mixed dtypes - falls back to pd.concat
+    df_list = [df.astype({"c0": "int64"}) for df in df_list]
+    X_rec = X_vect.reconstruct(df_list, overwrite_index=False)
+    X_concat = pd.concat(df_list, keys=row_ix, axis=0)
+    pd.testing.assert_frame_equal(X_rec, X_concat)
+
+
+def test_vectorize_est_does_not_change_input():
+    """Tests that in-place changes of instances do not change the vectorized data."""
+    from sktime.forecasting.base import BaseForecaster
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    class _InplaceForecaster(BaseForecaster):
+        """Forecaster that overwrites its input in fit."""
+
+        _tags = {"requires-fh-in-fit": False, "y_inner_mtype": "pd.DataFrame"}
+
+        def _fit(self, y, X=None, fh=None):
+            y.iloc[:] = 0
+            return self
+
+    X = _make_hierarchical(hierarchy_levels=(2, 3), n_columns=2, random_state=42)
+    X_orig = X.copy()
+    X_vect = VectorizedDF(X=X, iterate_as="Series", is_scitype="Hierarchical")
+
+    for group in X_vect:
+        group.iloc[:] = 0
+    pd.testing.assert_frame_equal(X, X_orig)
+
+    forecasters = X_vect.vectorize_est(_InplaceForecaster(), method="clone")
+    X_vect.vectorize_est(forecasters, method="fit", y=X_vect)
+    pd.testing.assert_frame_equal(X, X_orig)
+
+    # the sorted copy of the data is released after vectorize_est
+    assert X_vect._group_offsets == {}
@@ -28,6 +28,7 @@ __all__ = [
     "distance_alignment_path_factory",
     "distance_alignment_path",
     "twe_alignment_path",
+    "dtw_kneighbors",
 ]
 
 from sktime.distances._distance import (
@@ -57,4 +58,5 @@ from sktime.distances._distance import (
     wdtw_alignment_path,
     wdtw_distance,
 )
+from sktime.distances._dtw_knn import dtw_kneighbors
 from sktime.distances.lower_bounding import LowerBounding
@@ -2055,6 +2055,9 @@ def pairwise_distance(
         Callable[[np.ndarray, np.ndarray], float],
         NumbaDistance,
     ] = "euclidean",
+    n_jobs: int = 1,
+    out: np.ndarray = None,
+    chunk_size: int = None,
     **kwargs: Any,
 ) -> np.ndarray:
     """Compute the pairwise distance matrix between two time series.
@@ -2085,6 +2088,18 @@ def pairwise_distance(
         A distance factory takes the form (must return a no_python callable):
         Callable[[np.ndarray, np.ndarray, bool, dict], Callable[[np.ndarray,
         np.ndarray], float]].
+    n_jobs: int, defaults = 1
+        Number of threads used to compute the pairwise distance matrix, rows are
+        distributed over threads via numba ``prange``. -1 means using all processors.
+        If not 1, a parallel loop is compiled for the resolved metric on every call,
+        so this pays off only for large distance matrices.
+    out: np.ndarray (2d of size mxn where m is len(x) and n is len(y)), defaults = None
+        Array to write the pairwise distance matrix to, e.g., a ``np.memmap`` for
+        distance matrices that do not fit in memory. If None, a new array is returned.
+    chunk_size: int, defaults = None
+        Number of rows of the pairwise distance matrix computed at once, and written
+        to ``out`` at once. Bounds the working memory to ``chunk_size`` times ``len(y)``
+        entries if ``out`` is a ``np.memmap``. If None, all rows are computed at once.
     kwargs: Any
         Extra arguments for metric. Refer to each metric documentation for a list of
         possible arguments.
@@ -2093,6 +2108,7 @@ def pairwise_distance(
     -------
     np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
         Pairwise distance matrix between the two time series.
+        If ``out`` is passed, this is ``out``.
 
     Raises
     ------
@@ -2134,6 +2150,12 @@ def pairwise_distance(
     >>> pairwise_distance(x_2d, y_2d, metric='dtw', window=0.5)
     array([[256., 576.],
            [ 58., 256.]])
+
+    >>> x_3d = np.random.default_rng(42).random((6, 1, 10))  # 3d array
+    >>> out = np.zeros((6, 6))
+    >>> dist = pairwise_distance(x_3d, metric='dtw', chunk_size=2, out=out)
+    >>> dist is out
+    True
     """
     from sktime.distances._numba_utils import (
         _compute_pairwise_distance,
@@ -2148,7 +2170,15 @@ def pairwise_distance(
     _metric_callable = _resolve_metric_to_factory(
         metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
     )
-    return _compute_pairwise_distance(_x, _y, symmetric, _metric_callable)
+    return _compute_pairwise_distance(
+        _x,
+        _y,
+        symmetric,
+        _metric_callable,
+        n_jobs=n_jobs,
+        out=out,
+        chunk_size=chunk_size,
+    )
 
 
 def distance_alignment_path(
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""Nearest neighbour search under dtw distance, with lower bound pruning."""
+__all__ = ["dtw_kneighbors"]
+
+import numpy as np
+
+
+def dtw_kneighbors(
+    X: np.ndarray,
+    X2: np.ndarray,
+    n_neighbors: int = 1,
+    window: float = None,
+    itakura_max_slope: float = None,
+    bounding_matrix: np.ndarray = None,
+    return_distance: bool = True,
+    **kwargs,
+):
+    """Find the nearest neighbours under dtw distance, with lower bound pruning.
+
+    Exact k-nearest neighbour search, returning the same neighbours as a search on
+    ``pairwise_distance(X, X2, metric="dtw")``, up to ties. Full dtw computations are
+    avoided via a cascade of lower bounds, as in the UCR suite [1]_:
+
+    1. LB_Kim, from first and last time points. Candidates are visited in order of
+       LB_Kim, and the search stops once LB_Kim exceeds the current k-th distance.
+    2. LB_Keogh, from the envelope of the candidate within the bounding window.
+    3. dtw with early abandoning, once the cost exceeds the current k-th distance.
+
+    Pruning is most effective for long series, and with a ``window`` constraint.
+
+    Parameters
+    ----------
+    X: np.ndarray (1d, 2d or 3d array)
+        Query time series, of shape (n, d, m1) if 3d.
+    X2: np.ndarray (1d, 2d or 3d array)
+        Time series to search neighbours in, of shape (n2, d, m2) if 3d.
+    n_neighbors: int, defaults = 1
+        Number of neighbours to find, must be at most n2.
+    window: float, defaults = None
+        Float that is the radius of the sakoe chiba window (if using Sakoe-Chiba
+        lower bounding). Must be between 0 and 1.
+    itakura_max_slope: float, defaults = None
+        Gradient of the slope for itakura parallelogram (if using Itakura
+        Parallelogram lower bounding). Must be between 0 and 1.
+    bounding_matrix: np.ndarray (2d array of shape (m1,m2)), defaults = None
+        Custom bounding matrix to use. If defined then other lower_bounding params
+        are ignored. The matrix should be structure so that indexes considered in
+        bound should be the value 0. and indexes outside the bounding matrix should
+        be infinity.
+    return_distance: bool, defaults = True
+        Whether to return the distances to the neighbours.
+    kwargs: Any
+        Extra arguments for dtw, ignored.
+
+    Returns
+    -------
+    dist: np.ndarray (2d array of shape (n, n_neighbors))
+        Dtw distances to the nearest neighbours, in increasing order.
+        Only returned if ``return_distance`` is True.
+    ind: np.ndarray (2d int array of shape (n, n_neighbors))
+        Indices of the nearest neighbours in X2.
+
+    Raises
+    ------
+    ValueError
+        If n_neighbors is larger than the number of series in X2.
+
+    References
+    ----------
+    .. [1] Rakthanmanon, T., Campana, B., Mueen, A., Batista, G., Westover, B.,
+       Zhu, Q., Zakaria, J. and Keogh, E., 2012. Searching and mining trillions of
+       time series subsequences under dynamic time warping. Proceedings of the 18th
+       ACM SIGKDD international conference on Knowledge discovery and data mining.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sktime.distances import dtw_kneighbors
+    >>> X = np.array([[1, 2, 3, 4], [5, 6, 7, 8]])  # 2d array
+    >>> X2 = np.array([[9, 10, 11, 12], [5, 6, 7, 7], [1, 2, 2, 4]])  # 2d array
+    >>> dtw_kneighbors(X, X2, n_neighbors=2)
+    (array([[ 1., 51.],
+           [ 1., 58.]]), array([[2, 1],
+           [1, 0]]))
+    """
+    from sktime.distances._dtw_knn_numba import _dtw_kneighbors
+    from sktime.distances._lower_bounding_numba import (
+        _bounding_matrix_band,
+        _keogh_envelope,
+    )
+    from sktime.distances._numba_utils import _make_3d_series
+    from sktime.distances.lower_bounding import resolve_bounding_matrix
+
+    _X = _make_3d_series(np.asarray(X, dtype="float"))
+    _X2 = _make_3d_series(np.asarray(X2, dtype="float"))
+
+    if n_neighbors > _X2.shape[0]:
+        raise ValueError(
+            f"n_neighbors must be at most the number of series in X2, "
+            f"{_X2.shape[0]}, but found {n_neighbors}"
+        )
+
+    _bounding_matrix = resolve_bounding_matrix(
+        _X[0], _X2[0], window, itakura_max_slope, bounding_matrix
+    )
+    band = _bounding_matrix_band(_bounding_matrix)
+
+    upper = np.empty((_X2.shape[0], _X2.shape[1], _X.shape[2]))
+    lower = np.empty((_X2.shape[0], _X2.shape[1], _X.shape[2]))
+    for i in range(_X2.shape[0]):
+        upper[i], lower[i] = _keogh_envelope(_X2[i], band)
+
+    dist, ind = _dtw_kneighbors(_X, _X2, upper, lower, _bounding_matrix, n_neighbors)
+
+    if return_distance:
+        return dist, ind
+    return ind
+
+
+def _dtw_lb_search_params(distance, algorithm, distance_params=None):
+    """Return dtw parameters for lower bound pruned knn search, if it applies.
+
+    Lower bound pruned search via ``dtw_kneighbors`` applies for ``distance="dtw"``
+    and ``algorithm="brute"``, with ``distance_params`` only setting the bounding
+    window.
+
+    Parameters
+    ----------
+    distance : str or callable
+        ``distance`` parameter of the time series knn estimator.
+    algorithm : str
+        ``algorithm`` parameter of the time series knn estimator.
+    distance_params : dict or None, optional, default = None
+        ``distance_params`` parameter of the time series knn estimator.
+
+    Returns
+    -------
+    dict or None
+        Parameters to pass to ``dtw_kneighbors``, or None if pruned search
+        does not apply.
+    """
+    if distance_params is None:
+        distance_params = {}
+    bounding_params = ["window", "itakura_max_slope", "bounding_matrix"]
+
+    use_lb_search = (
+        isinstance(distance, str)
+        and distance == "dtw"
+        and algorithm == "brute"
+        and set(distance_params).issubset(bounding_params)
+    )
+    if not use_lb_search:
+        return None
+    return distance_params
+
+
+def _knn_distance_to_train(X, X_train, distance, n_neighbors, lb_search_params=None):
+    """Compute distances of X to training data of a time series knn estimator.
+
+    Used by ``KNeighborsTimeSeriesClassifier`` and ``KNeighborsTimeSeriesRegressor``,
+    as input to their ``knn_estimator_``.
+
+    If ``lb_search_params`` is given, only distances to the nearest training
+    series are computed, via ``dtw_kneighbors`` with lower bound pruning,
+    and returned as a sparse neighbours graph, as accepted by ``sklearn``.
+    Otherwise, returns the full distance matrix ``distance(X, X_train)``.
+
+    Parameters
+    ----------
+    X : Panel data container
+        Series to compute distances of.
+    X_train : Panel data container, of same mtype as X
+        Training series to compute distances to.
+    distance : callable (X, X_train) -> 2D np.ndarray of shape (n_instances, n_train)
+        Pairwise distance function, used if ``lb_search_params`` is None.
+    n_neighbors : int
+        Number of nearest neighbours to compute distances to, if the sparse
+        neighbours graph is returned.
+    lb_search_params : dict or None, optional, default = None
+        dtw parameters for lower bound pruned search, as returned by
+        ``_dtw_lb_search_params``. If None, the full distance matrix is returned.
+
+    Returns
+    -------
+    2D np.ndarray or scipy.sparse.csr_matrix of shape (n_instances, n_train)
+    """
+    from scipy.sparse import csr_matrix
+
+    if lb_search_params is None:
+        return distance(X, X_train)
+
+    n_train = len(X_train)
+    n_neighbors = min(n_neighbors, n_train)
+
+    dist, ind = dtw_kneighbors(X, X_train, n_neighbors=n_neighbors, **lb_search_params)
+    n = dist.shape[0]
+    indptr = np.arange(0, n * n_neighbors + 1, n_neighbors)
+    return csr_matrix((dist.ravel(), ind.ravel(), indptr), shape=(n, n_train))
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Isolated numba imports for _dtw_knn."""
+
+import numpy as np
+
+from sktime.distances._dtw_numba import _early_abandon_dtw_distance
+from sktime.distances._lower_bounding_numba import _lb_keogh, _lb_kim
+from sktime.utils.numba.njit import njit
+
+
+@njit(cache=True)
+def _dtw_kneighbors(
+    X: np.ndarray,
+    X2: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    bounding_matrix: np.ndarray,
+    n_neighbors: int,
+):
+    """Find nearest neighbours under dtw, via LB_Kim, LB_Keogh and early abandoning.
+
+    For every series in ``X``, candidates in ``X2`` are visited in order of LB_Kim.
+    Once ``n_neighbors`` candidates have been found, a candidate is pruned if
+    LB_Kim or LB_Keogh is not smaller than the distance of the current
+    ``n_neighbors``-th neighbour, otherwise the dtw distance is computed with
+    early abandoning at that distance.
+
+    Parameters
+    ----------
+    X: np.ndarray (3d array of shape (n, d, m1))
+        Query time series.
+    X2: np.ndarray (3d array of shape (n2, d, m2))
+        Time series to search neighbours in.
+    upper: np.ndarray (3d array of shape (n2, d, m1))
+        Upper LB_Keogh envelopes of the series in X2.
+    lower: np.ndarray (3d array of shape (n2, d, m1))
+        Lower LB_Keogh envelopes of the series in X2.
+    bounding_matrix: np.ndarray (2d array of shape m1xm2)
+        Bounding matrix of the dtw distance.
+    n_neighbors: int
+        Number of neighbours to find, at most n2.
+
+    Returns
+    -------
+    dist: np.ndarray (2d array of shape (n, n_neighbors))
+        Dtw distances to the nearest neighbours, in increasing order.
+    ind: np.ndarray (2d int array of shape (n, n_neighbors))
+        Indices of the nearest neighbours in X2.
+    """
+    n = X.shape[0]
+    n2 = X2.shape[0]
+    dist = np.full((n, n_neighbors), np.inf)
+    ind = np.full((n, n_neighbors), -1, dtype=np.int64)
+    lb_kim = np.empty(n2)
+
+    for q in range(n):
+        x = X[q]
+        for c in range(n2):
+            lb_kim[c] = _lb_kim(x, X2[c])
+        order = np.argsort(lb_kim, kind="mergesort")
+
+        n_found = 0
+        for c in order:
+            if n_found < n_neighbors:
+                threshold = np.inf
+            else:
+                threshold = dist[q, n_neighbors - 1]
+                # candidates are sorted by LB_Kim, so all remaining ones are pruned
+                if lb_kim[c] >= threshold:
+                    break
+                if _lb_keogh(x, upper[c], lower[c], threshold) >= threshold:
+                    continue
+
+            d = _early_abandon_dtw_distance(x, X2[c], bounding_matrix, threshold)
+            if n_found == n_neighbors and d >= threshold:
+                continue
+
+            # insert into sorted neighbours, dropping the current last one if full
+            pos = min(n_found, n_neighbors - 1)
+            while pos > 0 and dist[q, pos - 1] > d:
+                dist[q, pos] = dist[q, pos - 1]
+                ind[q, pos] = ind[q, pos - 1]
+                pos -= 1
+            dist[q, pos] = d
+            ind[q, pos] = c
+            n_found = min(n_found + 1, n_neighbors)
+
+    return dist, ind
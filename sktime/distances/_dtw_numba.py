@@ -61,3 +61,60 @@ def _cost_matrix(
                 )
 
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _early_abandon_dtw_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    threshold: float,
+) -> float:
+    """Dtw distance compiled to no_python, abandoned once exceeding a threshold.
+
+    Computes the dtw cost matrix row by row, keeping only two rows in memory.
+    Since costs do not decrease along a warping path, the distance is at least the
+    minimum of every row, so the computation is abandoned once that reaches
+    ``threshold``.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape dxm1).
+        First time series.
+    y: np.ndarray (2d array of shape dxm2).
+        Second time series.
+    bounding_matrix: np.ndarray (2d array of shape m1xm2)
+        Bounding matrix where the index in bound finite values (0.) and indexes
+        outside bound points are infinite values (non finite).
+    threshold: float
+        Distance at which the computation is abandoned.
+
+    Returns
+    -------
+    float
+        Dtw distance between x and y, equal to ``_cost_matrix(x, y)[-1, -1]``,
+        or np.inf if abandoned.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.full(y_size + 1, np.inf)
+    prev[0] = 0.0
+    curr = np.full(y_size + 1, np.inf)
+
+    for i in range(x_size):
+        curr[:] = np.inf
+        row_min = np.inf
+        for j in range(y_size):
+            if np.isfinite(bounding_matrix[i, j]):
+                sum = 0
+                for k in range(dimensions):
+                    sum += (x[k][i] - y[k][j]) ** 2
+                curr[j + 1] = sum + min(prev[j + 1], curr[j], prev[j])
+                if curr[j + 1] < row_min:
+                    row_min = curr[j + 1]
+        if row_min >= threshold:
+            return np.inf
+        prev, curr = curr, prev
+
+    return prev[y_size]
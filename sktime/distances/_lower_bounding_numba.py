@@ -269,3 +269,108 @@ def numba_create_bounding_matrix(
         bounding_matrix = no_bounding(x, y)
 
     return bounding_matrix
+
+
+@njit(cache=True)
+def _bounding_matrix_band(bounding_matrix: np.ndarray) -> np.ndarray:
+    """Get the in-bound column range of every row of a bounding matrix.
+
+    Parameters
+    ----------
+    bounding_matrix: np.ndarray (2d array of shape m1xm2)
+        Bounding matrix where the index in bound finite values (0.) and indexes
+        outside bound points are infinite values (non finite).
+
+    Returns
+    -------
+    np.ndarray (2d int array of shape m1x2)
+        First and last in-bound column of every row. Rows without in-bound columns
+        have the empty range (0, -1).
+    """
+    x_size, y_size = bounding_matrix.shape
+    band = np.zeros((x_size, 2), dtype=np.int64)
+    for i in range(x_size):
+        band[i, 1] = -1
+        for j in range(y_size):
+            if np.isfinite(bounding_matrix[i, j]):
+                band[i, 0] = j
+                break
+        for j in range(y_size - 1, -1, -1):
+            if np.isfinite(bounding_matrix[i, j]):
+                band[i, 1] = j
+                break
+    return band
+
+
+@njit(cache=True)
+def _keogh_envelope(y: np.ndarray, band: np.ndarray):
+    """Compute upper and lower envelope of a time series, for LB_Keogh.
+
+    Parameters
+    ----------
+    y: np.ndarray (2d array of shape (d, m2))
+        Time series to compute the envelope of.
+    band: np.ndarray (2d int array of shape (m1, 2))
+        In-bound column range of every row of the bounding matrix,
+        as returned by ``_bounding_matrix_band``.
+
+    Returns
+    -------
+    upper: np.ndarray (2d array of shape (d, m1))
+        Maximum of ``y`` over the in-bound range of every row.
+    lower: np.ndarray (2d array of shape (d, m1))
+        Minimum of ``y`` over the in-bound range of every row.
+    """
+    dimensions = y.shape[0]
+    x_size = band.shape[0]
+    upper = np.full((dimensions, x_size), -np.inf)
+    lower = np.full((dimensions, x_size), np.inf)
+    for k in range(dimensions):
+        for i in range(x_size):
+            for j in range(band[i, 0], band[i, 1] + 1):
+                if y[k, j] > upper[k, i]:
+                    upper[k, i] = y[k, j]
+                if y[k, j] < lower[k, i]:
+                    lower[k, i] = y[k, j]
+    return upper, lower
+
+
+@njit(cache=True)
+def _lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    """Lower bound of the dtw distance, from first and last time points.
+
+    Every warping path aligns the first and the last time points of ``x`` and ``y``.
+    """
+    dimensions = x.shape[0]
+    first = 0.0
+    last = 0.0
+    for k in range(dimensions):
+        first += (x[k, 0] - y[k, 0]) ** 2
+        last += (x[k, -1] - y[k, -1]) ** 2
+    if x.shape[1] == 1 and y.shape[1] == 1:
+        return first
+    return first + last
+
+
+@njit(cache=True)
+def _lb_keogh(
+    x: np.ndarray, upper: np.ndarray, lower: np.ndarray, threshold: float
+) -> float:
+    """Lower bound of the dtw distance, from the envelope of the second series.
+
+    Every warping path aligns each time point of ``x`` with at least one in-bound
+    time point of the second series, which lies between ``lower`` and ``upper``.
+    Summation stops early once the bound reaches ``threshold``.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    lb = 0.0
+    for i in range(x_size):
+        for k in range(dimensions):
+            if x[k, i] > upper[k, i]:
+                lb += (x[k, i] - upper[k, i]) ** 2
+            elif x[k, i] < lower[k, i]:
+                lb += (lower[k, i] - x[k, i]) ** 2
+        if lb >= threshold:
+            return lb
+    return lb
@@ -7,6 +7,11 @@ import numpy as np
 
 from sktime.distances.base import DistanceCallable
 from sktime.utils.numba.njit import njit
+from sktime.utils.validation import check_n_jobs
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+if _check_soft_dependencies("numba", severity="none"):
+    from numba import prange
 
 
 @njit(cache=True)
@@ -50,10 +55,22 @@ def _make_3d_series(x: np.ndarray) -> np.ndarray:
 
 
 def _compute_pairwise_distance(
-    x: np.ndarray, y: np.ndarray, symmetric: bool, distance_callable: DistanceCallable
+    x: np.ndarray,
+    y: np.ndarray,
+    symmetric: bool,
+    distance_callable: DistanceCallable,
+    n_jobs: int = 1,
+    out: np.ndarray = None,
+    chunk_size: int = None,
 ) -> np.ndarray:
     """Compute pairwise distance between two numpy arrays.
 
+    The rows of the distance matrix are computed in chunks of ``chunk_size`` rows.
+    The work is only split by rows, there is no tiling of the columns. If ``out`` is
+    not a plain C-contiguous array, each chunk is computed in a temporary array and
+    then written to ``out``, so ``out`` can be a ``np.memmap`` for distance matrices
+    that do not fit in memory.
+
     Parameters
     ----------
     x: np.ndarray (2d or 3d array)
@@ -63,30 +80,107 @@ def _compute_pairwise_distance(
     symmetric: bool
         Boolean that is true when distance_callable(x,y) == distance_callable(y,x).
         Used in some to speed up pairwise computation for symmetric distance functions.
+        If True, only the upper triangle is computed, the lower triangle is mirrored.
     distance_callable: Callable[[np.ndarray, np.ndarray], float]
         No_python distance callable to measure the distance between two 2d numpy
         arrays.
+    n_jobs: int, defaults = 1
+        Number of threads used to compute the rows of a chunk, via numba ``prange``.
+        -1 means using all processors. If not 1, a parallel loop is compiled for
+        ``distance_callable``, which takes a few seconds on the first call.
+    out: np.ndarray (2d of size mxn where m is len(x) and n is len(y)), defaults = None
+        Array to write the pairwise distance matrix to, e.g., a ``np.memmap``.
+        If None, a new array is allocated.
+    chunk_size: int, defaults = None
+        Number of rows of the pairwise distance matrix computed per chunk.
+        If None, all rows are computed in one chunk.
 
     Returns
     -------
     np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
-        Pairwise distance matrix between the two time series.
+        Pairwise distance matrix between the two time series. This is ``out``,
+        if ``out`` was passed.
     """
     _x = _make_3d_series(x)
     _y = _make_3d_series(y)
     x_size = _x.shape[0]
     y_size = _y.shape[0]
 
-    pairwise_matrix = np.zeros((x_size, y_size))
+    if out is None:
+        out = np.zeros((x_size, y_size))
+    elif out.shape != (x_size, y_size):
+        raise ValueError(
+            f"out must be of shape {(x_size, y_size)}, but found {out.shape}"
+        )
+
+    if chunk_size is None:
+        chunk_size = max(x_size, 1)
+    n_jobs = check_n_jobs(n_jobs)
+
+    # plain in-memory arrays are written to directly, others via a temporary chunk
+    write_direct = type(out) is np.ndarray and out.flags["C_CONTIGUOUS"]
+
+    for start in range(0, x_size, chunk_size):
+        stop = min(start + chunk_size, x_size)
+        if write_direct:
+            chunk = out[start:stop]
+        else:
+            chunk = np.zeros((stop - start, y_size))
 
-    for i in range(x_size):
-        curr_x = _x[i]
-        for j in range(y_size):
-            if symmetric and j < i:
-                pairwise_matrix[i, j] = pairwise_matrix[j, i]
-            else:
-                pairwise_matrix[i, j] = distance_callable(curr_x, _y[j])
-    return pairwise_matrix
+        if n_jobs == 1:
+            _pairwise_chunk(_x, _y, distance_callable, chunk, start, symmetric)
+        else:
+            _pairwise_chunk_parallel(
+                _x, _y, distance_callable, chunk, start, symmetric, n_jobs
+            )
+
+        if symmetric:
+            # mirror lower triangle, from previous chunks and from the chunk itself
+            chunk[:, :start] = out[:start, start:stop].T
+            chunk_sq = chunk[:, start:stop]
+            lower = np.tril_indices(stop - start, -1)
+            chunk_sq[lower] = chunk_sq.T[lower]
+
+        if not write_direct:
+            out[start:stop] = chunk
+
+    return out
+
+
+def _pairwise_chunk(x, y, distance_callable, chunk, start, symmetric):
+    """Compute rows ``start`` to ``start + len(chunk)`` of pairwise distance matrix.
+
+    If ``symmetric``, only entries on and above the diagonal are computed.
+    """
+    y_size = y.shape[0]
+    for r in range(chunk.shape[0]):
+        i = start + r
+        curr_x = x[i]
+        j_start = i if symmetric else 0
+        for j in range(j_start, y_size):
+            chunk[r, j] = distance_callable(curr_x, y[j])
+
+
+def _pairwise_chunk_parallel(x, y, distance_callable, chunk, start, symmetric, n_jobs):
+    """Compute rows of pairwise distance matrix in parallel, with n_jobs threads."""
+    from numba import config, get_num_threads, set_num_threads
+
+    n_threads = get_num_threads()
+    set_num_threads(min(n_jobs, config.NUMBA_NUM_THREADS))
+    try:
+        _numba_pairwise_chunk(x, y, distance_callable, chunk, start, symmetric)
+    finally:
+        set_num_threads(n_threads)
+
+
+@njit(parallel=True)
+def _numba_pairwise_chunk(x, y, distance_callable, chunk, start, symmetric):
+    y_size = y.shape[0]
+    for r in prange(chunk.shape[0]):
+        i = start + r
+        j_start = i if symmetric else 0
+        for j in range(j_start, y_size):
+            chunk[r, j] = distance_callable(x[i], y[j])
 
 
 def is_no_python_compiled_callable(
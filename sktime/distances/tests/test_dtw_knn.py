@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lower bound pruned dtw nearest neighbour search."""
+import numpy as np
+import pytest
+
+from sktime.distances import dtw_kneighbors, pairwise_distance
+from sktime.distances.tests._utils import create_test_distance_numpy
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize(
+    "dtw_params", [{}, {"window": 0.1}, {"itakura_max_slope": 0.5}]
+)
+@pytest.mark.parametrize("n_dims", [1, 3])
+def test_dtw_kneighbors(dtw_params, n_dims):
+    """Test pruned dtw neighbour search agrees with full pairwise distances."""
+    X = create_test_distance_numpy(4, n_dims, 30).cumsum(axis=-1)
+    X2 = create_test_distance_numpy(20, n_dims, 30, random_state=2).cumsum(axis=-1)
+
+    dist, ind = dtw_kneighbors(X, X2, n_neighbors=3, **dtw_params)
+    dist_mat = pairwise_distance(X, X2, metric="dtw", **dtw_params)
+
+    np.testing.assert_allclose(dist, np.sort(dist_mat, axis=1)[:, :3])
+    np.testing.assert_allclose(np.take_along_axis(dist_mat, ind, axis=1), dist)
+
+    ind_only = dtw_kneighbors(X, X2, n_neighbors=3, return_distance=False, **dtw_params)
+    np.testing.assert_array_equal(ind, ind_only)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+def test_dtw_kneighbors_too_many_neighbors():
+    """Test that more neighbours than candidates raise an error."""
+    X = create_test_distance_numpy(2, 1, 10)
+    with pytest.raises(ValueError, match="n_neighbors"):
+        dtw_kneighbors(X, X, n_neighbors=3)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+def test_knn_distance_to_train():
+    """Test knn distances to train data only depend on the arguments passed."""
+    from sktime.distances._dtw_knn import (
+        _dtw_lb_search_params,
+        _knn_distance_to_train,
+    )
+
+    X = create_test_distance_numpy(4, 1, 20)
+    X_train = create_test_distance_numpy(6, 1, 20, random_state=2)
+
+    def distance(X, X2):
+        return pairwise_distance(X, X2, metric="euclidean")
+
+    assert _dtw_lb_search_params("euclidean", "brute") is None
+    assert _dtw_lb_search_params("dtw", "kd_tree") is None
+    assert _dtw_lb_search_params("dtw", "brute", {"epsilon": 1}) is None
+    lb_params = _dtw_lb_search_params("dtw", "brute", {"window": 0.2})
+    assert lb_params == {"window": 0.2}
+
+    dist_mat = _knn_distance_to_train(X, X_train, distance, 2)
+    np.testing.assert_array_equal(dist_mat, distance(X, X_train))
+
+    graph = _knn_distance_to_train(X, X_train, distance, 2, lb_params)
+    dist, ind = dtw_kneighbors(X, X_train, n_neighbors=2, window=0.2)
+    assert graph.shape == (4, 6)
+    np.testing.assert_allclose(np.sort(graph.toarray(), axis=1)[:, -2:], dist)
@@ -290,3 +290,29 @@ def test_metric_parameters():
 def test_incorrect_parameters():
     """Ensure incorrect parameters raise errors."""
     _test_incorrect_parameters(pairwise_distance)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("metric", ["dtw", "msm"])
+def test_pairwise_distance_parallel_chunked(metric, tmp_path):
+    """Test parallel and chunked pairwise distance agree with the default."""
+    x = create_test_distance_numpy(7, 1, 10)
+    y = create_test_distance_numpy(5, 1, 10, random_state=2)
+
+    for x2 in [None, y]:
+        expected = pairwise_distance(x, x2, metric=metric)
+
+        parallel = pairwise_distance(x, x2, metric=metric, n_jobs=2)
+        assert np.allclose(expected, parallel)
+
+        out = np.lib.format.open_memmap(
+            str(tmp_path / f"{metric}.npy"), mode="w+", shape=expected.shape
+        )
+        chunked = pairwise_distance(x, x2, metric=metric, chunk_size=3, out=out)
+        assert chunked is out
+        assert np.allclose(expected, np.load(str(tmp_path / f"{metric}.npy")))
+
+    assert _check_symmetric(pairwise_distance(x, metric=metric, chunk_size=2))
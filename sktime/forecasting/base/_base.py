@@ -55,6 +55,7 @@ from sktime.datatypes import (
     scitype_to_mtype,
     update_data,
 )
+from sktime.datatypes._cache import _check_convert_cached
 from sktime.forecasting.base._fh import ForecastingHorizon
 from sktime.utils.datetime import _shift
 from sktime.utils.validation._dependencies import _check_estimator_deps
@@ -101,6 +102,20 @@ class BaseForecaster(BaseEstimator):
         "python_dependencies": None,  # str or list of str, package soft dependencies
     }
 
+    # default config values
+    _config = {
+        "backend:parallel": None,
+        # parallelization backend for broadcasting/vectorization, e.g., over
+        #  instances of a Panel or Hierarchical y, in fit, update, predict-likes
+        # valid values:
+        # None - no parallelization, loop is executed sequentially
+        # "loky", "multiprocessing", "threading" - uses joblib.Parallel
+        # "dask" - uses dask, requires dask to be installed
+        "backend:parallel:params": None,
+        # additional parameters passed to the parallelization backend,
+        #  see sktime.utils.parallel.parallelize for valid keys
+    }
+
     def __init__(self):
         self._is_fitted = False
 
@@ -276,6 +291,7 @@ class BaseForecaster(BaseEstimator):
         else:
             return ColumnSelect(key) ** self
 
+    @_check_convert_cached
     def fit(self, y, X=None, fh=None):
         """Fit forecaster to training data.
 
@@ -355,6 +371,7 @@ class BaseForecaster(BaseEstimator):
 
         return self
 
+    @_check_convert_cached
     def predict(
         self,
         fh=None,
@@ -415,6 +432,7 @@ class BaseForecaster(BaseEstimator):
 
         return y_out
 
+    @_check_convert_cached
     def fit_predict(self, y, X=None, fh=None):
         """Fit and forecast time series at future horizon.
 
@@ -492,6 +510,7 @@ class BaseForecaster(BaseEstimator):
         #  input conversions are skipped since we are using X_inner
         return self.predict(fh=fh, X=X_inner)
 
+    @_check_convert_cached
     def predict_quantiles(self, fh=None, X=None, alpha=None):
         """Compute/return quantile forecasts.
 
@@ -563,6 +582,7 @@ class BaseForecaster(BaseEstimator):
 
         return quantiles
 
+    @_check_convert_cached
     def predict_interval(
         self,
         fh=None,
@@ -640,6 +660,7 @@ class BaseForecaster(BaseEstimator):
 
         return pred_int
 
+    @_check_convert_cached
     def predict_var(self, fh=None, X=None, cov=False):
         """Compute/return variance forecasts.
 
@@ -710,6 +731,7 @@ class BaseForecaster(BaseEstimator):
 
         return pred_var
 
+    @_check_convert_cached
     def predict_proba(self, fh=None, X=None, marginal=True):
         """Compute/return fully probabilistic forecasts.
 
@@ -768,6 +790,7 @@ class BaseForecaster(BaseEstimator):
 
         return pred_dist
 
+    @_check_convert_cached
     def update(self, y, X=None, update_params=True):
         """Update cutoff value and, optionally, fitted parameters.
 
@@ -949,6 +972,7 @@ class BaseForecaster(BaseEstimator):
             reset_forecaster=reset_forecaster,
         )
 
+    @_check_convert_cached
     def update_predict_single(
         self,
         y=None,
@@ -1055,6 +1079,7 @@ class BaseForecaster(BaseEstimator):
 
         return y_pred
 
+    @_check_convert_cached
     def predict_residuals(self, y=None, X=None):
         """Return residuals of time series forecasts.
 
@@ -1724,6 +1749,11 @@ class BaseForecaster(BaseEstimator):
         kwargs["rowname_default"] = "forecasters"
         kwargs["colname_default"] = "forecasters"
 
+        # add parallelization backend, as set in config
+        configs = self.get_config()
+        kwargs["backend"] = configs["backend:parallel"]
+        kwargs["backend_params"] = configs["backend:parallel:params"]
+
         # fit-like methods: write y to self._yvec; then run method; clone first if fit
         if methodname in FIT_METHODS:
             self._yvec = y
@@ -341,3 +341,27 @@ def test_nullable_dtypes(nullable_type):
     assert isinstance(y_pred, pd.Series)
     assert len(y_pred) == 40
     assert y_pred.dtype == "float64"
+
+
+@pytest.mark.parametrize("backend", [None, "loky", "threading"])
+def test_vectorization_parallel_backend(backend):
+    """Test that vectorization with parallel backend config gives same result."""
+    from sktime.forecasting.naive import NaiveForecaster
+
+    y = _make_hierarchical(hierarchy_levels=(2, 4), random_state=84)
+
+    f_seq = NaiveForecaster(strategy="drift")
+    y_pred_seq = f_seq.fit(y, fh=[1, 2, 3]).predict_interval()
+
+    f_par = NaiveForecaster(strategy="drift")
+    f_par.set_config(
+        **{"backend:parallel": backend, "backend:parallel:params": {"n_jobs": 2}}
+    )
+    y_pred_par = f_par.fit(y, fh=[1, 2, 3]).predict_interval()
+
+    assert f_par.forecasters_.shape == f_seq.forecasters_.shape
+    pd.testing.assert_frame_equal(y_pred_seq, y_pred_par)
+
+    # update should also be vectorized, and keep the fitted forecasters aligned
+    f_par.update(y, update_params=False)
+    assert f_par.forecasters_.shape == f_seq.forecasters_.shape
@@ -874,19 +874,25 @@ class _RecursiveReducer(_Reducer):
 
             y_pred = _create_fcst_df(index_range, self._y)
 
-            for i in range(fh_max):
-                # Generate predictions.
-                y_pred_vector = self.estimator_.predict(X_last)
-                y_pred_curr = _create_fcst_df(
-                    [index_range[i]], self._y, fill=y_pred_vector
-                )
-                y_pred.update(y_pred_curr)
-
-                # # Update last window with previous prediction.
-                if i + 1 != fh_max:
-                    y_last, X_last = self._get_shifted_window(
-                        y_update=y_pred, X_update=X, shift=i + 1
+            # default lag features can be shifted in numpy, for all instances at once
+            if self.transformers is None:
+                y_pred_values = self._predict_global_lags(X_last, index_range, X=X)
+                y_pred.loc[:] = y_pred_values.reshape(y_pred.shape)
+            # custom transformers need to be re-applied to y after every step
+            else:
+                for i in range(fh_max):
+                    # Generate predictions.
+                    y_pred_vector = self.estimator_.predict(X_last)
+                    y_pred_curr = _create_fcst_df(
+                        [index_range[i]], self._y, fill=y_pred_vector
                     )
+                    y_pred.update(y_pred_curr)
+
+                    # # Update last window with previous prediction.
+                    if i + 1 != fh_max:
+                        y_last, X_last = self._get_shifted_window(
+                            y_update=y_pred, X_update=X, shift=i + 1
+                        )
         else:
             # Pre-allocate arrays.
             if X is None:
@@ -940,6 +946,63 @@ class _RecursiveReducer(_Reducer):
 
         return y_return
 
+    def _predict_global_lags(self, X_last, index_range, X=None):
+        """Recursively predict all instances from default lag features, in numpy.
+
+        Applies only if ``transformers`` is None, i.e., if the features of the
+        estimator are the lags 1 to ``window_length_`` of ``y``, followed by ``X``.
+        Lags for the next step are obtained by shifting the lag matrix by one and
+        inserting the latest prediction, so every step is a single 2D design matrix
+        and a single call of ``estimator_.predict``, for all instances in the panel.
+
+        Parameters
+        ----------
+        X_last : pd.DataFrame
+            design matrix of the first step, one row per instance,
+            as returned by ``_get_shifted_window`` with ``shift=0``
+        index_range : pd.Index
+            time index of the steps to predict, from cutoff + 1 to largest fh
+        X : pd.DataFrame, optional (default=None)
+            Exogenous time series, passed to predict
+
+        Returns
+        -------
+        y_pred : np.ndarray of shape (n_instances, len(index_range))
+            predictions, instances in the same order as rows of ``X_last``
+        """
+        window_length = self.window_length_
+        n_steps = len(index_range)
+        cols = X_last.columns
+
+        lags = X_last.iloc[:, :window_length].to_numpy(dtype="float64")
+        n_instances = lags.shape[0]
+
+        has_X = X_last.shape[1] > window_length
+        if has_X:
+            X_future = _create_fcst_df(index_range, self._X)
+            X_future.update(self._X)
+            if X is not None:
+                X_future.update(X)
+            X_future = X_future[cols[window_length:]].to_numpy(dtype="float64")
+            X_future = X_future.reshape(n_instances, n_steps, -1)
+
+        y_pred = np.empty((n_instances, n_steps))
+        X_pred = X_last
+
+        for i in range(n_steps):
+            y_pred[:, i] = np.asarray(self.estimator_.predict(X_pred)).ravel()
+
+            # shift lags by one, latest prediction becomes lag 1
+            lags[:, 1:] = lags[:, :-1].copy()
+            lags[:, 0] = y_pred[:, i]
+            if i + 1 < n_steps:
+                X_pred = lags
+                if has_X:
+                    X_pred = np.concatenate([lags, X_future[:, i + 1, :]], axis=1)
+                X_pred = pd.DataFrame(X_pred, index=X_last.index, columns=cols)
+
+        return y_pred
+
 
 class _DirRecReducer(_Reducer):
     strategy = "dirrec"
@@ -2186,6 +2249,8 @@ class RecursiveReductionForecaster(BaseForecaster, _ReducerMixin):
         # lag is 1, since we want to do recursive forecasting with 1 step ahead
         lag_plus = Lag(lags=1, index_out="extend")
         Xtt = lag_plus.fit_transform(Xt)
+        # remember lag feature names, these are reused by the array predict loop
+        self._lag_cols = [str(x) for x in Xtt.columns]
         Xtt_notna_idx = _get_notna_idx(Xtt)
         notna_idx = Xtt_notna_idx.intersection(y.index)
 
@@ -2254,7 +2319,106 @@ class RecursiveReductionForecaster(BaseForecaster, _ReducerMixin):
         return y_pred
 
     def _predict_out_of_sample(self, X_pool, fh):
-        """Recursive reducer: predict out of sample (ahead of cutoff)."""
+        """Recursive reducer: predict out of sample (ahead of cutoff).
+
+        Dispatches to ``_predict_out_of_sample_array`` if the last ``window_length``
+        observations of all instances are available without gaps at the cutoff,
+        otherwise to ``_predict_out_of_sample_pandas``, which imputes missing lags.
+        """
+        y_window = self._get_last_window()
+        if y_window is None:
+            return self._predict_out_of_sample_pandas(X_pool, fh)
+        return self._predict_out_of_sample_array(X_pool, fh, y_window)
+
+    def _get_last_window(self):
+        """Get last ``window_length`` values of all instances, as 3D np.ndarray.
+
+        Returns
+        -------
+        y_window : 3D np.ndarray (n_instances, window_length, n_variables), or None
+            values of ``self._y`` at the ``window_length`` time points up to the cutoff,
+            instances in order of ``self._y``, time in increasing order.
+            None if any of these values is missing, e.g., due to gaps in the index,
+            instances not ending at the cutoff, or nans in ``self._y``.
+        """
+        window_length = self.window_length
+        window_rel = ForecastingHorizon(
+            list(range(1 - window_length, 1)), is_relative=True, freq=self._cutoff
+        )
+        window_idx = window_rel.to_absolute_index(self._cutoff)
+        window_idx = self._get_expected_pred_idx(fh=window_idx)
+
+        y = self._y
+        if not window_idx.isin(y.index).all():
+            return None
+        y_window = y.loc[window_idx].to_numpy(dtype="float64")
+        if np.isnan(y_window).any():
+            return None
+
+        return y_window.reshape(-1, window_length, y.shape[1])
+
+    def _predict_out_of_sample_array(self, X_pool, fh, y_window):
+        """Recursive reducer: predict out of sample, using a numpy ring buffer.
+
+        Keeps only the last ``window_length`` values per instance in a ring buffer,
+        so every step costs O(window_length), independent of the length of ``y``.
+        All instances are predicted in a single call of ``estimator.predict`` per step.
+        """
+        fh_idx = self._get_expected_pred_idx(fh=fh)
+        y_cols = self._y.columns
+        n_inst, window_length, n_vars = y_window.shape
+
+        fh_rel = fh.to_relative(self.cutoff)
+        y_lags_no_gaps = range(1, fh_rel[-1] + 1)
+        y_abs_no_gaps = ForecastingHorizon(
+            list(y_lags_no_gaps), is_relative=True, freq=self._cutoff
+        )
+        y_abs_no_gaps = y_abs_no_gaps.to_absolute_index(self._cutoff)
+        n_steps = len(y_abs_no_gaps)
+        pred_idx = self._get_expected_pred_idx(fh=y_abs_no_gaps)
+
+        if X_pool is not None:
+            X_cols = [str(x) for x in X_pool.columns]
+            X_pred = X_pool.reindex(pred_idx).to_numpy()
+            X_pred = X_pred.reshape(n_inst, n_steps, -1)
+        else:
+            X_cols = []
+
+        estimator = self.estimator_
+        feature_cols = X_cols + self._lag_cols
+
+        # ring buffer, newest value at position pos, lag k at position pos - k
+        ring = y_window.copy()
+        pos = window_length - 1
+        lag_order = np.arange(window_length)
+        y_pred = np.empty((n_inst, n_steps, n_vars))
+
+        for i in range(n_steps):
+            # if = no training indices in _fit, fill in y training mean
+            if isinstance(estimator, pd.Series):
+                y_pred_i = np.tile(estimator.to_numpy(dtype="float64"), (n_inst, 1))
+            # otherwise proceed as per recursive reduction algorithm
+            else:
+                lags = ring[:, (pos - lag_order) % window_length, :]
+                Xtt_predrows = lags.reshape(n_inst, -1)
+                if X_pool is not None:
+                    Xtt_predrows = np.concatenate([X_pred[:, i, :], Xtt_predrows], 1)
+                Xtt_predrows = pd.DataFrame(Xtt_predrows, columns=feature_cols)
+                y_pred_i = estimator.predict(Xtt_predrows)
+                y_pred_i = np.asarray(y_pred_i).reshape(n_inst, n_vars)
+
+            y_pred[:, i, :] = y_pred_i
+            pos = (pos + 1) % window_length
+            ring[:, pos, :] = y_pred_i
+
+        y_pred = y_pred.reshape(n_inst * n_steps, n_vars)
+        y_pred = pd.DataFrame(y_pred, columns=y_cols, index=pred_idx)
+        y_pred = y_pred.loc[fh_idx]
+
+        return y_pred
+
+    def _predict_out_of_sample_pandas(self, X_pool, fh):
+        """Recursive reducer: predict out of sample, via Lag and Imputer on y."""
         # very similar to _predict_concurrent of DirectReductionForecaster - refactor?
         from sktime.transformations.series.impute import Imputer
         from sktime.transformations.series.lag import Lag
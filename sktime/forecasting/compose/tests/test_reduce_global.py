@@ -316,3 +316,67 @@ def test_nofreq_pass():
     np.testing.assert_almost_equal(
         y_pred_global["c0"].values, y_pred_nofreq["c0"].values
     )
+
+
+def test_recursive_reduction_array_vs_pandas():
+    """Test that array and pandas predict loops of recursive reduction agree."""
+    from sktime.forecasting.compose._reduce import RecursiveReductionForecaster
+
+    fh = ForecastingHorizon([1, 2, 5, 12], is_relative=True)
+    forecaster = RecursiveReductionForecaster(LinearRegression(), window_length=10)
+    forecaster.fit(y_train)
+
+    y_pred_array = forecaster.predict(fh=fh)
+    y_pred_pandas = forecaster._predict_out_of_sample_pandas(None, fh)
+
+    np.testing.assert_allclose(y_pred_array.values, y_pred_pandas.values.flatten())
+
+
+def test_recursive_reduction_global_batched():
+    """Test recursive reduction with global pooling predicts all instances at once."""
+    from sktime.forecasting.compose._reduce import RecursiveReductionForecaster
+
+    fh = [1, 2, 5, 12]
+    kwargs = {"estimator": LinearRegression(), "window_length": 10}
+
+    forecaster = RecursiveReductionForecaster(pooling="global", **kwargs)
+    y_pred_grp = forecaster.fit(y_train_grp).predict(fh=fh)
+
+    # both instances are identical to y_train, so predictions should agree
+    forecaster = RecursiveReductionForecaster(pooling="local", **kwargs)
+    y_pred = forecaster.fit(y_train).predict(fh=fh)
+
+    assert len(y_pred_grp) == 2 * len(fh)
+    for inst in [0, 1]:
+        np.testing.assert_allclose(
+            y_pred_grp.loc[inst].values.flatten(), y_pred.values.flatten()
+        )
+
+
+def test_recursive_global_lags_vs_transformers():
+    """Test batched default lags agree with recursion over explicit transformers."""
+    y = _make_hierarchical((2, 3), min_timepoints=20, max_timepoints=20)
+    X = _make_hierarchical((2, 3), min_timepoints=26, max_timepoints=26, n_columns=2)
+    X_train = X.groupby(level=[0, 1]).head(20)
+    X_test = X.groupby(level=[0, 1]).tail(6)
+    fh = [1, 3, 6]
+
+    forecaster = make_reduction(
+        LinearRegression(), window_length=4, strategy="recursive", pooling="global"
+    )
+    forecaster.fit(y, X=X_train)
+    y_pred_lags = forecaster.predict(fh=fh, X=X_test)
+
+    kwargs = {"lag_feature": {"lag": [1, 2, 3, 4]}}
+    forecaster = make_reduction(
+        LinearRegression(),
+        window_length=None,
+        strategy="recursive",
+        transformers=[WindowSummarizer(**kwargs, n_jobs=1)],
+        pooling="global",
+    )
+    forecaster.fit(y, X=X_train)
+    y_pred_trafo = forecaster.predict(fh=fh, X=X_test)
+
+    assert len(y_pred_lags) == 6 * len(fh)
+    np.testing.assert_allclose(y_pred_lags.values, y_pred_trafo.values)
@@ -8,17 +8,18 @@ Code based partially on NaiveVariance by ilyasmoutawwakil.
 __all__ = ["ConformalIntervals"]
 __author__ = ["fkiraly", "bethrice44"]
 
+import warnings
 from math import floor
 from warnings import warn
 
 import numpy as np
 import pandas as pd
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import clone
 
 from sktime.datatypes import convert, convert_to
 from sktime.datatypes._utilities import get_slice
-from sktime.forecasting.base import BaseForecaster
+from sktime.forecasting.base import BaseForecaster, ForecastingHorizon
 
 
 class ConformalIntervals(BaseForecaster):
@@ -64,12 +65,24 @@ class ConformalIntervals(BaseForecaster):
     sample_frac : float, optional, default=None
         value in range (0,1) corresponding to fraction of y index to calculate
         residuals matrix values for (for speeding up calculation)
+    max_cutoffs : int or None, optional, default=None
+        maximum number of sliding window residuals kept per forecasting horizon,
+        from the most recent cutoffs; bounds memory and compute of fit and update.
+        If None, residuals from all cutoffs are kept.
     verbose : bool, optional, default=False
         whether to print warnings if windows with too few data points occur
     n_jobs : int or None, optional, default=1
         The number of jobs to run in parallel for fit.
         -1 means using all processors.
 
+    Attributes
+    ----------
+    residuals_matrix_ : pd.DataFrame, only available if fh is passed in fit
+        sliding window residuals used for the intervals, row index are the cutoffs
+        the residuals were computed for, column index is y.index from the first
+        cutoff. [i,j]-th entry is signed residual of forecasting y.loc[j] from
+        y.loc[:i], for j up to max(fh) steps after i, NaN otherwise.
+
     References
     ----------
     .. [1] Kamile Stankeviciute, Ahmed M Alaa and Mihaela van der Schaar.
@@ -140,6 +153,7 @@ class ConformalIntervals(BaseForecaster):
         method="empirical",
         initial_window=None,
         sample_frac=None,
+        max_cutoffs=None,
         verbose=False,
         n_jobs=None,
     ):
@@ -157,8 +171,8 @@ class ConformalIntervals(BaseForecaster):
         self.verbose = verbose
         self.initial_window = initial_window
         self.sample_frac = sample_frac
+        self.max_cutoffs = max_cutoffs
         self.n_jobs = n_jobs
-        self.forecasters_ = []
 
         super(ConformalIntervals, self).__init__()
 
@@ -179,12 +193,13 @@ class ConformalIntervals(BaseForecaster):
         self.forecaster_.fit(y=y, X=X, fh=fh)
 
         if self.fh_early_:
-            self.residuals_matrix_ = self._compute_sliding_residuals(
+            self._residuals = self._compute_sliding_residuals(
                 y=y,
                 X=X,
                 forecaster=self.forecaster,
                 initial_window=self.initial_window,
                 sample_frac=self.sample_frac,
+                n_offsets=_get_n_offsets(fh.to_relative(self.cutoff)),
             )
 
         return self
@@ -192,17 +207,24 @@ class ConformalIntervals(BaseForecaster):
     def _predict(self, fh, X=None):
         return self.forecaster_.predict(fh=fh, X=X)
 
+    @property
+    def residuals_matrix_(self):
+        """Sliding window residuals, as pd.DataFrame of cutoffs x time points."""
+        if not getattr(self, "fh_early_", False):
+            raise AttributeError(
+                "residuals_matrix_ is only available after fit with fh passed"
+            )
+        y_index = convert_to(self._y, "pd.Series").index
+        cutoffs, residuals = self._residuals.get_matrix(len(y_index))
+        columns = y_index[len(y_index) - residuals.shape[1] :]
+        return pd.DataFrame(residuals, index=y_index[cutoffs], columns=columns)
+
     def _update(self, y, X=None, update_params=True):
         self.forecaster_.update(y, X, update_params=update_params)
 
-        if update_params and len(y.index.difference(self.residuals_matrix_.index)) > 2:
-            self.residuals_matrix_ = self._compute_sliding_residuals(
-                y,
-                X,
-                self.forecaster_,
-                self.initial_window,
-                self.sample_frac,
-                update=True,
+        if self.fh_early_:
+            self._update_sliding_residuals(
+                y=self._y, X=self._X, update_params=update_params
             )
 
     def _predict_interval(self, fh, X=None, coverage=None):
@@ -248,14 +270,16 @@ class ConformalIntervals(BaseForecaster):
         fh_absolute_idx = fh_absolute.to_pandas()
 
         if self.fh_early_:
-            residuals_matrix = self.residuals_matrix_
+            sliding_residuals = self._residuals
         else:
-            residuals_matrix = self._compute_sliding_residuals(
+            sliding_residuals = self._compute_sliding_residuals(
                 y=self._y,
                 X=self._X,
                 forecaster=self.forecaster,
                 initial_window=self.initial_window,
                 sample_frac=self.sample_frac,
+                n_offsets=_get_n_offsets(fh_relative),
+                keep_forecaster=False,
             )
 
         ABS_RESIDUAL_BASED = ["conformal", "conformal_bonferroni", "empirical_residual"]
@@ -263,8 +287,7 @@ class ConformalIntervals(BaseForecaster):
         cols = pd.MultiIndex.from_product([["Coverage"], coverage, ["lower", "upper"]])
         pred_int = pd.DataFrame(index=fh_absolute_idx, columns=cols)
         for fh_ind, offset in zip(fh_absolute, fh_relative):
-            resids = np.diagonal(residuals_matrix, offset=offset)
-            resids = resids[~np.isnan(resids)]
+            resids = sliding_residuals.get_residuals(offset)
             abs_resids = np.abs(resids)
             coverage2 = np.repeat(coverage, 2)
             if self.method == "empirical":
@@ -365,14 +388,28 @@ class ConformalIntervals(BaseForecaster):
         return n_initial_window
 
     def _compute_sliding_residuals(
-        self, y, X, forecaster, initial_window, sample_frac, update=False
+        self,
+        y,
+        X,
+        forecaster,
+        initial_window,
+        sample_frac,
+        n_offsets,
+        keep_forecaster=True,
     ):
         """Compute sliding residuals used in uncertainty estimates.
 
+        Residuals are computed by fitting a clone of forecaster once, at the first
+        cutoff, and updating it from cutoff to cutoff. If n_jobs is not 1, the cutoffs
+        are split in contiguous chunks, each with its own clone. Each clone replays
+        the fit and updates at cutoffs before its chunk without forecasting, so
+        residuals do not depend on n_jobs, also for forecasters whose update does
+        not refit.
+
         Parameters
         ----------
         y : pd.Series or pd.DataFrame
-            sktime compatible time series to use in computing residuals matrix
+            sktime compatible time series to use in computing residuals
         X : pd.DataFrame
             sktime compatible exogeneous time series to use in forecasts
         forecaster : sktime compatible forecaster
@@ -385,106 +422,95 @@ class ConformalIntervals(BaseForecaster):
             initial window.
             If None, the value is set to the larger of 0.1*len(y) and 10
         sample_frac : float
-            for speeding up computing of residuals matrix.
+            for speeding up computing of residuals.
             sample value in range (0, 1) to obtain a fraction of y indices to
-            compute residuals matrix for
-        update : bool
-            Whether residuals_matrix has been calculated previously and just
-            needs extending. Default = False
+            compute residuals for
+        n_offsets : int
+            number of offsets from the cutoffs to compute residuals for
+        keep_forecaster : bool, optional, default=True
+            whether to keep the clone fitted to the last cutoff, for extending
+            the residuals in update
+
         Returns
         -------
-        residuals_matrix : pd.DataFrame, row and column index = y.index[initial_window:]
-            [i,j]-th entry is signed residual of forecasting y.loc[j] from y.loc[:i],
-            using a clone of the forecaster passed through the forecaster arg.
-            if sample_frac is passed this will have NaN values for 1 - sample_frac
-            fraction of the matrix
+        sliding_residuals : _SlidingResiduals
+            residuals at offsets 0, ..., n_offsets - 1 from cutoffs y.index[i],
+            i.e., of forecasting y.iloc[i + offset] from y.iloc[:i],
+            for cutoffs i in y.index[initial_window:], or a sample thereof
         """
         y = convert_to(y, "pd.Series")
 
         n_initial_window = self._parse_initial_window(y, initial_window=initial_window)
 
-        full_y_index = y.iloc[n_initial_window:].index
+        sliding_residuals = _SlidingResiduals(n_offsets, max_cutoffs=self.max_cutoffs)
+        cutoffs = sliding_residuals.get_cutoffs(n_initial_window, len(y), sample_frac)
+        n_chunks = max(min(effective_n_jobs(self.n_jobs), len(cutoffs)), 1)
+        chunks = np.array_split(np.arange(len(cutoffs)), n_chunks)
+        chunks = [chunk for chunk in chunks if len(chunk)]
 
-        residuals_matrix = pd.DataFrame(
-            columns=full_y_index, index=full_y_index, dtype="float"
+        results = Parallel(n_jobs=self.n_jobs)(
+            delayed(_sliding_forecasts)(
+                forecaster.clone(),
+                y,
+                X,
+                cutoffs[: chunk[-1] + 1],
+                n_offsets,
+                predict_from=chunk[0],
+            )
+            for chunk in chunks
         )
+        for chunk, (_, y_preds) in zip(chunks, results):
+            for cutoff, y_pred in zip(cutoffs[chunk], y_preds):
+                sliding_residuals.add(cutoff, y_pred)
+        sliding_residuals.fill(y.values)
 
-        if update and hasattr(self, "residuals_matrix_") and not sample_frac:
-            remaining_y_index = full_y_index.difference(self.residuals_matrix_.index)
-            if len(remaining_y_index) != len(full_y_index):
-                overlapping_index = pd.Index(
-                    self.residuals_matrix_.index.intersection(full_y_index)
-                ).sort_values()
-                residuals_matrix.loc[
-                    overlapping_index, overlapping_index
-                ] = self.residuals_matrix_.loc[overlapping_index, overlapping_index]
-            else:
-                overlapping_index = None
-            y_index = remaining_y_index
-        else:
-            y_index = full_y_index
-            overlapping_index = None
+        sliding_residuals.n_timepoints = len(y)
+        if keep_forecaster and len(results) > 0:
+            sliding_residuals.forecaster = results[-1][0]
+            sliding_residuals.train_end = cutoffs[-1]
 
-        if sample_frac:
-            y_sample = y_index.to_series().sample(frac=sample_frac)
-            if len(y_sample) > 2:
-                y_index = y_sample
+        return sliding_residuals
 
-        def _get_residuals_matrix_row(forecaster, y, X, id):
-            y_train = get_slice(y, start=None, end=id)  # subset on which we fit
-            y_test = get_slice(y, start=id, end=None)  # subset on which we predict
+    def _update_sliding_residuals(self, y, X, update_params=True):
+        """Extend sliding residuals to new data, by updating the sliding forecaster.
 
-            X_train = get_slice(X, start=None, end=id)
-            X_test = get_slice(X, start=id, end=None)
-            forecaster.fit(y_train, X=X_train, fh=y_test.index)
-            # Append fitted forecaster to list for extending for update
-            self.forecasters_.append({"id": str(id), "forecaster": forecaster})
+        Residuals of forecasts made at previous cutoffs are filled in, and if
+        update_params is True, forecasts are made at cutoffs in the new data.
 
-            try:
-                residuals = forecaster.predict_residuals(y_test, X_test)
-            except IndexError:
-                warn(
-                    f"Couldn't predict after fitting on time series of length \
-                                 {len(y_train)}.\n"
-                )
-            return residuals
+        Parameters
+        ----------
+        y : pd.Series or pd.DataFrame
+            all data seen so far, including the update
+        X : pd.DataFrame
+            all exogeneous data seen so far, including the update
+        update_params : bool, optional, default=True
+            whether to compute residuals for new cutoffs
+        """
+        y = convert_to(y, "pd.Series")
+        sliding_residuals = self._residuals
 
-        all_residuals = Parallel(n_jobs=self.n_jobs)(
-            delayed(_get_residuals_matrix_row)(forecaster.clone(), y, X, id)
-            for id in y_index
-        )
-        for idx, id in enumerate(y_index):
-            residuals_matrix.loc[id] = all_residuals[idx]
-
-        if overlapping_index is not None:
-
-            def _extend_residuals_matrix_row(y, X, id):
-                forecasters_df = pd.DataFrame(self.forecasters_)
-                forecaster_to_extend = forecasters_df.loc[
-                    forecasters_df["id"] == str(id)
-                ]["forecaster"].values[0]
-
-                y_test = get_slice(y, start=id, end=None)
-                X_test = get_slice(X, start=id, end=None)
-
-                try:
-                    residuals = forecaster_to_extend.predict_residuals(y_test, X_test)
-                except IndexError:
-                    warn(
-                        f"Couldn't predict with existing forecaster for cutoff {id} \
-                         with existing forecaster.\n"
-                    )
-                return residuals
-
-            extend_residuals = Parallel(n_jobs=self.n_jobs)(
-                delayed(_extend_residuals_matrix_row)(y, X, id)
-                for id in overlapping_index
+        if update_params and len(y) > sliding_residuals.n_timepoints:
+            cutoffs = sliding_residuals.get_cutoffs(
+                sliding_residuals.n_timepoints, len(y), self.sample_frac
             )
+            forecaster = sliding_residuals.forecaster
+            if forecaster is None:
+                forecaster = self.forecaster.clone()
+            forecaster, y_preds = _sliding_forecasts(
+                forecaster,
+                y,
+                X,
+                cutoffs,
+                sliding_residuals.n_offsets,
+                train_end=sliding_residuals.train_end,
+            )
+            for cutoff, y_pred in zip(cutoffs, y_preds):
+                sliding_residuals.add(cutoff, y_pred)
+            sliding_residuals.n_timepoints = len(y)
+            sliding_residuals.forecaster = forecaster
+            sliding_residuals.train_end = cutoffs[-1]
 
-            for idx, id in enumerate(overlapping_index):
-                residuals_matrix.loc[id] = extend_residuals[idx]
-
-        return residuals_matrix
+        sliding_residuals.fill(y.values)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -503,6 +529,198 @@ class ConformalIntervals(BaseForecaster):
         from sktime.forecasting.naive import NaiveForecaster
 
         FORECASTER = NaiveForecaster()
-        params_list = {"forecaster": FORECASTER}
+        params_list = [
+            {"forecaster": FORECASTER},
+            {"forecaster": FORECASTER, "max_cutoffs": 5},
+        ]
 
         return params_list
+
+
+def _get_n_offsets(fh_relative):
+    """Return number of offsets from cutoffs to store residuals for, given fh."""
+    return int(max(np.max(fh_relative), 0)) + 1
+
+
+def _sliding_forecasts(
+    forecaster, y, X, cutoffs, n_offsets, train_end=None, predict_from=0
+):
+    """Forecast from consecutive cutoffs, by fitting once and then updating.
+
+    Parameters
+    ----------
+    forecaster : sktime forecaster
+        unfitted if train_end is None, otherwise fitted to y.iloc[:train_end]
+    y : pd.Series, time series to forecast
+    X : pd.DataFrame or None, exogeneous time series
+    cutoffs : 1D np.ndarray of int, increasing
+        positions i in y, forecasts are made from y.iloc[:i]
+    n_offsets : int
+        number of forecasts per cutoff, of y.iloc[i], ..., y.iloc[i + n_offsets - 1]
+    train_end : int or None, optional, default=None
+        position in y up to which forecaster is fitted, None if unfitted
+    predict_from : int, optional, default=0
+        index of the first cutoff in cutoffs to forecast from, the forecaster is
+        only fitted or updated at cutoffs before it
+
+    Returns
+    -------
+    forecaster : forecaster, fitted to y.iloc[:cutoffs[-1]]
+    y_preds : list of 1D np.ndarray of length n_offsets, forecasts per cutoff
+        in cutoffs[predict_from:], np.nan where no forecast could be made
+    """
+    fh = ForecastingHorizon(np.arange(1, n_offsets + 1), is_relative=True)
+
+    y_preds = []
+    # the base class warns on every update of forecasters that refit on update
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="NotImplementedWarning")
+        for i, cutoff in enumerate(cutoffs):
+            cutoff_id = y.index[cutoff]
+            if train_end is None:
+                X_train = get_slice(X, start=None, end=cutoff_id)
+                forecaster.fit(y.iloc[:cutoff], X=X_train, fh=fh)
+            elif cutoff > train_end:
+                X_new = get_slice(X, start=y.index[train_end], end=cutoff_id)
+                forecaster.update(y.iloc[train_end:cutoff], X=X_new)
+            train_end = cutoff
+            if i < predict_from:
+                continue
+
+            y_pred = np.full(n_offsets, np.nan)
+            fh_pred = fh
+            X_test = get_slice(X, start=cutoff_id, end=None)
+            if X_test is not None:
+                # exogeneous data is only available up to the end of y
+                fh_pred = fh[: min(n_offsets, len(y) - cutoff)]
+            try:
+                y_pred_cutoff = forecaster.predict(fh=fh_pred, X=X_test)
+                y_pred[: len(fh_pred)] = np.asarray(y_pred_cutoff).ravel()
+            except (IndexError, ValueError):
+                warn(
+                    f"Couldn't predict after fitting on time series of length \
+                                 {cutoff}.\n"
+                )
+            y_preds.append(y_pred)
+
+    return forecaster, y_preds
+
+
+class _SlidingResiduals:
+    """Ring buffer of sliding window forecasts and residuals, one row per cutoff.
+
+    Row for cutoff position i holds forecasts of y.iloc[i + offset] from y.iloc[:i],
+    for offset in 0, ..., n_offsets - 1, and their residuals once observed.
+    Rows of the last max_cutoffs + n_offsets - 1 cutoffs are kept, so that residuals
+    from max_cutoffs cutoffs are observed at every offset.
+
+    Parameters
+    ----------
+    n_offsets : int, number of offsets from the cutoff per row
+    max_cutoffs : int or None, optional, default=None
+        number of residuals kept per offset, if None, the buffer grows as
+        cutoffs are added
+
+    Attributes
+    ----------
+    n_timepoints : int, number of time points of y the residuals were computed on
+    forecaster : forecaster fitted to y.iloc[:train_end], for extending by update
+    train_end : int, position of the last cutoff
+    """
+
+    def __init__(self, n_offsets, max_cutoffs=None):
+        self.n_offsets = n_offsets
+        self.max_cutoffs = max_cutoffs
+        self.n_added = 0
+        self.n_timepoints = 0
+        self.forecaster = None
+        self.train_end = None
+
+        if max_cutoffs is not None:
+            size = max_cutoffs + n_offsets - 1
+        else:
+            size = 16
+        self.cutoffs = np.full(size, -1, dtype=np.int64)
+        self.y_pred = np.full((size, n_offsets), np.nan)
+        self.residuals = np.full((size, n_offsets), np.nan)
+
+    def get_cutoffs(self, start, stop, sample_frac=None):
+        """Return positions of cutoffs in range(start, stop) to add forecasts for.
+
+        A fraction sample_frac of cutoffs is sampled if sample_frac is passed,
+        cutoffs that would be overwritten in the buffer are not returned.
+        """
+        cutoffs = np.arange(start, stop)
+
+        if sample_frac:
+            cutoffs_sample = pd.Series(cutoffs).sample(frac=sample_frac)
+            if len(cutoffs_sample) > 2:
+                cutoffs = np.sort(cutoffs_sample.values)
+
+        if self.max_cutoffs is not None:
+            cutoffs = cutoffs[-len(self.cutoffs) :]
+
+        return cutoffs
+
+    def add(self, cutoff, y_pred):
+        """Add forecasts y_pred from cutoff position, overwriting the oldest row."""
+        size = len(self.cutoffs)
+        if self.max_cutoffs is None and self.n_added == size:
+            self.cutoffs = np.concatenate([self.cutoffs, np.full(size, -1)])
+            self.y_pred = np.concatenate(
+                [self.y_pred, np.full_like(self.y_pred, np.nan)]
+            )
+            self.residuals = np.concatenate(
+                [self.residuals, np.full_like(self.residuals, np.nan)]
+            )
+            size = 2 * size
+        row = self.n_added % size
+        self.cutoffs[row] = cutoff
+        self.y_pred[row] = y_pred
+        self.residuals[row] = np.nan
+        self.n_added += 1
+
+    def fill(self, y_values):
+        """Fill in residuals of forecasts whose targets are observed in y_values."""
+        targets = self.cutoffs[:, None] + np.arange(self.n_offsets)
+        pending = (
+            (self.cutoffs[:, None] >= 0)
+            & (targets < len(y_values))
+            & np.isnan(self.residuals)
+            & ~np.isnan(self.y_pred)
+        )
+        self.residuals[pending] = y_values[targets[pending]] - self.y_pred[pending]
+
+    def get_matrix(self, n_timepoints):
+        """Return residuals as matrix of cutoffs x positions in y, NaN if not stored.
+
+        Parameters
+        ----------
+        n_timepoints : int, length of y the residuals are taken from
+
+        Returns
+        -------
+        cutoffs : 1D np.ndarray of int, sorted positions of the cutoffs in y
+        residuals : 2D np.ndarray of shape (len(cutoffs), n_timepoints - cutoffs[0])
+            [i,j]-th entry is residual at position cutoffs[0] + j from cutoffs[i]
+        """
+        rows = np.argsort(self.cutoffs)
+        rows = rows[self.cutoffs[rows] >= 0]
+        cutoffs = self.cutoffs[rows]
+        start = cutoffs[0] if len(cutoffs) else n_timepoints
+        residuals = np.full((len(cutoffs), n_timepoints - start), np.nan)
+        cols = cutoffs[:, None] - start + np.arange(self.n_offsets)
+        in_range = cols < residuals.shape[1]
+        row_idx = np.broadcast_to(np.arange(len(cutoffs))[:, None], cols.shape)
+        residuals[row_idx[in_range], cols[in_range]] = self.residuals[rows][in_range]
+        return cutoffs, residuals
+
+    def get_residuals(self, offset):
+        """Return observed residuals at offset from the cutoffs, as 1D np.ndarray."""
+        if offset < 0 or offset >= self.n_offsets:
+            return np.array([])
+        residuals = self.residuals[np.argsort(self.cutoffs), offset]
+        residuals = residuals[~np.isnan(residuals)]
+        if self.max_cutoffs is not None:
+            residuals = residuals[-self.max_cutoffs :]
+        return residuals
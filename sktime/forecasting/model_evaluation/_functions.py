@@ -8,12 +8,14 @@ __all__ = ["evaluate"]
 
 import time
 import warnings
+from copy import deepcopy
 from typing import List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
 from sktime.datatypes import check_is_scitype, convert_to
+from sktime.datatypes._utilities import get_cutoff
 from sktime.exceptions import FitFailedWarning
 from sktime.forecasting.base import ForecastingHorizon
 from sktime.utils.validation._dependencies import _check_soft_dependencies
@@ -102,6 +104,60 @@ def _select_fh_from_y(y):
     return fh
 
 
+def _is_checkpoint(cutoff, checkpoints):
+    """Check whether forecaster state at cutoff should be checkpointed.
+
+    Parameters
+    ----------
+    cutoff : pandas compatible index element
+        cutoff of the forecaster after fit or update
+    checkpoints : None, "all", or list of pandas compatible index elements
+        checkpoints argument of evaluate
+
+    Returns
+    -------
+    bool, whether the state at cutoff should be checkpointed
+    """
+    if checkpoints is None:
+        return False
+    if isinstance(checkpoints, str) and checkpoints == "all":
+        return True
+    return cutoff in checkpoints
+
+
+def _get_pred_method_and_args(scoring):
+    """Get name of forecaster prediction method and its arguments for a metric.
+
+    Parameters
+    ----------
+    scoring : sktime metric object or callable
+
+    Returns
+    -------
+    methodname : str, name of the forecaster method producing y_pred for scoring
+    metric_args : dict, arguments to pass to the method, other than fh and X
+    """
+    pred_type = {
+        "pred_quantiles": "predict_quantiles",
+        "pred_interval": "predict_interval",
+        "pred_proba": "predict_proba",
+        None: "predict",
+    }
+
+    if hasattr(scoring, "metric_args"):
+        metric_args = scoring.metric_args
+    else:
+        metric_args = {}
+
+    if hasattr(scoring, "get_tag"):
+        scitype = scoring.get_tag("scitype:y_pred", raise_error=False)
+    else:
+        # If no scitype exists then metric is not proba and no args needed
+        scitype = None
+
+    return pred_type[scitype], metric_args
+
+
 def _evaluate_window(
     y,
     X,
@@ -114,17 +170,22 @@ def _evaluate_window(
     strategy,
     scoring,
     return_data,
-    score_name,
     error_score,
     cutoff_dtype,
+    checkpoints=None,
+    warm_start=False,
+    forecaster_config=None,
 ):
 
+    score_names = [f"test_{s.name}" for s in scoring]
+
     # set default result values in case estimator fitting fails
-    score = error_score
+    scores = {name: error_score for name in score_names}
     fit_time = np.nan
     pred_time = np.nan
     cutoff = pd.Period(pd.NaT) if cutoff_dtype.startswith("period") else pd.NA
     y_pred = pd.NA
+    fitted_forecaster = pd.NA
 
     # split data
     y_train, y_test, X_train, X_test = _split(
@@ -136,41 +197,36 @@ def _evaluate_window(
     try:
         # fit/update
         start_fit = time.perf_counter()
-        if i == 0 or strategy == "refit":
+        if strategy == "refit" or (i == 0 and not warm_start):
             forecaster = forecaster.clone()
+            if forecaster_config is not None:
+                forecaster.set_config(**forecaster_config)
             forecaster.fit(y_train, X_train, fh=fh)
         else:  # if strategy in ["update", "no-update_params"]:
             update_params = strategy == "update"
             forecaster.update(y_train, X_train, update_params=update_params)
         fit_time = time.perf_counter() - start_fit
 
-        pred_type = {
-            "pred_quantiles": "predict_quantiles",
-            "pred_interval": "predict_interval",
-            "pred_proba": "predict_proba",
-            None: "predict",
-        }
-        # predict
-        start_pred = time.perf_counter()
-
-        if hasattr(scoring, "metric_args"):
-            metric_args = scoring.metric_args
-        else:
-            metric_args = {}
-
-        if hasattr(scoring, "get_tag"):
-            scitype = scoring.get_tag("scitype:y_pred", raise_error=False)
-        else:
-            # If no scitype exists then metric is not proba and no args needed
-            scitype = None
-
-        methodname = pred_type[scitype]
-        method = getattr(forecaster, methodname)
+        # checkpoint forecaster state at the current cutoff, before predict
+        if _is_checkpoint(forecaster.cutoff[0], checkpoints):
+            fitted_forecaster = deepcopy(forecaster)
 
-        y_pred = method(fh, X_test, **metric_args)
+        # predict, once per distinct prediction method and arguments
+        start_pred = time.perf_counter()
+        y_preds = {}
+        fold_scores = {}
+        for name, s in zip(score_names, scoring):
+            methodname, metric_args = _get_pred_method_and_args(s)
+            pred_key = (methodname, repr(metric_args))
+            if pred_key not in y_preds:
+                method = getattr(forecaster, methodname)
+                y_preds[pred_key] = method(fh, X_test, **metric_args)
+            # score, on the in-memory fold data
+            fold_scores[name] = s(y_test, y_preds[pred_key], y_train=y_train)
         pred_time = time.perf_counter() - start_pred
-        # score
-        score = scoring(y_test, y_pred, y_train=y_train)
+        scores = fold_scores
+        # y_pred returned is the prediction used by the first metric
+        y_pred = next(iter(y_preds.values()))
         # get cutoff
         cutoff = forecaster.cutoff
 
@@ -183,7 +239,7 @@ def _evaluate_window(
                 In evaluate, fitting of forecaster {type(forecaster).__name__} failed,
                 you can set error_score='raise' in evaluate to see
                 the exception message. Fit failed for len(y_train)={len(y_train)}.
-                The score will be set to {error_score}.
+                The scores will be set to {error_score}.
                 Failed forecaster with parameters: {forecaster}.
                 """,
                 FitFailedWarning,
@@ -195,26 +251,56 @@ def _evaluate_window(
     else:
         cutoff_ind = cutoff[0]
 
-    result = pd.DataFrame(
+    result = {name: [score] for name, score in scores.items()}
+    result.update(
         {
-            score_name: [score],
             "fit_time": [fit_time],
             "pred_time": [pred_time],
             "len_train_window": [len(y_train)],
             "cutoff": [cutoff_ind],
-            "y_train": [y_train if return_data else pd.NA],
-            "y_test": [y_test if return_data else pd.NA],
-            "y_pred": [y_pred if return_data else pd.NA],
         }
-    ).astype({"cutoff": cutoff_dtype})
+    )
+    # fold data is only kept if requested, otherwise released with the fold
+    if return_data:
+        result.update({"y_train": [y_train], "y_test": [y_test], "y_pred": [y_pred]})
+    result = pd.DataFrame(result).astype({"cutoff": cutoff_dtype})
+
+    if checkpoints is not None:
+        result["fitted_forecaster"] = [fitted_forecaster]
 
-    # Return forecaster if "update"
-    if strategy == "update":
+    # Return forecaster if "update" or "no-update_params", to continue the chain
+    if strategy in ["update", "no-update_params"]:
         return result, forecaster
     else:
         return result
 
 
+def _is_vectorized(forecaster, y, X=None):
+    """Return whether forecaster is vectorized over instances or variables of y, X.
+
+    Same condition as in ``BaseForecaster._check_X_y``, for y, X in pandas mtypes.
+    """
+    from sktime.datatypes import mtype_to_scitype
+
+    def _scitype(obj):
+        return ["Series", "Panel", "Hierarchical"][min(obj.index.nlevels, 3) - 1]
+
+    def _inner_scitypes(tag):
+        mtypes = forecaster.get_tag(tag)
+        if isinstance(mtypes, str):
+            mtypes = [mtypes]
+        return mtype_to_scitype(mtypes, return_unique=True)
+
+    if _scitype(y) not in _inner_scitypes("y_inner_mtype"):
+        return True
+    if forecaster.get_tag("scitype:y") == "univariate" and y.ndim > 1:
+        if y.shape[1] > 1:
+            return True
+    if X is not None and _scitype(X) not in _inner_scitypes("X_inner_mtype"):
+        return True
+    return False
+
+
 def evaluate(
     forecaster,
     cv,
@@ -226,6 +312,8 @@ def evaluate(
     error_score: Union[str, int, float] = np.nan,
     backend: Optional[str] = None,
     compute: bool = True,
+    checkpoints: Optional[Union[str, list]] = None,
+    warm_start: bool = False,
     **kwargs,
 ):
     """Evaluate forecaster using timeseries cross-validation.
@@ -249,18 +337,31 @@ def evaluate(
         default=None. Used to get a score function that takes y_pred and y_test
         arguments and accept y_train as keyword argument.
         If None, then uses scoring = MeanAbsolutePercentageError(symmetric=True).
+        If a list, all metrics are computed in one pass per fold, with one call
+        of the prediction method per distinct prediction type needed by the metrics.
     return_data : bool, default=False
         Returns three additional columns in the DataFrame, by default False.
         The cells of the columns contain each a pd.Series for y_train,
         y_pred, y_test.
+        If False, fold data is not stored at any point, all scores are computed
+        on the in-memory fold data, directly after prediction.
     error_score : "raise" or numeric, default=np.nan
         Value to assign to the score if an exception occurs in estimator fitting. If set
         to "raise", the exception is raised. If a numeric value is given,
         FitFailedWarning is raised.
     backend : {"dask", "loky", "multiprocessing", "threading"}, by default None.
-        Runs parallel evaluate if specified and `strategy` is set as "refit".
+        Runs parallel evaluate if specified.
         - "loky", "multiprocessing" and "threading": uses `joblib` Parallel loops
         - "dask": uses `dask`, requires `dask` package in environment
+        If `strategy` is "refit", folds are evaluated in parallel.
+        If `strategy` is "update" or "no-update_params", the chain of updates over
+        folds is run sequentially, and the backend is used to parallelize across
+        independent forecasters instead, i.e., across instances of a Panel or
+        Hierarchical `y`, via the "backend:parallel" config of `forecaster`.
+        If `forecaster` handles `y` and `X` without vectorization, e.g., a single
+        series `y`, or a forecaster with native Panel support, there is nothing to
+        parallelize over with these strategies, so the backend is not used,
+        and a warning is raised.
         Recommendation: Use "dask" or "loky" for parallel evaluate.
         "threading" is unlikely to see speed ups due to the GIL and the serialization
         backend (`cloudpickle`) for "dask" and "loky" is generally more robust than the
@@ -268,6 +369,22 @@ def evaluate(
     compute : bool, default=True
         If backend="dask", whether returned DataFrame is computed.
         If set to True, returns `pd.DataFrame`, otherwise `dask.dataframe.DataFrame`.
+    checkpoints : None, "all", or list of cutoffs, optional, default=None
+        cutoffs at which the fitted forecaster state is checkpointed.
+        If not None, returns an additional column "fitted_forecaster", containing
+        a copy of the forecaster after fit/update at the cutoff of the fold,
+        if the fold's cutoff is in `checkpoints` (or `checkpoints="all"`),
+        and `pd.NA` otherwise.
+        Checkpointed forecasters can be used to resume or branch a backtest,
+        see `warm_start`.
+    warm_start : bool, optional, default=False
+        Only for `strategy` "update" or "no-update_params".
+        If True, `forecaster` must be fitted, e.g., a checkpoint from an earlier
+        call of `evaluate`, and is used as the initial state of the update chain,
+        instead of fitting a clone to the first training fold.
+        Folds with cutoff at or before the cutoff of `forecaster` are skipped.
+        `forecaster` is copied and not mutated, so the same checkpoint can be used
+        as the start of multiple backtests.
     **kwargs : Keyword arguments
         Only relevant if backend is specified. Additional kwargs are passed into
         `dask.distributed.get_client` or `dask.distributed.Client` if backend is
@@ -293,6 +410,8 @@ def evaluate(
           forecasts from fitted forecaster for the i-th test fold indices of `cv`.
         - y_test: (pd.Series) present if see `return_data=True`
           testing fold of the i-th split in `cv`, used to compute the metric.
+        - fitted_forecaster: (BaseForecaster) present if `checkpoints` is not None
+          copy of the forecaster fitted/updated to the train fold, if checkpointed.
 
     Examples
     --------
@@ -342,6 +461,17 @@ def evaluate(
         )
 
     _check_strategy(strategy)
+    if warm_start:
+        if strategy == "refit":
+            raise ValueError(
+                'warm_start=True requires strategy "update" or "no-update_params", '
+                'but found strategy="refit"'
+            )
+        if not forecaster.is_fitted:
+            raise ValueError(
+                "warm_start=True requires a fitted forecaster, "
+                "but the forecaster passed has not been fitted yet"
+            )
     cv = check_cv(cv, enforce_start_with_window=True)
     if isinstance(scoring, List):
         scoring = [check_scoring(s) for s in scoring]
@@ -377,29 +507,60 @@ def evaluate(
             )
         X = convert_to(X, to_type=PANDAS_MTYPES)
 
-    score_name = (
-        f"test_{scoring.name}"
-        if not isinstance(scoring, List)
-        else f"test_{scoring[0].name}"
-    )
+    if not isinstance(scoring, List):
+        scoring = [scoring]
+    score_names = [f"test_{s.name}" for s in scoring]
     cutoff_dtype = str(y.index.dtype)
+
+    # update chains are sequential in time, so the backend is used to parallelize
+    # across independent forecasters, i.e., across instances in vectorization
+    forecaster_config = None
+    if backend is not None and strategy in ["update", "no-update_params"]:
+        if not _is_vectorized(forecaster, y, X):
+            # no independent forecasters to parallelize across
+            warnings.warn(
+                f"evaluate with strategy={strategy!r} runs the folds sequentially, "
+                "and uses backend only to parallelize across the instances or "
+                "variables that the forecaster is vectorized over. "
+                f"{type(forecaster).__name__} handles y and X without vectorization, "
+                f"so backend={backend!r} and the backend kwargs are ignored. "
+                "Use strategy='refit' to evaluate folds in parallel.",
+                stacklevel=2,
+            )
+        else:
+            forecaster_config = {
+                "backend:parallel": backend,
+                "backend:parallel:params": kwargs if backend != "dask" else None,
+            }
+
+    if warm_start:
+        warm_start_cutoff = forecaster.cutoff[0]
+        forecaster = deepcopy(forecaster)
+        if forecaster_config is not None:
+            forecaster.set_config(**forecaster_config)
+
     _evaluate_window_kwargs = {
         "fh": cv.fh,
         "freq": freq,
         "forecaster": forecaster,
-        "scoring": scoring if not isinstance(scoring, List) else scoring[0],
+        "scoring": scoring,
         "strategy": strategy,
-        "return_data": True,
+        "return_data": return_data,
         "error_score": error_score,
-        "score_name": score_name,
         "cutoff_dtype": cutoff_dtype,
+        "checkpoints": checkpoints,
+        "warm_start": warm_start,
+        "forecaster_config": forecaster_config,
     }
 
     if backend is None or strategy in ["update", "no-update_params"]:
         # Run temporal cross-validation sequentially
         results = []
         for i, (train, test) in enumerate(cv.split(y)):
-            if strategy == "update":
+            # skip folds already seen by the warm started forecaster
+            if warm_start and get_cutoff(y.index[train]) <= warm_start_cutoff:
+                continue
+            if strategy in ["update", "no-update_params"]:
                 result, forecaster = _evaluate_window(
                     y,
                     X,
@@ -419,6 +580,13 @@ def evaluate(
                     **_evaluate_window_kwargs,
                 )
             results.append(result)
+        if len(results) == 0 and warm_start:
+            raise ValueError(
+                "warm_start=True, but all folds of cv have cutoff at or before "
+                f"the cutoff of the forecaster passed, {warm_start_cutoff}"
+            )
+        if len(results) == 0:
+            raise ValueError("cv does not generate any folds on y")
         results = pd.concat(results)
 
     elif backend == "dask":
@@ -439,19 +607,20 @@ def evaluate(
                     **_evaluate_window_kwargs,
                 )
             )
-        results = dd.from_delayed(
-            results,
-            meta={
-                score_name: "float",
+        meta = {name: "float" for name in score_names}
+        meta.update(
+            {
                 "fit_time": "float",
                 "pred_time": "float",
                 "len_train_window": "int",
                 "cutoff": cutoff_dtype,
-                "y_train": "object",
-                "y_test": "object",
-                "y_pred": "object",
-            },
+            }
         )
+        if return_data:
+            meta.update({"y_train": "object", "y_test": "object", "y_pred": "object"})
+        if checkpoints is not None:
+            meta["fitted_forecaster"] = "object"
+        results = dd.from_delayed(results, meta=meta)
         if compute:
             results = results.compute()
 
@@ -473,18 +642,6 @@ def evaluate(
         results = pd.concat(results)
 
     results = results.reset_index(drop=True)
-    if isinstance(scoring, List):
-        for s in scoring[1:]:
-            results[f"test_{s.name}"] = np.nan
-            for row in results.index:
-                results.loc[row, f"test_{s.name}"] = s(
-                    results["y_test"].loc[row],
-                    results["y_pred"].loc[row],
-                    y_train=results["y_train"].loc[row],
-                )
-
-    if not return_data:
-        results = results.drop(columns=["y_train", "y_test", "y_pred"])
     results = results.astype({"len_train_window": int})
 
     return results
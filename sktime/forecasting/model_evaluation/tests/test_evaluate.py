@@ -14,6 +14,8 @@ __all__ = [
     "test_evaluate_no_exog_against_with_exog",
 ]
 
+import warnings
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -342,3 +344,149 @@ def test_evaluate_probabilistic(n_columns, metric):
         assert scoring_name in out.columns
     except NotImplementedError:
         pass
+
+
+@pytest.mark.parametrize("strategy", ["update", "no-update_params"])
+@pytest.mark.parametrize("backend", [None, "loky", "threading"])
+def test_evaluate_update_parallel(strategy, backend):
+    """Check that update strategies with backend give same result as sequential."""
+    y = _make_hierarchical(
+        random_state=0, hierarchy_levels=(2, 2), min_timepoints=20, max_timepoints=20
+    )
+    forecaster = NaiveForecaster(strategy="mean")
+    cv = ExpandingWindowSplitter(fh=[1, 2], initial_window=10, step_length=3)
+    scoring = MeanAbsoluteError()
+
+    out_seq = evaluate(forecaster, cv, y, strategy=strategy, scoring=scoring)
+    out_par = evaluate(
+        forecaster, cv, y, strategy=strategy, scoring=scoring, backend=backend, n_jobs=2
+    )
+
+    scoring_name = f"test_{scoring.name}"
+    assert not out_par[scoring_name].isna().any()
+    np.testing.assert_array_equal(out_seq[scoring_name], out_par[scoring_name])
+
+
+def test_evaluate_checkpoints_warm_start():
+    """Check that checkpointed forecasters can be used to resume a backtest."""
+    y = make_forecasting_problem(n_timepoints=30, index_type="int")
+    forecaster = NaiveForecaster(strategy="mean")
+    cv = ExpandingWindowSplitter(fh=[1, 2, 3], initial_window=10, step_length=2)
+    scoring = MeanAbsoluteError()
+    scoring_name = f"test_{scoring.name}"
+
+    cutoffs = y.iloc[cv.get_cutoffs(y)].index
+    checkpoint_cutoff = cutoffs[3]
+
+    out = evaluate(
+        forecaster,
+        cv,
+        y,
+        strategy="update",
+        scoring=scoring,
+        checkpoints=[checkpoint_cutoff],
+    )
+    assert "fitted_forecaster" in out.columns
+    is_ckpt = out["cutoff"] == checkpoint_cutoff
+    assert out.loc[~is_ckpt, "fitted_forecaster"].isna().all()
+
+    ckpt = out.loc[is_ckpt, "fitted_forecaster"].iloc[0]
+    assert ckpt.cutoff[0] == checkpoint_cutoff
+
+    out_resumed = evaluate(
+        ckpt, cv, y, strategy="update", scoring=scoring, warm_start=True
+    )
+    # the checkpoint is not mutated by resuming the backtest
+    assert ckpt.cutoff[0] == checkpoint_cutoff
+
+    # resumed backtest covers only the folds after the checkpoint
+    out_after = out.loc[out["cutoff"] > checkpoint_cutoff].reset_index(drop=True)
+    np.testing.assert_array_equal(out_resumed["cutoff"], out_after["cutoff"])
+    np.testing.assert_array_equal(out_resumed[scoring_name], out_after[scoring_name])
+
+    with pytest.raises(ValueError, match="fitted forecaster"):
+        evaluate(forecaster, cv, y, strategy="update", warm_start=True)
+
+
+@pytest.mark.parametrize("return_data", [True, False])
+@pytest.mark.parametrize("backend", [None, "loky"])
+def test_scoring_list_equals_single(return_data, backend):
+    """Check that scores with a list of metrics equal scores of single metrics."""
+    y = make_forecasting_problem(n_timepoints=30, index_type="int")
+    forecaster = NaiveForecaster()
+    cv = SlidingWindowSplitter(fh=[1, 2, 3], initial_window=15, step_length=3)
+    scoring = [
+        MeanAbsolutePercentageError(symmetric=True),
+        MeanAbsoluteScaledError(),
+        MeanAbsoluteError(),
+    ]
+
+    out = evaluate(
+        forecaster, cv, y, scoring=scoring, return_data=return_data, backend=backend
+    )
+    for metric in scoring:
+        out_single = evaluate(forecaster, cv, y, scoring=metric)
+        scoring_name = f"test_{metric.name}"
+        np.testing.assert_array_equal(out[scoring_name], out_single[scoring_name])
+
+
+def test_evaluate_update_backend_series_warns():
+    """Check that a backend which cannot be used with a single series y warns."""
+    y = make_forecasting_problem(n_timepoints=30, index_type="int")
+    forecaster = NaiveForecaster(strategy="mean")
+    cv = ExpandingWindowSplitter(fh=[1, 2], initial_window=10, step_length=5)
+    scoring = MeanAbsoluteError()
+
+    out_seq = evaluate(forecaster, cv, y, strategy="update", scoring=scoring)
+    with pytest.warns(UserWarning, match="backend='threading'"):
+        out_par = evaluate(
+            forecaster, cv, y, strategy="update", scoring=scoring, backend="threading"
+        )
+
+    scoring_name = f"test_{scoring.name}"
+    np.testing.assert_array_equal(out_seq[scoring_name], out_par[scoring_name])
+
+
+def test_evaluate_no_folds():
+    """Check the error message if cv has no folds, without warm_start."""
+    from sktime.forecasting.model_selection._split import BaseSplitter
+
+    class _NoFoldSplitter(BaseSplitter):
+        def _split(self, y):
+            yield from ()
+
+    y = make_forecasting_problem(n_timepoints=10, index_type="int")
+    cv = _NoFoldSplitter(fh=[1, 2])
+
+    with pytest.raises(ValueError, match="does not generate any folds") as excinfo:
+        evaluate(NaiveForecaster(), cv, y, strategy="update")
+    assert "warm_start" not in str(excinfo.value)
+
+
+def test_evaluate_update_backend_native_hierarchical_warns():
+    """Check that a backend which cannot be used with a Hierarchical y warns.
+
+    Forecasters with native Hierarchical support are not vectorized over instances,
+    so there is nothing the backend can parallelize over in update strategies.
+    """
+    from sktime.forecasting.dummy import ForecastKnownValues
+
+    y = _make_hierarchical(
+        random_state=0, hierarchy_levels=(2, 2), min_timepoints=20, max_timepoints=20
+    )
+    forecaster = ForecastKnownValues(y)
+    cv = ExpandingWindowSplitter(fh=[1, 2], initial_window=10, step_length=5)
+
+    with pytest.warns(UserWarning, match="ForecastKnownValues handles y and X"):
+        evaluate(forecaster, cv, y, strategy="update", backend="threading")
+
+
+def test_evaluate_update_backend_multivariate_no_warning():
+    """Check that no warning is raised if the backend is used for variables of y."""
+    y = _make_series(n_columns=2, n_timepoints=20, random_state=0)
+    forecaster = NaiveForecaster()
+    cv = ExpandingWindowSplitter(fh=[1, 2], initial_window=10, step_length=5)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("error", message="evaluate with strategy")
+        evaluate(forecaster, cv, y, strategy="update", backend="threading")
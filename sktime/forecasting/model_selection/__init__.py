@@ -11,6 +11,7 @@ __all__ = [
     "temporal_train_test_split",
     "ExpandingWindowSplitter",
     "ForecastingGridSearchCV",
+    "ForecastingHalvingGridSearchCV",
     "ForecastingRandomizedSearchCV",
 ]
 
@@ -23,5 +24,6 @@ from sktime.forecasting.model_selection._split import (
 )
 from sktime.forecasting.model_selection._tune import (
     ForecastingGridSearchCV,
+    ForecastingHalvingGridSearchCV,
     ForecastingRandomizedSearchCV,
 )
@@ -4,10 +4,19 @@
 """Implements grid search functionality to tune forecasters."""
 
 __author__ = ["mloning"]
-__all__ = ["ForecastingGridSearchCV", "ForecastingRandomizedSearchCV"]
-
+__all__ = [
+    "ForecastingGridSearchCV",
+    "ForecastingHalvingGridSearchCV",
+    "ForecastingRandomizedSearchCV",
+]
+
+import os
+import shutil
+import tempfile
+import time
 from collections.abc import Sequence
 
+import joblib
 import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
@@ -17,8 +26,172 @@ from sktime.datatypes import mtype_to_scitype
 from sktime.exceptions import NotFittedError
 from sktime.forecasting.base._delegate import _DelegatedForecaster
 from sktime.forecasting.model_evaluation import evaluate
+from sktime.forecasting.model_selection._split import BaseSplitter
 from sktime.utils.validation.forecasting import check_scoring
 
+# joblib backends which run tasks in separate processes, data is sent by pickling
+PROCESS_BACKENDS = ["loky", "multiprocessing"]
+
+# per-process cache of memory-mapped data loaded from _MemmapHandle
+#   holds data of one tuner fit only, since worker processes persist across fits
+_MEMMAP_CACHE = dict()
+
+
+class _MemmapHandle:
+    """Lightweight, picklable handle to data persisted once to disk.
+
+    Used to broadcast y and X to worker processes in tuning, without pickling
+    the data into every task. The data is loaded memory-mapped in copy-on-write
+    mode, so workers share the pages of the file, and in-place writes by
+    forecasters remain private to the worker.
+
+    Parameters
+    ----------
+    path : str
+        path of the file written by ``joblib.dump``
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """Load the data, memory-mapped, once per process and tuner fit.
+
+        Data of earlier tuner fits, persisted in other folders, is dropped from
+        the cache, so that reused worker processes do not keep their files mapped.
+
+        Returns
+        -------
+        the object persisted at ``self.path``
+        """
+        if self.path not in _MEMMAP_CACHE:
+            folder = os.path.dirname(self.path)
+            if any(os.path.dirname(path) != folder for path in _MEMMAP_CACHE):
+                _MEMMAP_CACHE.clear()
+            _MEMMAP_CACHE[self.path] = joblib.load(self.path, mmap_mode="c")
+        return _MEMMAP_CACHE[self.path]
+
+
+def _share_data(obj, folder, name):
+    """Persist obj to folder for memory-mapped broadcast, return handle.
+
+    Parameters
+    ----------
+    obj : object to share, e.g., pd.DataFrame, or None
+    folder : str, path of folder to persist obj in
+    name : str, file name to use for obj within folder
+
+    Returns
+    -------
+    _MemmapHandle pointing to persisted obj, or None if obj is None
+    """
+    if obj is None:
+        return None
+    path = os.path.join(folder, f"{name}.joblib")
+    joblib.dump(obj, path)
+    return _MemmapHandle(path)
+
+
+def _get_data(data):
+    """Resolve data from a _MemmapHandle, or return data if not a handle."""
+    if isinstance(data, _MemmapHandle):
+        return data.load()
+    return data
+
+
+def _fit_and_score(params, meta):
+    """Evaluate a clone of forecaster with params, return aggregated scores.
+
+    Parameters
+    ----------
+    params : dict, parameters to set in the forecaster clone
+    meta : dict with keys
+        forecaster, cv, strategy, scoring, error_score : as in BaseGridSearch
+        y, X : data, or _MemmapHandle of data
+        scoring_name : str, name of score column
+
+    Returns
+    -------
+    pd.Series with mean scores and times, params,
+        and time to load data vs time to evaluate (compute) in the worker
+    """
+    scoring_name = meta["scoring_name"]
+
+    start_load = time.perf_counter()
+    y = _get_data(meta["y"])
+    X = _get_data(meta["X"])
+    data_load_time = time.perf_counter() - start_load
+
+    # Clone forecaster.
+    forecaster = meta["forecaster"].clone()
+
+    # Set parameters.
+    forecaster.set_params(**params)
+
+    # Evaluate.
+    start_compute = time.perf_counter()
+    out = evaluate(
+        forecaster,
+        meta["cv"],
+        y,
+        X,
+        strategy=meta["strategy"],
+        scoring=meta["scoring"],
+        error_score=meta["error_score"],
+    )
+    compute_time = time.perf_counter() - start_compute
+
+    # Filter columns.
+    out = out.filter(items=[scoring_name, "fit_time", "pred_time"], axis=1)
+
+    # Aggregate results.
+    out = out.mean()
+    out = out.add_prefix("mean_")
+
+    # Add parameters to output table.
+    out["params"] = params
+
+    # Add time spent on obtaining the data vs evaluating the forecaster.
+    out["data_load_time"] = data_load_time
+    out["compute_time"] = compute_time
+
+    return out
+
+
+class _FoldSubsetSplitter(BaseSplitter):
+    """Splitter which returns a subset of the folds of another splitter.
+
+    Used in tuning, to evaluate candidates only on some of the folds of ``cv``.
+
+    Parameters
+    ----------
+    cv : BaseSplitter
+        splitter to take folds from
+    folds : list of int
+        iloc indices of folds of ``cv`` to return, in the order of ``cv``
+    """
+
+    def __init__(self, cv, folds):
+        self.cv = cv
+        self.folds = folds
+        super(_FoldSubsetSplitter, self).__init__(
+            fh=cv.fh, window_length=cv.window_length
+        )
+
+    def _split(self, y):
+        folds = set(self.folds)
+        for i, (train, test) in enumerate(self.cv._split(y)):
+            if i in folds:
+                yield train, test
+
+    def get_n_splits(self, y=None):
+        """Return the number of splits."""
+        return len(self.folds)
+
+    def get_cutoffs(self, y=None):
+        """Return the cutoff points in .iloc[] context."""
+        return self.cv.get_cutoffs(y)[sorted(self.folds)]
+
 
 class BaseGridSearch(_DelegatedForecaster):
 
@@ -131,6 +304,30 @@ class BaseGridSearch(_DelegatedForecaster):
     def _run_search(self, evaluate_candidates):
         raise NotImplementedError("abstract method")
 
+    def _check_param_grid(self, param_grid):
+        """_check_param_grid from sklearn 1.0.2, before it was removed."""
+        if hasattr(param_grid, "items"):
+            param_grid = [param_grid]
+
+        for p in param_grid:
+            for name, v in p.items():
+                if isinstance(v, np.ndarray) and v.ndim > 1:
+                    raise ValueError("Parameter array should be one-dimensional.")
+
+                if isinstance(v, str) or not isinstance(v, (np.ndarray, Sequence)):
+                    raise ValueError(
+                        "Parameter grid for parameter ({0}) needs to"
+                        " be a list or numpy array, but got ({1})."
+                        " Single values need to be wrapped in a list"
+                        " with one element.".format(name, type(v))
+                    )
+
+                if len(v) == 0:
+                    raise ValueError(
+                        "Parameter values for parameter ({0}) need "
+                        "to be a non-empty sequence.".format(name)
+                    )
+
     def _fit(self, y, X=None, fh=None):
         """Fit to training data.
 
@@ -156,42 +353,46 @@ class BaseGridSearch(_DelegatedForecaster):
             n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch, backend=self.backend
         )
 
-        def _fit_and_score(params):
-            # Clone forecaster.
-            forecaster = self.forecaster.clone()
-
-            # Set parameters.
-            forecaster.set_params(**params)
-
-            # Evaluate.
-            out = evaluate(
-                forecaster,
-                cv,
-                y,
-                X,
-                strategy=self.strategy,
-                scoring=scoring,
-                error_score=self.error_score,
-            )
-
-            # Filter columns.
-            out = out.filter(items=[scoring_name, "fit_time", "pred_time"], axis=1)
-
-            # Aggregate results.
-            out = out.mean()
-            out = out.add_prefix("mean_")
-
-            # Add parameters to output table.
-            out["params"] = params
+        meta = {
+            "forecaster": self.forecaster,
+            "cv": cv,
+            "strategy": self.strategy,
+            "scoring": scoring,
+            "scoring_name": scoring_name,
+            "error_score": self.error_score,
+            "y": y,
+            "X": X,
+        }
 
-            return out
+        # if tasks run in other processes, persist y and X once, memory-mappable,
+        #   and send lightweight handles to workers, instead of pickling per task
+        share_data = self.backend in PROCESS_BACKENDS and self.n_jobs not in [None, 1]
+        if share_data:
+            tmp_folder = tempfile.mkdtemp(prefix="sktime_tune_")
+            meta["y"] = _share_data(y, tmp_folder, "y")
+            meta["X"] = _share_data(X, tmp_folder, "X")
+
+        # get_n_splits counts folds on the full index, not per instance of a
+        #   multiindex, in that case folds are counted from split directly
+        if isinstance(getattr(y, "index", None), pd.MultiIndex):
+            self.n_splits_ = sum(1 for _ in cv.split(y))
+        else:
+            self.n_splits_ = cv.get_n_splits(y)
 
-        def evaluate_candidates(candidate_params):
+        def evaluate_candidates(candidate_params, folds=None):
             candidate_params = list(candidate_params)
 
+            # evaluate only on a subset of the folds of cv, if folds are passed
+            if folds is None:
+                meta_folds = meta
+                n_splits = self.n_splits_
+            else:
+                meta_folds = meta.copy()
+                meta_folds["cv"] = _FoldSubsetSplitter(cv=cv, folds=folds)
+                n_splits = len(folds)
+
             if self.verbose > 0:
                 n_candidates = len(candidate_params)
-                n_splits = cv.get_n_splits(y)
                 print(  # noqa
                     "Fitting {0} folds for each of {1} candidates,"
                     " totalling {2} fits".format(
@@ -200,7 +401,8 @@ class BaseGridSearch(_DelegatedForecaster):
                 )
 
             out = parallel(
-                delayed(_fit_and_score)(params) for params in candidate_params
+                delayed(_fit_and_score)(params, meta_folds)
+                for params in candidate_params
             )
 
             if len(out) < 1:
@@ -213,14 +415,25 @@ class BaseGridSearch(_DelegatedForecaster):
             return out
 
         # Run grid-search cross-validation.
-        results = self._run_search(evaluate_candidates)
+        try:
+            results = self._run_search(evaluate_candidates)
+        finally:
+            # workers may still have the files mapped, removal then fails on Windows
+            if share_data:
+                shutil.rmtree(tmp_folder, ignore_errors=True)
 
         results = pd.DataFrame(results)
 
         # Rank results, according to whether greater is better for the given scoring.
-        results[f"rank_{scoring_name}"] = results.loc[:, f"mean_{scoring_name}"].rank(
-            ascending=scoring.get_tag("lower_is_better")
-        )
+        # If the search ran in multiple rounds, indicated by an "iter" column,
+        # only candidates in the last round are ranked, other ranks are NaN.
+        if "iter" in results.columns:
+            is_ranked = results["iter"] == results["iter"].max()
+        else:
+            is_ranked = pd.Series(True, index=results.index)
+        results[f"rank_{scoring_name}"] = results.loc[
+            is_ranked, f"mean_{scoring_name}"
+        ].rank(ascending=scoring.get_tag("lower_is_better"))
 
         self.cv_results_ = results
 
@@ -241,7 +454,8 @@ class BaseGridSearch(_DelegatedForecaster):
         if self.refit:
             self.best_forecaster_.fit(y, X, fh)
 
-        # Sort values according to rank
+        # Sort values according to rank, candidates without rank are not selected
+        results = results.dropna(subset=[f"rank_{scoring_name}"])
         results = results.sort_values(
             by=f"rank_{scoring_name}",
             ascending=True,
@@ -249,7 +463,7 @@ class BaseGridSearch(_DelegatedForecaster):
         # Select n best forecaster
         self.n_best_forecasters_ = []
         self.n_best_scores_ = []
-        for i in range(self.return_n_best_forecasters):
+        for i in range(min(self.return_n_best_forecasters, len(results))):
             params = results["params"].iloc[i]
             rank = results[f"rank_{scoring_name}"].iloc[i]
             rank = str(int(rank))
@@ -360,6 +574,10 @@ class ForecastingGridSearchCV(BaseGridSearch):
     backend : str, optional (default="loky")
         Specify the parallelisation backend implementation in joblib, where
         "loky" is used by default.
+        If a process-based backend ("loky", "multiprocessing") is used with
+        ``n_jobs`` other than None or 1, y and X are persisted once to a temporary,
+        memory-mappable file, and workers receive lightweight handles instead of
+        a pickled copy of the data per candidate.
     error_score : "raise" or numeric, default=np.nan
         Value to assign to the score if an exception occurs in estimator fitting. If set
         to "raise", the exception is raised. If a numeric value is given,
@@ -375,7 +593,10 @@ class ForecastingGridSearchCV(BaseGridSearch):
     best_forecaster_ : estimator
         Fitted estimator with the best parameters
     cv_results_ : dict
-        Results from grid search cross validation
+        Results from grid search cross validation, one row per candidate.
+        Contains mean scores and fit/predict times over folds, and per candidate,
+        "data_load_time", the time to obtain y and X in the worker
+        (deserialization), and "compute_time", the time spent in evaluation.
     n_splits_: int
         Number of splits in the data for cross validation
     refit_time_ : float
@@ -482,30 +703,6 @@ class ForecastingGridSearchCV(BaseGridSearch):
         )
         self.param_grid = param_grid
 
-    def _check_param_grid(self, param_grid):
-        """_check_param_grid from sklearn 1.0.2, before it was removed."""
-        if hasattr(param_grid, "items"):
-            param_grid = [param_grid]
-
-        for p in param_grid:
-            for name, v in p.items():
-                if isinstance(v, np.ndarray) and v.ndim > 1:
-                    raise ValueError("Parameter array should be one-dimensional.")
-
-                if isinstance(v, str) or not isinstance(v, (np.ndarray, Sequence)):
-                    raise ValueError(
-                        "Parameter grid for parameter ({0}) needs to"
-                        " be a list or numpy array, but got ({1})."
-                        " Single values need to be wrapped in a list"
-                        " with one element.".format(name, type(v))
-                    )
-
-                if len(v) == 0:
-                    raise ValueError(
-                        "Parameter values for parameter ({0}) need "
-                        "to be a non-empty sequence.".format(name)
-                    )
-
     def _run_search(self, evaluate_candidates):
         """Search all candidates in param_grid."""
         self._check_param_grid(self.param_grid)
@@ -618,6 +815,10 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
     backend : str, optional (default="loky")
         Specify the parallelisation backend implementation in joblib, where
         "loky" is used by default.
+        If a process-based backend ("loky", "multiprocessing") is used with
+        ``n_jobs`` other than None or 1, y and X are persisted once to a temporary,
+        memory-mappable file, and workers receive lightweight handles instead of
+        a pickled copy of the data per candidate.
     error_score : "raise" or numeric, default=np.nan
         Value to assign to the score if an exception occurs in estimator fitting. If set
         to "raise", the exception is raised. If a numeric value is given,
@@ -633,7 +834,10 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
     best_forecaster_ : estimator
         Fitted estimator with the best parameters
     cv_results_ : dict
-        Results from grid search cross validation
+        Results from grid search cross validation, one row per candidate.
+        Contains mean scores and fit/predict times over folds, and per candidate,
+        "data_load_time", the time to obtain y and X in the worker
+        (deserialization), and "compute_time", the time spent in evaluation.
     n_best_forecasters_: list of tuples ("rank", <forecaster>)
         The "rank" is in relation to best_forecaster_
     n_best_scores_: list of float
@@ -720,3 +924,252 @@ class ForecastingRandomizedSearchCV(BaseGridSearch):
         }
 
         return [params, params2]
+
+
+class ForecastingHalvingGridSearchCV(BaseGridSearch):
+    """Perform successive halving grid-search cross-validation for forecasters.
+
+    Searches the parameter grid like ``ForecastingGridSearchCV``, but in rounds
+    with a growing budget of cross-validation folds, instead of evaluating every
+    candidate on every fold of ``cv``.
+
+    In the first round, all candidates are evaluated on the last ``min_folds``
+    folds of ``cv``. After every round, only the best ``1 / factor`` of candidates
+    are kept, and the number of folds is multiplied by ``factor``, using the
+    most recent folds of ``cv``. Rounds continue until all folds are used, or
+    a single candidate is left. The remaining candidates are then evaluated
+    on all folds of ``cv``, and the best among them is selected.
+
+    Parameters
+    ----------
+    forecaster : estimator object
+        The estimator should implement the sktime or scikit-learn estimator
+        interface. Either the estimator must contain a "score" function,
+        or a scoring function must be passed.
+    cv : cross-validation generator or an iterable
+        e.g. SlidingWindowSplitter() or ExpandingWindowSplitter()
+    param_grid : dict or list of dictionaries
+        Model tuning parameters of the forecaster to evaluate
+    factor : int, optional (default=3)
+        halving parameter, must be 2 or greater.
+        After every round, the number of candidates is divided by ``factor``,
+        rounded up, and the number of folds evaluated on is multiplied by ``factor``.
+    min_folds : int, optional (default=1)
+        number of folds of ``cv`` that candidates are evaluated on in the first round
+    scoring : sktime metric object (BaseMetric), or callable, optional (default=None)
+        scoring metric to use in tuning the forecaster
+        if callable, must have signature
+        `(y_true: 1D np.ndarray, y_pred: 1D np.ndarray) -> float`,
+        assuming np.ndarrays being of the same length, and lower being better.
+    strategy : {"refit", "update", "no-update_params"}, optional, default="refit"
+        data ingestion strategy in fitting cv, passed to `evaluate` internally
+        defines the ingestion mode when the forecaster sees new data when window expands
+        "refit" = forecaster is refitted to each training window
+        "update" = forecaster is updated with training window data, in sequence provided
+        "no-update_params" = fit to first training window, re-used without fit or update
+    n_jobs: int, optional (default=None)
+        Number of jobs to run in parallel.
+        None means 1 unless in a joblib.parallel_backend context.
+        -1 means using all processors.
+    refit : bool, optional (default=True)
+        True = refit the forecaster with the best parameters on the entire data in fit
+        False = best forecaster remains fitted on the last fold in cv
+    verbose: int, optional (default=0)
+    return_n_best_forecasters : int, default=1
+        In case the n best forecaster should be returned, this value can be set
+        and the n best forecasters will be assigned to n_best_forecasters_.
+        Only candidates of the last round are considered.
+    pre_dispatch : str, optional (default='2*n_jobs')
+    backend : str, optional (default="loky")
+        Specify the parallelisation backend implementation in joblib, where
+        "loky" is used by default.
+    update_behaviour : str, optional, default = "full_refit"
+        one of {"full_refit", "inner_only", "no_update"}
+        behaviour of the forecaster when calling update
+        "full_refit" = both tuning parameters and inner estimator refit on all data seen
+        "inner_only" = tuning parameters are not re-tuned, inner estimator is updated
+        "no_update" = neither tuning parameters nor inner estimator are updated
+    error_score : "raise" or numeric, default=np.nan
+        Value to assign to the score if an exception occurs in estimator fitting. If set
+        to "raise", the exception is raised. If a numeric value is given,
+        FitFailedWarning is raised.
+
+    Attributes
+    ----------
+    best_index_ : int
+    best_score_: float
+        Score of the best model, on all folds of cv
+    best_params_ : dict
+        Best parameter values across the parameter grid
+    best_forecaster_ : estimator
+        Fitted estimator with the best parameters
+    cv_results_ : pd.DataFrame
+        Results from cross validation, one row per candidate and round.
+        Column "iter" is the round, "n_folds" the number of folds evaluated on.
+        Only candidates in the last round are ranked.
+    n_splits_: int
+        Number of splits in the data for cross validation
+    n_candidates_ : list of int
+        number of candidates evaluated in each round
+    n_folds_ : list of int
+        number of folds candidates were evaluated on, in each round
+    n_best_forecasters_: list of tuples ("rank", <forecaster>)
+        The "rank" is in relation to best_forecaster_
+    n_best_scores_: list of float
+        The scores of n_best_forecasters_ sorted from best to worst
+        score of forecasters
+
+    Examples
+    --------
+    >>> from sktime.datasets import load_shampoo_sales
+    >>> from sktime.forecasting.model_selection import (
+    ...     ExpandingWindowSplitter,
+    ...     ForecastingHalvingGridSearchCV,
+    ... )
+    >>> from sktime.forecasting.naive import NaiveForecaster
+    >>> y = load_shampoo_sales()
+    >>> cv = ExpandingWindowSplitter(initial_window=12, step_length=3, fh=[1, 2, 3])
+    >>> forecaster = NaiveForecaster()
+    >>> param_grid = {
+    ...     "strategy": ["last", "mean", "drift"],
+    ...     "window_length": [3, 6, 9],
+    ... }
+    >>> hscv = ForecastingHalvingGridSearchCV(
+    ...     forecaster=forecaster,
+    ...     param_grid=param_grid,
+    ...     cv=cv,
+    ...     factor=3)
+    >>> hscv.fit(y)
+    ForecastingHalvingGridSearchCV(...)
+    >>> y_pred = hscv.predict(fh=[1, 2, 3])
+    """
+
+    def __init__(
+        self,
+        forecaster,
+        cv,
+        param_grid,
+        factor=3,
+        min_folds=1,
+        scoring=None,
+        strategy="refit",
+        n_jobs=None,
+        refit=True,
+        verbose=0,
+        return_n_best_forecasters=1,
+        pre_dispatch="2*n_jobs",
+        backend="loky",
+        update_behaviour="full_refit",
+        error_score=np.nan,
+    ):
+        super(ForecastingHalvingGridSearchCV, self).__init__(
+            forecaster=forecaster,
+            scoring=scoring,
+            n_jobs=n_jobs,
+            refit=refit,
+            cv=cv,
+            strategy=strategy,
+            verbose=verbose,
+            return_n_best_forecasters=return_n_best_forecasters,
+            pre_dispatch=pre_dispatch,
+            backend=backend,
+            update_behaviour=update_behaviour,
+            error_score=error_score,
+        )
+        self.param_grid = param_grid
+        self.factor = factor
+        self.min_folds = min_folds
+
+    def _run_search(self, evaluate_candidates):
+        """Search candidates in param_grid by successive halving over folds."""
+        self._check_param_grid(self.param_grid)
+
+        factor = self.factor
+        if not isinstance(factor, int) or factor < 2:
+            raise ValueError(f"factor must be an int of 2 or greater, found {factor}")
+        min_folds = self.min_folds
+        if not isinstance(min_folds, int) or min_folds < 1:
+            raise ValueError(
+                f"min_folds must be an int of 1 or greater, found {min_folds}"
+            )
+
+        scoring = check_scoring(self.scoring, obj=self)
+        mean_score_name = f"mean_test_{scoring.name}"
+        lower_is_better = scoring.get_tag("lower_is_better")
+
+        n_splits = self.n_splits_
+        candidates = list(ParameterGrid(self.param_grid))
+        n_folds = min(min_folds, n_splits)
+
+        self.n_candidates_ = []
+        self.n_folds_ = []
+        results = []
+        i_round = 0
+        while True:
+            # evaluate on the most recent n_folds folds of cv
+            folds = list(range(n_splits - n_folds, n_splits))
+            out = evaluate_candidates(candidates, folds=folds)
+            for res in out:
+                res["iter"] = i_round
+                res["n_folds"] = n_folds
+            results += out
+            self.n_candidates_.append(len(candidates))
+            self.n_folds_.append(n_folds)
+
+            if n_folds == n_splits:
+                break
+
+            # keep the best 1 / factor of candidates, failed fits are ranked last
+            n_keep = int(np.ceil(len(candidates) / factor))
+            scores = pd.Series([res[mean_score_name] for res in out])
+            order = scores.sort_values(
+                ascending=lower_is_better, na_position="last", kind="stable"
+            ).index
+            candidates = [candidates[i] for i in order[:n_keep]]
+
+            # last round is on all folds, once there is a single candidate left
+            if len(candidates) == 1:
+                n_folds = n_splits
+            else:
+                n_folds = min(n_folds * factor, n_splits)
+            i_round += 1
+
+        return results
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+        Returns
+        -------
+        params : dict or list of dict
+        """
+        from sktime.forecasting.model_selection._split import (
+            ExpandingWindowSplitter,
+            SingleWindowSplitter,
+        )
+        from sktime.forecasting.naive import NaiveForecaster
+        from sktime.forecasting.trend import PolynomialTrendForecaster
+        from sktime.performance_metrics.forecasting import MeanAbsolutePercentageError
+
+        params = {
+            "forecaster": NaiveForecaster(strategy="mean"),
+            "cv": ExpandingWindowSplitter(initial_window=5, step_length=2, fh=1),
+            "param_grid": {"window_length": [2, 3, 4, 5]},
+            "scoring": MeanAbsolutePercentageError(symmetric=True),
+            "factor": 2,
+        }
+        params2 = {
+            "forecaster": PolynomialTrendForecaster(),
+            "cv": SingleWindowSplitter(fh=1),
+            "param_grid": {"degree": [1, 2]},
+            "scoring": MeanAbsolutePercentageError(symmetric=True),
+            "update_behaviour": "inner_only",
+        }
+        return [params, params2]
@@ -4,7 +4,7 @@
 """Test grid search CV."""
 
 __author__ = ["mloning", "fkiraly"]
-__all__ = ["test_gscv", "test_rscv"]
+__all__ = ["test_gscv", "test_rscv", "test_hgscv"]
 
 import numpy as np
 import pytest
@@ -15,7 +15,9 @@ from sktime.forecasting.arima import ARIMA
 from sktime.forecasting.compose import TransformedTargetForecaster
 from sktime.forecasting.model_evaluation import evaluate
 from sktime.forecasting.model_selection import (
+    ExpandingWindowSplitter,
     ForecastingGridSearchCV,
+    ForecastingHalvingGridSearchCV,
     ForecastingRandomizedSearchCV,
     SingleWindowSplitter,
     SlidingWindowSplitter,
@@ -199,3 +201,108 @@ def test_gscv_proba(cv, scoring, error_score):
     fitted_params = gscv.get_fitted_params()
     assert "best_forecaster" in fitted_params.keys()
     assert "best_score" in fitted_params.keys()
+
+
+@pytest.mark.parametrize("backend", ["loky", "threading"])
+def test_gscv_shared_data(backend):
+    """Test ForecastingGridSearchCV with data broadcast to parallel workers.
+
+    Checks that scores are as for sequential evaluation, and that
+    serialization vs compute times are reported per candidate.
+    """
+    y, X = load_longley()
+    cv = SlidingWindowSplitter(fh=1, initial_window=15)
+    scoring = MeanSquaredError()
+    gscv = ForecastingGridSearchCV(
+        NAIVE,
+        param_grid=NAIVE_GRID,
+        cv=cv,
+        scoring=scoring,
+        n_jobs=2,
+        backend=backend,
+    )
+    gscv.fit(y, X)
+
+    param_grid = ParameterGrid(NAIVE_GRID)
+    _check_cv(NAIVE, gscv, cv, param_grid, y, X, scoring)
+
+    for col in ["data_load_time", "compute_time"]:
+        assert col in gscv.cv_results_.columns
+        assert (gscv.cv_results_[col] >= 0).all()
+
+
+@pytest.mark.parametrize("factor", [2, 3])
+@pytest.mark.parametrize("min_folds", [1, 2])
+def test_hgscv(factor, min_folds):
+    """Test ForecastingHalvingGridSearchCV.
+
+    Tests that candidates are halved over rounds with growing number of folds,
+    and that the selected candidate is best among last round candidates,
+    with scores equal to evaluation on all folds.
+    """
+    y = load_airline()
+    cv = ExpandingWindowSplitter(initial_window=60, step_length=12, fh=[1, 2, 3])
+    scoring = MeanSquaredError()
+    param_grid = {"strategy": ["last", "mean", "drift"], "window_length": [3, 6, 12]}
+    hgscv = ForecastingHalvingGridSearchCV(
+        NaiveForecaster(),
+        param_grid=param_grid,
+        cv=cv,
+        scoring=scoring,
+        factor=factor,
+        min_folds=min_folds,
+    )
+    hgscv.fit(y)
+
+    n_splits = cv.get_n_splits(y)
+    n_candidates = len(ParameterGrid(param_grid))
+
+    # rounds: candidates shrink by factor, last round is on all folds
+    assert hgscv.n_candidates_[0] == n_candidates
+    assert hgscv.n_folds_[0] == min_folds
+    assert hgscv.n_folds_[-1] == n_splits
+    for n_cand, n_cand_next in zip(hgscv.n_candidates_, hgscv.n_candidates_[1:]):
+        assert n_cand_next == int(np.ceil(n_cand / factor))
+
+    results = hgscv.cv_results_
+    assert len(results) == sum(hgscv.n_candidates_)
+    last_round = results.loc[results["iter"] == results["iter"].max()]
+    assert (last_round["n_folds"] == n_splits).all()
+    assert (
+        results.loc[results["iter"] < results["iter"].max()]
+        .filter(like="rank_")
+        .isna()
+        .all()
+        .all()
+    )
+
+    # scores of last round equal scores with evaluate on all folds
+    last_params = list(last_round["params"])
+    actual = last_round[f"mean_test_{scoring.name}"].to_numpy()
+    expected = _get_expected_scores(
+        NaiveForecaster(), cv, last_params, y, None, scoring
+    )
+    np.testing.assert_array_equal(actual, expected)
+    assert hgscv.best_params_ == last_params[np.argmin(actual)]
+
+
+def test_memmap_cache_per_fit(tmp_path):
+    """Test that the worker cache of shared data only holds data of the last fit."""
+    from sktime.forecasting.model_selection import _tune
+
+    y, X = load_longley()
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    handles_first = [
+        _tune._share_data(obj, str(first), n) for n, obj in zip("yX", [y, X])
+    ]
+    for handle in handles_first:
+        handle.load()
+    assert set(_tune._MEMMAP_CACHE) == {handle.path for handle in handles_first}
+
+    handle_second = _tune._share_data(y, str(second), "y")
+    assert handle_second.load().equals(y)
+    assert set(_tune._MEMMAP_CACHE) == {handle_second.path}
+    _tune._MEMMAP_CACHE.clear()
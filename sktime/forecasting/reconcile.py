@@ -20,8 +20,12 @@ from sktime.forecasting.base import BaseForecaster, ForecastingHorizon
 from sktime.transformations.hierarchical.aggregate import _check_index_no_total
 from sktime.transformations.hierarchical.reconcile import (
     Reconciler,
-    _get_s_matrix,
+    _get_g_matrix_frame,
+    _get_s_matrix_frame,
+    _get_s_matrix_sparse,
     _parent_child_df,
+    _reconcile,
+    _to_node_time_array,
 )
 
 
@@ -157,21 +161,23 @@ class ReconcilerForecaster(BaseForecaster):
         if np.isin(self.method, self.TRFORM_LIST):
             self.forecaster_ = self.forecaster.clone() * Reconciler(method=self.method)
             self.forecaster_.fit(y=y, X=X, fh=fh)
-            # bring g matrix/s_matrix/parent_child to top for compatibility/tests
-            self.s_matrix = self.forecaster_.transformers_post_[0][1].s_matrix
-            self.g_matrix = self.forecaster_.transformers_post_[0][1].g_matrix
-            self.parent_child = self.forecaster_.transformers_post_[0][1].parent_child
+            # bring s_matrix/parent_child to top for compatibility/tests
+            reconciler = self.forecaster_.transformers_post_[0][1]
+            self._s_sparse = reconciler._s_sparse
+            self._node_index = reconciler._node_index
+            self._bottom_pos = reconciler._bottom_pos
+            self.parent_child = reconciler.parent_child
             return self
 
         # fit forecasters for each level
         self.forecaster_ = self.forecaster.clone()
         self.forecaster_.fit(y=y, X=X, fh=fh)
 
-        # now summation matrix
-        self.s_matrix = _get_s_matrix(y)
+        # now summation matrix, sparse, and positions of the bottom level nodes
+        self._s_sparse, self._node_index, self._bottom_pos = _get_s_matrix_sparse(y)
 
         # parent child df
-        self.parent_child = _parent_child_df(self.s_matrix)
+        self.parent_child = _parent_child_df(self._s_sparse, self._node_index)
 
         # bug in self.forecaster_.predict_residuals() for heir data
         fh_resid = ForecastingHorizon(
@@ -180,14 +186,7 @@ class ReconcilerForecaster(BaseForecaster):
         self.residuals_ = y - self.forecaster_.predict(fh=fh_resid, X=X)
 
         # now define recon matrix
-        if self.method == "mint_cov":
-            self.g_matrix = self._get_g_matrix_mint(shrink=False)
-        elif self.method == "mint_shrink":
-            self.g_matrix = self._get_g_matrix_mint(shrink=True)
-        elif self.method == "wls_var":
-            self.g_matrix = self._get_g_matrix_mint(shrink=False, diag_only=True)
-        else:
-            raise RuntimeError("unreachable condition, error in _check_method")
+        self._set_recon_matrix()
 
         return self
 
@@ -223,17 +222,19 @@ class ReconcilerForecaster(BaseForecaster):
         if np.isin(self.method, self.TRFORM_LIST):
             return base_fc
 
-        base_fc = base_fc.groupby(level=-1)
+        y_hat, node_pos, time_pos = _to_node_time_array(base_fc, self._node_index)
 
-        recon_fc = []
-        for _name, group in base_fc:
-            # reconcile via SGy
-            fcst = self.s_matrix.dot(self.g_matrix.dot(group.droplevel(-1)))
-            # add back in time index
-            fcst.index = group.index
-            recon_fc.append(fcst)
+        g_matrix = None
+        if self._g_dense is not None:
+            g_matrix = self._g_dense.values
 
-        recon_fc = pd.concat(recon_fc, axis=0)
+        # reconcile via SGy
+        recon = _reconcile(
+            y_hat, self._s_sparse, self._bottom_pos, self._weights, g_matrix
+        )
+        recon_fc = pd.DataFrame(
+            recon[node_pos, time_pos], index=base_fc.index, columns=base_fc.columns
+        )
         recon_fc = recon_fc.sort_index()
 
         return recon_fc
@@ -278,16 +279,44 @@ class ReconcilerForecaster(BaseForecaster):
 
         # could implement something specific here
         # for now just refit
+        self._set_recon_matrix()
+
+        return self
+
+    def _set_recon_matrix(self):
+        """Set the reconciliation of the MinT methods, based on self.residuals_.
+
+        For "wls_var", sets self._weights to the residual variances, reconciled via
+        sparse solves, otherwise sets self._g_dense to the dense G matrix.
+        """
+        self._weights = None
+        self._g_dense = None
         if self.method == "mint_cov":
-            self.g_matrix = self._get_g_matrix_mint(shrink=False)
+            self._g_dense = self._get_g_matrix_mint(shrink=False)
         elif self.method == "mint_shrink":
-            self.g_matrix = self._get_g_matrix_mint(shrink=True)
+            self._g_dense = self._get_g_matrix_mint(shrink=True)
         elif self.method == "wls_var":
-            self.g_matrix = self._get_g_matrix_mint(shrink=False, diag_only=True)
+            # diagonal of the covariance matrix, the G matrix is not formed
+            resid = self.residuals_.unstack().transpose()
+            self._weights = resid.var().values.astype(float)
         else:
             raise RuntimeError("unreachable condition, error in _check_method")
 
-        return self
+    @property
+    def s_matrix(self):
+        """Summation "S" matrix of the hierarchy seen in fit, as pd.DataFrame."""
+        return _get_s_matrix_frame(self._s_sparse, self._node_index, self._bottom_pos)
+
+    @property
+    def g_matrix(self):
+        """Reconciliation "G" matrix of the method, as pd.DataFrame."""
+        if np.isin(self.method, self.TRFORM_LIST):
+            return self.forecaster_.transformers_post_[0][1].g_matrix
+        if self._g_dense is not None:
+            return self._g_dense
+        return _get_g_matrix_frame(
+            self._s_sparse, self._node_index, self._bottom_pos, self._weights
+        )
 
     def _get_g_matrix_mint(self, shrink=False, diag_only=False):
         """Define the G matrix for the MinT methods based on model residuals.
@@ -359,24 +388,24 @@ class ReconcilerForecaster(BaseForecaster):
             cov_mat = (lamb * var_d) + ((1 - lamb) * cov_mat)
 
         if diag_only:
-            # digonal matrix of variances
-            for i in resid.columns:
-                cov_mat.loc[cov_mat.index != i, cov_mat.columns == i] = 0
+            # digonal matrix of variances, G via sparse solves
+            return _get_g_matrix_frame(
+                self._s_sparse,
+                self._node_index,
+                self._bottom_pos,
+                np.diag(cov_mat.values).copy(),
+            )
 
-        # now get the g matrix based on the covariance
+        # now get the g matrix based on the covariance, with sparse S
+        smat = self._s_sparse
+        s_cov = np.asarray(smat.T @ cov_mat.values)
+        g_mint = np.dot(inv(np.asarray(smat.T @ s_cov.T)), s_cov)
+        # set indexes of matrix
         g_mint = pd.DataFrame(
-            np.dot(
-                inv(
-                    np.dot(np.transpose(self.s_matrix), np.dot(cov_mat, self.s_matrix))
-                ),
-                np.dot(np.transpose(self.s_matrix), cov_mat),
-            )
+            g_mint,
+            index=self._node_index[self._bottom_pos],
+            columns=self._node_index,
         )
-        # set indexes of matrix
-        g_mint = g_mint.transpose()
-        g_mint = g_mint.set_index(self.s_matrix.index)
-        g_mint.columns = self.s_matrix.columns
-        g_mint = g_mint.transpose()
 
         return g_mint
 
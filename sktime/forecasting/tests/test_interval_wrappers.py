@@ -113,3 +113,65 @@ def test_evaluate_with_window_splitters(wrapper, splitter, strategy, sample_frac
 
     assert len(results) == 8
     assert not results.test_PinballLoss.isna().any()
+
+
+@pytest.mark.parametrize("max_cutoffs", [None, 20])
+def test_conformal_update_extends_residuals(max_cutoffs):
+    """Test that ConformalIntervals update extends the sliding residuals.
+
+    Intervals after update should be equal to intervals after fitting on all data,
+    for a forecaster whose update is equivalent to refitting.
+    """
+    y = load_airline()
+    f = NaiveForecaster(strategy="drift")
+    kwargs = {"initial_window": 24, "max_cutoffs": max_cutoffs}
+
+    updated = ConformalIntervals(f, **kwargs).fit(y[:100], fh=[1, 2, 3])
+    updated.update(y[100:110])
+    refitted = ConformalIntervals(f, **kwargs).fit(y[:110], fh=[1, 2, 3])
+
+    pd.testing.assert_frame_equal(
+        updated.predict_interval(), refitted.predict_interval()
+    )
+    if max_cutoffs is not None:
+        assert len(updated._residuals.get_residuals(2)) == max_cutoffs
+
+
+def test_conformal_n_jobs_invariant():
+    """Test that ConformalIntervals residuals do not depend on n_jobs.
+
+    ThetaForecaster does not refit in update, so this fails if parallel chunks
+    are fitted from scratch at their first cutoff.
+    """
+    from sktime.forecasting.theta import ThetaForecaster
+
+    y = load_airline()
+    f = ThetaForecaster(sp=12)
+    kwargs = {"initial_window": 30, "max_cutoffs": 40}
+
+    sequential = ConformalIntervals(f, n_jobs=1, **kwargs).fit(y, fh=[1, 2, 3])
+    parallel = ConformalIntervals(f, n_jobs=3, **kwargs).fit(y, fh=[1, 2, 3])
+
+    pd.testing.assert_frame_equal(
+        sequential.residuals_matrix_, parallel.residuals_matrix_
+    )
+    pd.testing.assert_frame_equal(
+        sequential.predict_interval(), parallel.predict_interval()
+    )
+
+
+def test_conformal_residuals_matrix():
+    """Test that residuals_matrix_ holds residuals of forecasts from each cutoff."""
+    y = load_airline()[:48]
+    forecaster = ConformalIntervals(NaiveForecaster(), initial_window=24)
+    forecaster.fit(y, fh=[1, 2])
+
+    residuals_matrix = forecaster.residuals_matrix_
+    assert (residuals_matrix.index == y.index[24:]).all()
+    assert (residuals_matrix.columns == y.index[24:]).all()
+    # naive "last" forecasts y.iloc[i - 1] from cutoff position i
+    for i in range(24, 46):
+        for j in (i, i + 1, i + 2):
+            expected = y.iloc[j] - y.iloc[i - 1]
+            assert residuals_matrix.loc[y.index[i], y.index[j]] == expected
+    assert residuals_matrix.iloc[0, 3:].isna().all()
@@ -15,6 +15,7 @@ __all__ = ["KNeighborsTimeSeriesRegressor"]
 from sklearn.neighbors import KNeighborsRegressor
 
 from sktime.distances import pairwise_distance
+from sktime.distances._dtw_knn import _dtw_lb_search_params, _knn_distance_to_train
 from sktime.regression.base import BaseRegressor
 
 # add new distance string codes here
@@ -56,6 +57,9 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             'euclidean', 'squared', 'dtw', 'ddtw', 'wdtw', 'wddtw',
             'lcss', 'edr', 'erp', 'msm'
         this will substitute a hard-coded distance metric from sktime.distances
+        If "dtw", with algorithm "brute" and distance_params only setting the
+            bounding window, neighbours are searched via ``dtw_kneighbors``,
+            which prunes most dtw computations by lower bounds
         When mpdist is used, the subsequence length (parameter m) must be set
             Example: knn_mpdist = KNeighborsTimeSeriesClassifier(
                                 metric='mpdist', metric_params={'m':30})
@@ -168,6 +172,17 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         else:
             return distance(X, X2)
 
+    def _distance_to_train(self, X, n_neighbors=None):
+        """Compute distances of X to the stored training data self._X."""
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        lb_search_params = _dtw_lb_search_params(
+            self.distance, self.algorithm, self.distance_params
+        )
+        return _knn_distance_to_train(
+            X, self._X, self._distance, n_neighbors, lb_search_params
+        )
+
     def _fit(self, X, y):
         """Fit the model using X as training data and y as target values.
 
@@ -216,7 +231,7 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         X = self._check_convert_X_for_predict(X)
 
         # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._distance_to_train(X, n_neighbors=n_neighbors)
 
         neigh_ind = self.knn_estimator_.kneighbors(
             dist_mat, n_neighbors=n_neighbors, return_distance=return_distance
@@ -237,7 +252,7 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             Class labels for each data sample.
         """
         # self._X should be the stored _X
-        dist_mat = self._distance(X, self._X)
+        dist_mat = self._distance_to_train(X)
 
         y_pred = self.knn_estimator_.predict(dist_mat)
 
@@ -57,6 +57,7 @@ import pandas as pd
 
 from sktime.base import BaseEstimator
 from sktime.datatypes import (
+    LazyPanel,
     VectorizedDF,
     check_is_mtype,
     check_is_scitype,
@@ -64,6 +65,8 @@ from sktime.datatypes import (
     mtype_to_scitype,
     update_data,
 )
+from sktime.datatypes._cache import _check_convert_cached
+from sktime.datatypes._lazy import _concat_batches
 from sktime.datatypes._series_as_panel import convert_to_scitype
 from sktime.utils.sklearn import (
     is_sklearn_classifier,
@@ -142,12 +145,22 @@ class BaseTransformer(BaseEstimator):
         # "on" - input check and conversion is carried out
         # "off" - input check and conversion is not done before passing to inner methods
         # valid mtype string - input is assumed to specified mtype
-        "output_conversion": "on"
+        "output_conversion": "on",
         # controls output conversion for _transform, _inverse_transform
         # valid values:
         # "on" - if input_conversion is "on", output conversion is carried out
         # "off" - output of _transform, _inverse_transform is directly returned
         # valid mtype string - output is converted to specified mtype
+        "backend:parallel": None,
+        # parallelization backend for broadcasting/vectorization, e.g., over
+        #  instances or columns of X, in fit, transform, inverse_transform, update
+        # valid values:
+        # None - no parallelization, loop is executed sequentially
+        # "loky", "multiprocessing", "threading" - uses joblib.Parallel
+        # "dask" - uses dask, requires dask to be installed
+        "backend:parallel:params": None,
+        # additional parameters passed to the parallelization backend,
+        #  see sktime.utils.parallel.parallelize for valid keys
     }
 
     # allowed mtypes for transformers - Series and Panel
@@ -369,6 +382,7 @@ class BaseTransformer(BaseEstimator):
         else:
             return ColumnSelect(key) * self
 
+    @_check_convert_cached
     def fit(self, X, y=None):
         """Fit transformer to X, optionally to y.
 
@@ -409,6 +423,10 @@ class BaseTransformer(BaseEstimator):
         # if fit is called, estimator is reset, including fitted state
         self.reset()
 
+        # fitting requires the full data, out-of-core panels are materialized
+        if isinstance(X, LazyPanel):
+            X = X.to_numpy()
+
         # skip everything if fit_is_empty is True and we do not need to remember data
         if self.get_tag("fit_is_empty") and not self.get_tag("remember_data", False):
             self._is_fitted = True
@@ -446,6 +464,7 @@ class BaseTransformer(BaseEstimator):
 
         return self
 
+    @_check_convert_cached
     def transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -470,6 +489,8 @@ class BaseTransformer(BaseEstimator):
                 if 3D np.ndarray, of shape (n_instances, n_variables, n_timepoints)
             Hierarchical: pd.DataFrame with 3- or more-level MultiIndex
                 highest (rightmost) level  of MultiIndex is time
+            LazyPanel: out-of-core Panel of equal length series,
+                transformed in batches of instances, outputs are concatenated
             for more details on sktime mtype format specifications,
             and additional valid type specifications, refer to
                 examples/AA_datatypes_and_datasets.ipynb
@@ -529,6 +550,10 @@ class BaseTransformer(BaseEstimator):
         # check whether is fitted
         self.check_is_fitted()
 
+        # out-of-core panels are streamed through transform in batches
+        if isinstance(X, LazyPanel):
+            return self._transform_lazy(X, y)
+
         # input check and conversion for X/y
         X_inner, y_inner, metadata = self._check_X_y(X=X, y=y, return_metadata=True)
 
@@ -551,6 +576,35 @@ class BaseTransformer(BaseEstimator):
 
         return X_out
 
+    def _transform_lazy(self, X, y=None):
+        """Transform LazyPanel X batch by batch, and concatenate the results.
+
+        Parameters
+        ----------
+        X : LazyPanel
+            out-of-core panel, batches are passed to transform as 3D np.ndarray
+        y : optional, 1D np.ndarray or pd.Series of length len(X), default=None
+            sliced along with X, passed to transform per batch
+
+        Returns
+        -------
+        transformed version of X, batch outputs concatenated along instances
+        """
+        Xt = []
+        start = 0
+        for X_batch in X.iter_batches():
+            stop = start + len(X_batch)
+            if y is None:
+                y_batch = None
+            elif isinstance(y, (pd.Series, pd.DataFrame)):
+                y_batch = y.iloc[start:stop]
+            else:
+                y_batch = y[start:stop]
+            Xt.append(self.transform(X_batch, y_batch))
+            start = stop
+        return _concat_batches(Xt)
+
+    @_check_convert_cached
     def fit_transform(self, X, y=None):
         """Fit to data, then transform it.
 
@@ -619,6 +673,7 @@ class BaseTransformer(BaseEstimator):
         # method is possible for a given algorithm.
         return self.fit(X, y).transform(X, y)
 
+    @_check_convert_cached
     def inverse_transform(self, X, y=None):
         """Inverse transform X and return an inverse transformed version.
 
@@ -684,6 +739,7 @@ class BaseTransformer(BaseEstimator):
 
         return X_out
 
+    @_check_convert_cached
     def update(self, X, y=None, update_params=True):
         """Update transformer with X, optionally y.
 
@@ -1168,8 +1224,10 @@ class BaseTransformer(BaseEstimator):
                 if isinstance(Xt.index, pd.MultiIndex):
                     Xt.index = Xt.index.droplevel(-1)
                 # else this is only zeros and should be reset to RangeIndex
+                # without copying the data, as reset_index would
                 else:
-                    Xt = Xt.reset_index(drop=True)
+                    Xt = Xt.copy(deep=False)
+                    Xt.index = pd.RangeIndex(len(Xt))
             Xt = convert_to(
                 Xt,
                 to_type="pd_DataFrame_Table",
@@ -1191,6 +1249,11 @@ class BaseTransformer(BaseEstimator):
         kwargs["rowname_default"] = "transformers"
         kwargs["colname_default"] = "transformers"
 
+        # add parallelization backend, as set in config
+        configs = self.get_config()
+        kwargs["backend"] = configs["backend:parallel"]
+        kwargs["backend_params"] = configs["backend:parallel:params"]
+
         FIT_METHODS = ["fit", "update"]
         TRAFO_METHODS = ["transform", "inverse_transform"]
 
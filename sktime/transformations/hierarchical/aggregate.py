@@ -4,15 +4,27 @@
 
 __author__ = ["ciaran-g"]
 
+import threading
+import weakref
+from collections import OrderedDict
 from warnings import warn
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
+from sktime.datatypes._panel._check import _multiindex_group_ids
 from sktime.transformations.base import BaseTransformer
 
 # todo: add any necessary sktime internal imports here
 
+# structures of recently aggregated indices, see _get_cached_aggregate_structure
+#   indices are referenced weakly, entries are dropped when their index is collected
+_STRUCTURE_CACHE = OrderedDict()
+_STRUCTURE_CACHE_SIZE = 4
+# reentrant, since the weakref callback can run in a thread that holds the lock
+_STRUCTURE_CACHE_LOCK = threading.RLock()
+
 
 class Aggregator(BaseTransformer):
     """Prepare hierarchical data, including aggregate levels, from bottom level.
@@ -106,50 +118,14 @@ class Aggregator(BaseTransformer):
             )
             X = self._inverse_transform(X)
 
-        # starting from top aggregate
-        df_out = X.copy()
-        for i in range(0, X.index.nlevels - 1, 1):
-            # finding "__totals" parent/child from (up -> down)
-            indx_grouper = np.arange(0, i, 1).tolist()
-            indx_grouper.append(X.index.nlevels - 1)
-
-            out = X.groupby(level=indx_grouper).sum()
-
-            # get new index with aggregate levels to match with old
-            new_idx = []
-            for j in range(0, X.index.nlevels - 1, 1):
-                if j in indx_grouper:
-                    new_idx.append(out.index.get_level_values(j))
-                else:
-                    new_idx.append(["__total"] * len(out.index))
-
-            # add in time index
-            new_idx.append(out.index.get_level_values(-1))
-
-            new_idx = pd.MultiIndex.from_arrays(new_idx, names=X.index.names)
-
-            out = out.set_index(new_idx)
-
-            df_out = pd.concat([out, df_out])
-
-        # now remove duplicated aggregate indexes
-        if self.flatten_single_levels:
-            new_index = _flatten_single_indexes(X)
-
-            nm = X.index.names[-1]
-            if nm is None:
-                nm = "level_" + str(X.index.nlevels - 1)
-            else:
-                pass
-
-            # now reindex with new non-duplicated axis
-            df_out = (
-                df_out.reset_index(level=-1).loc[new_index].set_index(nm, append=True)
-            ).rename_axis(X.index.names, axis=0)
-
-        df_out = df_out.sort_index()
+        numeric = all(
+            is_numeric_dtype(dtype) and not is_bool_dtype(dtype) for dtype in X.dtypes
+        )
+        if len(X) == 0 or not numeric:
+            return _aggregate_groupby(X, self.flatten_single_levels)
 
-        return df_out
+        structure = _get_cached_aggregate_structure(X, self.flatten_single_levels)
+        return _aggregate(X, structure)
 
     def _inverse_transform(self, X, y=None):
         """Inverse transform, inverse operation to transform.
@@ -177,8 +153,12 @@ class Aggregator(BaseTransformer):
                 "Returning X unchanged."
             )
         else:
+            is_total = np.zeros(len(X), dtype=bool)
             for i in range(X.index.nlevels - 1):
-                X = X.drop(index="__total", level=i)
+                level = X.index.levels[i]
+                if "__total" in level:
+                    is_total |= X.index.codes[i] == level.get_loc("__total")
+            X = X[~is_total]
         return X
 
     @classmethod
@@ -198,6 +178,197 @@ class Aggregator(BaseTransformer):
         return params
 
 
+def _aggregate_groupby(X, flatten_single_levels):
+    """Aggregate X via groupby, level by level, for non-numeric or empty X."""
+    # starting from top aggregate
+    df_out = X.copy()
+    for i in range(0, X.index.nlevels - 1, 1):
+        # finding "__totals" parent/child from (up -> down)
+        indx_grouper = np.arange(0, i, 1).tolist()
+        indx_grouper.append(X.index.nlevels - 1)
+
+        out = X.groupby(level=indx_grouper).sum()
+
+        # get new index with aggregate levels to match with old
+        new_idx = []
+        for j in range(0, X.index.nlevels - 1, 1):
+            if j in indx_grouper:
+                new_idx.append(out.index.get_level_values(j))
+            else:
+                new_idx.append(["__total"] * len(out.index))
+
+        # add in time index
+        new_idx.append(out.index.get_level_values(-1))
+
+        new_idx = pd.MultiIndex.from_arrays(new_idx, names=X.index.names)
+
+        out = out.set_index(new_idx)
+
+        df_out = pd.concat([out, df_out])
+
+    # now remove duplicated aggregate indexes
+    if flatten_single_levels:
+        new_index = _flatten_single_indexes(X)
+
+        nm = X.index.names[-1]
+        if nm is None:
+            nm = "level_" + str(X.index.nlevels - 1)
+        else:
+            pass
+
+        # now reindex with new non-duplicated axis
+        df_out = (
+            df_out.reset_index(level=-1).loc[new_index].set_index(nm, append=True)
+        ).rename_axis(X.index.names, axis=0)
+
+    df_out = df_out.sort_index()
+
+    return df_out
+
+
+def _get_aggregate_structure(X, flatten_single_levels):
+    """Determine the structure of the aggregation of X, from the index codes.
+
+    Rows of X are sorted once by time point, then by the hierarchy levels from
+    the top. In this order, the rows summed into each aggregate node, at a given
+    time point, are contiguous for all aggregate levels, so all aggregates can be
+    computed with ``np.add.reduceat``. The structure only depends on X.index.
+
+    Parameters
+    ----------
+    X : Panel of pd.DataFrame, with MultiIndex and no "__total" nodes
+    flatten_single_levels : bool, as in Aggregator
+
+    Returns
+    -------
+    structure : dict with keys
+        "flatten_single_levels" : flatten_single_levels
+        "order" : 1D np.ndarray of int, permutation that sorts the rows of X
+        "starts" : list of 1D np.ndarray of int, one per aggregate level from the
+            top, first rows of the aggregate nodes in the sorted rows of X
+        "take" : 1D np.ndarray of int, rows of the output, in the rows of X
+            stacked with the aggregate rows of all levels
+        "index_out" : pd.MultiIndex, index of the output
+    """
+    index = X.index
+    n_levels = index.nlevels - 1
+
+    # sort by time, then hierarchy levels from the top, np.lexsort sorts by last
+    sort_keys = [index.codes[i] for i in range(n_levels - 1, -1, -1)]
+    order = np.lexsort(sort_keys + [index.codes[-1]])
+
+    # source row in X and number of non-"__total" hierarchy levels, per output row
+    src = [np.arange(len(index))]
+    depth = [np.full(len(index), n_levels)]
+
+    time_codes = index.codes[-1][order]
+    new_group = np.ones(len(index), dtype=bool)
+    new_group[1:] = time_codes[1:] != time_codes[:-1]
+    starts = []
+    for i in range(n_levels):
+        # aggregate nodes of level i keep the top i hierarchy levels
+        if i > 0:
+            level_codes = index.codes[i - 1][order]
+            new_group[1:] |= level_codes[1:] != level_codes[:-1]
+        start = np.flatnonzero(new_group)
+        starts.append(start)
+        src.append(order[start])
+        depth.append(np.full(len(start), i))
+    src = np.concatenate(src)
+    depth = np.concatenate(depth)
+
+    arrays = []
+    for i in range(n_levels):
+        level_values = np.asarray(index.get_level_values(i).take(src), dtype=object)
+        level_values[depth <= i] = "__total"
+        arrays.append(level_values)
+    arrays.append(index.get_level_values(-1).take(src))
+    index_out = pd.MultiIndex.from_arrays(arrays, names=index.names)
+
+    # remove aggregate nodes with a single child, rows of X are all kept
+    keep = np.arange(len(index_out))
+    if flatten_single_levels:
+        new_index = _flatten_single_indexes(X)
+        agg_nodes = index_out[len(index) :].droplevel(-1)
+        keep_agg = keep[len(index) :][agg_nodes.isin(new_index)]
+        keep = np.concatenate([keep[: len(index)], keep_agg])
+
+    sorter = pd.Series(keep, index=index_out[keep]).sort_index()
+
+    structure = {
+        "flatten_single_levels": flatten_single_levels,
+        "order": order,
+        "starts": starts,
+        "take": sorter.values,
+        "index_out": sorter.index,
+    }
+    return structure
+
+
+def _get_cached_aggregate_structure(X, flatten_single_levels):
+    """Get the structure of the aggregation of X, reused for recently seen indices.
+
+    The structure only depends on X.index, so it is cached in a bounded, module
+    level, least recently used cache, and reused when transforming new data with
+    an index identical to a recently transformed one, e.g., in backtesting.
+    The cache references indices weakly, and drops the structure of an index once
+    the index is garbage collected. The cache is shared between threads, access is
+    guarded by a lock.
+
+    Parameters and return as in _get_aggregate_structure.
+    """
+    index = X.index
+    with _STRUCTURE_CACHE_LOCK:
+        for key, (index_ref, structure) in list(_STRUCTURE_CACHE.items()):
+            cached_index = index_ref()
+            if cached_index is None:
+                continue
+            # index names can be changed in place, so they are compared to the output
+            if (
+                structure["flatten_single_levels"] == flatten_single_levels
+                and list(structure["index_out"].names) == list(index.names)
+                and cached_index.identical(index)
+            ):
+                _STRUCTURE_CACHE.move_to_end(key)
+                return structure
+
+    structure = _get_aggregate_structure(X, flatten_single_levels)
+
+    key = (id(index), flatten_single_levels)
+    index_ref = weakref.ref(index, lambda ref, key=key: _evict_structure(key, ref))
+    with _STRUCTURE_CACHE_LOCK:
+        _STRUCTURE_CACHE[key] = (index_ref, structure)
+        while len(_STRUCTURE_CACHE) > _STRUCTURE_CACHE_SIZE:
+            _STRUCTURE_CACHE.popitem(last=False)
+    return structure
+
+
+def _evict_structure(key, ref):
+    """Weakref callback, drop cached structure of a garbage collected index."""
+    with _STRUCTURE_CACHE_LOCK:
+        entry = _STRUCTURE_CACHE.get(key)
+        if entry is not None and entry[0] is ref:
+            del _STRUCTURE_CACHE[key]
+
+
+def _aggregate(X, structure):
+    """Aggregate numeric X, given the structure from _get_aggregate_structure."""
+    columns = {}
+    for i in range(X.shape[1]):
+        values = X.iloc[:, i].to_numpy()
+        summands = values
+        if np.issubdtype(values.dtype, np.floating):
+            # as groupby.sum, missing values are skipped
+            summands = np.where(np.isnan(values), 0, values)
+        summands = summands[structure["order"]]
+        aggregates = [np.add.reduceat(summands, s) for s in structure["starts"]]
+        columns[i] = np.concatenate([values] + aggregates)[structure["take"]]
+
+    df_out = pd.DataFrame(columns, index=structure["index_out"])
+    df_out.columns = X.columns
+    return df_out
+
+
 def _check_index_no_total(X):
     """Check the index of X and return boolean."""
     # check the elements of the index for "__total"
@@ -211,8 +382,10 @@ def _check_index_no_total(X):
 
 def _flatten_single_indexes(X):
     """Check the index of X and return new unique index object."""
-    # get unique indexes outwith timepoints
-    inds = list(X.droplevel(-1).index.unique())
+    # get unique indexes outwith timepoints, in order of appearance
+    node_ids = _multiindex_group_ids(X.index, list(range(X.index.nlevels - 1)))
+    first_rows = np.unique(node_ids, return_index=True)[1]
+    inds = list(X.index.droplevel(-1)[first_rows])
     ind_df = pd.DataFrame(inds)
 
     # add the new top aggregate level
@@ -230,7 +403,7 @@ def _flatten_single_indexes(X):
                 filter_cols = list(ind_aggs.columns[0:-1])
                 filter_inds = ind_aggs.groupby(
                     by=filter_cols, as_index=False
-                ).transform(lambda x: x.nunique())
+                ).transform("nunique")
                 filter_inds = filter_inds[(filter_inds > 1)].dropna().index
                 ind_aggs = ind_aggs.iloc[filter_inds, :]
             else:
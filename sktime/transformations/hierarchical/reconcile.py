@@ -11,7 +11,8 @@ from warnings import warn
 
 import numpy as np
 import pandas as pd
-from numpy.linalg import inv
+from scipy import sparse
+from scipy.sparse.linalg import splu
 
 from sktime.transformations.base import BaseTransformer
 from sktime.transformations.hierarchical.aggregate import _check_index_no_total
@@ -134,23 +135,24 @@ class Reconciler(BaseTransformer):
         if _check_index_no_total(X):
             X = self._add_totals(X)
 
-        # define reconciliation matrix
-        if self.method == "bu":
-            self.g_matrix = _get_g_matrix_bu(X)
-        elif self.method == "ols":
-            self.g_matrix = _get_g_matrix_ols(X)
+        # summation matrix, sparse, and positions of the bottom level nodes
+        self._s_sparse, self._node_index, self._bottom_pos = _get_s_matrix_sparse(X)
+
+        # define reconciliation, via weights of the least squares problem,
+        # or a dense G matrix template for the forecast dependent td_fcst
+        self._weights = None
+        self._g_dense = None
+        if self.method == "ols":
+            self._weights = _get_wls_weights(self._s_sparse, "ols")
         elif self.method == "wls_str":
-            self.g_matrix = _get_g_matrix_wls_str(X)
+            self._weights = _get_wls_weights(self._s_sparse, "wls_str")
         elif self.method == "td_fcst":
-            self.g_matrix = _get_g_matrix_td_fcst(X)
-        else:
+            self._g_dense = _get_g_matrix_td_fcst(X)
+        elif self.method != "bu":
             raise RuntimeError("unreachable condition, error in _check_method")
 
-        # now summation matrix
-        self.s_matrix = _get_s_matrix(X)
-
         # parent child df
-        self.parent_child = _parent_child_df(self.s_matrix)
+        self.parent_child = _parent_child_df(self._s_sparse, self._node_index)
 
         return self
 
@@ -186,37 +188,56 @@ class Reconciler(BaseTransformer):
             )
             X = self._add_totals(X)
 
-        # check here that index of X matches the self.s_matrix
+        # check here that index of X matches the summation matrix
         al_inds = X.droplevel(level=-1).index.unique()
-        chk_newindx = np.all(self.s_matrix.index == al_inds)
-        if not chk_newindx:
+        if not self._node_index.equals(al_inds):
             raise ValueError(
                 "Check unique indexes of X.droplevel(level=-1) matches "
                 "the data used in Reconciler().fit(X)."
             )
 
-        X = X.groupby(level=-1)
-        # could use X.transform() with np.dot, v. marginally faster in my tests
-        # - loop can use index matching via df.dot() which is probably worth it
-        recon_preds = []
-        gmat = self.g_matrix
-        for _name, group in X:
+        y_hat, node_pos, time_pos = _to_node_time_array(X, self._node_index)
 
-            if self.method == "td_fcst":
+        g_matrix = None
+        if self.method == "td_fcst":
+            # G matrix depends on the forecasts, one per time point
+            g_matrix = []
+            gmat = self._g_dense
+            for i in range(y_hat.shape[1]):
+                x_sf = pd.DataFrame(y_hat[:, [i]], index=self._node_index)
                 gmat = _update_td_fcst(
-                    g_matrix=gmat, x_sf=group.droplevel(-1), conn_df=self.parent_child
+                    g_matrix=gmat, x_sf=x_sf, conn_df=self.parent_child
                 )
-            # reconcile via SGy
-            fcst = self.s_matrix.dot(gmat.dot(group.droplevel(-1)))
-            # add back in time index
-            fcst.index = group.index
-            recon_preds.append(fcst)
+                g_matrix.append(gmat.values.copy())
 
-        recon_preds = pd.concat(recon_preds, axis=0)
+        # reconcile via SGy
+        recon = _reconcile(
+            y_hat, self._s_sparse, self._bottom_pos, self._weights, g_matrix
+        )
+        recon_preds = pd.DataFrame(
+            recon[node_pos, time_pos], index=X.index, columns=X.columns
+        )
         recon_preds = recon_preds.sort_index()
 
         return recon_preds
 
+    @property
+    def s_matrix(self):
+        """Summation "S" matrix of the hierarchy seen in fit, as pd.DataFrame."""
+        return _get_s_matrix_frame(self._s_sparse, self._node_index, self._bottom_pos)
+
+    @property
+    def g_matrix(self):
+        """Reconciliation "G" matrix of the method, as pd.DataFrame.
+
+        For ``method="td_fcst"``, this is the template updated at each time point.
+        """
+        if self._g_dense is not None:
+            return self._g_dense
+        return _get_g_matrix_frame(
+            self._s_sparse, self._node_index, self._bottom_pos, self._weights
+        )
+
     def _check_method(self):
         """Raise warning if method is not defined correctly."""
         if not np.isin(self.method, self.METHOD_LIST):
@@ -239,6 +260,66 @@ class Reconciler(BaseTransformer):
         return [{"method": x} for x in cls.METHOD_LIST]
 
 
+def _get_s_matrix_sparse(X):
+    """Determine the summation "S" matrix as sparse matrix.
+
+    The S matrix is derived directly from the multi-index of X, without forming
+    it densely: each bottom level node is summed into itself and into each of its
+    aggregate nodes, which replace the trailing levels by "__total", if present.
+
+    Parameters
+    ----------
+    X :  Panel of mtype pd_multiindex_hier
+
+    Returns
+    -------
+    s_matrix : scipy.sparse.csr_matrix of shape (n_nodes, n_bottom_nodes)
+        rows are the unique nodes of the hierarchy, in order of node_index,
+        columns are the bottom level nodes, in order of bottom_pos
+    node_index : pd.Index, unique index of X with the time level removed
+    bottom_pos : 1D np.ndarray of int, positions of bottom level nodes in node_index
+    """
+    node_index = X.index.droplevel(level=-1).unique()
+    if isinstance(node_index, pd.MultiIndex):
+        node_levels = [
+            node_index.get_level_values(i) for i in range(node_index.nlevels)
+        ]
+    else:
+        node_levels = [node_index]
+    n_levels = len(node_levels)
+
+    bottom_pos = np.flatnonzero(np.asarray(node_levels[-1] != "__total"))
+    n_bottom = len(bottom_pos)
+    bottom_cols = np.arange(n_bottom)
+
+    rows = [bottom_pos]
+    cols = [bottom_cols]
+    # aggregate nodes replace the last j levels by "__total", j = 1, ..., n_levels
+    total = np.full(n_bottom, "__total", dtype=object)
+    for j in range(1, n_levels + 1):
+        agg_levels = [lvl[bottom_pos] for lvl in node_levels[: n_levels - j]]
+        agg_levels += [total] * j
+        if n_levels > 1:
+            agg_inds = pd.MultiIndex.from_arrays(agg_levels)
+        else:
+            agg_inds = pd.Index(agg_levels[0])
+        agg_pos = node_index.get_indexer(agg_inds)
+        # aggregate nodes not present in X, e.g., flattened levels, are skipped
+        present = agg_pos >= 0
+        rows.append(agg_pos[present])
+        cols.append(bottom_cols[present])
+
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    s_matrix = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(node_index), n_bottom)
+    )
+    # indicator matrix, duplicate entries are summed by the constructor
+    s_matrix.data[:] = 1.0
+
+    return s_matrix, node_index, bottom_pos
+
+
 def _get_s_matrix(X):
     """Determine the summation "S" matrix.
 
@@ -264,42 +345,14 @@ def _get_s_matrix(X):
     ----------
     .. [1] https://otexts.com/fpp3/hierarchical.html
     """
-    # get bottom level indexes
-    bl_inds = (
-        X.loc[~(X.index.get_level_values(level=-2).isin(["__total"]))]
-        .index.droplevel(level=-1)
-        .unique()
-    )
-    # get all level indexes
-    al_inds = X.droplevel(level=-1).index.unique()
-
-    # set up matrix
-    s_matrix = pd.DataFrame(
-        [[0.0 for i in range(len(bl_inds))] for i in range(len(al_inds))],
-        index=al_inds,
-    )
-    s_matrix.columns = bl_inds
-
-    # now insert indicator for bottom level
-    for i in s_matrix.columns:
-        s_matrix.loc[s_matrix.index == i, i] = 1.0
-
-    # now for each unique column add aggregate indicator
-    for i in s_matrix.columns:
-        if s_matrix.index.nlevels > 1:
-            # replace index with totals -> ("nodeA", "__total")
-            agg_ind = list(i)[::-1]
-            for j in range(len(agg_ind)):
-                agg_ind[j] = "__total"
-                # insert indicator
-                s_matrix.loc[tuple(agg_ind[::-1]), i] = 1.0
-        else:
-            s_matrix.loc["__total", i] = 1.0
+    return _get_s_matrix_frame(*_get_s_matrix_sparse(X))
 
-    # drop new levels not present in orginal matrix
-    s_matrix = s_matrix.loc[s_matrix.index.isin(al_inds)]
 
-    return s_matrix
+def _get_s_matrix_frame(s_matrix, node_index, bottom_pos):
+    """Return sparse S matrix from _get_s_matrix_sparse as dense pd.DataFrame."""
+    return pd.DataFrame(
+        s_matrix.toarray(), index=node_index, columns=node_index[bottom_pos]
+    )
 
 
 def _get_g_matrix_bu(X):
@@ -326,27 +379,7 @@ def _get_g_matrix_bu(X):
     ----------
     .. [1] https://otexts.com/fpp3/hierarchical.html
     """
-    # get bottom level indexes
-    bl_inds = (
-        X.loc[~(X.index.get_level_values(level=-2).isin(["__total"]))]
-        .index.droplevel(level=-1)
-        .unique()
-    )
-
-    # get all level indexes
-    al_inds = X.droplevel(level=-1).index.unique()
-
-    g_matrix = pd.DataFrame(
-        [[0.0 for i in range(len(bl_inds))] for i in range(len(al_inds))],
-        index=al_inds,
-    )
-    g_matrix.columns = bl_inds
-
-    # now insert indicator for bottom level
-    for i in g_matrix.columns:
-        g_matrix.loc[g_matrix.index == i, i] = 1.0
-
-    return g_matrix.transpose()
+    return _get_g_matrix_frame(*_get_s_matrix_sparse(X))
 
 
 def _get_g_matrix_ols(X):
@@ -373,19 +406,9 @@ def _get_g_matrix_ols(X):
     ----------
     .. [1] https://otexts.com/fpp3/hierarchical.html
     """
-    # get s matrix
-    smat = _get_s_matrix(X)
-    # get g
-    g_ols = pd.DataFrame(
-        np.dot(inv(np.dot(np.transpose(smat), smat)), np.transpose(smat))
-    )
-    # set indexes of matrix
-    g_ols = g_ols.transpose()
-    g_ols = g_ols.set_index(smat.index)
-    g_ols.columns = smat.columns
-    g_ols = g_ols.transpose()
-
-    return g_ols
+    smat, node_index, bottom_pos = _get_s_matrix_sparse(X)
+    weights = _get_wls_weights(smat, "ols")
+    return _get_g_matrix_frame(smat, node_index, bottom_pos, weights)
 
 
 def _get_g_matrix_wls_str(X):
@@ -412,25 +435,146 @@ def _get_g_matrix_wls_str(X):
     ----------
     .. [1] https://otexts.com/fpp3/hierarchical.html
     """
-    # this is similar to the ols except we have a new matrix W
-    smat = _get_s_matrix(X)
+    smat, node_index, bottom_pos = _get_s_matrix_sparse(X)
+    weights = _get_wls_weights(smat, "wls_str")
+    return _get_g_matrix_frame(smat, node_index, bottom_pos, weights)
 
-    diag_data = np.diag(smat.sum(axis=1).values)
-    w_mat = pd.DataFrame(diag_data, index=smat.index, columns=smat.index)
 
-    g_wls_str = pd.DataFrame(
-        np.dot(
-            inv(np.dot(np.transpose(smat), np.dot(w_mat, smat))),
-            np.dot(np.transpose(smat), w_mat),
-        )
-    )
-    # set indexes of matrix
-    g_wls_str = g_wls_str.transpose()
-    g_wls_str = g_wls_str.set_index(smat.index)
-    g_wls_str.columns = smat.columns
-    g_wls_str = g_wls_str.transpose()
+def _get_wls_weights(s_matrix, method):
+    """Diagonal weights W of the least squares G matrix, inv(S'WS)S'W.
+
+    Parameters
+    ----------
+    s_matrix : scipy.sparse matrix, the S matrix from _get_s_matrix_sparse
+    method : str, "ols" or "wls_str"
+
+    Returns
+    -------
+    weights : 1D np.ndarray of float, diagonal of W, one entry per node
+    """
+    if method == "ols":
+        return np.ones(s_matrix.shape[0])
+    # wls_str - weight by the number of bottom level nodes summed into each node
+    return np.asarray(s_matrix.sum(axis=1), dtype=float).ravel()
+
+
+def _get_g_matrix_frame(s_matrix, node_index, bottom_pos, weights=None):
+    """Dense G matrix as pd.DataFrame, from the sparse S matrix and weights.
+
+    Parameters
+    ----------
+    s_matrix, node_index, bottom_pos : return of _get_s_matrix_sparse
+    weights : 1D np.ndarray or None, optional, default=None
+        diagonal weights W of the least squares G matrix, inv(S'WS)S'W,
+        if None, the G matrix of the bottom up method is returned
+
+    Returns
+    -------
+    g_matrix : pd.DataFrame with rows equal to the number of bottom level nodes,
+        and columns equal to the number of unique nodes in the hierarchy
+    """
+    n_nodes = len(node_index)
+    if weights is None:
+        g_matrix = np.zeros((len(bottom_pos), n_nodes))
+        g_matrix[np.arange(len(bottom_pos)), bottom_pos] = 1.0
+    else:
+        g_matrix = _solve_wls(np.eye(n_nodes), s_matrix, bottom_pos, weights)
+    return pd.DataFrame(g_matrix, index=node_index[bottom_pos], columns=node_index)
+
+
+def _solve_wls(y, s_matrix, bottom_pos, weights):
+    """Bottom level values of the weighted least squares reconciliation of y.
+
+    Computes inv(S'WS)S'Wy with W = diag(weights) without forming S'WS, which is
+    dense, as all bottom level nodes share the "__total" node. Instead, y is
+    projected in the W-norm onto the coherent forecasts, i.e., the x with U'x = 0,
+    for the constraint matrix U' = [I, -S_agg], S_agg the aggregate rows of S:
+    x = y - inv(W)U inv(U'inv(W)U) U'y, of which the bottom level rows are returned.
+    U'inv(W)U is sparse, and of size the number of aggregate nodes only.
+
+    Parameters
+    ----------
+    y : 2D np.ndarray of shape (n_nodes, n_columns), values per node, e.g.,
+        base forecasts, one column per time point
+    s_matrix, bottom_pos : return of _get_s_matrix_sparse
+    weights : 1D np.ndarray of shape (n_nodes,), diagonal of W
+
+    Returns
+    -------
+    2D np.ndarray of shape (n_bottom_nodes, n_columns), equal to inv(S'WS)S'Wy
+    """
+    y = np.asarray(y, dtype=float)
+
+    if np.any(weights <= 0):
+        # inv(W) does not exist, solve the normal equations instead
+        s_w = s_matrix.T.multiply(weights).tocsr()
+        return splu((s_w @ s_matrix).tocsc()).solve(s_w @ y)
 
-    return g_wls_str
+    is_agg = np.ones(s_matrix.shape[0], dtype=bool)
+    is_agg[bottom_pos] = False
+    agg_pos = np.flatnonzero(is_agg)
+    y_bottom = y[bottom_pos]
+    if len(agg_pos) == 0:
+        return y_bottom
+
+    s_agg = s_matrix[agg_pos]
+    w_inv = 1.0 / weights
+    w_inv_bottom = w_inv[bottom_pos]
+    lhs = sparse.diags(w_inv[agg_pos]) + s_agg.multiply(w_inv_bottom).tocsr() @ s_agg.T
+    mu = splu(lhs.tocsc()).solve(y[agg_pos] - s_agg @ y_bottom)
+    return y_bottom + w_inv_bottom[:, None] * (s_agg.T @ mu)
+
+
+def _reconcile(y, s_matrix, bottom_pos, weights=None, g_matrix=None):
+    """Reconcile values y of all nodes via SGy, with sparse products.
+
+    Parameters
+    ----------
+    y : 2D np.ndarray of shape (n_nodes, n_timepoints), values per node, e.g.,
+        base forecasts, one column per time point
+    s_matrix, bottom_pos : return of _get_s_matrix_sparse
+    weights : 1D np.ndarray or None, optional, default=None
+        diagonal weights W of the least squares G matrix, inv(S'WS)S'W
+    g_matrix : 2D np.ndarray, list of 2D np.ndarray, or None, optional, default=None
+        dense G matrix of shape (n_bottom_nodes, n_nodes), or one per time point,
+        takes precedence over weights if passed
+        if both weights and g_matrix are None, reconciles bottom up
+
+    Returns
+    -------
+    2D np.ndarray of shape (n_nodes, n_timepoints), the reconciled values
+    """
+    if isinstance(g_matrix, list):
+        bottom = np.stack([g @ y[:, i] for i, g in enumerate(g_matrix)], axis=1)
+    elif g_matrix is not None:
+        bottom = g_matrix @ y
+    elif weights is not None:
+        bottom = _solve_wls(y, s_matrix, bottom_pos, weights)
+    else:
+        bottom = y[bottom_pos]
+    return s_matrix @ bottom
+
+
+def _to_node_time_array(X, node_index):
+    """Arrange univariate hierarchical X as 2D array of nodes by time points.
+
+    Parameters
+    ----------
+    X : Panel of mtype pd_multiindex_hier, univariate
+    node_index : pd.Index, unique nodes, i.e., index of X with time level removed
+
+    Returns
+    -------
+    y : 2D np.ndarray of shape (n_nodes, n_timepoints), time points sorted,
+        entries not present in X are np.nan
+    node_pos : 1D np.ndarray of int, row of y for each row of X
+    time_pos : 1D np.ndarray of int, column of y for each row of X
+    """
+    node_pos = node_index.get_indexer(X.index.droplevel(level=-1))
+    time_pos, times = pd.factorize(X.index.get_level_values(-1), sort=True)
+    y = np.full((len(node_index), len(times)), np.nan)
+    y[node_pos, time_pos] = X.iloc[:, 0].values
+    return y, node_pos, time_pos
 
 
 def _get_g_matrix_td_fcst(X):
@@ -525,7 +669,7 @@ def _update_td_fcst(g_matrix, x_sf, conn_df):
     return g_matrix
 
 
-def _parent_child_df(s_matrix):
+def _parent_child_df(s_matrix, node_index):
     """Extract the parent and child connections in a hierarchy.
 
     This function takes the summation S matrix for a given hierarchy and
@@ -534,35 +678,38 @@ def _parent_child_df(s_matrix):
 
     Parameters
     ----------
-    s_matrix :  The summation matrix for a given hierarchy from the function
-        _get_s_matrix().
+    s_matrix : scipy.sparse matrix, the summation matrix for a given hierarchy
+        from the function _get_s_matrix_sparse().
+    node_index : pd.Index, the nodes of the rows of s_matrix
 
     Returns
     -------
     df : A two column pd.DataFrame with rows equal to the number of
         connections in a hierarchy.
     """
-    parent_child = []
-    total_count = s_matrix.index.to_frame()
-    total_count = (total_count == "__total").sum(axis=1)
-
-    # for each bottom node
-    for i in s_matrix.columns:
-        # get all connections
-        connected_nodes = s_matrix[(s_matrix[i] == 1)].sum(axis=1)
-        # for non-flattened hiearchies make sure "__totals" are above
-        connected_nodes = (connected_nodes + total_count).dropna()
-        connected_nodes = connected_nodes.sort_values(ascending=False)
-
-        # starting from top add list of [parent, child]
-        for j in range(len(connected_nodes.index) - 1):
-            parent_child.append(
-                [connected_nodes.index[j], connected_nodes.index[j + 1]]
-            )
-
-    df = pd.DataFrame(parent_child)
-    df.columns = ["parent", "child"]
+    total_count = (node_index.to_frame() == "__total").sum(axis=1).values
+    # for non-flattened hiearchies make sure "__totals" are above
+    height = np.asarray(s_matrix.sum(axis=1)).ravel() + total_count
+
+    # all connections of each bottom node, ordered from the top
+    s_coo = s_matrix.tocoo()
+    order = np.lexsort((-height[s_coo.row], s_coo.col))
+    nodes = s_coo.row[order]
+    bottoms = s_coo.col[order]
+
+    # consecutive connected nodes of the same bottom node are [parent, child]
+    same_bottom = bottoms[1:] == bottoms[:-1]
+    parent_child = np.stack([nodes[:-1][same_bottom], nodes[1:][same_bottom]], axis=1)
+    parent_child = np.unique(parent_child, axis=0)
+
+    node_values = node_index.to_numpy()
+    df = pd.DataFrame(
+        {
+            "parent": node_values[parent_child[:, 0]],
+            "child": node_values[parent_child[:, 1]],
+        }
+    )
 
-    df = df.drop_duplicates().sort_values(["parent", "child"]).reset_index(drop=True)
+    df = df.sort_values(["parent", "child"]).reset_index(drop=True)
 
     return df
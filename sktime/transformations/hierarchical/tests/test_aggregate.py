@@ -5,10 +5,16 @@
 
 __author__ = ["ciaran-g"]
 
+import numpy as np
 import pytest
+from pandas.testing import assert_frame_equal
 
-from sktime.transformations.hierarchical.aggregate import Aggregator
-from sktime.utils._testing.hierarchical import _bottom_hier_datagen
+from sktime.transformations.hierarchical.aggregate import (
+    Aggregator,
+    _aggregate_groupby,
+    _get_cached_aggregate_structure,
+)
+from sktime.utils._testing.hierarchical import _bottom_hier_datagen, _make_hierarchical
 
 
 # test for equal output with with named/unnamed indexes
@@ -71,3 +77,55 @@ def test_aggregator_flatten():
         "with the time index removed, for random_seed=111."
     )
     assert len(X_agg_flat.droplevel(-1).index.unique()) == 17, msg
+
+
+# test that the vectorized aggregation agrees with groupby aggregation
+@pytest.mark.parametrize("flatten_single_levels", [True, False])
+def test_aggregator_vectorized(flatten_single_levels):
+    """Tests Aggregator against groupby aggregation, and reuse of its structure.
+
+    This tests that the aggregates computed from the index codes are equal to
+    aggregating level by level with groupby, also with missing values and
+    integer columns, and that transforming new data with the same index reuses
+    the structure of the hierarchy, but not the values.
+    """
+    agg = Aggregator(flatten_single_levels=flatten_single_levels)
+
+    X = _make_hierarchical(
+        hierarchy_levels=(2, 3, 4),
+        n_columns=2,
+        min_timepoints=5,
+        max_timepoints=8,
+        same_cutoff=False,
+        add_nan=True,
+        random_state=42,
+    )
+    X["c1"] = np.arange(len(X))
+
+    X_agg = agg.fit_transform(X)
+    assert_frame_equal(X_agg, _aggregate_groupby(X, flatten_single_levels))
+
+    structure = _get_cached_aggregate_structure(X, flatten_single_levels)
+    X2 = X * 2
+    X2_agg = agg.transform(X2)
+    assert _get_cached_aggregate_structure(X2, flatten_single_levels) is structure
+    assert_frame_equal(X2_agg, _aggregate_groupby(X2, flatten_single_levels))
+
+
+def test_aggregate_structure_cache_weak():
+    """Tests that cached aggregation structures do not keep their index alive."""
+    import gc
+    import weakref
+
+    from sktime.transformations.hierarchical.aggregate import _STRUCTURE_CACHE
+
+    X = _make_hierarchical(hierarchy_levels=(2, 3), random_state=0)
+    _get_cached_aggregate_structure(X, True)
+    index_ref = weakref.ref(X.index)
+    assert any(ref() is X.index for ref, _ in _STRUCTURE_CACHE.values())
+
+    # the entry of X.index is dropped once X is collected
+    del X
+    gc.collect()
+    assert index_ref() is None
+    assert all(ref() is not None for ref, _ in _STRUCTURE_CACHE.values())
@@ -75,3 +75,40 @@ def test_reconciler_fit_transform(method, flatten, no_levels):
     reconciler_unnamed = Reconciler(method=method)
     msg = "Reconciler returns different output for named and unnamed indexes."
     assert prds_recon.equals(reconciler_unnamed.fit_transform(prds)), msg
+
+
+@pytest.mark.parametrize("method", ["bu", "ols", "wls_str"])
+@pytest.mark.parametrize("flatten", flatten_list)
+@pytest.mark.parametrize("no_levels", level_list)
+def test_reconciler_sparse_equals_dense(method, flatten, no_levels):
+    """Tests sparse reconciliation against the dense G matrix formulae."""
+    agg = Aggregator(flatten_single_levels=flatten)
+    X = _bottom_hier_datagen(
+        no_bottom_nodes=5,
+        no_levels=no_levels,
+        random_seed=123,
+    )
+    X = agg.fit_transform(X)
+    # perturb so that X is not coherent
+    X = X + np.random.RandomState(42).normal(scale=10, size=X.shape)
+
+    reconciler = Reconciler(method=method)
+    X_recon = reconciler.fit_transform(X)
+
+    smat = reconciler.s_matrix.values
+    if method == "bu":
+        nodes = reconciler.s_matrix.index.values
+        bottom_nodes = reconciler.s_matrix.columns.values
+        gmat = (bottom_nodes[:, None] == nodes[None, :]).astype(float)
+    else:
+        wmat = np.eye(len(smat))
+        if method == "wls_str":
+            wmat = np.diag(smat.sum(axis=1))
+        gmat = np.linalg.inv(smat.T @ wmat @ smat) @ smat.T @ wmat
+    np.testing.assert_allclose(reconciler.g_matrix.values, gmat, atol=1e-10)
+
+    for _, group in X.groupby(level=-1):
+        expected = smat @ gmat @ group.values[:, 0]
+        np.testing.assert_allclose(
+            X_recon.loc[group.index].values[:, 0], expected, rtol=1e-10
+        )
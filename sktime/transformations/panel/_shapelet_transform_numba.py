@@ -4,76 +4,12 @@
 __author__ = ["MatthewMiddlehurst", "jasonlines", "dguijo"]
 
 import heapq
-import math
 
 import numpy as np
 
 from sktime.utils.numba.njit import njit
 
 
-@njit(fastmath=True, cache=True)
-def _online_shapelet_distance(series, shapelet, sorted_indicies, position, length):
-    subseq = series[position : position + length]
-
-    sum = 0.0
-    sum2 = 0.0
-    for i in subseq:
-        sum += i
-        sum2 += i * i
-
-    mean = sum / length
-    std = (sum2 - mean * mean * length) / length
-    if std > 0:
-        subseq = (subseq - mean) / std
-    else:
-        subseq = np.zeros(length)
-
-    best_dist = 0
-    for i, n in zip(shapelet, subseq):
-        temp = i - n
-        best_dist += temp * temp
-
-    i = 1
-    traverse = [True, True]
-    sums = [sum, sum]
-    sums2 = [sum2, sum2]
-
-    while traverse[0] or traverse[1]:
-        for n in range(2):
-            mod = -1 if n == 0 else 1
-            pos = position + mod * i
-            traverse[n] = pos >= 0 if n == 0 else pos <= len(series) - length
-
-            if not traverse[n]:
-                continue
-
-            start = series[pos - n]
-            end = series[pos - n + length]
-
-            sums[n] += mod * end - mod * start
-            sums2[n] += mod * end * end - mod * start * start
-
-            mean = sums[n] / length
-            std = math.sqrt((sums2[n] - mean * mean * length) / length)
-
-            dist = 0
-            use_std = std != 0
-            for j in range(length):
-                val = (series[pos + sorted_indicies[j]] - mean) / std if use_std else 0
-                temp = shapelet[sorted_indicies[j]] - val
-                dist += temp * temp
-
-                if dist > best_dist:
-                    break
-
-            if dist < best_dist:
-                best_dist = dist
-
-        i += 1
-
-    return best_dist if best_dist == 0 else 1 / length * best_dist
-
-
 @njit(fastmath=True, cache=True)
 def _calc_early_binary_ig(
     orderline,
@@ -196,30 +132,19 @@ def _is_self_similar(s1, s2):
 
 @njit(fastmath=True, cache=True)
 def _find_shapelet_quality(
-    X,
+    distances,
     y,
-    shapelet,
-    sorted_indicies,
-    position,
-    length,
-    dim,
     inst_idx,
     this_cls_count,
     other_cls_count,
     worst_quality,
 ):
-    # todo optimise this more, we spend 99% of time here
     orderline = []
     this_cls_traversed = 0
     other_cls_traversed = 0
 
-    for i, series in enumerate(X):
-        if i != inst_idx:
-            distance = _online_shapelet_distance(
-                series[dim], shapelet, sorted_indicies, position, length
-            )
-        else:
-            distance = 0
+    for i in range(len(distances)):
+        distance = distances[i] if i != inst_idx else 0
 
         if y[i] == y[inst_idx]:
             cls = 1
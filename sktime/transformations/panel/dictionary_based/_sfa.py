@@ -87,10 +87,19 @@ class SFA(BaseTransformer):
         The number of jobs to run in parallel for both `transform`.
         ``-1`` means using all processors.
 
+    return_sparse:       boolean, default = False
+        set to true to return a scipy sparse csr_matrix of word counts, one row
+        per series and one column per word in `vocabulary`, in place of a
+        dictionary per series. Only used if return_pandas_data_series is False.
+
     Attributes
     ----------
     words: []
     breakpoints: = []
+    vocabulary: pd.Index or None
+        only if return_sparse is True, the words of the series seen in fit,
+        position in the index is the column of the word in the sparse matrix.
+        Words that are not in the vocabulary are dropped in transform.
     num_insts = 0
     num_atts = 0
 
@@ -133,9 +142,11 @@ class SFA(BaseTransformer):
         use_fallback_dft=False,
         typed_dict=False,
         n_jobs=1,
+        return_sparse=False,
     ):
         self.words = []
         self.breakpoints = []
+        self.vocabulary = None
 
         # we cannot select more than window_size many letters in a word
         offset = 2 if norm else 0
@@ -176,6 +187,7 @@ class SFA(BaseTransformer):
         self.typed_dict = typed_dict
 
         self.n_jobs = n_jobs
+        self.return_sparse = return_sparse
 
         self.n_instances = 0
         self.series_length = 0
@@ -191,18 +203,8 @@ class SFA(BaseTransformer):
         if not return_pandas_data_series:
             self.set_config(**{"output_conversion": "off"})
 
-    def fit(self, X, y=None):
-        """Calculate word breakpoints using MCB or IGB.
-
-        Parameters
-        ----------
-        X : pandas DataFrame or 3d numpy array, input time series.
-        y : array_like, target values (optional, ignored).
-
-        Returns
-        -------
-        self: object
-        """
+    def _fit_sfa(self, X, y=None):
+        """Fit SFA, return sparse bags of X if return_sparse is True, else None."""
         if self.alphabet_size < 2:
             raise ValueError("Alphabet size must be an integer greater than 2")
 
@@ -250,10 +252,50 @@ class SFA(BaseTransformer):
 
         self.n_instances, self.series_length = X.shape
         self.breakpoints = self._binning(X, y)
+        self.vocabulary = None
 
         self._is_fitted = True
+
+        if self.return_sparse and not self.return_pandas_data_series:
+            bags, self.vocabulary = self._bags_to_sparse(self._transform_words(X))
+            return bags
+
+    def fit(self, X, y=None):
+        """Calculate word breakpoints using MCB or IGB.
+
+        If return_sparse is True, also sets the vocabulary to the words of X.
+
+        Parameters
+        ----------
+        X : pandas DataFrame or 3d numpy array, input time series.
+        y : array_like, target values (optional, ignored).
+
+        Returns
+        -------
+        self: object
+        """
+        self._fit_sfa(X, y)
         return self
 
+    def fit_transform(self, X, y=None):
+        """Fit to data, then transform it.
+
+        If return_sparse is True, the words of X are only computed once.
+
+        Parameters
+        ----------
+        X : pandas DataFrame or 3d numpy array, input time series.
+        y : array_like, target values (optional, ignored).
+
+        Returns
+        -------
+        List of dictionaries containing SFA words, or sparse matrix of word counts
+        if return_sparse is True
+        """
+        if self.return_sparse and not self.return_pandas_data_series:
+            return self._fit_sfa(X, y)
+        return super(SFA, self).fit_transform(X, y)
+
     def _transform(self, X, y=None):
         """Transform data into SFA words.
 
@@ -264,26 +306,17 @@ class SFA(BaseTransformer):
 
         Returns
         -------
-        List of dictionaries containing SFA words
+        List of dictionaries containing SFA words, or sparse matrix of word counts
+        if return_sparse is True
         """
-        from numba import NumbaTypeSafetyWarning, types
+        from numba import types
         from numba.typed import Dict
 
-        X = X.squeeze(1)
+        dim = self._transform_words(X.squeeze(1))
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=NumbaTypeSafetyWarning)
-            transform = Parallel(n_jobs=self.n_jobs)(
-                delayed(self._transform_case)(
-                    X[i, :],
-                    supplied_dft=self.binning_dft[i] if self.keep_binning_dft else None,
-                )
-                for i in range(X.shape[0])
-            )
-
-        dim, words = zip(*transform)
-        if self.save_words:
-            self.words = list(words)
+        if self.return_sparse and not self.return_pandas_data_series:
+            bags, _ = self._bags_to_sparse(dim, self.vocabulary)
+            return bags
 
         # cant pickle typed dict
         if self.typed_dict and self.n_jobs != 1:
@@ -306,6 +339,95 @@ class SFA(BaseTransformer):
 
         return bags
 
+    def _transform_words(self, X):
+        """Return bags of words of series in 2D np.ndarray X, save words if set."""
+        from numba import NumbaTypeSafetyWarning
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=NumbaTypeSafetyWarning)
+            transform = Parallel(n_jobs=self.n_jobs)(
+                delayed(self._transform_case)(
+                    X[i, :],
+                    supplied_dft=self.binning_dft[i] if self.keep_binning_dft else None,
+                )
+                for i in range(X.shape[0])
+            )
+
+        dim, words = zip(*transform)
+        if self.save_words:
+            self.words = list(words)
+        return dim
+
+    def _bags_to_sparse(self, bags, vocabulary=None):
+        """Convert bags to a csr_matrix of counts, with a column per vocabulary word.
+
+        If vocabulary is None, it is made of the words in bags, otherwise words not
+        in the vocabulary are dropped. Returns the csr_matrix and the vocabulary.
+        """
+        from numba.typed import Dict
+        from scipy.sparse import csr_matrix
+
+        from sktime.transformations.panel.dictionary_based._sfa_numba import (
+            _typed_bag_to_arrays,
+            _typed_pyramid_bag_to_arrays,
+        )
+
+        pyramid = self.typed_dict and self.levels > 1
+        words = []
+        levels = []
+        counts = []
+        for bag in bags:
+            if isinstance(bag, Dict):
+                if pyramid:
+                    bag_words, bag_levels, bag_counts = _typed_pyramid_bag_to_arrays(
+                        bag
+                    )
+                    levels.append(bag_levels)
+                else:
+                    bag_words, bag_counts = _typed_bag_to_arrays(bag)
+            else:
+                keys = list(bag.keys())
+                if pyramid:
+                    bag_words = [key[0] for key in keys]
+                    levels.append(np.array([key[1] for key in keys], dtype=np.int64))
+                else:
+                    bag_words = keys
+                bag_words = np.array(bag_words, dtype=object)
+                bag_counts = np.fromiter(bag.values(), dtype=np.uint32, count=len(bag))
+            words.append(bag_words)
+            counts.append(bag_counts)
+
+        bag_ids = np.repeat(np.arange(len(bags)), [len(c) for c in counts])
+        counts = np.concatenate(counts) if len(counts) > 0 else np.zeros(0, np.uint32)
+        words = np.concatenate(words) if len(words) > 0 else np.zeros(0, np.int64)
+        if words.dtype == object:
+            # words of more than 64 bits are kept as python ints
+            try:
+                words = words.astype(np.int64)
+            except OverflowError:
+                pass
+        if pyramid:
+            keys = pd.MultiIndex.from_arrays([words, np.concatenate(levels)])
+        else:
+            keys = pd.Index(words)
+
+        if vocabulary is None:
+            vocabulary = keys[~keys.duplicated()]
+        cols = vocabulary.get_indexer(keys)
+        known = cols >= 0
+
+        index_dtype = (
+            np.int32 if max(len(cols), len(vocabulary)) < 2**31 else np.int64
+        )
+        indptr = np.zeros(len(bags) + 1, dtype=index_dtype)
+        np.cumsum(np.bincount(bag_ids[known], minlength=len(bags)), out=indptr[1:])
+        bags = csr_matrix(
+            (counts[known], cols[known].astype(index_dtype), indptr),
+            shape=(len(bags), len(vocabulary)),
+        )
+        bags.sort_indices()
+        return bags, vocabulary
+
     def _transform_case(self, X, supplied_dft=None):
         from numba import types
         from numba.typed import Dict
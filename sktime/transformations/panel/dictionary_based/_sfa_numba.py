@@ -158,3 +158,31 @@ def _create_bigram_word(word, other_word, word_bits):
 def _shorten_word(word, amount, letter_bits):
     # shorten a word by set amount of letters
     return word >> amount * letter_bits
+
+
+@njit(cache=True)
+def _typed_bag_to_arrays(bag):
+    """Return words and counts of a typed bag with int64 words, as arrays."""
+    words = np.empty(len(bag), dtype=np.int64)
+    counts = np.empty(len(bag), dtype=np.uint32)
+    i = 0
+    for word, count in bag.items():
+        words[i] = word
+        counts[i] = count
+        i += 1
+    return words, counts
+
+
+@njit(cache=True)
+def _typed_pyramid_bag_to_arrays(bag):
+    """Return words, levels and counts of a typed bag with (word, level) keys."""
+    words = np.empty(len(bag), dtype=np.int64)
+    levels = np.empty(len(bag), dtype=np.int64)
+    counts = np.empty(len(bag), dtype=np.uint32)
+    i = 0
+    for key, count in bag.items():
+        words[i] = key[0]
+        levels[i] = key[1]
+        counts[i] = count
+        i += 1
+    return words, levels, counts
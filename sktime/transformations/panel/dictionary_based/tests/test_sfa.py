@@ -239,3 +239,30 @@ def test_typed_dict():
     word_list2 = p2.bag_to_string(p2.transform(X, y)[0][0])
 
     assert word_list == word_list2
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("typed_dict", [True, False])
+@pytest.mark.parametrize("levels", [1, 2])
+def test_return_sparse(typed_dict, levels):
+    """Test sparse word counts are the same as the bags of words."""
+    X, y = load_gunpoint(split="train", return_X_y=True)
+    X_test, _ = load_gunpoint(split="test", return_X_y=True)
+
+    params = {"levels": levels, "bigrams": True, "typed_dict": typed_dict}
+    bags = SFA(**params).fit(X, y).transform(X_test)[0]
+    p = SFA(return_sparse=True, **params).fit(X, y)
+    counts = p.transform(X_test)
+
+    assert counts.shape == (len(X_test), len(p.vocabulary))
+    # the vocabulary is set in fit, transform does not change it
+    assert (p.transform(X) != p.fit_transform(X, y)).nnz == 0
+    assert (p.transform(X_test) != counts).nnz == 0
+    for i, bag in enumerate(bags):
+        row = counts.getrow(i)
+        words = p.vocabulary[row.indices]
+        expected = {word: count for word, count in bag.items() if word in p.vocabulary}
+        assert dict(zip(words, row.data)) == expected
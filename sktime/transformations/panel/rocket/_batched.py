@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Instance-batched transforms of the rocket transformers."""
+
+import multiprocessing
+
+import numpy as np
+
+from sktime.datatypes import convert_to
+
+
+class _BatchedTransformMixin:
+    """Mixin for rocket transformers, transforming instances in batches.
+
+    Transformers using the mixin have ``batch_size`` and ``n_jobs`` parameters, and
+    implement ``_transform_instances``, which transforms a 3D np.ndarray of
+    instances to a 2D np.ndarray of float32 features. Memory of the conversions of
+    the input, e.g., to float, is bounded by the batch size.
+    """
+
+    def transform_batches(self, X, out=None):
+        """Transform X in batches of ``batch_size`` instances, writing into out.
+
+        Unlike ``transform``, the features are written into a single array, which
+        may be a ``np.memmap`` for panels whose features do not fit into memory.
+        3D np.ndarray X, including ``np.memmap``, is read one batch at a time and
+        is neither checked nor copied as a whole.
+
+        Parameters
+        ----------
+        X : 3D np.ndarray of shape = [n_instances, n_dimensions, series_length]
+            or other Panel mtype, panel of time series to transform, with the
+            dimensions and series length seen in fit
+        out : 2D np.ndarray of shape = [n_instances, n_features], optional
+            Array to write the features into, e.g., a ``np.memmap``. ``n_features``
+            is the number of columns of ``transform`` output. If None, a float32
+            array is allocated.
+
+        Returns
+        -------
+        out : 2D np.ndarray of shape = [n_instances, n_features], transformed features
+        """
+        self.check_is_fitted()
+        if not isinstance(X, np.ndarray) or X.ndim != 3:
+            X = convert_to(X, to_type="numpy3D")
+        return self._transform_batches(X, out=out)
+
+    def _transform_batches(self, X, out=None):
+        """Transform 3D np.ndarray X in batches, see transform_batches."""
+        from numba import get_num_threads, set_num_threads
+
+        n_instances = X.shape[0]
+        batch_size = self.batch_size if self.batch_size is not None else n_instances
+        batch_size = max(batch_size, 1)
+
+        # change n_jobs dependend on value and existing cores
+        prev_threads = get_num_threads()
+        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
+            n_jobs = multiprocessing.cpu_count()
+        else:
+            n_jobs = self.n_jobs
+        set_num_threads(n_jobs)
+        try:
+            for start in range(0, n_instances, batch_size):
+                Xt = self._transform_instances(
+                    np.asarray(X[start : start + batch_size])
+                )
+                if out is None:
+                    if len(Xt) == n_instances:
+                        return Xt
+                    out = np.empty((n_instances, Xt.shape[1]), dtype=Xt.dtype)
+                out[start : start + len(Xt)] = Xt
+        finally:
+            set_num_threads(prev_threads)
+        return out
@@ -4,15 +4,14 @@
 __author__ = ["angus924"]
 __all__ = ["MiniRocket"]
 
-import multiprocessing
-
 import numpy as np
 import pandas as pd
 
 from sktime.transformations.base import BaseTransformer
+from sktime.transformations.panel.rocket._batched import _BatchedTransformMixin
 
 
-class MiniRocket(BaseTransformer):
+class MiniRocket(_BatchedTransformMixin, BaseTransformer):
     """MINImally RandOm Convolutional KErnel Transform (MiniRocket).
 
     MiniRocket [1]_ is an almost deterministic version of Rocket. If creates
@@ -31,6 +30,11 @@ class MiniRocket(BaseTransformer):
         The number of jobs to run in parallel for `transform`. ``-1`` means using all
         processors.
     random_state : None or int, default = None
+    batch_size : int or None, default=None
+        Number of instances to transform at a time, bounding the memory used for
+        converting the input. If None, all instances are transformed at once.
+        ``transform_batches`` writes features into a given array instead, e.g., a
+        ``np.memmap`` for panels whose features do not fit into memory.
 
     See Also
     --------
@@ -76,12 +80,14 @@ class MiniRocket(BaseTransformer):
         max_dilations_per_kernel=32,
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.num_kernels = num_kernels
         self.max_dilations_per_kernel = max_dilations_per_kernel
 
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.batch_size = batch_size
         super(MiniRocket, self).__init__()
 
     def _fit(self, X, y=None):
@@ -130,19 +136,11 @@ class MiniRocket(BaseTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        from numba import get_num_threads, set_num_threads
+        return pd.DataFrame(self._transform_batches(X))
 
+    def _transform_instances(self, X):
+        """Transform a batch of instances, see _BatchedTransformMixin."""
         from sktime.transformations.panel.rocket._minirocket_numba import _transform
 
         X = X[:, 0, :].astype(np.float32)
-
-        # change n_jobs dependend on value and existing cores
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-        X_ = _transform(X, self.parameters)
-        set_num_threads(prev_threads)
-        return pd.DataFrame(X_)
+        return _transform(X, self.parameters)
@@ -4,15 +4,14 @@
 __author__ = ["angus924"]
 __all__ = ["MiniRocketMultivariate"]
 
-import multiprocessing
-
 import numpy as np
 import pandas as pd
 
 from sktime.transformations.base import BaseTransformer
+from sktime.transformations.panel.rocket._batched import _BatchedTransformMixin
 
 
-class MiniRocketMultivariate(BaseTransformer):
+class MiniRocketMultivariate(_BatchedTransformMixin, BaseTransformer):
     """MINImally RandOm Convolutional KErnel Transform (MiniRocket) multivariate.
 
     MiniRocketMultivariate [1]_ is an almost deterministic version of Rocket. If creates
@@ -30,6 +29,11 @@ class MiniRocketMultivariate(BaseTransformer):
         The number of jobs to run in parallel for `transform`. ``-1`` means using all
         processors.
     random_state : None or int, default = None
+    batch_size : int or None, default=None
+        Number of instances to transform at a time, bounding the memory used for
+        converting the input. If None, all instances are transformed at once.
+        ``transform_batches`` writes features into a given array instead, e.g., a
+        ``np.memmap`` for panels whose features do not fit into memory.
 
     See Also
     --------
@@ -75,12 +79,14 @@ class MiniRocketMultivariate(BaseTransformer):
         max_dilations_per_kernel=32,
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.num_kernels = num_kernels
         self.max_dilations_per_kernel = max_dilations_per_kernel
 
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.batch_size = batch_size
 
         if random_state is not None and not isinstance(random_state, int):
             raise ValueError(
@@ -138,20 +144,13 @@ class MiniRocketMultivariate(BaseTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        from numba import get_num_threads, set_num_threads
+        return pd.DataFrame(self._transform_batches(X))
 
+    def _transform_instances(self, X):
+        """Transform a batch of instances, see _BatchedTransformMixin."""
         from sktime.transformations.panel.rocket._minirocket_multi_numba import (
             _transform_multi,
         )
 
         X = X.astype(np.float32)
-        # change n_jobs dependend on value and existing cores
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-        X_ = _transform_multi(X, self.parameters)
-        set_num_threads(prev_threads)
-        return pd.DataFrame(X_)
+        return _transform_multi(X, self.parameters)
@@ -1,16 +1,15 @@
 # -*- coding: utf-8 -*-
 """MultiRocket transform."""
 
-import multiprocessing
-
 import numpy as np
 import pandas as pd
 
 from sktime.datatypes import convert
 from sktime.transformations.base import BaseTransformer
+from sktime.transformations.panel.rocket._batched import _BatchedTransformMixin
 
 
-class MultiRocket(BaseTransformer):
+class MultiRocket(_BatchedTransformMixin, BaseTransformer):
     """Multi RandOm Convolutional KErnel Transform (MultiRocket).
 
     MultiRocket [1]_ is uses the same set of kernels as MiniRocket on both the raw
@@ -36,6 +35,11 @@ class MultiRocket(BaseTransformer):
         The number of jobs to run in parallel for `transform`. ``-1`` means using all
         processors.
     random_state : None or int, default = None
+    batch_size : int or None, default=None
+        Number of instances to transform at a time, bounding the memory used for
+        converting the input. If None, all instances are transformed at once.
+        ``transform_batches`` writes features into a given array instead, e.g., a
+        ``np.memmap`` for panels whose features do not fit into memory.
 
     Attributes
     ----------
@@ -93,6 +97,7 @@ class MultiRocket(BaseTransformer):
         normalise=False,
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.max_dilations_per_kernel = max_dilations_per_kernel
         self.n_features_per_kernel = n_features_per_kernel
@@ -102,6 +107,7 @@ class MultiRocket(BaseTransformer):
         self.normalise = normalise
         self.n_jobs = n_jobs
         self.random_state = random_state if isinstance(random_state, int) else None
+        self.batch_size = batch_size
 
         self.parameter = None
         self.parameter1 = None
@@ -148,8 +154,10 @@ class MultiRocket(BaseTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        from numba import get_num_threads, set_num_threads
+        return pd.DataFrame(self._transform_batches(X))
 
+    def _transform_instances(self, X):
+        """Transform a batch of instances, see _BatchedTransformMixin."""
         from sktime.transformations.panel.rocket._multirocket_numba import _transform
 
         X = X.astype(np.float64)
@@ -161,14 +169,6 @@ class MultiRocket(BaseTransformer):
 
         X1 = np.diff(X, 1)
 
-        # change n_jobs dependend on value and existing cores
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-
         X = _transform(
             X,
             X1,
@@ -176,12 +176,7 @@ class MultiRocket(BaseTransformer):
             self.parameter1,
             self.n_features_per_kernel,
         )
-        X = np.nan_to_num(X)
-
-        set_num_threads(prev_threads)
-        # # from_2d_array_to_3d_numpy
-        # _X = np.reshape(_X, (_X.shape[0], 1, _X.shape[1])).astype(np.float64)
-        return pd.DataFrame(X)
+        return np.nan_to_num(X, copy=False)
 
     def _get_parameter(self, X):
         from sktime.transformations.panel.rocket._multirocket_numba import (
@@ -4,15 +4,14 @@
 __author__ = ["angus924"]
 __all__ = ["Rocket"]
 
-import multiprocessing
-
 import numpy as np
 import pandas as pd
 
 from sktime.transformations.base import BaseTransformer
+from sktime.transformations.panel.rocket._batched import _BatchedTransformMixin
 
 
-class Rocket(BaseTransformer):
+class Rocket(_BatchedTransformMixin, BaseTransformer):
     """RandOm Convolutional KErnel Transform (ROCKET).
 
     ROCKET [1]_ generates random convolutional kernels, including random length and
@@ -30,6 +29,11 @@ class Rocket(BaseTransformer):
        The number of jobs to run in parallel for `transform`. ``-1`` means use all
        processors.
     random_state : None or int, optional, default = None
+    batch_size : int or None, default=None
+        Number of instances to transform at a time, bounding the memory used for
+        converting the input. If None, all instances are transformed at once.
+        ``transform_batches`` writes features into a given array instead, e.g., a
+        ``np.memmap`` for panels whose features do not fit into memory.
 
     See Also
     --------
@@ -70,11 +74,19 @@ class Rocket(BaseTransformer):
         "python_dependencies": "numba",
     }
 
-    def __init__(self, num_kernels=10_000, normalise=True, n_jobs=1, random_state=None):
+    def __init__(
+        self,
+        num_kernels=10_000,
+        normalise=True,
+        n_jobs=1,
+        random_state=None,
+        batch_size=None,
+    ):
         self.num_kernels = num_kernels
         self.normalise = normalise
         self.n_jobs = n_jobs
         self.random_state = random_state if isinstance(random_state, int) else None
+        self.batch_size = batch_size
         super(Rocket, self).__init__()
 
     def _fit(self, X, y=None):
@@ -115,20 +127,14 @@ class Rocket(BaseTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        from numba import get_num_threads, set_num_threads
+        return pd.DataFrame(self._transform_batches(X))
 
+    def _transform_instances(self, X):
+        """Transform a batch of instances, see _BatchedTransformMixin."""
         from sktime.transformations.panel.rocket._rocket_numba import _apply_kernels
 
         if self.normalise:
             X = (X - X.mean(axis=-1, keepdims=True)) / (
                 X.std(axis=-1, keepdims=True) + 1e-8
             )
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-        t = pd.DataFrame(_apply_kernels(X.astype(np.float32), self.kernels))
-        set_num_threads(prev_threads)
-        return t
+        return _apply_kernels(X.astype(np.float32), self.kernels)
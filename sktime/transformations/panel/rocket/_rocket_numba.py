@@ -230,4 +230,4 @@ def _apply_kernels(X, kernels):
             a2 = b2
             a3 = b3
 
-    return _X.astype(np.float32)
+    return _X
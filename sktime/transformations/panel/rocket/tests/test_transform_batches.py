@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Instance-batched rocket transform test code."""
+import numpy as np
+import pytest
+
+from sktime.datasets import load_basic_motions, load_unit_test
+from sktime.transformations.panel.rocket import (
+    MiniRocket,
+    MiniRocketMultivariate,
+    MultiRocket,
+    MultiRocketMultivariate,
+    Rocket,
+)
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize(
+    "transformer_class, load",
+    [
+        (Rocket, load_basic_motions),
+        (MiniRocket, load_unit_test),
+        (MiniRocketMultivariate, load_basic_motions),
+        (MultiRocket, load_unit_test),
+        (MultiRocketMultivariate, load_basic_motions),
+    ],
+)
+def test_transform_batches(transformer_class, load, tmp_path):
+    """Test batched transforms against transforming all instances at once."""
+    X = load(split="train", return_X_y=True, return_type="numpy3D")[0]
+
+    # MultiRocketMultivariate selects channels with the global numpy random state
+    np.random.seed(0)
+    trf = transformer_class(num_kernels=100, random_state=0).fit(X)
+    expected = trf.transform(X).to_numpy()
+    assert expected.dtype == np.float32
+
+    np.random.seed(0)
+    trf = transformer_class(num_kernels=100, random_state=0, batch_size=7).fit(X)
+    np.testing.assert_array_equal(trf.transform(X).to_numpy(), expected)
+    np.testing.assert_array_equal(trf.transform_batches(X), expected)
+
+    # write features of memory mapped instances into a memory mapped array
+    X_mmap = np.lib.format.open_memmap(
+        tmp_path / "X.npy", mode="w+", dtype=X.dtype, shape=X.shape
+    )
+    X_mmap[:] = X
+    out = np.lib.format.open_memmap(
+        tmp_path / "Xt.npy", mode="w+", dtype=np.float32, shape=expected.shape
+    )
+    assert trf.transform_batches(X_mmap, out=out) is out
+    np.testing.assert_array_equal(out, expected)
@@ -173,12 +173,15 @@ class ShapeletTransform(BaseTransformer):
         self : ShapeletTransform
             This estimator
         """
-        X_lens = np.repeat(X.shape[-1], X.shape[0])
         # note, assumes all dimensions of a case are the same
         # length. A shapelet would not be well defined if indices do not match!
         # may need to pad with nans here for uneq length,
         # look at later
 
+        # distances of candidates to all series, computed in batches of candidates
+        distance = _MassDistance(X)
+        distance_batch_size = 100
+
         num_ins = len(y)
         distinct_class_vals = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
 
@@ -354,6 +357,23 @@ class ShapeletTransform(BaseTransformer):
                     X[series_id][:, cand_start_pos : cand_start_pos + cand_len]
                 )
 
+                if candidate_idx % distance_batch_size == 0:
+                    batch = candidates_to_visit[
+                        candidate_idx : candidate_idx + distance_batch_size
+                    ]
+                    batch_distances = distance.min_distances(
+                        [
+                            ShapeletTransform.zscore(
+                                X[series_id][:, start : start + length]
+                            )[0]
+                            for start, length in batch
+                        ],
+                        np.zeros(len(batch), dtype=int),
+                    )
+                candidate_distances = batch_distances[
+                    candidate_idx % distance_batch_size
+                ]
+
                 # now go through all other series and get a distance from
                 # the candidate to each
                 orderline = []
@@ -383,44 +403,7 @@ class ShapeletTransform(BaseTransformer):
                         binary_class_identifier = -1  # negative for any
                         # other class
 
-                    bsf_dist = np.inf
-
-                    start_left = cand_start_pos
-                    start_right = cand_start_pos + 1
-
-                    if X_lens[i] == cand_len:
-                        start_left = 0
-                        start_right = 0
-
-                    for _ in range(
-                        max(1, int(np.ceil((X_lens[i] - cand_len) / 2)))
-                    ):  # max
-                        # used to force iteration where series len ==
-                        # candidate len
-                        if start_left < 0:
-                            start_left = X_lens[i] - 1 - cand_len
-
-                        comparison = ShapeletTransform.zscore(
-                            X[i][:, start_left : start_left + cand_len]
-                        )
-                        dist_left = np.linalg.norm(candidate - comparison)
-                        bsf_dist = min(dist_left * dist_left, bsf_dist)
-
-                        # for odd lengths
-                        if start_left == start_right:
-                            continue
-
-                        # right
-                        if start_right == X_lens[i] - cand_len + 1:
-                            start_right = 0
-                        comparison = ShapeletTransform.zscore(
-                            X[i][:, start_right : start_right + cand_len]
-                        )
-                        dist_right = np.linalg.norm(candidate - comparison)
-                        bsf_dist = min(dist_right * dist_right, bsf_dist)
-
-                        start_left -= 1
-                        start_right += 1
+                    bsf_dist = candidate_distances[i]
 
                     orderline.append((bsf_dist, binary_class_identifier))
                     # sorting required after each add for early IG abandon.
@@ -713,34 +696,14 @@ class ShapeletTransform(BaseTransformer):
             )
 
         # may need to pad with nans here for uneq length, look at later
-        output = np.zeros(
-            [len(X), len(self.shapelets)],
-            dtype=np.float32,
-        )
-
-        # for the i^th series to transform
-        for i in range(0, len(X)):
-            this_series = X[i]
-
-            # get the s^th shapelet
-            for s in range(0, len(self.shapelets)):
-                # find distance between this series and each shapelet
-                min_dist = np.inf
-                this_shapelet_length = self.shapelets[s].length
-
-                for start_pos in range(
-                    0, len(this_series[0]) - this_shapelet_length + 1
-                ):
-                    comparison = ShapeletTransform.zscore(
-                        this_series[:, start_pos : (start_pos + this_shapelet_length)]
-                    )
-
-                    dist = np.linalg.norm(self.shapelets[s].data - comparison)
-                    dist = dist * dist
-                    dist = 1.0 / this_shapelet_length * dist
-                    min_dist = min(min_dist, dist)
+        distance = _MassDistance(X)
+        lengths = np.array([shapelet.length for shapelet in self.shapelets])
 
-                    output[i][s] = min_dist
+        output = distance.min_distances(
+            [shapelet.data[0] for shapelet in self.shapelets],
+            np.zeros(len(self.shapelets), dtype=int),
+        )
+        output = (output / lengths[:, None]).T.astype(np.float32)
 
         return pd.DataFrame(output)
 
@@ -968,6 +931,8 @@ class RandomShapeletTransform(BaseTransformer):
             - Abandon evaluating the shapelet if it is impossible to obtain a higher
               information gain than the current worst
         For each shapelet batch
+            - Compute the distances of all candidates to all train cases at once,
+              using FFT based sliding window distances
             - Add each candidate to its classes shapelet heap, removing the lowest
               information gain shapelet if the max number of shapelets has been met
             - Remove self-similar shapelets from the heap
@@ -1122,7 +1087,6 @@ class RandomShapeletTransform(BaseTransformer):
         self._batch_size = batch_size
         self._class_counts = []
         self._class_dictionary = {}
-        self._sorted_indicies = []
 
         super(RandomShapeletTransform, self).__init__()
 
@@ -1182,22 +1146,23 @@ class RandomShapeletTransform(BaseTransformer):
         )
         n_shapelets_extracted = 0
 
+        # distances of all candidates of a batch are computed together
+        distance = _MassDistance(X, n_jobs=self._n_jobs)
+
         if time_limit > 0:
             while (
                 fit_time < time_limit
                 and n_shapelets_extracted < self.contract_max_n_shapelet_samples
             ):
-                candidate_shapelets = Parallel(
-                    n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-                )(
-                    delayed(self._extract_random_shapelet)(
-                        X,
-                        y,
-                        n_shapelets_extracted + i,
-                        shapelets,
-                        max_shapelets_per_class,
-                    )
-                    for i in range(self._batch_size)
+                candidate_shapelets = self._extract_random_shapelets(
+                    X,
+                    y,
+                    distance,
+                    range(
+                        n_shapelets_extracted, n_shapelets_extracted + self._batch_size
+                    ),
+                    shapelets,
+                    max_shapelets_per_class,
                 )
 
                 for i, heap in enumerate(shapelets):
@@ -1224,17 +1189,16 @@ class RandomShapeletTransform(BaseTransformer):
                     else self._n_shapelet_samples - n_shapelets_extracted
                 )
 
-                candidate_shapelets = Parallel(
-                    n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-                )(
-                    delayed(self._extract_random_shapelet)(
-                        X,
-                        y,
-                        n_shapelets_extracted + i,
-                        shapelets,
-                        max_shapelets_per_class,
-                    )
-                    for i in range(n_shapelets_to_extract)
+                candidate_shapelets = self._extract_random_shapelets(
+                    X,
+                    y,
+                    distance,
+                    range(
+                        n_shapelets_extracted,
+                        n_shapelets_extracted + n_shapelets_to_extract,
+                    ),
+                    shapelets,
+                    max_shapelets_per_class,
                 )
 
                 for i, heap in enumerate(shapelets):
@@ -1271,14 +1235,6 @@ class RandomShapeletTransform(BaseTransformer):
         to_keep = _remove_identical_shapelets(List(self.shapelets))
         self.shapelets = [n for (n, b) in zip(self.shapelets, to_keep) if b]
 
-        self._sorted_indicies = []
-        for s in self.shapelets:
-            sabs = np.abs(s[6])
-            self._sorted_indicies.append(
-                np.array(
-                    sorted(range(s[1]), reverse=True, key=lambda j, sabs=sabs: sabs[j])
-                )
-            )
         return self
 
     def _transform(self, X, y=None):
@@ -1294,27 +1250,13 @@ class RandomShapeletTransform(BaseTransformer):
         output : pandas DataFrame
             The transformed dataframe in tabular format.
         """
-        from sktime.transformations.panel._shapelet_transform_numba import (
-            _online_shapelet_distance,
-        )
+        distance = _MassDistance(X, n_jobs=self._n_jobs)
+        lengths = np.array([s[1] for s in self.shapelets])
 
-        output = np.zeros((len(X), len(self.shapelets)))
-
-        for i, series in enumerate(X):
-            dists = Parallel(
-                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-            )(
-                delayed(_online_shapelet_distance)(
-                    series[shapelet[3]],
-                    shapelet[6],
-                    self._sorted_indicies[n],
-                    shapelet[2],
-                    shapelet[1],
-                )
-                for n, shapelet in enumerate(self.shapelets)
-            )
-
-            output[i] = dists
+        output = distance.min_distances(
+            [s[6] for s in self.shapelets], [s[3] for s in self.shapelets]
+        )
+        output = (output / lengths[:, None]).T
 
         return pd.DataFrame(output)
 
@@ -1338,12 +1280,47 @@ class RandomShapeletTransform(BaseTransformer):
         """
         return {"max_shapelets": 5, "n_shapelet_samples": 50, "batch_size": 20}
 
-    def _extract_random_shapelet(self, X, y, i, shapelets, max_shapelets_per_class):
+    def _extract_random_shapelets(
+        self, X, y, distance, indices, shapelets, max_shapelets_per_class
+    ):
         from sktime.transformations.panel._shapelet_transform_numba import (
             _find_shapelet_quality,
         )
         from sktime.utils.numba.general import z_normalise_series
 
+        candidates = [self._sample_shapelet(i) for i in indices]
+        distances = distance.min_distances(
+            [
+                z_normalise_series(X[inst_idx, dim, position : position + length])
+                for (length, position, dim, inst_idx) in candidates
+            ],
+            [dim for (_, _, dim, _) in candidates],
+        )
+
+        worst_qualities = [
+            heap[0][0] if len(heap) == max_shapelets_per_class else -1
+            for heap in shapelets
+        ]
+        qualities = Parallel(
+            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(
+            delayed(_find_shapelet_quality)(
+                distances[n],
+                y,
+                inst_idx,
+                self._class_counts[y[inst_idx]],
+                self.n_instances - self._class_counts[y[inst_idx]],
+                worst_qualities[y[inst_idx]],
+            )
+            for n, (_, _, _, inst_idx) in enumerate(candidates)
+        )
+
+        return [
+            (quality, length, position, dim, inst_idx, int(y[inst_idx]))
+            for quality, (length, position, dim, inst_idx) in zip(qualities, candidates)
+        ]
+
+    def _sample_shapelet(self, i):
         rs = 255 if self.random_state == 0 else self.random_state
         rs = (
             None
@@ -1353,13 +1330,6 @@ class RandomShapeletTransform(BaseTransformer):
         rng = check_random_state(rs)
 
         inst_idx = i % self.n_instances
-        cls_idx = int(y[inst_idx])
-        worst_quality = (
-            shapelets[cls_idx][0][0]
-            if len(shapelets[cls_idx]) == max_shapelets_per_class
-            else -1
-        )
-
         length = (
             rng.randint(0, self._max_shapelet_length - self.min_shapelet_length)
             + self.min_shapelet_length
@@ -1367,24 +1337,118 @@ class RandomShapeletTransform(BaseTransformer):
         position = rng.randint(0, self.series_length - length)
         dim = rng.randint(0, self.n_dims)
 
-        shapelet = z_normalise_series(X[inst_idx, dim, position : position + length])
-        sabs = np.abs(shapelet)
-        sorted_indicies = np.array(
-            sorted(range(length), reverse=True, key=lambda j: sabs[j])
-        )
+        return length, position, dim, inst_idx
 
-        quality = _find_shapelet_quality(
-            X,
-            y,
-            shapelet,
-            sorted_indicies,
-            position,
-            length,
-            dim,
-            inst_idx,
-            self._class_counts[cls_idx],
-            self.n_instances - self._class_counts[cls_idx],
-            worst_quality,
-        )
 
-        return quality, length, position, dim, inst_idx, cls_idx
+class _MassDistance:
+    """Batched sliding window distances of shapelets to series, using MASS.
+
+    Computes the minimum squared Euclidean distance between z-normalised shapelets
+    and all z-normalised windows of the same length of series, for many shapelets
+    and series at once. Following MASS [1]_, sliding dot products are computed with
+    FFTs, where the FFTs of the series are computed once, and window means and
+    standard deviations are computed from cumulative sums of the series.
+
+    Parameters
+    ----------
+    X : 3D np.ndarray of shape = [n_instances, n_dims, series_length]
+        The series to compute distances to.
+    n_jobs : int, default=1
+        The number of workers for the FFTs.
+    max_batch_size : int, default=2**20
+        Shapelets are processed in batches, such that the intermediate arrays of a
+        batch have at most max_batch_size elements, or hold a single shapelet.
+
+    References
+    ----------
+    .. [1] Abdullah Mueen, Yan Zhu, Michael Yeh, Kaveh Kamgar, Krishnamurthy
+       Viswanathan, Chetan Kumar Gupta and Eamonn Keogh, "The Fastest Similarity
+       Search Algorithm for Time Series Subsequences under Euclidean Distance",
+       2017, https://www.cs.unm.edu/~mueen/FastestSimilaritySearch.html
+    """
+
+    def __init__(self, X, n_jobs=1, max_batch_size=2**20):
+        from scipy.fft import next_fast_len, rfft
+
+        self.n_jobs = n_jobs
+        self.max_batch_size = max_batch_size
+
+        # dot products and window statistics are invariant to centering the series,
+        # which keeps cumulative sums of long series precise
+        X = np.asarray(X, dtype=np.float64)
+        X = X - X.mean(axis=-1, keepdims=True)
+        self.n_instances, self.n_dims, self.series_length = X.shape
+
+        # no circular wrap-around for windows within the series if n_fft >= length
+        self._n_fft = next_fast_len(self.series_length, real=True)
+        self._X_fft = rfft(X, n=self._n_fft, axis=-1, workers=n_jobs)
+
+        self._X_cumsum = np.zeros(X.shape[:-1] + (self.series_length + 1,))
+        self._X2_cumsum = np.zeros(X.shape[:-1] + (self.series_length + 1,))
+        np.cumsum(X, axis=-1, out=self._X_cumsum[..., 1:])
+        np.cumsum(X * X, axis=-1, out=self._X2_cumsum[..., 1:])
+
+        # windows with variance below this, relative to the series, are constant
+        self._min_var = 1e-12 * np.maximum(X.var(axis=-1), np.finfo(np.float64).tiny)
+
+    def min_distances(self, shapelets, dims):
+        """Minimum squared distances of z-normalised shapelets to all series.
+
+        Parameters
+        ----------
+        shapelets : list of 1D np.ndarray
+            The z-normalised shapelets, with length at most series_length.
+        dims : list of int
+            The dimension of the series each shapelet is compared to.
+
+        Returns
+        -------
+        distances : 2D np.ndarray of shape = [len(shapelets), n_instances]
+            Minimum over all windows of the sum of squared differences between
+            shapelet and z-normalised window. Constant windows are normalised to 0.
+        """
+        dims = np.asarray(dims, dtype=np.int64)
+        distances = np.zeros((len(shapelets), self.n_instances))
+        batch_size = max(1, self.max_batch_size // (self.n_instances * self._n_fft))
+        for start in range(0, len(shapelets), batch_size):
+            end = start + batch_size
+            distances[start:end] = self._min_distances(
+                shapelets[start:end], dims[start:end]
+            )
+        return distances
+
+    def _min_distances(self, shapelets, dims):
+        from scipy.fft import irfft, rfft
+
+        n_timepoints = self.series_length
+        lengths = np.array([len(shapelet) for shapelet in shapelets])[:, None]
+
+        Q = np.zeros((len(shapelets), self._n_fft))
+        for i, shapelet in enumerate(shapelets):
+            Q[i, : len(shapelet)] = shapelet
+        q_sum = Q.sum(axis=-1)[:, None]
+        q_sum2 = np.einsum("ij,ij->i", Q, Q)[:, None]
+
+        # sliding dot products of shapelets and windows starting at each position,
+        # shape (n_instances, n_shapelets, series_length)
+        Q_fft = np.conj(rfft(Q, axis=-1, workers=self.n_jobs))
+        QT = irfft(
+            self._X_fft[:, dims] * Q_fft, n=self._n_fft, axis=-1, workers=self.n_jobs
+        )[..., :n_timepoints]
+
+        # window means and variances from cumulative sums
+        starts = np.arange(n_timepoints)[None, :]
+        ends = np.minimum(starts + lengths, n_timepoints)
+        dim_idx = dims[:, None]
+        sums = self._X_cumsum[:, dim_idx, ends] - self._X_cumsum[:, dim_idx, starts]
+        sums2 = self._X2_cumsum[:, dim_idx, ends] - self._X2_cumsum[:, dim_idx, starts]
+        means = sums / lengths
+        variances = sums2 / lengths - means * means
+
+        is_constant = variances <= self._min_var[:, dims][..., None]
+        stds = np.sqrt(np.where(is_constant, 1, variances))
+        distances = q_sum2 + lengths - 2 * (QT - means * q_sum) / stds
+        distances = np.where(is_constant, q_sum2, distances)
+        distances[:, starts[0] + lengths > n_timepoints] = np.inf
+
+        return np.maximum(distances.min(axis=-1), 0).T
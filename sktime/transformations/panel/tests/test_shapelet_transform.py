@@ -5,7 +5,10 @@ import pytest
 from numpy import testing
 
 from sktime.datasets import load_basic_motions, load_unit_test
-from sktime.transformations.panel.shapelet_transform import RandomShapeletTransform
+from sktime.transformations.panel.shapelet_transform import (
+    RandomShapeletTransform,
+    _MassDistance,
+)
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 
@@ -55,21 +58,100 @@ def test_st_on_basic_motions():
     )
 
 
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+def test_st_distances_are_minimum_window_distances():
+    """Test transformed values are minimum distances over all windows.
+
+    Regression test for the first window compared to a shapelet being normalised by
+    its variance instead of its standard deviation, which gave a series a nonzero
+    distance to a shapelet taken from it.
+    """
+
+    def z_normalise(x):
+        std = x.std()
+        return (x - x.mean()) / std if std > 0 else x - x.mean()
+
+    X_train, y_train = load_basic_motions(split="train", return_type="numpy3D")
+    indices = np.random.RandomState(4).choice(len(y_train), 5, replace=False)
+    X, y = X_train[indices], y_train[indices]
+
+    st = RandomShapeletTransform(
+        max_shapelets=10, n_shapelet_samples=50, random_state=0
+    )
+    st.fit(X, y)
+    data = st.transform(X).to_numpy()
+
+    for n, (_, length, _, dim, inst_idx, _, shapelet) in enumerate(st.shapelets):
+        expected = [
+            min(
+                np.sum((shapelet - z_normalise(x[dim, i : i + length])) ** 2)
+                for i in range(x.shape[-1] - length + 1)
+            )
+            / length
+            for x in X
+        ]
+        testing.assert_array_almost_equal(data[:, n], expected, decimal=6)
+        assert data[inst_idx, n] == pytest.approx(0, abs=1e-6)
+
+
+def test_mass_distance():
+    """Test batched shapelet distances against exhaustive window distances."""
+
+    def z_normalise(x):
+        std = x.std()
+        return (x - x.mean()) / std if std > 0 else x - x.mean()
+
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(6, 3, 60)).cumsum(axis=-1) + 1000
+    X[2, 1, 10:30] = 5.0
+
+    shapelets, dims = [], []
+    for _ in range(30):
+        length = rng.randint(3, 61)
+        position = rng.randint(0, 61 - length)
+        dim = rng.randint(0, 3)
+        inst_idx = rng.randint(0, 6)
+        shapelets.append(z_normalise(X[inst_idx, dim, position : position + length]))
+        dims.append(dim)
+    shapelets.append(np.zeros(5))
+    dims.append(1)
+
+    expected = np.array(
+        [
+            [
+                min(
+                    np.sum((shapelet - z_normalise(x[dim, i : i + len(shapelet)])) ** 2)
+                    for i in range(61 - len(shapelet))
+                )
+                for x in X
+            ]
+            for shapelet, dim in zip(shapelets, dims)
+        ]
+    )
+
+    # small max_batch_size to compute the distances in several batches
+    distances = _MassDistance(X, max_batch_size=1000).min_distances(shapelets, dims)
+    testing.assert_array_almost_equal(distances, expected, decimal=6)
+
+
 shapelet_transform_unit_test_data = np.array(
     [
-        [0.0845, 0.1536, 0.1812],
-        [0.1006, 0.1373, 0.1423],
-        [0.1557, 0.2457, 0.2811],
-        [0.1437, 0.1117, 0.0832],
-        [0.059, 0.117, 0.1461],
+        [0.0297, 0.0, 0.0571, 0.043],
+        [0.0724, 0.0498, 0.0413, 0.0],
+        [0.0, 0.0297, 0.1119, 0.0657],
+        [0.1437, 0.1039, 0.0, 0.0147],
+        [0.0576, 0.0116, 0.0589, 0.0376],
     ]
 )
 shapelet_transform_basic_motions_data = np.array(
     [
-        [0.987, 0.9232, 1.5005, 1.9604, 1.93, 1.629, 1.2492, 1.006],
-        [1.0555, 1.0586, 0.6147, 0.9763, 0.5589, 1.0327, 1.0834, 1.1117],
-        [1.9684, 1.7907, 2.4537, 1.9677, 2.0294, 1.3484, 1.9878, 0.5488],
-        [1.0066, 1.1597, 1.0618, 0.323, 1.145, 1.0387, 0.6769, 1.0157],
-        [0.2871, 0.0919, 1.7344, 1.9065, 1.73, 1.6298, 1.566, 1.1203],
+        [0.0, 1.5154, 2.0713, 1.6964, 1.93, 1.7166, 1.6446, 1.3747],
+        [2.1278, 1.7971, 0.0, 1.5443, 0.0, 2.0929, 2.0797, 2.4141],
+        [1.8443, 1.6338, 2.2822, 1.9677, 2.0294, 0.0, 1.9878, 0.0],
+        [1.8894, 1.8463, 2.1423, 0.0, 1.8901, 2.1195, 0.0, 1.8769],
+        [1.6369, 0.0, 1.9507, 1.8272, 1.73, 2.0308, 1.9637, 1.9896],
     ]
 )
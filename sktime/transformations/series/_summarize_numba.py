@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Isolated numba imports for WindowSummarizer.
+
+Rolling window features of all series in a column are computed in one compiled pass
+over the contiguous values of the column, in parallel over series.
+"""
+
+import weakref
+
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+from numba.core.registry import CPUDispatcher
+
+from sktime.datatypes._panel._check import _multiindex_group_ids
+
+# codes of the summarizers computed by _window_stat, "lag" is the single value
+_BUILTIN_CODES = {
+    "sum": 0,
+    "mean": 1,
+    "median": 2,
+    "std": 3,
+    "var": 4,
+    "kurt": 5,
+    "min": 6,
+    "max": 7,
+    "corr": 8,
+    "cov": 9,
+    "skew": 10,
+    "sem": 11,
+    "lag": 12,
+}
+
+
+@njit(cache=True)
+def _window_stat(w, code):
+    """Compute summarizer with given code on window w, as pandas rolling does."""
+    n = w.shape[0]
+    if code == 12:
+        return w[0]
+    if code == 0:
+        return np.sum(w)
+    if code == 1:
+        return np.mean(w)
+    if code == 2:
+        return np.median(w)
+    if code == 6:
+        return np.min(w)
+    if code == 7:
+        return np.max(w)
+
+    # moment based summarizers, with central moments of the window
+    mean = np.mean(w)
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    all_same = True
+    for i in range(n):
+        d = w[i] - mean
+        m2 += d * d
+        m3 += d * d * d
+        m4 += d * d * d * d
+        if w[i] != w[0]:
+            all_same = False
+    if all_same:
+        m2 = 0.0
+
+    if code == 4 or code == 9:
+        return m2 / (n - 1) if n > 1 else np.nan
+    if code == 3:
+        return np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    if code == 11:
+        return np.sqrt(m2 / (n - 1)) / np.sqrt(n - 1) if n > 1 else np.nan
+    if code == 8:
+        return 1.0 if m2 > 0 else np.nan
+    if code == 10:
+        if n < 3:
+            return np.nan
+        if all_same:
+            return 0.0
+        m2, m3 = m2 / n, m3 / n
+        if m2 <= 1e-14:
+            return np.nan
+        return np.sqrt(n * (n - 1.0)) * m3 / ((n - 2.0) * m2**1.5)
+    if code == 5:
+        if n < 4:
+            return np.nan
+        if all_same:
+            return -3.0
+        m2, m4 = m2 / n, m4 / n
+        if m2 <= 1e-14:
+            return np.nan
+        k = (n * n - 1.0) * m4 / (m2 * m2) - 3.0 * (n - 1.0) ** 2
+        return k / ((n - 2.0) * (n - 3.0))
+    return np.nan
+
+
+@njit(cache=True)
+def _bfill(x):
+    """Fill nans in x backwards from the next non-nan value, in place."""
+    last = np.nan
+    for t in range(x.shape[0] - 1, -1, -1):
+        if np.isnan(x[t]):
+            x[t] = last
+        else:
+            last = x[t]
+
+
+@njit(cache=True)
+def _shift(x, lag, bfill):
+    """Shift x by lag into the future, optionally backfill."""
+    s = np.full(x.shape[0], np.nan)
+    if lag < x.shape[0]:
+        s[lag:] = x[: x.shape[0] - lag]
+    if bfill:
+        _bfill(s)
+    return s
+
+
+@njit(cache=True)
+def _complete(w):
+    """Check whether window w has no nans."""
+    for i in range(w.shape[0]):
+        if np.isnan(w[i]):
+            return False
+    return True
+
+
+@njit(parallel=True, cache=True)
+def _rolling_builtins(values, offsets, codes, lags, window_lengths, bfill):
+    """Compute built-in window features of all series, in one pass per series.
+
+    Parameters
+    ----------
+    values : 1D np.ndarray of float, values of all series, concatenated
+    offsets : 1D np.ndarray of int, series i are values[offsets[i]:offsets[i + 1]]
+    codes, lags, window_lengths : 1D np.ndarray of int, one entry per feature
+    bfill : bool, whether to backfill as WindowSummarizer does for truncate="bfill"
+
+    Returns
+    -------
+    2D np.ndarray of shape (len(values), len(codes)), features per value
+    """
+    out = np.full((values.shape[0], codes.shape[0]), np.nan)
+    for i in prange(offsets.shape[0] - 1):
+        start, end = offsets[i], offsets[i + 1]
+        x = values[start:end]
+        for j in range(codes.shape[0]):
+            s = _shift(x, lags[j], bfill)
+            wl = window_lengths[j]
+            col = np.full(end - start, np.nan)
+            for t in range(wl - 1, end - start):
+                w = s[t - wl + 1 : t + 1]
+                if _complete(w):
+                    col[t] = _window_stat(w, codes[j])
+            if bfill:
+                _bfill(col)
+            out[start:end, j] = col
+    return out
+
+
+@njit(parallel=True)
+def _rolling_apply(values, offsets, func, lags, window_lengths, bfill):
+    """Compute window features of jitted func, of all series, in one pass per series.
+
+    Parameters as in _rolling_builtins, with func a numba jitted function of a
+    1D np.ndarray of float, returning float, in place of codes.
+    """
+    out = np.full((values.shape[0], lags.shape[0]), np.nan)
+    for i in prange(offsets.shape[0] - 1):
+        start, end = offsets[i], offsets[i + 1]
+        x = values[start:end]
+        for j in range(lags.shape[0]):
+            s = _shift(x, lags[j], bfill)
+            wl = window_lengths[j]
+            col = np.full(end - start, np.nan)
+            for t in range(wl - 1, end - start):
+                w = s[t - wl + 1 : t + 1]
+                if _complete(w):
+                    col[t] = func(w)
+            if bfill:
+                _bfill(col)
+            out[start:end, j] = col
+    return out
+
+
+# jitted custom summarizers, kernels are compiled once per jitted function
+_jitted_summarizers = weakref.WeakKeyDictionary()
+
+
+def _jit_summarizer(summarizer):
+    """Return numba jitted summarizer, or None if it cannot be compiled."""
+    if summarizer in _jitted_summarizers:
+        return _jitted_summarizers[summarizer]
+
+    if isinstance(summarizer, CPUDispatcher):
+        func = summarizer
+    else:
+        func = njit(summarizer)
+    try:
+        float(func(np.arange(3, dtype=np.float64)))
+    except Exception:
+        func = None
+    _jitted_summarizers[summarizer] = func
+    return func
+
+
+def _window_features_numba(Z, func_dict, bfill=False):
+    """Compute window features of a single column with numba kernels.
+
+    Parameters
+    ----------
+    Z : pd.Series, column of X, with pd.Index or pd.MultiIndex, sorted
+        if MultiIndex, series are defined by all but the last level
+    func_dict : pd.DataFrame with columns "summarizer" and "window"
+        as WindowSummarizer._func_dict
+    bfill : bool, optional, default=False
+
+    Returns
+    -------
+    feats : dict of int to pd.DataFrame, position of rows of func_dict to their
+        feature, with single column, named as by _window_feature
+        rows with summarizers that cannot be compiled are not in feats
+    """
+    if isinstance(Z.index, pd.MultiIndex):
+        levels = list(range(Z.index.nlevels - 1))
+        group_ids = _multiindex_group_ids(Z.index, levels)
+    else:
+        group_ids = np.zeros(len(Z), dtype=np.int64)
+    order = np.argsort(group_ids, kind="stable")
+    sorted_ids = group_ids[order]
+    offsets = np.flatnonzero(np.diff(sorted_ids, prepend=-1, append=-1))
+    values = np.ascontiguousarray(Z.to_numpy(dtype=np.float64)[order])
+
+    def _to_frames(out, rows):
+        """Unsort kernel output and wrap columns as named DataFrame."""
+        unsorted = np.empty_like(out)
+        unsorted[order] = out
+        frames = dict()
+        for j, (row, summarizer, window) in enumerate(rows):
+            name = summarizer if isinstance(summarizer, str) else summarizer.__name__
+            if name == "lag":
+                name = f"lag_{window[0]}"
+            else:
+                name = name + "_" + "_".join([str(item) for item in window])
+            frames[row] = pd.DataFrame({name: unsorted[:, j]}, index=Z.index)
+        return frames
+
+    builtin_rows = []
+    callable_rows = dict()
+    rows = enumerate(zip(func_dict["summarizer"], func_dict["window"]))
+    for row, (summarizer, window) in rows:
+        if isinstance(summarizer, str) and summarizer in _BUILTIN_CODES:
+            builtin_rows.append((row, summarizer, window))
+        elif callable(summarizer):
+            callable_rows.setdefault(summarizer, []).append((row, summarizer, window))
+
+    feats = dict()
+    if len(builtin_rows) > 0:
+        codes = np.array([_BUILTIN_CODES[r[1]] for r in builtin_rows], dtype=np.int64)
+        lags = np.array([r[2][0] for r in builtin_rows], dtype=np.int64)
+        wls = np.array([r[2][1] for r in builtin_rows], dtype=np.int64)
+        out = _rolling_builtins(values, offsets, codes, lags, wls, bfill)
+        feats.update(_to_frames(out, builtin_rows))
+
+    for summarizer, rows in callable_rows.items():
+        func = _jit_summarizer(summarizer)
+        if func is None:
+            continue
+        lags = np.array([r[2][0] for r in rows], dtype=np.int64)
+        wls = np.array([r[2][1] for r in rows], dtype=np.int64)
+        out = _rolling_apply(values, offsets, func, lags, wls, bfill)
+        feats.update(_to_frames(out, rows))
+
+    return feats
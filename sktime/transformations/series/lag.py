@@ -24,6 +24,89 @@ def _coerce_to_int(obj):
     return obj
 
 
+def _get_grid(index):
+    """Return (first, step, length) of index, if evenly spaced integer-like, else None.
+
+    Integer, period and datetime indices are considered, by their integer values,
+    ordinals, or nanoseconds.
+    """
+    if len(index) < 2:
+        return None
+    if pd.api.types.is_integer_dtype(index):
+        codes = index.to_numpy(dtype=np.int64)
+    elif isinstance(index, (pd.PeriodIndex, pd.DatetimeIndex)):
+        codes = index.asi8
+    else:
+        return None
+    step = codes[1] - codes[0]
+    if step <= 0 or not np.all(np.diff(codes) == step):
+        return None
+    return codes[0], step, len(codes)
+
+
+def _get_src_range(index_grid, X_idx_shifted, rows):
+    """Return rows of index with values of shifted X, for evenly spaced indices.
+
+    Parameters
+    ----------
+    index_grid : return of _get_grid for the output index
+    X_idx_shifted : pd.Index, shifted index of the source data
+    rows : pd.Index, rows of the output index that are kept for the lag
+
+    Returns
+    -------
+    (start, stop, src_start) such that rows start:stop of the output are the
+        source rows src_start:src_start + stop - start, all other rows are missing
+        None if indices are not evenly spaced with the same step
+    """
+    if index_grid is None or type(X_idx_shifted) is not type(rows):
+        return None
+    first, step, length = index_grid
+
+    ranges = []
+    for idx in [X_idx_shifted, rows]:
+        grid = _get_grid(idx)
+        if grid is None or grid[1] != step or (grid[0] - first) % step != 0:
+            return None
+        offset = (grid[0] - first) // step
+        ranges.append((offset, offset + grid[2]))
+
+    start = max(0, ranges[0][0], ranges[1][0])
+    stop = min(length, ranges[0][1], ranges[1][1])
+    if stop <= start:
+        return None
+    return start, stop, start - ranges[0][0]
+
+
+def _gather_rows(values, src, missing, out):
+    """Write source rows of values into out, missing rows are set to np.nan.
+
+    Parameters
+    ----------
+    values : 2D np.ndarray, source rows
+    src : (start, stop, src_start) tuple, as returned by _get_src_range, or
+        1D np.ndarray of int, source row per row of out, -1 for missing rows
+    missing : 1D np.ndarray of bool, rows of out that are missing, if src is array
+    out : 2D np.ndarray with values.shape[1] columns, written to in place
+        must be of float dtype if any rows are missing
+    """
+    if isinstance(src, tuple):
+        start, stop, src_start = src
+        out[start:stop] = values[src_start : src_start + stop - start]
+        if start > 0:
+            out[:start] = np.nan
+        if stop < len(out):
+            out[stop:] = np.nan
+        return
+
+    if out.dtype == values.dtype:
+        np.take(values, src, axis=0, out=out)
+    else:
+        out[:] = np.take(values, src, axis=0)
+    if missing.any():
+        out[missing] = np.nan
+
+
 class Lag(BaseTransformer):
     """Lagging transformer. Lags time series by one or multiple lags.
 
@@ -212,30 +295,173 @@ class Lag(BaseTransformer):
         -------
         pd.DataFrame, transformed version of X
         """
-        index_out = self.index_out
-
         X_orig_idx = X.index
         X_orig_cols = X.columns
-        X = X.combine_first(self._X).copy()
+        X = X.combine_first(self._X)
+
+        # numeric data is gathered into one array, instead of concatenating copies
+        if all(
+            isinstance(dtype, np.dtype) and dtype.kind in "fi" for dtype in X.dtypes
+        ):
+            Xt = self._transform_gather(X, X_orig_idx)
+        else:
+            Xt = self._transform_concat(X.copy(), X_orig_idx)
+
+        if self.flatten_transform_index:
+            Xt.columns = flatten_multiindex(Xt.columns)
+        if len(self._lags) == 1 and self.keep_column_names:
+            Xt.columns = X_orig_cols
+
+        return Xt
+
+    def _get_shifted_index(self, X, X_orig_idx, lag, freq):
+        """Get index of X and of X_orig_idx, shifted by lag, freq.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, data to shift
+        X_orig_idx : pd.Index, index of data passed to transform, sub-set of X.index
+        lag, freq : periods and freq, as returned by _yield_shift_params
+
+        Returns
+        -------
+        X_idx_shifted : pd.Index, index of X shifted
+        X_orig_idx_shifted : pd.Index, X_orig_idx shifted
+        """
+        # need to deal separately with RangeIndex
+        # because shift always cuts off the end values
+        if isinstance(lag, int) and pd.api.types.is_integer_dtype(X.index):
+            return X.index + lag, X_orig_idx + lag
+
+        if hasattr(X.index, "freq") and X.index.freq is None and freq is None:
+            freq = pd.infer_freq(X.index)
+        X_orig_idx_shifted = X_orig_idx.shift(periods=lag, freq=freq)
+        if isinstance(lag, int) and freq is None:
+            freq = "infer"
+        # shift of empty frame with the index of X, shifts only the index
+        X_idx_shifted = pd.DataFrame(index=X.index).shift(periods=lag, freq=freq).index
+        return X_idx_shifted, X_orig_idx_shifted
+
+    def _transform_gather(self, X, X_orig_idx):
+        """Transform numeric X by gathering all lags into preallocated arrays.
+
+        Rows of output and source rows in X for every lag are obtained from index
+        arithmetic, values are written directly into the output arrays, one array
+        per output dtype. Result is equal to _transform_concat.
+        """
+        index_out = self.index_out
+
+        # rows kept per lag, and source row positions in X, of shifted index labels
+        rows_list = []
+        X_idx_shifted_list = []
+        for lag, freq in self._yield_shift_params():
+            X_idx_shifted, X_orig_idx_shifted = self._get_shifted_index(
+                X, X_orig_idx, lag, freq
+            )
+            if index_out == "extend":
+                rows = X_orig_idx_shifted.union(X_orig_idx)
+            elif index_out == "original":
+                rows = X_orig_idx
+            else:
+                rows = X_idx_shifted
+            rows_list.append(rows)
+            X_idx_shifted_list.append(X_idx_shifted)
+
+        index = rows_list[0]
+        for rows in rows_list[1:]:
+            index = index.union(rows)
+        if not index.is_monotonic_increasing:
+            index = index.sort_values()
+        if len(rows_list) == 1 and index_out == "extend":
+            # as in _transform_concat, where rows are selected from a union by loc
+            if isinstance(index, pd.DatetimeIndex):
+                index = pd.DatetimeIndex(index, freq=None)
+
+        # source rows per lag, as a range of rows, or as row positions in X
+        index_grid = _get_grid(index)
+        sources = []
+        for rows, X_idx_shifted in zip(rows_list, X_idx_shifted_list):
+            # on evenly spaced indices, each lag is a contiguous range of rows
+            src_range = _get_src_range(index_grid, X_idx_shifted, rows)
+            if src_range is not None:
+                start, stop, _ = src_range
+                complete = start == 0 and stop == len(index)
+                sources.append((src_range, None, complete))
+                continue
+            src = X_idx_shifted.get_indexer(index)
+            if len(rows) < len(index):
+                src[rows.get_indexer(index) < 0] = -1
+            missing = src < 0
+            sources.append((src, missing, not missing.any()))
+
+        lag_names = list(self._yield_shift_param_names())
+        columns = pd.MultiIndex.from_product(
+            [lag_names, X.columns], names=["lag", "variable"]
+        )
+
+        # columns are gathered in their own dtype, integer columns are float64
+        #   only in lags with missing values, as in _transform_concat
+        col_dtypes = list(X.dtypes)
+        values_by_dtype = {}
+        for dtype in dict.fromkeys(col_dtypes):
+            cols = [j for j, col_dtype in enumerate(col_dtypes) if col_dtype == dtype]
+            values_by_dtype[dtype] = (cols, X.iloc[:, cols].to_numpy(dtype=dtype))
+
+        # (lag, column) pairs of the output, by output dtype
+        out_cols = {}
+        for i, (_, _, complete) in enumerate(sources):
+            for j, dtype in enumerate(col_dtypes):
+                if dtype.kind == "i" and not complete:
+                    dtype = np.dtype("float64")
+                out_cols.setdefault(dtype, []).append((i, j))
+
+        blocks = []
+        for out_dtype, pairs in out_cols.items():
+            Xt_values = np.empty((len(index), len(pairs)), dtype=out_dtype)
+            for i, (src, missing, _) in enumerate(sources):
+                for dtype, (cols, values) in values_by_dtype.items():
+                    out_pos = [
+                        k
+                        for k, (lag_i, j) in enumerate(pairs)
+                        if lag_i == i and col_dtypes[j] == dtype
+                    ]
+                    if len(out_pos) == 0:
+                        continue
+                    src_cols = [cols.index(pairs[k][1]) for k in out_pos]
+                    if src_cols != list(range(len(cols))):
+                        values = values[:, src_cols]
+                    if out_pos == list(range(out_pos[0], out_pos[-1] + 1)):
+                        out = Xt_values[:, out_pos[0] : out_pos[-1] + 1]
+                        _gather_rows(values, src, missing, out)
+                    else:
+                        out = np.empty((len(index), len(out_pos)), dtype=out_dtype)
+                        _gather_rows(values, src, missing, out)
+                        Xt_values[:, out_pos] = out
+            col_idx = [i * len(col_dtypes) + j for i, j in pairs]
+            blocks.append(
+                pd.DataFrame(
+                    Xt_values, index=index, columns=columns[col_idx], copy=False
+                )
+            )
+
+        if len(blocks) == 1:
+            return blocks[0]
+        return pd.concat(blocks, axis=1)[columns]
+
+    def _transform_concat(self, X, X_orig_idx):
+        """Transform X by concatenating shifted copies of X, one per lag."""
+        index_out = self.index_out
 
         shift_params = list(self._yield_shift_params())
 
         Xt_list = []
 
         for lag, freq in shift_params:
-            # need to deal separately with RangeIndex
-            # because shift always cuts off the end values
-            if isinstance(lag, int) and pd.api.types.is_integer_dtype(X.index):
-                Xt = X.copy()
-                Xt.index = X.index + lag
-                X_orig_idx_shifted = X_orig_idx + lag
-            else:
-                if hasattr(X.index, "freq") and X.index.freq is None and freq is None:
-                    freq = pd.infer_freq(X.index)
-                X_orig_idx_shifted = X_orig_idx.shift(periods=lag, freq=freq)
-                if isinstance(lag, int) and freq is None:
-                    freq = "infer"
-                Xt = X.copy().shift(periods=lag, freq=freq)
+            X_idx_shifted, X_orig_idx_shifted = self._get_shifted_index(
+                X, X_orig_idx, lag, freq
+            )
+            Xt = X.copy()
+            Xt.index = X_idx_shifted
             # extend index to include original, if "extend" or "original"
             if index_out in ["extend", "original"]:
                 X_idx = pd.DataFrame(index=X_orig_idx)
@@ -257,10 +483,6 @@ class Lag(BaseTransformer):
 
         lag_names = self._yield_shift_param_names()
         Xt = pd.concat(Xt_list, axis=1, keys=lag_names, names=["lag", "variable"])
-        if self.flatten_transform_index:
-            Xt.columns = flatten_multiindex(Xt.columns)
-        if len(shift_params) == 1 and self.keep_column_names:
-            Xt.columns = X_orig_cols
 
         # some pandas versions do not sort index automatically after concat
         # so removing will break specific pandas versions
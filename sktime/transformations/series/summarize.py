@@ -11,6 +11,7 @@ from joblib import Parallel, delayed
 
 from sktime.transformations.base import BaseTransformer
 from sktime.utils.multiindex import flatten_multiindex
+from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 
 class WindowSummarizer(BaseTransformer):
@@ -23,8 +24,8 @@ class WindowSummarizer(BaseTransformer):
     Parameters
     ----------
     n_jobs : int, optional (default=-1)
-        The number of jobs to run in parallel for applying the window functions.
-        ``-1`` means using all processors.
+        The number of jobs to run in parallel for applying the window functions,
+        with `engine="pandas"`. ``-1`` means using all processors.
     target_cols: list of str, optional (default = None)
         Specifies which columns in X to target for applying the window functions.
         ``None`` will target the first column
@@ -112,6 +113,21 @@ class WindowSummarizer(BaseTransformer):
             None will keep the NAs generated, and would leave it for the user to choose
             an estimator that can correctly deal with observations with missing values,
             "bfill" will fill the NAs by carrying the first observation backwards.
+    engine: str, optional (default = "pandas")
+        Engine computing the window features, one of:
+            * "pandas", pandas rolling window functions, parallelized over
+            summarizers with `n_jobs`
+            * "numba", compiled kernels computing all built-in summarizers in one
+            pass over the data, in parallel over series; custom functions are
+            compiled with `numba.njit` on first use if possible, otherwise
+            computed with pandas.
+    streaming: bool, optional (default = False)
+        Whether to keep only the last `truncate_start` observations of each series
+        seen in `fit` and `update`, instead of all data seen.
+        If True, `transform` of time points after those seen costs O(window) per
+        time point instead of O(history), and `update` advances the kept observations.
+        Features of time points before the kept observations are computed from the
+        data passed to `transform` only.
 
 
     Attributes
@@ -207,15 +223,22 @@ class WindowSummarizer(BaseTransformer):
         n_jobs=-1,
         target_cols=None,
         truncate=None,
+        engine="pandas",
+        streaming=False,
     ):
 
         self.lag_feature = lag_feature
         self.n_jobs = n_jobs
         self.target_cols = target_cols
         self.truncate = truncate
+        self.engine = engine
+        self.streaming = streaming
 
         super(WindowSummarizer, self).__init__()
 
+        if streaming:
+            self.set_tags(**{"remember_data": False})
+
     def _fit(self, X, y=None):
         """Fit transformer to X and y.
 
@@ -238,6 +261,11 @@ class WindowSummarizer(BaseTransformer):
             The raw inputs to transformed columns will be dropped.
         self: reference to self
         """
+        if self.engine not in ["pandas", "numba"]:
+            raise ValueError(
+                f'engine must be one of "pandas", "numba", but found "{self.engine}"'
+            )
+
         X_name = get_name_list(X)
 
         if self.target_cols is not None:
@@ -284,6 +312,41 @@ class WindowSummarizer(BaseTransformer):
         self.truncate_start = func_dict["window"].apply(lambda x: x[0] + x[1] - 1).max()
         self._func_dict = func_dict
 
+        if self.streaming:
+            self._X_tail = self._get_tail(X)
+
+        return self
+
+    def _update(self, X, y=None):
+        """Update transformer with X and y.
+
+        private _update containing the core logic, called from update
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Data to update transformer with
+        y : None
+
+        Returns
+        -------
+        self: reference to self
+        """
+        if self.streaming:
+            self._X_tail = self._get_tail(X.combine_first(self._X_tail))
+
+        return self
+
+    def _get_tail(self, X):
+        """Get last truncate_start observations of target columns, per series of X."""
+        target_cols = [col for col in X.columns if str(col) in self._target_cols]
+        X = X.loc[:, target_cols]
+        n_tail = max(int(self.truncate_start), 1)
+        if isinstance(X.index, pd.MultiIndex):
+            hier_levels = list(range(X.index.nlevels - 1))
+            return X.groupby(level=hier_levels).tail(n_tail)
+        return X.iloc[-n_tail:]
+
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -297,7 +360,10 @@ class WindowSummarizer(BaseTransformer):
         transformed version of X
         """
         idx = X.index
-        X = X.combine_first(self._X)
+        if self.streaming:
+            X = X.combine_first(self._X_tail)
+        else:
+            X = X.combine_first(self._X)
 
         func_dict = self._func_dict
         target_cols = self._target_cols
@@ -309,19 +375,33 @@ class WindowSummarizer(BaseTransformer):
         else:
             bfill = False
         for cols in target_cols:
+            if self.engine == "numba":
+                from sktime.transformations.series._summarize_numba import (
+                    _window_features_numba,
+                )
+
+                feats = _window_features_numba(X[cols], func_dict, bfill=bfill)
+            else:
+                feats = dict()
+
             if isinstance(X.index, pd.MultiIndex):
                 hier_levels = list(range(X.index.nlevels - 1))
-                X_grouped = X.groupby(level=hier_levels)[cols]
-                df = Parallel(n_jobs=self.n_jobs)(
-                    delayed(_window_feature)(X_grouped, **kwargs, bfill=bfill)
-                    for index, kwargs in func_dict.iterrows()
-                )
+                Z = X.groupby(level=hier_levels)[cols]
             else:
+                Z = X.loc[:, [cols]]
+            # summarizers not computed by the numba engine are computed with pandas
+            rows = [
+                (pos, kwargs)
+                for pos, (_index, kwargs) in enumerate(func_dict.iterrows())
+                if pos not in feats
+            ]
+            if len(rows) > 0:
                 df = Parallel(n_jobs=self.n_jobs)(
-                    delayed(_window_feature)(X.loc[:, [cols]], **kwargs, bfill=bfill)
-                    for _index, kwargs in func_dict.iterrows()
+                    delayed(_window_feature)(Z, **kwargs, bfill=bfill)
+                    for _pos, kwargs in rows
                 )
-            Xt = pd.concat(df, axis=1)
+                feats.update(zip([pos for pos, _kwargs in rows], df))
+            Xt = pd.concat([feats[pos] for pos in range(len(func_dict))], axis=1)
             Xt = Xt.add_prefix(str(cols) + "_")
             Xt_out.append(Xt)
         Xt_out_df = pd.concat(Xt_out, axis=1)
@@ -369,7 +449,15 @@ class WindowSummarizer(BaseTransformer):
             }
         }
 
-        return [params1, params2, params3]
+        params4 = {**params1, "streaming": True}
+
+        params = [params1, params2, params3, params4]
+
+        if _check_soft_dependencies("numba", severity="none"):
+            params5 = {**params3, "engine": "numba"}
+            params.append(params5)
+
+        return params
 
 
 # List of native pandas rolling window function.
@@ -434,22 +522,22 @@ def _window_feature(Z, summarizer=None, window=None, bfill=False):
     lag = window[0]
     window_length = window[1]
 
+    if isinstance(Z, pd.core.groupby.generic.SeriesGroupBy):
+        # shift of grouped series is not grouped, windows must not span series
+        hier_levels = list(range(Z.obj.index.nlevels - 1))
+
     if summarizer in pd_rolling:
         if isinstance(Z, pd.core.groupby.generic.SeriesGroupBy):
-            if bfill is False:
-                feat = getattr(
-                    Z.shift(lag).rolling(
-                        window=window_length, min_periods=window_length
-                    ),
-                    summarizer,
-                )()
-            else:
-                feat = getattr(
-                    Z.shift(lag)
-                    .fillna(method="bfill")
-                    .rolling(window=window_length, min_periods=window_length),
-                    summarizer,
-                )()
+            shifted = Z.shift(lag)
+            if bfill is True:
+                shifted = shifted.groupby(level=hier_levels).bfill()
+            feat = getattr(
+                shifted.groupby(level=hier_levels).rolling(
+                    window=window_length, min_periods=window_length
+                ),
+                summarizer,
+            )()
+            feat = feat.droplevel(list(range(len(hier_levels)))).loc[shifted.index]
             feat = pd.DataFrame(feat)
         else:
             if bfill is False:
@@ -473,12 +561,20 @@ def _window_feature(Z, summarizer=None, window=None, bfill=False):
     else:
         if bfill is False:
             feat = Z.shift(lag)
+        elif isinstance(Z, pd.core.groupby.generic.SeriesGroupBy):
+            feat = Z.shift(lag).groupby(level=hier_levels).bfill()
         else:
             feat = Z.shift(lag).fillna(method="bfill")
         if isinstance(Z, pd.core.groupby.generic.SeriesGroupBy) and callable(
             summarizer
         ):
-            feat = feat.rolling(window_length).apply(summarizer, raw=True)
+            shifted = feat
+            feat = (
+                shifted.groupby(level=hier_levels)
+                .rolling(window_length)
+                .apply(summarizer, raw=True)
+            )
+            feat = feat.droplevel(list(range(len(hier_levels)))).loc[shifted.index]
         elif not isinstance(Z, pd.core.groupby.generic.SeriesGroupBy) and callable(
             summarizer
         ):
@@ -488,7 +584,9 @@ def _window_feature(Z, summarizer=None, window=None, bfill=False):
                 ).apply(summarizer, raw=True)
             )
         feat = pd.DataFrame(feat)
-    if bfill is True:
+    if bfill is True and isinstance(Z, pd.core.groupby.generic.SeriesGroupBy):
+        feat = feat.groupby(level=hier_levels).bfill()
+    elif bfill is True:
         feat = feat.fillna(method="bfill")
 
     if callable(summarizer):
@@ -6,6 +6,7 @@ __author__ = ["fkiraly"]
 
 import itertools
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -93,3 +94,53 @@ def test_lag_fit_transform_column_names(X, index_out, lags):
 
     elif isinstance(Xt, pd.Series):
         assert Xt.name is None
+
+
+# integer index with gaps
+X_gap_idx = pd.DataFrame({"a": [1.0, 2.0, 4.0, 3.0, 5.0]}, index=[0, 1, 3, 4, 7])
+
+# mixed dtypes, integers that are not exactly representable as float64
+X_mixed_dtypes = pd.DataFrame(
+    {
+        "a": np.arange(2**60 + 1, 2**60 + 12, 2, dtype=np.int64),
+        "b": np.arange(6, dtype=np.float32) / 3,
+        "c": np.arange(6, dtype=np.float64) / 7,
+        "d": np.arange(6, dtype=np.int32),
+    }
+)
+
+
+@pytest.mark.parametrize("X", X_fixtures + [X_gap_idx, X_mixed_dtypes])
+@pytest.mark.parametrize("index_out", index_outs)
+@pytest.mark.parametrize("lags", [2, [2, 4], [-1, 0, 5]])
+def test_lag_gather_equals_concat(X, index_out, lags):
+    """Test that lags gathered into one array equal concatenated shifted copies."""
+    X = pd.DataFrame(X)
+    t = Lag(lags, index_out=index_out).fit(X.iloc[:-1])
+
+    X_new = X.iloc[-3:]
+    X_all = X_new.combine_first(t._X)
+    Xt_gather = t._transform_gather(X_all, X_new.index)
+    Xt_concat = t._transform_concat(X_all.copy(), X_new.index)
+
+    pd.testing.assert_frame_equal(Xt_gather, Xt_concat, check_freq=False)
+
+
+@pytest.mark.parametrize("index_out", index_outs)
+def test_lag_large_int_values(index_out):
+    """Test that integer columns are not converted to float where not needed.
+
+    Failure case: integers above 2**53 lost precision, as all columns were
+    gathered as float64.
+    """
+    y = pd.Series([2**60 + 1, 2**60 + 3, 2**60 + 5])
+    yt = Lag(0, index_out=index_out).fit_transform(y)
+    assert yt.dtype == np.int64
+    assert yt.tolist() == y.tolist()
+
+    Xt = Lag([0, 1], index_out="original").fit_transform(X_mixed_dtypes)
+    assert Xt["lag_0__a"].tolist() == X_mixed_dtypes["a"].tolist()
+    assert Xt["lag_0__d"].dtype == np.int32
+    assert Xt["lag_0__b"].dtype == np.float32
+    assert Xt["lag_1__b"].dtype == np.float32
+    assert Xt["lag_1__a"].dtype == np.float64
@@ -10,6 +10,7 @@ from sktime.datasets import load_airline, load_longley
 from sktime.datatypes import get_examples
 from sktime.forecasting.model_selection import temporal_train_test_split
 from sktime.transformations.series.summarize import WindowSummarizer
+from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 
 def check_eval(test_input, expected):
@@ -169,3 +170,94 @@ def test_wrong_column():
     transformer = WindowSummarizer(target_cols=["dummy"])
     Xt = transformer.fit_transform(X_ll_train)
     return Xt
+
+
+@pytest.mark.parametrize("truncate", [None, "bfill"])
+@pytest.mark.parametrize("kwargs", [kwargs, kwargs_custom])
+def test_windowsummarizer_streaming(kwargs, truncate):
+    """Test that streaming transform and update equal transform of all data."""
+    transformer = WindowSummarizer(**kwargs, truncate=truncate)
+    Xt_expected = transformer.fit_transform(y)
+
+    transformer = WindowSummarizer(**kwargs, truncate=truncate, streaming=True)
+    Xt = [transformer.fit_transform(y[:36])]
+    for i in range(36, len(y), 12):
+        y_new = y[i : i + 12]
+        Xt.append(transformer.transform(y_new))
+        transformer.update(y_new)
+    Xt = pd.concat(Xt)
+
+    # only the last truncate_start observations are kept
+    assert len(transformer._X_tail) == transformer.truncate_start
+    pd.testing.assert_frame_equal(pd.DataFrame(Xt), pd.DataFrame(Xt_expected))
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("truncate", [None, "bfill"])
+@pytest.mark.parametrize("y", [y, y_hierarchical])
+def test_windowsummarizer_numba(y, truncate):
+    """Test that numba engine computes the same features as pandas engine."""
+    lag_feature = {
+        "lag": [1, 3],
+        "mean": [[0, 4]],
+        "median": [[1, 5]],
+        "std": [[1, 4]],
+        "skew": [[1, 5]],
+        "kurt": [[1, 6]],
+        "sem": [[2, 4]],
+        "cov": [[1, 4]],
+        count_gt100: [[3, 2]],
+    }
+    kwargs = {"lag_feature": lag_feature, "truncate": truncate, "n_jobs": 1}
+    Xt_pandas = WindowSummarizer(**kwargs).fit_transform(y)
+    Xt_numba = WindowSummarizer(**kwargs, engine="numba").fit_transform(y)
+
+    pd.testing.assert_frame_equal(Xt_numba, Xt_pandas)
+
+
+def test_windowsummarizer_engine_checked_in_fit():
+    """Test that engine is validated in fit, not in the constructor."""
+    transformer = WindowSummarizer(engine="spark")
+    assert transformer.get_params()["engine"] == "spark"
+    with pytest.raises(ValueError, match="engine must be one of"):
+        transformer.fit(y)
+
+
+@pytest.mark.parametrize("truncate", [None, "bfill"])
+@pytest.mark.parametrize("kwargs", [kwargs, kwargs_custom])
+@pytest.mark.parametrize("hierarchy_levels", [(3,), (2, 2)])
+def test_windowsummarizer_streaming_panel(kwargs, truncate, hierarchy_levels):
+    """Test streaming on Panel and hierarchical data equals transform of all data.
+
+    Instances have different values, so the kept tail must be per instance.
+    """
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical(
+        hierarchy_levels=hierarchy_levels,
+        min_timepoints=60,
+        max_timepoints=60,
+        n_columns=1,
+        random_state=7,
+    )
+    time = X.index.get_level_values(-1)
+    cutoffs = time.unique().sort_values()
+
+    transformer = WindowSummarizer(**kwargs, truncate=truncate)
+    Xt_expected = transformer.fit_transform(X)
+
+    transformer = WindowSummarizer(**kwargs, truncate=truncate, streaming=True)
+    Xt = [transformer.fit_transform(X[time <= cutoffs[23]])]
+    for i in range(24, len(cutoffs), 12):
+        X_new = X[(time > cutoffs[i - 1]) & (time <= cutoffs[min(i + 11, 59)])]
+        Xt.append(transformer.transform(X_new))
+        transformer.update(X_new)
+    Xt = pd.concat(Xt).sort_index()
+
+    # only the last truncate_start observations of each instance are kept
+    n_instances = np.prod(hierarchy_levels)
+    assert len(transformer._X_tail) == n_instances * transformer.truncate_start
+    pd.testing.assert_frame_equal(Xt, Xt_expected.sort_index())
@@ -658,3 +658,29 @@ def test_vectorize_reconstruct_correct_hierarchy():
 
     # check that Xt.index is the same as X.index with time level dropped and made unique
     assert (X.index.droplevel(-1).unique() == Xt.index).all()
+
+
+@pytest.mark.parametrize("backend", [None, "loky", "threading"])
+def test_vectorize_parallel_backend(backend):
+    """Tests that vectorized transform with parallel backend gives same result.
+
+    Raises
+    ------
+    AssertionError if output with parallel backend differs from sequential output.
+    """
+    from sktime.transformations.series.difference import Differencer
+    from sktime.utils._testing.hierarchical import _make_hierarchical
+
+    X = _make_hierarchical(hierarchy_levels=(2, 3), n_columns=2)
+
+    t_seq = Differencer()
+    Xt_seq = t_seq.fit_transform(X)
+
+    t_par = Differencer()
+    t_par.set_config(
+        **{"backend:parallel": backend, "backend:parallel:params": {"n_jobs": 2}}
+    )
+    Xt_par = t_par.fit_transform(X)
+
+    assert t_par.transformers_.shape == t_seq.transformers_.shape
+    pd.testing.assert_frame_equal(Xt_seq, Xt_par)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+"""Common abstraction utilities for parallelization backends.
+
+New parallelization or iteration backends can be added easily as follows:
+
+* Add a new backend name to ``PARALLEL_BACKENDS``, a string.
+* Add a new function ``_parallelize_<name>``, following the signature of
+  ``_parallelize_none``, with ``<name>`` the string added in the first step.
+* Dispatch happens in ``parallelize``, via the ``_PARALLELIZE_DISPATCH`` dict.
+"""
+
+__all__ = ["parallelize", "PARALLEL_BACKENDS"]
+
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+PARALLEL_BACKENDS = [None, "loky", "multiprocessing", "threading", "dask"]
+
+
+def parallelize(fun, iter, meta=None, backend=None, backend_params=None):
+    """Parallelize loop over iterable, with a function and meta-parameters.
+
+    Executes ``[fun(x, meta=meta) for x in iter]``, using the backend selected.
+
+    Parameters
+    ----------
+    fun : callable, must have exactly two arguments, first argument of type ``x``,
+        and second argument ``meta``, a dict
+        the function to apply to each element of ``iter``
+    iter : iterable
+        elements over which to apply ``fun``
+    meta : dict, optional, default=None
+        additional keyword arguments passed to every call of ``fun``,
+        as the single argument ``meta``
+    backend : str or None, one of ``PARALLEL_BACKENDS``, optional, default=None
+        backend to use for the loop over ``iter``
+
+        - None: executes loop sequentially, simple list comprehension
+        - "loky", "multiprocessing" and "threading": uses ``joblib.Parallel`` loops
+        - "dask": uses ``dask``, requires ``dask`` package in environment
+
+    backend_params : dict, optional, default=None
+        additional parameters passed to the backend as config.
+        Valid keys depend on the value of ``backend``:
+
+        - None: no additional parameters, ``backend_params`` is ignored
+        - "loky", "multiprocessing" and "threading":
+          any valid keys for ``joblib.Parallel`` can be passed here, e.g.,
+          ``n_jobs``, or ``batch_size`` to control chunked dispatch of elements.
+          If ``n_jobs`` is not passed, it defaults to ``-1``, other parameters
+          default to ``joblib`` defaults.
+        - "dask": any valid keys for ``dask.compute`` can be passed,
+          e.g., ``scheduler``
+
+    Returns
+    -------
+    list, i-th element is ``fun(x_i, meta=meta)``, where ``x_i`` is i-th element
+        of ``iter``, in the same sequence as ``iter``
+    """
+    if meta is None:
+        meta = {}
+    if backend_params is None:
+        backend_params = {}
+
+    if backend not in _PARALLELIZE_DISPATCH:
+        raise ValueError(
+            f"backend must be one of {PARALLEL_BACKENDS}, but found {backend}"
+        )
+
+    parallel_fun = _PARALLELIZE_DISPATCH[backend]
+    return parallel_fun(
+        fun=fun, iter=iter, meta=meta, backend=backend, backend_params=backend_params
+    )
+
+
+def _parallelize_none(fun, iter, meta, backend, backend_params):
+    """Execute loop via simple sequential list comprehension."""
+    return [fun(x, meta=meta) for x in iter]
+
+
+def _parallelize_joblib(fun, iter, meta, backend, backend_params):
+    """Parallelize loop via joblib Parallel."""
+    from joblib import Parallel, delayed
+
+    par_params = backend_params.copy()
+    par_params["backend"] = backend
+    if "n_jobs" not in par_params:
+        par_params["n_jobs"] = -1
+
+    return Parallel(**par_params)(delayed(fun)(x, meta=meta) for x in iter)
+
+
+def _parallelize_dask(fun, iter, meta, backend, backend_params):
+    """Parallelize loop via dask delayed and dask.compute."""
+    _check_soft_dependencies("dask", obj="parallelize with backend='dask'")
+
+    from dask import compute, delayed
+
+    lazy = [delayed(fun)(x, meta=meta) for x in iter]
+    return list(compute(*lazy, **backend_params))
+
+
+_PARALLELIZE_DISPATCH = {
+    None: _parallelize_none,
+    "loky": _parallelize_joblib,
+    "multiprocessing": _parallelize_joblib,
+    "threading": _parallelize_joblib,
+    "dask": _parallelize_dask,
+}
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Tests for parallelization utilities."""
+
+import pytest
+
+from sktime.utils.parallel import PARALLEL_BACKENDS, parallelize
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+BACKENDS_TO_TEST = [
+    backend
+    for backend in PARALLEL_BACKENDS
+    if backend != "dask" or _check_soft_dependencies("dask", severity="none")
+]
+
+
+def _square_plus(x, meta):
+    """Square x and add meta["plus"], used as test function."""
+    return x**2 + meta["plus"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS_TO_TEST)
+def test_parallelize_simple_loop(backend):
+    """Test that parallelize returns same result as list comprehension."""
+    iter = range(10)
+    meta = {"plus": 1}
+    backend_params = None if backend is None else {"n_jobs": 2}
+
+    result = parallelize(
+        _square_plus,
+        iter,
+        meta=meta,
+        backend=backend,
+        backend_params=backend_params,
+    )
+
+    assert result == [x**2 + 1 for x in iter]
+
+
+def test_parallelize_unknown_backend():
+    """Test that parallelize raises informative error for unknown backend."""
+    with pytest.raises(ValueError, match="backend must be one of"):
+        parallelize(_square_plus, range(3), meta={"plus": 1}, backend="foo")